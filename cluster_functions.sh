@@ -34,46 +34,86 @@ function execute {
  fi
 }
 
-# Launches a remote or local perf monitor (full system aggregated cores)
+# Launches a remote or local counter collector (perf_collector.py, full system per cpu)
 # $1 = Full name of remote host node, "local" if we are doing a local run
 # $2 = Microarch
 # $3 = Performance counter sample rate in seconds (decimals ok)
 function run_perf {
     NODE=$1
     CNTR_FILE=$WATTWATCHER_HOME/counter_lists/$2.txt
-    SAMPLE_RATE=`bc -l <<< "scale=0; $3 *1000" | xargs printf "%1.0f"`
+    SAMPLE_RATE=$3
     QUIET_MODE=$5
-    CNTRS=`grep ^[^#] $CNTR_FILE | awk 'BEGIN { ORS=","; FS=","; } { print $1}' | sed 's/.$//'`
     if [ $NODE == "local" ]
     then
-        rm -f counters.csv
-	execute "perf stat -x , -I $SAMPLE_RATE -a -A -e $CNTRS  -o counters.csv sleep infinity &"
+        rm -f counters.bin
+	execute "$WATTWATCHER_HOME/perf_collector.py $CNTR_FILE $SAMPLE_RATE --output counters.bin &"
     else
-        ssh -p 3131 lca@$NODE "rm counters.csv"
-        echo "sleep infinity" > wait.sh 
-        chmod +x wait.sh
-        scp -P 3131 wait.sh lca@$NODE:~/
-        rm wait.sh
-        PERF_CMD="perf stat -x , -I $SAMPLE_RATE -a -A -e $CNTRS ./wait.sh"
-        ssh -n -p 3131 lca@$NODE "nohup $PERF_CMD > /dev/null 2>> counters.csv &" 
+        ssh -p 3131 lca@$NODE "rm counters.bin"
+        scp -P 3131 $WATTWATCHER_HOME/perf_collector.py $CNTR_FILE lca@$NODE:~/
+        COLLECTOR_CMD="python perf_collector.py $2.txt $SAMPLE_RATE --output counters.bin"
+        ssh -n -p 3131 lca@$NODE "nohup $COLLECTOR_CMD > /dev/null 2>> collector.log &" 
     fi
     PERF_START_TIME=`date +%s`
 }
 
-# Stops a local or remote perf daemon
+# Stops a local or remote counter collector, which finishes the sample it is reading
 # $1 = Full name of remote host node, "local" if we are doing a local run
 function stop_perf {
     NODE=$1
     QUITE_MODE=$2
     if [ $NODE == "local" ]
     then
-        execute "pkill sleep"
+        execute "pkill -f perf_collector.py"
+        while pgrep -f perf_collector.py > /dev/null; do sleep 0.1; done
     else
-        ssh -n -p 3131 lca@$NODE "pkill sleep"
+        ssh -n -p 3131 lca@$NODE "pkill -f perf_collector.py; while pgrep -f perf_collector.py > /dev/null; do sleep 0.1; done"
     fi
     PERF_END_TIME=`date +%s`
 }
 
+# Publishes per core power estimates of every sample while the collector (started with run_perf) is running
+# The readings are appended to the output file as lines of JSON, see live_power.py
+# $1 = Full name of remote host node, "local" if we are doing a local run
+# $2 = microarch
+# $3 = Performance counter sample rate in seconds (same as run_perf)
+# $4 = TSC_FREQUENCY (Hz)
+# $5 = CORES
+# $6 = THREADS_PER_CORE
+# $7 = Output file for the readings
+# Extra live_power.py options (e.g. "--latest latest.json") can be passed in $WATTWATCHER_LIVE_OPTS
+function watch_perf {
+    NODE=$1
+    MICROARCH=$2
+    SAMPLE_RATE=$3
+    TSC_FREQUENCY=$4
+    CORES=$5
+    THREADS_PER_CORE=$6
+    OUTPUT=$7
+
+    LIVE_ARGS="$MICROARCH $SAMPLE_RATE $TSC_FREQUENCY $CORES $THREADS_PER_CORE --start-time $PERF_START_TIME --output $OUTPUT $WATTWATCHER_LIVE_OPTS"
+    if [ $NODE == "local" ]
+    then
+        PYTHONPATH=:$PYTHONPATH:$WATTWATCHER_HOME/sniper_libs $WATTWATCHER_HOME/live_power.py counters.bin $LIVE_ARGS &
+    else
+        ssh -n -p 3131 lca@$NODE "tail -c +1 -F counters.bin" | PYTHONPATH=:$PYTHONPATH:$WATTWATCHER_HOME/sniper_libs $WATTWATCHER_HOME/live_power.py - $LIVE_ARGS &
+    fi
+    WATCH_PID=$!
+}
+
+# Stops the live power readings started with watch_perf
+function stop_watch {
+    kill $WATCH_PID 2> /dev/null
+    pkill -f "tail -c \+1 -F counters.bin"
+}
+
+# Solves the CACTI arrays of a microarch template ahead of time, into
+# mcpat_procs/<microarch>.cache, which every later McPAT run of the template reads
+# $1 = microarch
+# $2 = TSC_FREQUENCY (Hz)
+function warm_cacti {
+    PYTHONPATH=:$PYTHONPATH:$WATTWATCHER_HOME/sniper_libs $WATTWATCHER_HOME/warm_cacti.py $1 --tsc-frequency $2
+}
+
 # Aggregates together all of the relevant stats from perf and post processes them
 # Also uses the performance counters to launch McPat analysis
 # $1 = Full name of remote host node, "local" if we are doing a local run
@@ -86,6 +126,7 @@ function stop_perf {
 # $7 = CORES
 # $8 = THREADS_PER_CORE
 # $9 = Quite mode actually doesn't run
+# Extra process.py options (e.g. "--jobs 8") can be passed in $WATTWATCHER_OPTS
 
 function marshal_perf {
     NODE=$1
@@ -98,36 +139,24 @@ function marshal_perf {
     THREADS_PER_CORE=$8
     QUIET_MODE=$9
 
-    # move the results to the run directory
+    # move the results to the run directory, the records have the start time of the run in their header
     mkdir -p $RESULTS_DIR
     if [ $NODE == "local" ]
     then
-        execute "mv counters.csv $RESULTS_DIR/$BENCH_NAME-counters.csv 2> /dev/null" 
+        execute "mv counters.bin $RESULTS_DIR/$BENCH_NAME-counters.bin 2> /dev/null" 
     else
-        scp -P 3131 lca@$NODE:~/counters.csv $RESULTS_DIR/$BENCH_NAME-counters.csv
+        scp -P 3131 lca@$NODE:~/counters.bin $RESULTS_DIR/$BENCH_NAME-counters.bin
     fi
-  
-    # Post the start and end times for this run
-    if [ $EXIT_CODE == "0" ]
-    then
-        echo "START TIME,$PERF_START_TIME" >> $RESULTS_DIR/$BENCH_NAME-counters.csv
-        echo "END TIME,$PERF_END_TIME" >> $RESULTS_DIR/$BENCH_NAME-counters.csv
-    fi
-
-    # Post process correctly
-    sed -i '/Terminated/d' $RESULTS_DIR/$BENCH_NAME-counters.csv
-    sed -i '/^\s*$/d' $RESULTS_DIR/$BENCH_NAME-counters.csv
-    sed -i '/^#/ d' $RESULTS_DIR/$BENCH_NAME-counters.csv
-    sed -i "s/^[ \t]*//" $RESULTS_DIR/$BENCH_NAME-counters.csv
     
     execute "PYTHONPATH=:$PYTHONPATH:$WATTWATCHER_HOME/sniper_libs $WATTWATCHER_HOME/process.py 
-				       $RESULTS_DIR/$BENCH_NAME-counters.csv 
+				       $RESULTS_DIR/$BENCH_NAME-counters.bin 
 				       $RESULTS_DIR 
      		                       $MICROARCH 
                                        $BIN_SIZE 
 				       $TSC_FREQUENCY
                                        $CORES
-				       $THREADS_PER_CORE"   
+				       $THREADS_PER_CORE
+				       $WATTWATCHER_OPTS"   
 }
 
 # same thing as marshal perf, but it assumes the config files already exist in the right place and we just need to redo the analysis
@@ -143,14 +172,22 @@ function analyze_perf {
     THREADS_PER_CORE=$8
     QUIET_MODE=$9
  
+    # runs from before perf_collector.py have the perf stat output instead
+    CNTR_FILE=$RESULTS_DIR/$NAME-counters.bin
+    if [ ! -f $CNTR_FILE ]
+    then
+        CNTR_FILE=$RESULTS_DIR/$NAME-counters.csv
+    fi
    
     execute "PYTHONPATH=:$PYTHONPATH:$WATTWATCHER_HOME/sniper_libs $WATTWATCHER_HOME/process.py 
-				       $RESULTS_DIR/$NAME-counters.csv 
+				       $CNTR_FILE 
 				       $RESULTS_DIR 
      		                       $MICROARCH 
                                        $BIN_SIZE 
 				       $TSC_FREQUENCY
                                        $CORES
-				       $THREADS_PER_CORE"     
+				       $THREADS_PER_CORE
+				       --stage-cache ${WATTWATCHER_STAGE_CACHE:-$RESULTS_DIR/stage_cache}
+				       $WATTWATCHER_OPTS"     
 
 }
@@ -31,14 +31,621 @@
 
 
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <stddef.h>
 #include "xmlParser.h"
 #include <string>
+#include <map>
 #include "XML_Parse.h"
 #include <iostream>
 
 using namespace std;
 
+//the params of a component and of all its subcomponents, as name=value pairs
+static string param_signature(XMLNode xNode)
+{
+	string signature;
+	int itmp=xNode.nChildNode("param");
+	for (int k=0; k<itmp; k++)
+	{
+		const char * name=xNode.getChildNode("param",k).getAttribute("name");
+		const char * value=xNode.getChildNode("param",k).getAttribute("value");
+		signature.append(name ? name : "").append("=").append(value ? value : "").append(";");
+	}
+	itmp=xNode.nChildNode("component");
+	for (int k=0; k<itmp; k++)
+		signature.append("{").append(param_signature(xNode.getChildNode("component",k))).append("}");
+	return signature;
+}
+
+//the params and stats parse() reads into a field of sys with read_field(),
+//for each kind of component
+static const XMLField system_params[] = {
+	{"number_of_cores", offsetof(root_system, number_of_cores), FIELD_INT, READ_ATOI},
+	{"number_of_L1Directories", offsetof(root_system, number_of_L1Directories), FIELD_INT, READ_ATOI},
+	{"number_of_L2Directories", offsetof(root_system, number_of_L2Directories), FIELD_INT, READ_ATOI},
+	{"number_of_L2s", offsetof(root_system, number_of_L2s), FIELD_INT, READ_ATOI},
+	{"Private_L2", offsetof(root_system, Private_L2), FIELD_BOOL, READ_BOOL},
+	{"number_of_L3s", offsetof(root_system, number_of_L3s), FIELD_INT, READ_ATOI},
+	{"number_of_NoCs", offsetof(root_system, number_of_NoCs), FIELD_INT, READ_ATOI},
+	{"number_of_dir_levels", offsetof(root_system, number_of_dir_levels), FIELD_INT, READ_ATOI},
+	{"domain_size", offsetof(root_system, domain_size), FIELD_INT, READ_ATOI},
+	{"first_level_dir", offsetof(root_system, first_level_dir), FIELD_INT, READ_ATOI},
+	{"homogeneous_cores", offsetof(root_system, homogeneous_cores), FIELD_INT, READ_ATOI},
+	{"core_tech_node", offsetof(root_system, core_tech_node), FIELD_DOUBLE, READ_ATOF},
+	{"target_core_clockrate", offsetof(root_system, target_core_clockrate), FIELD_INT, READ_ATOI},
+	{"target_chip_area", offsetof(root_system, target_chip_area), FIELD_INT, READ_ATOI},
+	{"temperature", offsetof(root_system, temperature), FIELD_INT, READ_ATOI},
+	{"number_cache_levels", offsetof(root_system, number_cache_levels), FIELD_INT, READ_ATOI},
+	{"L1_property", offsetof(root_system, L1_property), FIELD_INT, READ_ATOI},
+	{"L2_property", offsetof(root_system, L2_property), FIELD_INT, READ_ATOI},
+	{"homogeneous_L2s", offsetof(root_system, homogeneous_L2s), FIELD_INT, READ_ATOI},
+	{"homogeneous_L1Directories", offsetof(root_system, homogeneous_L1Directories), FIELD_INT, READ_ATOI},
+	{"homogeneous_L2Directories", offsetof(root_system, homogeneous_L2Directories), FIELD_INT, READ_ATOI},
+	{"L3_property", offsetof(root_system, L3_property), FIELD_INT, READ_ATOI},
+	{"homogeneous_L3s", offsetof(root_system, homogeneous_L3s), FIELD_INT, READ_ATOI},
+	{"homogeneous_ccs", offsetof(root_system, homogeneous_ccs), FIELD_INT, READ_ATOI},
+	{"homogeneous_NoCs", offsetof(root_system, homogeneous_NoCs), FIELD_INT, READ_ATOI},
+	{"Max_area_deviation", offsetof(root_system, Max_area_deviation), FIELD_INT, READ_ATOI},
+	{"Max_power_deviation", offsetof(root_system, Max_power_deviation), FIELD_INT, READ_ATOI},
+	{"device_type", offsetof(root_system, device_type), FIELD_INT, READ_ATOI},
+	{"longer_channel_device", offsetof(root_system, longer_channel_device), FIELD_BOOL, READ_BOOL},
+	{"power_gating", offsetof(root_system, power_gating), FIELD_BOOL, READ_BOOL},
+	{"opt_dynamic_power", offsetof(root_system, opt_dynamic_power), FIELD_BOOL, READ_BOOL},
+	{"opt_lakage_power", offsetof(root_system, opt_lakage_power), FIELD_BOOL, READ_BOOL},
+	{"opt_clockrate", offsetof(root_system, opt_clockrate), FIELD_BOOL, READ_BOOL},
+	{"opt_area", offsetof(root_system, opt_area), FIELD_BOOL, READ_BOOL},
+	{"Embedded", offsetof(root_system, Embedded), FIELD_BOOL, READ_BOOL},
+	{"machine_bits", offsetof(root_system, machine_bits), FIELD_INT, READ_ATOI},
+	{"virtual_address_width", offsetof(root_system, virtual_address_width), FIELD_INT, READ_ATOI},
+	{"physical_address_width", offsetof(root_system, physical_address_width), FIELD_INT, READ_ATOI},
+	{"virtual_memory_page_size", offsetof(root_system, virtual_memory_page_size), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(root_system, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(root_system, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField system_stats[] = {
+	{"total_cycles", offsetof(root_system, total_cycles), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField core_params[] = {
+	{"clock_rate", offsetof(system_core, clock_rate), FIELD_INT, READ_ATOI},
+	{"opt_local", offsetof(system_core, opt_local), FIELD_BOOL, READ_BOOL},
+	{"x86", offsetof(system_core, x86), FIELD_BOOL, READ_BOOL},
+	{"machine_bits", offsetof(system_core, machine_bits), FIELD_INT, READ_ATOI},
+	{"virtual_address_width", offsetof(system_core, virtual_address_width), FIELD_INT, READ_ATOI},
+	{"physical_address_width", offsetof(system_core, physical_address_width), FIELD_INT, READ_ATOI},
+	{"instruction_length", offsetof(system_core, instruction_length), FIELD_INT, READ_ATOI},
+	{"opcode_width", offsetof(system_core, opcode_width), FIELD_INT, READ_ATOI},
+	{"micro_opcode_width", offsetof(system_core, micro_opcode_width), FIELD_INT, READ_ATOI},
+	{"machine_type", offsetof(system_core, machine_type), FIELD_INT, READ_ATOI},
+	{"internal_datapath_width", offsetof(system_core, internal_datapath_width), FIELD_INT, READ_ATOI},
+	{"number_hardware_threads", offsetof(system_core, number_hardware_threads), FIELD_INT, READ_ATOI},
+	{"fetch_width", offsetof(system_core, fetch_width), FIELD_INT, READ_ATOI},
+	{"number_instruction_fetch_ports", offsetof(system_core, number_instruction_fetch_ports), FIELD_INT, READ_ATOI},
+	{"decode_width", offsetof(system_core, decode_width), FIELD_INT, READ_ATOI},
+	{"issue_width", offsetof(system_core, issue_width), FIELD_INT, READ_ATOI},
+	{"peak_issue_width", offsetof(system_core, peak_issue_width), FIELD_INT, READ_ATOI},
+	{"commit_width", offsetof(system_core, commit_width), FIELD_INT, READ_ATOI},
+	{"fp_issue_width", offsetof(system_core, fp_issue_width), FIELD_INT, READ_ATOI},
+	{"prediction_width", offsetof(system_core, prediction_width), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(system_core, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_core, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{"FPU", offsetof(system_core, FPU), FIELD_STRING, READ_STRING},
+	{"divider_multiplier", offsetof(system_core, divider_multiplier), FIELD_STRING, READ_STRING},
+	{"ALU_per_core", offsetof(system_core, ALU_per_core), FIELD_INT, READ_ATOI},
+	{"FPU_per_core", offsetof(system_core, FPU_per_core), FIELD_DOUBLE, READ_ATOF},
+	{"MUL_per_core", offsetof(system_core, MUL_per_core), FIELD_INT, READ_ATOI},
+	{"instruction_buffer_size", offsetof(system_core, instruction_buffer_size), FIELD_INT, READ_ATOI},
+	{"decoded_stream_buffer_size", offsetof(system_core, decoded_stream_buffer_size), FIELD_INT, READ_ATOI},
+	{"instruction_window_scheme", offsetof(system_core, instruction_window_scheme), FIELD_INT, READ_ATOI},
+	{"instruction_window_size", offsetof(system_core, instruction_window_size), FIELD_INT, READ_ATOI},
+	{"fp_instruction_window_size", offsetof(system_core, fp_instruction_window_size), FIELD_INT, READ_ATOI},
+	{"ROB_size", offsetof(system_core, ROB_size), FIELD_INT, READ_ATOI},
+	{"archi_Regs_IRF_size", offsetof(system_core, archi_Regs_IRF_size), FIELD_INT, READ_ATOI},
+	{"archi_Regs_FRF_size", offsetof(system_core, archi_Regs_FRF_size), FIELD_INT, READ_ATOI},
+	{"phy_Regs_IRF_size", offsetof(system_core, phy_Regs_IRF_size), FIELD_INT, READ_ATOI},
+	{"phy_Regs_FRF_size", offsetof(system_core, phy_Regs_FRF_size), FIELD_INT, READ_ATOI},
+	{"rename_scheme", offsetof(system_core, rename_scheme), FIELD_INT, READ_ATOI},
+	{"register_windows_size", offsetof(system_core, register_windows_size), FIELD_INT, READ_ATOI},
+	{"LSU_order", offsetof(system_core, LSU_order), FIELD_STRING, READ_STRING},
+	{"store_buffer_size", offsetof(system_core, store_buffer_size), FIELD_INT, READ_ATOI},
+	{"load_buffer_size", offsetof(system_core, load_buffer_size), FIELD_INT, READ_ATOI},
+	{"memory_ports", offsetof(system_core, memory_ports), FIELD_INT, READ_ATOI},
+	{"Dcache_dual_pump", offsetof(system_core, Dcache_dual_pump), FIELD_STRING, READ_STRING},
+	{"RAS_size", offsetof(system_core, RAS_size), FIELD_INT, READ_ATOI},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField core_stats[] = {
+	{"total_instructions", offsetof(system_core, total_instructions), FIELD_DOUBLE, READ_ATOF},
+	{"int_instructions", offsetof(system_core, int_instructions), FIELD_DOUBLE, READ_ATOF},
+	{"fp_instructions", offsetof(system_core, fp_instructions), FIELD_DOUBLE, READ_ATOF},
+	{"branch_instructions", offsetof(system_core, branch_instructions), FIELD_DOUBLE, READ_ATOF},
+	{"branch_mispredictions", offsetof(system_core, branch_mispredictions), FIELD_DOUBLE, READ_ATOF},
+	{"committed_instructions", offsetof(system_core, committed_instructions), FIELD_DOUBLE, READ_ATOF},
+	{"committed_int_instructions", offsetof(system_core, committed_int_instructions), FIELD_DOUBLE, READ_ATOF},
+	{"committed_fp_instructions", offsetof(system_core, committed_fp_instructions), FIELD_DOUBLE, READ_ATOF},
+	{"load_instructions", offsetof(system_core, load_instructions), FIELD_DOUBLE, READ_ATOF},
+	{"store_instructions", offsetof(system_core, store_instructions), FIELD_DOUBLE, READ_ATOF},
+	{"total_cycles", offsetof(system_core, total_cycles), FIELD_DOUBLE, READ_ATOF},
+	{"idle_cycles", offsetof(system_core, idle_cycles), FIELD_DOUBLE, READ_ATOF},
+	{"busy_cycles", offsetof(system_core, busy_cycles), FIELD_DOUBLE, READ_ATOF},
+	{"instruction_buffer_reads", offsetof(system_core, instruction_buffer_reads), FIELD_DOUBLE, READ_ATOF},
+	{"instruction_buffer_write", offsetof(system_core, instruction_buffer_write), FIELD_DOUBLE, READ_ATOF},
+	{"ROB_reads", offsetof(system_core, ROB_reads), FIELD_DOUBLE, READ_ATOF},
+	{"ROB_writes", offsetof(system_core, ROB_writes), FIELD_DOUBLE, READ_ATOF},
+	{"rename_reads", offsetof(system_core, rename_reads), FIELD_DOUBLE, READ_ATOF},
+	{"rename_writes", offsetof(system_core, rename_writes), FIELD_DOUBLE, READ_ATOF},
+	{"fp_rename_reads", offsetof(system_core, fp_rename_reads), FIELD_DOUBLE, READ_ATOF},
+	{"fp_rename_writes", offsetof(system_core, fp_rename_writes), FIELD_DOUBLE, READ_ATOF},
+	{"inst_window_reads", offsetof(system_core, inst_window_reads), FIELD_DOUBLE, READ_ATOF},
+	{"inst_window_writes", offsetof(system_core, inst_window_writes), FIELD_DOUBLE, READ_ATOF},
+	{"inst_window_wakeup_accesses", offsetof(system_core, inst_window_wakeup_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"inst_window_selections", offsetof(system_core, inst_window_selections), FIELD_DOUBLE, READ_ATOF},
+	{"fp_inst_window_reads", offsetof(system_core, fp_inst_window_reads), FIELD_DOUBLE, READ_ATOF},
+	{"fp_inst_window_writes", offsetof(system_core, fp_inst_window_writes), FIELD_DOUBLE, READ_ATOF},
+	{"fp_inst_window_wakeup_accesses", offsetof(system_core, fp_inst_window_wakeup_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"archi_int_regfile_reads", offsetof(system_core, archi_int_regfile_reads), FIELD_DOUBLE, READ_ATOF},
+	{"archi_float_regfile_reads", offsetof(system_core, archi_float_regfile_reads), FIELD_DOUBLE, READ_ATOF},
+	{"phy_int_regfile_reads", offsetof(system_core, phy_int_regfile_reads), FIELD_DOUBLE, READ_ATOF},
+	{"phy_float_regfile_reads", offsetof(system_core, phy_float_regfile_reads), FIELD_DOUBLE, READ_ATOF},
+	{"phy_int_regfile_writes", offsetof(system_core, archi_int_regfile_writes), FIELD_DOUBLE, READ_ATOF},
+	{"phy_float_regfile_writes", offsetof(system_core, archi_float_regfile_writes), FIELD_DOUBLE, READ_ATOF},
+	{"archi_int_regfile_writes", offsetof(system_core, phy_int_regfile_writes), FIELD_DOUBLE, READ_ATOF},
+	{"archi_float_regfile_writes", offsetof(system_core, phy_float_regfile_writes), FIELD_DOUBLE, READ_ATOF},
+	{"int_regfile_reads", offsetof(system_core, int_regfile_reads), FIELD_DOUBLE, READ_ATOF},
+	{"float_regfile_reads", offsetof(system_core, float_regfile_reads), FIELD_DOUBLE, READ_ATOF},
+	{"int_regfile_writes", offsetof(system_core, int_regfile_writes), FIELD_DOUBLE, READ_ATOF},
+	{"float_regfile_writes", offsetof(system_core, float_regfile_writes), FIELD_DOUBLE, READ_ATOF},
+	{"windowed_reg_accesses", offsetof(system_core, windowed_reg_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"windowed_reg_transports", offsetof(system_core, windowed_reg_transports), FIELD_DOUBLE, READ_ATOF},
+	{"function_calls", offsetof(system_core, function_calls), FIELD_DOUBLE, READ_ATOF},
+	{"context_switches", offsetof(system_core, context_switches), FIELD_DOUBLE, READ_ATOF},
+	{"ialu_accesses", offsetof(system_core, ialu_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"fpu_accesses", offsetof(system_core, fpu_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"mul_accesses", offsetof(system_core, mul_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"cdb_alu_accesses", offsetof(system_core, cdb_alu_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"cdb_mul_accesses", offsetof(system_core, cdb_mul_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"cdb_fpu_accesses", offsetof(system_core, cdb_fpu_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"load_buffer_reads", offsetof(system_core, load_buffer_reads), FIELD_DOUBLE, READ_ATOF},
+	{"load_buffer_writes", offsetof(system_core, load_buffer_writes), FIELD_DOUBLE, READ_ATOF},
+	{"load_buffer_cams", offsetof(system_core, load_buffer_cams), FIELD_DOUBLE, READ_ATOF},
+	{"store_buffer_reads", offsetof(system_core, store_buffer_reads), FIELD_DOUBLE, READ_ATOF},
+	{"store_buffer_writes", offsetof(system_core, store_buffer_writes), FIELD_DOUBLE, READ_ATOF},
+	{"store_buffer_cams", offsetof(system_core, store_buffer_cams), FIELD_DOUBLE, READ_ATOF},
+	{"store_buffer_forwards", offsetof(system_core, store_buffer_forwards), FIELD_DOUBLE, READ_ATOF},
+	{"main_memory_access", offsetof(system_core, main_memory_access), FIELD_DOUBLE, READ_ATOF},
+	{"main_memory_read", offsetof(system_core, main_memory_read), FIELD_DOUBLE, READ_ATOF},
+	{"main_memory_write", offsetof(system_core, main_memory_write), FIELD_DOUBLE, READ_ATOI},
+	{"pipeline_duty_cycle", offsetof(system_core, pipeline_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"IFU_duty_cycle", offsetof(system_core, IFU_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"BR_duty_cycle", offsetof(system_core, BR_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"LSU_duty_cycle", offsetof(system_core, LSU_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"MemManU_I_duty_cycle", offsetof(system_core, MemManU_I_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"MemManU_D_duty_cycle", offsetof(system_core, MemManU_D_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"ALU_duty_cycle", offsetof(system_core, ALU_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"MUL_duty_cycle", offsetof(system_core, MUL_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"FPU_duty_cycle", offsetof(system_core, FPU_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"ALU_cdb_duty_cycle", offsetof(system_core, ALU_cdb_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"MUL_cdb_duty_cycle", offsetof(system_core, MUL_cdb_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"FPU_cdb_duty_cycle", offsetof(system_core, FPU_cdb_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField predictor_params[] = {
+	{"prediction_width", offsetof(predictor_systemcore, prediction_width), FIELD_INT, READ_ATOI},
+	{"prediction_scheme", offsetof(predictor_systemcore, prediction_scheme), FIELD_STRING, READ_STRING},
+	{"predictor_size", offsetof(predictor_systemcore, predictor_size), FIELD_INT, READ_ATOI},
+	{"predictor_entries", offsetof(predictor_systemcore, predictor_entries), FIELD_INT, READ_ATOI},
+	{"local_predictor_entries", offsetof(predictor_systemcore, local_predictor_entries), FIELD_INT, READ_ATOI},
+	{"global_predictor_entries", offsetof(predictor_systemcore, global_predictor_entries), FIELD_INT, READ_ATOI},
+	{"global_predictor_bits", offsetof(predictor_systemcore, global_predictor_bits), FIELD_INT, READ_ATOI},
+	{"chooser_predictor_entries", offsetof(predictor_systemcore, chooser_predictor_entries), FIELD_INT, READ_ATOI},
+	{"chooser_predictor_bits", offsetof(predictor_systemcore, chooser_predictor_bits), FIELD_INT, READ_ATOI},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField predictor_stats[] = {
+	{"predictor_accesses", offsetof(predictor_systemcore, predictor_accesses), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField itlb_params[] = {
+	{"number_entries", offsetof(itlb_systemcore, number_entries), FIELD_INT, READ_ATOI},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField itlb_stats[] = {
+	{"total_hits", offsetof(itlb_systemcore, total_hits), FIELD_DOUBLE, READ_ATOF},
+	{"total_accesses", offsetof(itlb_systemcore, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"total_misses", offsetof(itlb_systemcore, total_misses), FIELD_DOUBLE, READ_ATOF},
+	{"conflicts", offsetof(itlb_systemcore, conflicts), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField icache_stats[] = {
+	{"total_accesses", offsetof(icache_systemcore, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_accesses", offsetof(icache_systemcore, read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_misses", offsetof(icache_systemcore, read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"replacements", offsetof(icache_systemcore, replacements), FIELD_DOUBLE, READ_ATOF},
+	{"read_hits", offsetof(icache_systemcore, read_hits), FIELD_DOUBLE, READ_ATOF},
+	{"total_hits", offsetof(icache_systemcore, total_hits), FIELD_DOUBLE, READ_ATOF},
+	{"total_misses", offsetof(icache_systemcore, total_misses), FIELD_DOUBLE, READ_ATOF},
+	{"miss_buffer_access", offsetof(icache_systemcore, miss_buffer_access), FIELD_DOUBLE, READ_ATOF},
+	{"fill_buffer_accesses", offsetof(icache_systemcore, fill_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_accesses", offsetof(icache_systemcore, prefetch_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_writes", offsetof(icache_systemcore, prefetch_buffer_writes), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_reads", offsetof(icache_systemcore, prefetch_buffer_reads), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_hits", offsetof(icache_systemcore, prefetch_buffer_hits), FIELD_DOUBLE, READ_ATOF},
+	{"conflicts", offsetof(icache_systemcore, conflicts), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField dtlb_params[] = {
+	{"number_entries", offsetof(dtlb_systemcore, number_entries), FIELD_INT, READ_ATOI},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField dtlb_stats[] = {
+	{"total_accesses", offsetof(dtlb_systemcore, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_accesses", offsetof(dtlb_systemcore, read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"write_accesses", offsetof(dtlb_systemcore, write_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_hits", offsetof(dtlb_systemcore, read_hits), FIELD_DOUBLE, READ_ATOF},
+	{"write_hits", offsetof(dtlb_systemcore, write_hits), FIELD_DOUBLE, READ_ATOF},
+	{"read_misses", offsetof(dtlb_systemcore, read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"write_misses", offsetof(dtlb_systemcore, write_misses), FIELD_DOUBLE, READ_ATOF},
+	{"total_hits", offsetof(dtlb_systemcore, total_hits), FIELD_DOUBLE, READ_ATOF},
+	{"total_misses", offsetof(dtlb_systemcore, total_misses), FIELD_DOUBLE, READ_ATOF},
+	{"conflicts", offsetof(dtlb_systemcore, conflicts), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField dcache_stats[] = {
+	{"total_accesses", offsetof(dcache_systemcore, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_accesses", offsetof(dcache_systemcore, read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"write_accesses", offsetof(dcache_systemcore, write_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"total_hits", offsetof(dcache_systemcore, total_hits), FIELD_DOUBLE, READ_ATOF},
+	{"total_misses", offsetof(dcache_systemcore, total_misses), FIELD_DOUBLE, READ_ATOF},
+	{"read_hits", offsetof(dcache_systemcore, read_hits), FIELD_DOUBLE, READ_ATOF},
+	{"write_hits", offsetof(dcache_systemcore, write_hits), FIELD_DOUBLE, READ_ATOF},
+	{"read_misses", offsetof(dcache_systemcore, read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"write_misses", offsetof(dcache_systemcore, write_misses), FIELD_DOUBLE, READ_ATOF},
+	{"replacements", offsetof(dcache_systemcore, replacements), FIELD_DOUBLE, READ_ATOF},
+	{"write_backs", offsetof(dcache_systemcore, write_backs), FIELD_DOUBLE, READ_ATOF},
+	{"miss_buffer_access", offsetof(dcache_systemcore, miss_buffer_access), FIELD_DOUBLE, READ_ATOF},
+	{"fill_buffer_accesses", offsetof(dcache_systemcore, fill_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_accesses", offsetof(dcache_systemcore, prefetch_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_writes", offsetof(dcache_systemcore, prefetch_buffer_writes), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_reads", offsetof(dcache_systemcore, prefetch_buffer_reads), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_hits", offsetof(dcache_systemcore, prefetch_buffer_hits), FIELD_DOUBLE, READ_ATOF},
+	{"wbb_writes", offsetof(dcache_systemcore, wbb_writes), FIELD_DOUBLE, READ_ATOF},
+	{"wbb_reads", offsetof(dcache_systemcore, wbb_reads), FIELD_DOUBLE, READ_ATOF},
+	{"conflicts", offsetof(dcache_systemcore, conflicts), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField BTB_stats[] = {
+	{"total_accesses", offsetof(BTB_systemcore, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_accesses", offsetof(BTB_systemcore, read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"write_accesses", offsetof(BTB_systemcore, write_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"total_hits", offsetof(BTB_systemcore, total_hits), FIELD_DOUBLE, READ_ATOF},
+	{"total_misses", offsetof(BTB_systemcore, total_misses), FIELD_DOUBLE, READ_ATOF},
+	{"read_hits", offsetof(BTB_systemcore, read_hits), FIELD_DOUBLE, READ_ATOF},
+	{"write_hits", offsetof(BTB_systemcore, write_hits), FIELD_DOUBLE, READ_ATOF},
+	{"read_misses", offsetof(BTB_systemcore, read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"write_misses", offsetof(BTB_systemcore, write_misses), FIELD_DOUBLE, READ_ATOF},
+	{"replacements", offsetof(BTB_systemcore, replacements), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField L1Directory_params[] = {
+	{"clockrate", offsetof(system_L1Directory, clockrate), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(system_L1Directory, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_L1Directory, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{"device_type", offsetof(system_L1Directory, device_type), FIELD_INT, READ_ATOI},
+	{"Directory_type", offsetof(system_L1Directory, Directory_type), FIELD_INT, READ_ATOI},
+	{"3D_stack", offsetof(system_L1Directory, threeD_stack), FIELD_STRING, READ_STRING},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField L1Directory_stats[] = {
+	{"total_accesses", offsetof(system_L1Directory, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_accesses", offsetof(system_L1Directory, read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"write_accesses", offsetof(system_L1Directory, write_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_misses", offsetof(system_L1Directory, read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"write_misses", offsetof(system_L1Directory, write_misses), FIELD_DOUBLE, READ_ATOF},
+	{"conflicts", offsetof(system_L1Directory, conflicts), FIELD_DOUBLE, READ_ATOF},
+	{"duty_cycle", offsetof(system_L1Directory, duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField L2Directory_params[] = {
+	{"clockrate", offsetof(system_L2Directory, clockrate), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(system_L2Directory, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_L2Directory, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{"Directory_type", offsetof(system_L2Directory, Directory_type), FIELD_INT, READ_ATOI},
+	{"device_type", offsetof(system_L2Directory, device_type), FIELD_INT, READ_ATOI},
+	{"3D_stack", offsetof(system_L2Directory, threeD_stack), FIELD_STRING, READ_STRING},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField L2Directory_stats[] = {
+	{"total_accesses", offsetof(system_L2Directory, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_accesses", offsetof(system_L2Directory, read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"write_accesses", offsetof(system_L2Directory, write_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_misses", offsetof(system_L2Directory, read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"write_misses", offsetof(system_L2Directory, write_misses), FIELD_DOUBLE, READ_ATOF},
+	{"conflicts", offsetof(system_L2Directory, conflicts), FIELD_DOUBLE, READ_ATOF},
+	{"duty_cycle", offsetof(system_L2Directory, duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField L2_params[] = {
+	{"clockrate", offsetof(system_L2, clockrate), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(system_L2, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_L2, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{"merged_dir", offsetof(system_L2, merged_dir), FIELD_BOOL, READ_BOOL},
+	{"device_type", offsetof(system_L2, device_type), FIELD_INT, READ_ATOI},
+	{"threeD_stack", offsetof(system_L2, threeD_stack), FIELD_STRING, READ_STRING},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField L2_stats[] = {
+	{"total_accesses", offsetof(system_L2, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_accesses", offsetof(system_L2, read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"write_accesses", offsetof(system_L2, write_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"total_hits", offsetof(system_L2, total_hits), FIELD_DOUBLE, READ_ATOF},
+	{"total_misses", offsetof(system_L2, total_misses), FIELD_DOUBLE, READ_ATOF},
+	{"read_hits", offsetof(system_L2, read_hits), FIELD_DOUBLE, READ_ATOF},
+	{"write_hits", offsetof(system_L2, write_hits), FIELD_DOUBLE, READ_ATOF},
+	{"read_misses", offsetof(system_L2, read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"write_misses", offsetof(system_L2, write_misses), FIELD_DOUBLE, READ_ATOF},
+	{"replacements", offsetof(system_L2, replacements), FIELD_DOUBLE, READ_ATOF},
+	{"write_backs", offsetof(system_L2, write_backs), FIELD_DOUBLE, READ_ATOF},
+	{"miss_buffer_accesses", offsetof(system_L2, miss_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"fill_buffer_accesses", offsetof(system_L2, fill_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_accesses", offsetof(system_L2, prefetch_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_writes", offsetof(system_L2, prefetch_buffer_writes), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_reads", offsetof(system_L2, prefetch_buffer_reads), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_hits", offsetof(system_L2, prefetch_buffer_hits), FIELD_DOUBLE, READ_ATOF},
+	{"wbb_writes", offsetof(system_L2, wbb_writes), FIELD_DOUBLE, READ_ATOF},
+	{"wbb_reads", offsetof(system_L2, wbb_reads), FIELD_DOUBLE, READ_ATOF},
+	{"conflicts", offsetof(system_L2, conflicts), FIELD_DOUBLE, READ_ATOF},
+	{"duty_cycle", offsetof(system_L2, duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_read_accesses", offsetof(system_L2, homenode_read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_read_hits", offsetof(system_L2, homenode_read_hits), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_write_hits", offsetof(system_L2, homenode_write_hits), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_read_misses", offsetof(system_L2, homenode_read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_write_misses", offsetof(system_L2, homenode_write_misses), FIELD_DOUBLE, READ_ATOF},
+	{"dir_duty_cycle", offsetof(system_L2, dir_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField L3_params[] = {
+	{"clockrate", offsetof(system_L3, clockrate), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(system_L3, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_L3, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{"merged_dir", offsetof(system_L3, merged_dir), FIELD_BOOL, READ_BOOL},
+	{"device_type", offsetof(system_L3, device_type), FIELD_INT, READ_ATOI},
+	{"threeD_stack", offsetof(system_L3, threeD_stack), FIELD_STRING, READ_STRING},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField L3_stats[] = {
+	{"total_accesses", offsetof(system_L3, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"read_accesses", offsetof(system_L3, read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"write_accesses", offsetof(system_L3, write_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"total_hits", offsetof(system_L3, total_hits), FIELD_DOUBLE, READ_ATOF},
+	{"total_misses", offsetof(system_L3, total_misses), FIELD_DOUBLE, READ_ATOF},
+	{"read_hits", offsetof(system_L3, read_hits), FIELD_DOUBLE, READ_ATOF},
+	{"write_hits", offsetof(system_L3, write_hits), FIELD_DOUBLE, READ_ATOF},
+	{"read_misses", offsetof(system_L3, read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"write_misses", offsetof(system_L3, write_misses), FIELD_DOUBLE, READ_ATOF},
+	{"replacements", offsetof(system_L3, replacements), FIELD_DOUBLE, READ_ATOF},
+	{"write_backs", offsetof(system_L3, write_backs), FIELD_DOUBLE, READ_ATOF},
+	{"miss_buffer_accesses", offsetof(system_L3, miss_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"fill_buffer_accesses", offsetof(system_L3, fill_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_accesses", offsetof(system_L3, prefetch_buffer_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_writes", offsetof(system_L3, prefetch_buffer_writes), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_reads", offsetof(system_L3, prefetch_buffer_reads), FIELD_DOUBLE, READ_ATOF},
+	{"prefetch_buffer_hits", offsetof(system_L3, prefetch_buffer_hits), FIELD_DOUBLE, READ_ATOF},
+	{"wbb_writes", offsetof(system_L3, wbb_writes), FIELD_DOUBLE, READ_ATOF},
+	{"wbb_reads", offsetof(system_L3, wbb_reads), FIELD_DOUBLE, READ_ATOF},
+	{"conflicts", offsetof(system_L3, conflicts), FIELD_DOUBLE, READ_ATOF},
+	{"duty_cycle", offsetof(system_L3, duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_read_accesses", offsetof(system_L3, homenode_read_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_read_hits", offsetof(system_L3, homenode_read_hits), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_write_hits", offsetof(system_L3, homenode_write_hits), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_read_misses", offsetof(system_L3, homenode_read_misses), FIELD_DOUBLE, READ_ATOF},
+	{"homenode_write_misses", offsetof(system_L3, homenode_write_misses), FIELD_DOUBLE, READ_ATOF},
+	{"dir_duty_cycle", offsetof(system_L3, dir_duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField NoC_params[] = {
+	{"clockrate", offsetof(system_NoC, clockrate), FIELD_INT, READ_ATOI},
+	{"type", offsetof(system_NoC, type), FIELD_BOOL, READ_BOOL},
+	{"vdd", offsetof(system_NoC, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_NoC, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{"topology", offsetof(system_NoC, topology), FIELD_STRING, READ_STRING},
+	{"horizontal_nodes", offsetof(system_NoC, horizontal_nodes), FIELD_INT, READ_ATOI},
+	{"vertical_nodes", offsetof(system_NoC, vertical_nodes), FIELD_INT, READ_ATOI},
+	{"has_global_link", offsetof(system_NoC, has_global_link), FIELD_BOOL, READ_BOOL},
+	{"link_throughput", offsetof(system_NoC, link_throughput), FIELD_INT, READ_ATOI},
+	{"link_latency", offsetof(system_NoC, link_latency), FIELD_INT, READ_ATOI},
+	{"input_ports", offsetof(system_NoC, input_ports), FIELD_INT, READ_ATOI},
+	{"output_ports", offsetof(system_NoC, output_ports), FIELD_INT, READ_ATOI},
+	{"virtual_channel_per_port", offsetof(system_NoC, virtual_channel_per_port), FIELD_INT, READ_ATOI},
+	{"flit_bits", offsetof(system_NoC, flit_bits), FIELD_INT, READ_ATOI},
+	{"input_buffer_entries_per_vc", offsetof(system_NoC, input_buffer_entries_per_vc), FIELD_INT, READ_ATOI},
+	{"dual_pump", offsetof(system_NoC, dual_pump), FIELD_INT, READ_ATOI},
+	{"chip_coverage", offsetof(system_NoC, chip_coverage), FIELD_DOUBLE, READ_ATOF},
+	{"link_routing_over_percentage", offsetof(system_NoC, route_over_perc), FIELD_DOUBLE, READ_ATOF},
+	{"number_of_crossbars", offsetof(system_NoC, number_of_crossbars), FIELD_INT, READ_ATOI},
+	{"crossbar_type", offsetof(system_NoC, crossbar_type), FIELD_STRING, READ_STRING},
+	{"crosspoint_type", offsetof(system_NoC, crosspoint_type), FIELD_STRING, READ_STRING},
+	{"arbiter_type", offsetof(system_NoC, arbiter_type), FIELD_INT, READ_ATOI},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField xbar0_params[] = {
+	{"number_of_inputs_of_crossbars", offsetof(xbar0_systemNoC, number_of_inputs_of_crossbars), FIELD_INT, READ_ATOI},
+	{"number_of_outputs_of_crossbars", offsetof(xbar0_systemNoC, number_of_outputs_of_crossbars), FIELD_INT, READ_ATOI},
+	{"flit_bits", offsetof(xbar0_systemNoC, flit_bits), FIELD_INT, READ_ATOI},
+	{"input_buffer_entries_per_port", offsetof(xbar0_systemNoC, input_buffer_entries_per_port), FIELD_INT, READ_ATOI},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField NoC_stats[] = {
+	{"total_accesses", offsetof(system_NoC, total_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"duty_cycle", offsetof(system_NoC, duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField mc_params[] = {
+	{"mc_clock", offsetof(system_mc, mc_clock), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(system_mc, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_mc, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{"block_size", offsetof(system_mc, llc_line_length), FIELD_INT, READ_ATOI},
+	{"number_mcs", offsetof(system_mc, number_mcs), FIELD_INT, READ_ATOI},
+	{"memory_channels_per_mc", offsetof(system_mc, memory_channels_per_mc), FIELD_INT, READ_ATOI},
+	{"req_window_size_per_channel", offsetof(system_mc, req_window_size_per_channel), FIELD_INT, READ_ATOI},
+	{"IO_buffer_size_per_channel", offsetof(system_mc, IO_buffer_size_per_channel), FIELD_INT, READ_ATOI},
+	{"databus_width", offsetof(system_mc, databus_width), FIELD_INT, READ_ATOI},
+	{"addressbus_width", offsetof(system_mc, addressbus_width), FIELD_INT, READ_ATOI},
+	{"peak_transfer_rate", offsetof(system_mc, peak_transfer_rate), FIELD_DOUBLE, READ_ATOI},
+	{"number_ranks", offsetof(system_mc, number_ranks), FIELD_INT, READ_ATOI},
+	{"LVDS", offsetof(system_mc, LVDS), FIELD_BOOL, READ_BOOL},
+	{"type", offsetof(system_mc, type), FIELD_INT, READ_ATOI},
+	{"withPHY", offsetof(system_mc, withPHY), FIELD_BOOL, READ_BOOL},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField mc_stats[] = {
+	{"memory_accesses", offsetof(system_mc, memory_accesses), FIELD_DOUBLE, READ_ATOF},
+	{"memory_reads", offsetof(system_mc, memory_reads), FIELD_DOUBLE, READ_ATOF},
+	{"memory_writes", offsetof(system_mc, memory_writes), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField niu_params[] = {
+	{"clockrate", offsetof(system_niu, clockrate), FIELD_INT, READ_ATOI},
+	{"number_units", offsetof(system_niu, number_units), FIELD_INT, READ_ATOI},
+	{"type", offsetof(system_niu, type), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(system_niu, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_niu, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField niu_stats[] = {
+	{"duty_cycle", offsetof(system_niu, duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"total_load_perc", offsetof(system_niu, total_load_perc), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField pcie_params[] = {
+	{"clockrate", offsetof(system_pcie, clockrate), FIELD_INT, READ_ATOI},
+	{"number_units", offsetof(system_pcie, number_units), FIELD_INT, READ_ATOI},
+	{"num_channels", offsetof(system_pcie, num_channels), FIELD_INT, READ_ATOI},
+	{"type", offsetof(system_pcie, type), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(system_pcie, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_pcie, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{"withPHY", offsetof(system_pcie, withPHY), FIELD_BOOL, READ_BOOL},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField pcie_stats[] = {
+	{"duty_cycle", offsetof(system_pcie, duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"total_load_perc", offsetof(system_pcie, total_load_perc), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField flashc_params[] = {
+	{"number_flashcs", offsetof(system_mc, number_mcs), FIELD_INT, READ_ATOI},
+	{"vdd", offsetof(system_mc, vdd), FIELD_DOUBLE, READ_ATOF},
+	{"power_gating_vcc", offsetof(system_mc, power_gating_vcc), FIELD_DOUBLE, READ_ATOF},
+	{"peak_transfer_rate", offsetof(system_mc, peak_transfer_rate), FIELD_DOUBLE, READ_ATOI},
+	{"type", offsetof(system_mc, type), FIELD_INT, READ_ATOI},
+	{"withPHY", offsetof(system_mc, withPHY), FIELD_BOOL, READ_BOOL},
+	{NULL, 0, 0, 0}
+};
+
+static const XMLField flashc_stats[] = {
+	{"duty_cycle", offsetof(system_mc, duty_cycle), FIELD_DOUBLE, READ_ATOF},
+	{"total_load_perc", offsetof(system_mc, total_load_perc), FIELD_DOUBLE, READ_ATOF},
+	{NULL, 0, 0, 0}
+};
+
+struct field_name_less
+{
+	bool operator()(const char * a, const char * b) const { return strcmp(a, b) < 0; }
+};
+
+//looks a name up in a table, through an index of the table built once
+static const XMLField * find_field(const XMLField * fields, const char * name)
+{
+	static map<const XMLField *, map<const char *, const XMLField *, field_name_less> > indexes;
+	map<const char *, const XMLField *, field_name_less> & index = indexes[fields];
+	if (index.empty())
+		for (const XMLField * field = fields; field->name; field++)
+			index.insert(make_pair(field->name, field));
+	map<const char *, const XMLField *, field_name_less>::const_iterator found = index.find(name);
+	return found == index.end() ? NULL : found->second;
+}
+
+template <class T> static void store_field(char * field, char type, T value)
+{
+	switch (type)
+	{
+	case FIELD_INT:    *(int *)field = value; break;
+	case FIELD_DOUBLE: *(double *)field = value; break;
+	case FIELD_BOOL:   *(bool *)field = value; break;
+	}
+}
+
+void ParseXML::set_field(size_t offset, char type, char read, const char * value)
+{
+	char * field = (char *)&sys + offset;
+	switch (read)
+	{
+	case READ_ATOI:   store_field(field, type, atoi(value)); break;
+	case READ_ATOF:   store_field(field, type, atof(value)); break;
+	case READ_BOOL:   store_field(field, type, (bool)atoi(value)); break;
+	case READ_STRING: strcpy(field, value); break;
+	}
+}
+
+//reads the k-th param or stat of a component into its field of base, if
+//the table has one.  Returns whether it had one.
+bool ParseXML::read_field(const XMLField * fields, void * base, XMLNode xNode, const char * kind, int k)
+{
+	XMLNode xItem=xNode.getChildNode(kind,k);
+	const XMLField * field=find_field(fields,xItem.getAttribute("name"));
+	if (field==NULL)
+		return false;
+	size_t offset=(char *)base+field->offset-(char *)&sys;
+	const char * value=xItem.getAttribute("value");
+	set_field(offset,field->type,field->read,value);
+	if (writes)
+	{
+		const char * id=xNode.getAttribute("id");
+		writes->push_back(XMLWrite(string(id ? id : "")+"/"+kind+"/"+field->name,value,offset,field->type,field->read));
+	}
+	return true;
+}
+
 void ParseXML::parse(char* filepath)
+{
+	// this open and parse the XML file:
+	XMLNode xMainNode=XMLNode::openFileHelper(filepath,"component"); //the 'component' in the first layer
+	parse(xMainNode);
+}
+
+void ParseXML::parse(XMLNode xMainNode)
 {
 	unsigned int i,j,k,m,n;
 	unsigned int NumofCom_4;
@@ -46,56 +653,13 @@ void ParseXML::parse(char* filepath)
 	//Initialize all structures
 	ParseXML::initialize();
 
-	// this open and parse the XML file:
-	XMLNode xMainNode=XMLNode::openFileHelper(filepath,"component"); //the 'component' in the first layer
-
 	XMLNode xNode2=xMainNode.getChildNode("component"); // the 'component' in the second layer
 	//get all params in the second layer
 	itmp=xNode2.nChildNode("param");
 	for(i=0; i<itmp; i++)
 	{
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"number_of_cores")==0) {sys.number_of_cores=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"number_of_L1Directories")==0) {sys.number_of_L1Directories=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"number_of_L2Directories")==0) {sys.number_of_L2Directories=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"number_of_L2s")==0) {sys.number_of_L2s=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"Private_L2")==0) {sys.Private_L2=(bool)atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"number_of_L3s")==0) {sys.number_of_L3s=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"number_of_NoCs")==0) {sys.number_of_NoCs=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"number_of_dir_levels")==0) {sys.number_of_dir_levels=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"domain_size")==0) {sys.domain_size=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"first_level_dir")==0) {sys.first_level_dir=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"homogeneous_cores")==0) {sys.homogeneous_cores=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"core_tech_node")==0) {sys.core_tech_node=atof(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"target_core_clockrate")==0) {sys.target_core_clockrate=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"target_chip_area")==0) {sys.target_chip_area=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"temperature")==0) {sys.temperature=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"number_cache_levels")==0) {sys.number_cache_levels=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"L1_property")==0) {sys.L1_property =atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"L2_property")==0) {sys.L2_property =atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"homogeneous_L2s")==0) {sys.homogeneous_L2s=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"homogeneous_L1Directories")==0) {sys.homogeneous_L1Directories=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"homogeneous_L2Directories")==0) {sys.homogeneous_L2Directories=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"L3_property")==0) {sys.L3_property =atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"homogeneous_L3s")==0) {sys.homogeneous_L3s=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"homogeneous_ccs")==0) {sys.homogeneous_ccs=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"homogeneous_NoCs")==0) {sys.homogeneous_NoCs=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"Max_area_deviation")==0) {sys.Max_area_deviation=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"Max_power_deviation")==0) {sys.Max_power_deviation=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"device_type")==0) {sys.device_type=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"longer_channel_device")==0) {sys.longer_channel_device=(bool)atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"power_gating")==0) {sys.power_gating=(bool)atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"opt_dynamic_power")==0) {sys.opt_dynamic_power=(bool)atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"opt_lakage_power")==0) {sys.opt_lakage_power=(bool)atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"opt_clockrate")==0) {sys.opt_clockrate=(bool)atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"opt_area")==0) {sys.opt_area=(bool)atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"Embedded")==0) {sys.Embedded=(bool)atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
+		if (read_field(system_params, &sys, xNode2, "param", i)) continue;
 		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"interconnect_projection_type")==0) {sys.interconnect_projection_type=atoi(xNode2.getChildNode("param",i).getAttribute("value"))==0?0:1;continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"machine_bits")==0) {sys.machine_bits=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"virtual_address_width")==0) {sys.virtual_address_width=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"physical_address_width")==0) {sys.physical_address_width=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"virtual_memory_page_size")==0) {sys.virtual_memory_page_size=atoi(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"vdd")==0) {sys.vdd=atof(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
-		if (strcmp(xNode2.getChildNode("param",i).getAttribute("name"),"power_gating_vcc")==0) {sys.power_gating_vcc=atof(xNode2.getChildNode("param",i).getAttribute("value"));continue;}
 
 
 	}
@@ -140,8 +704,7 @@ void ParseXML::parse(char* filepath)
 	itmp=xNode2.nChildNode("stat");
 	for(i=0; i<itmp; i++)
 	{
-		if (strcmp(xNode2.getChildNode("stat",i).getAttribute("name"),"total_cycles")==0) {sys.total_cycles=atof(xNode2.getChildNode("stat",i).getAttribute("value"));continue;}
-
+		read_field(system_stats, &sys, xNode2, "stat", i);
 	}
 
 	//get the number of components within the second layer
@@ -168,33 +731,13 @@ void ParseXML::parse(char* filepath)
 			else{
 				if (strstr(xNode3.getAttribute("name"),"core")!=NULL)
 				{
+					core_signature[i]=param_signature(xNode3);
 					{ //For cpu0-cpui
 						//Get all params with system.core?
 						itmp=xNode3.nChildNode("param");
 						for(k=0; k<itmp; k++)
 						{
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"clock_rate")==0) {sys.core[i].clock_rate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"opt_local")==0) {sys.core[i].opt_local=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"x86")==0) {sys.core[i].x86=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"machine_bits")==0) {sys.core[i].machine_bits=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"virtual_address_width")==0) {sys.core[i].virtual_address_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"physical_address_width")==0) {sys.core[i].physical_address_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"instruction_length")==0) {sys.core[i].instruction_length=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"opcode_width")==0) {sys.core[i].opcode_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"micro_opcode_width")==0) {sys.core[i].micro_opcode_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"machine_type")==0) {sys.core[i].machine_type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"internal_datapath_width")==0) {sys.core[i].internal_datapath_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"number_hardware_threads")==0) {sys.core[i].number_hardware_threads=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"fetch_width")==0) {sys.core[i].fetch_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"number_instruction_fetch_ports")==0) {sys.core[i].number_instruction_fetch_ports=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"decode_width")==0) {sys.core[i].decode_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"issue_width")==0) {sys.core[i].issue_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"peak_issue_width")==0) {sys.core[i].peak_issue_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"commit_width")==0) {sys.core[i].commit_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"fp_issue_width")==0) {sys.core[i].fp_issue_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"prediction_width")==0) {sys.core[i].prediction_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.core[i].vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.core[i].power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
+							if (read_field(core_params, &sys.core[i], xNode3, "param", k)) continue;
 
 							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"pipelines_per_core")==0)
 							{
@@ -241,107 +784,12 @@ void ParseXML::parse(char* filepath)
 								continue;
 							}
 
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"FPU")==0) {strcpy(sys.core[i].FPU,xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"divider_multiplier")==0) {strcpy(sys.core[i].divider_multiplier,xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"ALU_per_core")==0) {sys.core[i].ALU_per_core=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"FPU_per_core")==0) {sys.core[i].FPU_per_core=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"MUL_per_core")==0) {sys.core[i].MUL_per_core=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"instruction_buffer_size")==0) {sys.core[i].instruction_buffer_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"decoded_stream_buffer_size")==0) {sys.core[i].decoded_stream_buffer_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"instruction_window_scheme")==0) {sys.core[i].instruction_window_scheme  =atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"instruction_window_size")==0) {sys.core[i].instruction_window_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"fp_instruction_window_size")==0) {sys.core[i].fp_instruction_window_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"ROB_size")==0) {sys.core[i].ROB_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"archi_Regs_IRF_size")==0) {sys.core[i].archi_Regs_IRF_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"archi_Regs_FRF_size")==0) {sys.core[i].archi_Regs_FRF_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"phy_Regs_IRF_size")==0) {sys.core[i].phy_Regs_IRF_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"phy_Regs_FRF_size")==0) {sys.core[i].phy_Regs_FRF_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"rename_scheme")==0) {sys.core[i].rename_scheme=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"register_windows_size")==0) {sys.core[i].register_windows_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"LSU_order")==0) {strcpy(sys.core[i].LSU_order,xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"store_buffer_size")==0) {sys.core[i].store_buffer_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"load_buffer_size")==0) {sys.core[i].load_buffer_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"memory_ports")==0) {sys.core[i].memory_ports=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"Dcache_dual_pump")==0) {strcpy(sys.core[i].Dcache_dual_pump,xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"RAS_size")==0) {sys.core[i].RAS_size=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 						}
 						//Get all stats with system.core?
 						itmp=xNode3.nChildNode("stat");
 						for(k=0; k<itmp; k++)
 						{
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_instructions")==0) {sys.core[i].total_instructions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"int_instructions")==0) {sys.core[i].int_instructions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"fp_instructions")==0) {sys.core[i].fp_instructions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"branch_instructions")==0) {sys.core[i].branch_instructions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"branch_mispredictions")==0) {sys.core[i].branch_mispredictions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"committed_instructions")==0) {sys.core[i].committed_instructions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"committed_int_instructions")==0) {sys.core[i].committed_int_instructions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"committed_fp_instructions")==0) {sys.core[i].committed_fp_instructions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"load_instructions")==0) {sys.core[i].load_instructions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"store_instructions")==0) {sys.core[i].store_instructions=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_cycles")==0) {sys.core[i].total_cycles=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"idle_cycles")==0) {sys.core[i].idle_cycles=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"busy_cycles")==0) {sys.core[i].busy_cycles=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"instruction_buffer_reads")==0) {sys.core[i].instruction_buffer_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"instruction_buffer_write")==0) {sys.core[i].instruction_buffer_write=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"ROB_reads")==0) {sys.core[i].ROB_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"ROB_writes")==0) {sys.core[i].ROB_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"rename_reads")==0) {sys.core[i].rename_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"rename_writes")==0) {sys.core[i].rename_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"fp_rename_reads")==0) {sys.core[i].fp_rename_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"fp_rename_writes")==0) {sys.core[i].fp_rename_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"inst_window_reads")==0) {sys.core[i].inst_window_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"inst_window_writes")==0) {sys.core[i].inst_window_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"inst_window_wakeup_accesses")==0) {sys.core[i].inst_window_wakeup_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"inst_window_selections")==0) {sys.core[i].inst_window_selections=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"fp_inst_window_reads")==0) {sys.core[i].fp_inst_window_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"fp_inst_window_writes")==0) {sys.core[i].fp_inst_window_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"fp_inst_window_wakeup_accesses")==0) {sys.core[i].fp_inst_window_wakeup_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"archi_int_regfile_reads")==0) {sys.core[i].archi_int_regfile_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"archi_float_regfile_reads")==0) {sys.core[i].archi_float_regfile_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"phy_int_regfile_reads")==0) {sys.core[i].phy_int_regfile_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"phy_float_regfile_reads")==0) {sys.core[i].phy_float_regfile_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"phy_int_regfile_writes")==0) {sys.core[i].archi_int_regfile_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"phy_float_regfile_writes")==0) {sys.core[i].archi_float_regfile_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"archi_int_regfile_writes")==0) {sys.core[i].phy_int_regfile_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"archi_float_regfile_writes")==0) {sys.core[i].phy_float_regfile_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"int_regfile_reads")==0) {sys.core[i].int_regfile_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"float_regfile_reads")==0) {sys.core[i].float_regfile_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"int_regfile_writes")==0) {sys.core[i].int_regfile_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"float_regfile_writes")==0) {sys.core[i].float_regfile_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"windowed_reg_accesses")==0) {sys.core[i].windowed_reg_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"windowed_reg_transports")==0) {sys.core[i].windowed_reg_transports=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"function_calls")==0) {sys.core[i].function_calls=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"context_switches")==0) {sys.core[i].context_switches=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"ialu_accesses")==0) {sys.core[i].ialu_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"fpu_accesses")==0) {sys.core[i].fpu_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"mul_accesses")==0) {sys.core[i].mul_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"cdb_alu_accesses")==0) {sys.core[i].cdb_alu_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"cdb_mul_accesses")==0) {sys.core[i].cdb_mul_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"cdb_fpu_accesses")==0) {sys.core[i].cdb_fpu_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"load_buffer_reads")==0) {sys.core[i].load_buffer_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"load_buffer_writes")==0) {sys.core[i].load_buffer_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"load_buffer_cams")==0) {sys.core[i].load_buffer_cams=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"store_buffer_reads")==0) {sys.core[i].store_buffer_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"store_buffer_writes")==0) {sys.core[i].store_buffer_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"store_buffer_cams")==0) {sys.core[i].store_buffer_cams=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"store_buffer_forwards")==0) {sys.core[i].store_buffer_forwards=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"main_memory_access")==0) {sys.core[i].main_memory_access=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"main_memory_read")==0) {sys.core[i].main_memory_read=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"main_memory_write")==0) {sys.core[i].main_memory_write=atoi(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"pipeline_duty_cycle")==0) {sys.core[i].pipeline_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"IFU_duty_cycle")==0) {sys.core[i].IFU_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"BR_duty_cycle")==0) {sys.core[i].BR_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"LSU_duty_cycle")==0) {sys.core[i].LSU_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"MemManU_I_duty_cycle")==0) {sys.core[i].MemManU_I_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"MemManU_D_duty_cycle")==0) {sys.core[i].MemManU_D_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"ALU_duty_cycle")==0) {sys.core[i].ALU_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"MUL_duty_cycle")==0) {sys.core[i].MUL_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"FPU_duty_cycle")==0) {sys.core[i].FPU_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"ALU_cdb_duty_cycle")==0) {sys.core[i].ALU_cdb_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"MUL_cdb_duty_cycle")==0) {sys.core[i].MUL_cdb_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"FPU_cdb_duty_cycle")==0) {sys.core[i].FPU_cdb_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
+							read_field(core_stats, &sys.core[i], xNode3, "stat", k);
 						}
 					}
 
@@ -354,10 +802,7 @@ void ParseXML::parse(char* filepath)
 							itmp=xNode4.nChildNode("param");
 							for(k=0; k<itmp; k++)
 							{ //get all items of param in system.core0.predictor--PBT
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"prediction_width")==0) {sys.core[i].predictor.prediction_width=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"prediction_scheme")==0) {strcpy(sys.core[i].predictor.prediction_scheme,xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"predictor_size")==0) {sys.core[i].predictor.predictor_size=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"predictor_entries")==0) {sys.core[i].predictor.predictor_entries=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
+								if (read_field(predictor_params, &sys.core[i].predictor, xNode4, "param", k)) continue;
 								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"local_predictor_size")==0)
 								{
 									strtmp.assign(xNode4.getChildNode("param",k).getAttribute("value"));
@@ -380,16 +825,11 @@ void ParseXML::parse(char* filepath)
 									chtmp1[0]='\0';
 									continue;
 								}
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"local_predictor_entries")==0) {sys.core[i].predictor.local_predictor_entries=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"global_predictor_entries")==0) {sys.core[i].predictor.global_predictor_entries=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"global_predictor_bits")==0) {sys.core[i].predictor.global_predictor_bits=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"chooser_predictor_entries")==0) {sys.core[i].predictor.chooser_predictor_entries=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"chooser_predictor_bits")==0) {sys.core[i].predictor.chooser_predictor_bits=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
 							}
 							itmp=xNode4.nChildNode("stat");
 							for(k=0; k<itmp; k++)
 							{ //get all items of stat in system.core0.predictor--PBT
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"predictor_accesses")==0) sys.core[i].predictor.predictor_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));
+								read_field(predictor_stats, &sys.core[i].predictor, xNode4, "stat", k);
 							}
 						}
 						if (strcmp(xNode4.getAttribute("name"),"itlb")==0)
@@ -397,15 +837,12 @@ void ParseXML::parse(char* filepath)
 							itmp=xNode4.nChildNode("param");
 							for(k=0; k<itmp; k++)
 							{ //get all items of param in system.core0.itlb--itlb
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"number_entries")==0) sys.core[i].itlb.number_entries=atoi(xNode4.getChildNode("param",k).getAttribute("value"));
+								read_field(itlb_params, &sys.core[i].itlb, xNode4, "param", k);
 							}
 							itmp=xNode4.nChildNode("stat");
 							for(k=0; k<itmp; k++)
 							{ //get all items of stat in itlb
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_hits")==0) {sys.core[i].itlb.total_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) {sys.core[i].itlb.total_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_misses")==0) {sys.core[i].itlb.total_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"conflicts")==0) {sys.core[i].itlb.conflicts=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
+								read_field(itlb_stats, &sys.core[i].itlb, xNode4, "stat", k);
 							}
 						}
 						if (strcmp(xNode4.getAttribute("name"),"icache")==0)
@@ -460,20 +897,7 @@ void ParseXML::parse(char* filepath)
 							itmp=xNode4.nChildNode("stat");
 							for(k=0; k<itmp; k++)
 							{
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) {sys.core[i].icache.total_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_accesses")==0) {sys.core[i].icache.read_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_misses")==0) {sys.core[i].icache.read_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"replacements")==0) {sys.core[i].icache.replacements=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_hits")==0) {sys.core[i].icache.read_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_hits")==0) {sys.core[i].icache.total_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_misses")==0) {sys.core[i].icache.total_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"miss_buffer_access")==0) {sys.core[i].icache.miss_buffer_access=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"fill_buffer_accesses")==0) {sys.core[i].icache.fill_buffer_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_accesses")==0) {sys.core[i].icache.prefetch_buffer_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_writes")==0) {sys.core[i].icache.prefetch_buffer_writes=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_reads")==0) {sys.core[i].icache.prefetch_buffer_reads=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_hits")==0) {sys.core[i].icache.prefetch_buffer_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"conflicts")==0) {sys.core[i].icache.conflicts=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
+								read_field(icache_stats, &sys.core[i].icache, xNode4, "stat", k);
 							}
 						}
 						if (strcmp(xNode4.getAttribute("name"),"dtlb")==0)
@@ -481,22 +905,12 @@ void ParseXML::parse(char* filepath)
 							itmp=xNode4.nChildNode("param");
 							for(k=0; k<itmp; k++)
 							{ //get all items of param in system.core0.dtlb--dtlb
-								if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"number_entries")==0) sys.core[i].dtlb.number_entries=atoi(xNode4.getChildNode("param",k).getAttribute("value"));
+								read_field(dtlb_params, &sys.core[i].dtlb, xNode4, "param", k);
 							}
 							itmp=xNode4.nChildNode("stat");
 							for(k=0; k<itmp; k++)
 							{ //get all items of stat in dtlb
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) {sys.core[i].dtlb.total_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_accesses")==0) {sys.core[i].dtlb.read_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_accesses")==0) {sys.core[i].dtlb.write_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_hits")==0) {sys.core[i].dtlb.read_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_hits")==0) {sys.core[i].dtlb.write_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_misses")==0) {sys.core[i].dtlb.read_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_misses")==0) {sys.core[i].dtlb.write_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_hits")==0) {sys.core[i].dtlb.total_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_misses")==0) {sys.core[i].dtlb.total_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"conflicts")==0) {sys.core[i].dtlb.conflicts=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-
+								read_field(dtlb_stats, &sys.core[i].dtlb, xNode4, "stat", k);
 							}
 						}
 						if (strcmp(xNode4.getAttribute("name"),"dcache")==0)
@@ -551,27 +965,7 @@ void ParseXML::parse(char* filepath)
 							itmp=xNode4.nChildNode("stat");
 							for(k=0; k<itmp; k++)
 							{ //get all items of stat in dcache
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) {sys.core[i].dcache.total_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_accesses")==0) {sys.core[i].dcache.read_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_accesses")==0) {sys.core[i].dcache.write_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_hits")==0) {sys.core[i].dcache.total_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_misses")==0) {sys.core[i].dcache.total_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_hits")==0) {sys.core[i].dcache.read_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_hits")==0) {sys.core[i].dcache.write_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_misses")==0) {sys.core[i].dcache.read_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_misses")==0) {sys.core[i].dcache.write_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"replacements")==0) {sys.core[i].dcache.replacements=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_backs")==0) {sys.core[i].dcache.write_backs=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"miss_buffer_access")==0) {sys.core[i].dcache.miss_buffer_access=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"fill_buffer_accesses")==0) {sys.core[i].dcache.fill_buffer_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_accesses")==0) {sys.core[i].dcache.prefetch_buffer_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_writes")==0) {sys.core[i].dcache.prefetch_buffer_writes=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_reads")==0) {sys.core[i].dcache.prefetch_buffer_reads=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_hits")==0) {sys.core[i].dcache.prefetch_buffer_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"wbb_writes")==0) {sys.core[i].dcache.wbb_writes=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"wbb_reads")==0) {sys.core[i].dcache.wbb_reads=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"conflicts")==0) {sys.core[i].dcache.conflicts=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-
+								read_field(dcache_stats, &sys.core[i].dcache, xNode4, "stat", k);
 							}
 						}
 						if (strcmp(xNode4.getAttribute("name"),"BTB")==0)
@@ -604,16 +998,7 @@ void ParseXML::parse(char* filepath)
 							itmp=xNode4.nChildNode("stat");
 							for(k=0; k<itmp; k++)
 							{ //get all items of stat in BTB
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) {sys.core[i].BTB.total_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_accesses")==0) {sys.core[i].BTB.read_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_accesses")==0) {sys.core[i].BTB.write_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_hits")==0) {sys.core[i].BTB.total_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"total_misses")==0) {sys.core[i].BTB.total_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_hits")==0) {sys.core[i].BTB.read_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_hits")==0) {sys.core[i].BTB.write_hits=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"read_misses")==0) {sys.core[i].BTB.read_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"write_misses")==0) {sys.core[i].BTB.write_misses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
-								if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"replacements")==0) {sys.core[i].BTB.replacements=atof(xNode4.getChildNode("stat",k).getAttribute("value"));continue;}
+								read_field(BTB_stats, &sys.core[i].BTB, xNode4, "stat", k);
 							}
 						}
 					}
@@ -646,6 +1031,7 @@ void ParseXML::parse(char* filepath)
 					itmp=xNode3.nChildNode("param");
 					for(k=0; k<itmp; k++)
 					{ //get all items of param in system.L1Directory
+						if (read_field(L1Directory_params, &sys.L1Directory[i], xNode3, "param", k)) continue;
 						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"Dir_config")==0)
 						{
 							strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -691,9 +1077,6 @@ void ParseXML::parse(char* filepath)
 							continue;
 						}
 
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"clockrate")==0) {sys.L1Directory[i].clockrate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.L1Directory[i].vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.L1Directory[i].power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 
 						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"ports")==0)
 						{
@@ -717,20 +1100,11 @@ void ParseXML::parse(char* filepath)
 							chtmp1[0]='\0';
 							continue;
 						}
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"device_type")==0) {sys.L1Directory[i].device_type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"Directory_type")==0) {sys.L1Directory[i].Directory_type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"3D_stack")==0) {strcpy(sys.L1Directory[i].threeD_stack,xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 					}
 					itmp=xNode3.nChildNode("stat");
 					for(k=0; k<itmp; k++)
 					{ //get all items of stat in system.L2directorydirectory
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) {sys.L1Directory[i].total_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_accesses")==0) {sys.L1Directory[i].read_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_accesses")==0) {sys.L1Directory[i].write_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_misses")==0) {sys.L1Directory[i].read_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_misses")==0) {sys.L1Directory[i].write_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"conflicts")==0) {sys.L1Directory[i].conflicts=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"duty_cycle")==0) {sys.L1Directory[i].duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
+						read_field(L1Directory_stats, &sys.L1Directory[i], xNode3, "stat", k);
 					}
 					w=w+1;
 				}
@@ -761,6 +1135,7 @@ void ParseXML::parse(char* filepath)
 					itmp=xNode3.nChildNode("param");
 					for(k=0; k<itmp; k++)
 					{ //get all items of param in system.L2Directory
+						if (read_field(L2Directory_params, &sys.L2Directory[i], xNode3, "param", k)) continue;
 						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"Dir_config")==0)
 						{
 							strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -806,11 +1181,7 @@ void ParseXML::parse(char* filepath)
 							continue;
 						}
 
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"clockrate")==0) {sys.L2Directory[i].clockrate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.L2Directory[i].vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.L2Directory[i].power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"Directory_type")==0) {sys.L2Directory[i].Directory_type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"ports")==0)
 						{
 							strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -833,20 +1204,11 @@ void ParseXML::parse(char* filepath)
 							chtmp1[0]='\0';
 							continue;
 						}
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"device_type")==0) {sys.L2Directory[i].device_type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"3D_stack")==0) {strcpy(sys.L2Directory[i].threeD_stack,xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 					}
 					itmp=xNode3.nChildNode("stat");
 					for(k=0; k<itmp; k++)
 					{ //get all items of stat in system.L2directorydirectory
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) {sys.L2Directory[i].total_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_accesses")==0) {sys.L2Directory[i].read_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_accesses")==0) {sys.L2Directory[i].write_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_misses")==0) {sys.L2Directory[i].read_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-     					if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_misses")==0) {sys.L2Directory[i].write_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"conflicts")==0) {sys.L2Directory[i].conflicts=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-						if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"duty_cycle")==0) {sys.L2Directory[i].duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-
+						read_field(L2Directory_stats, &sys.L2Directory[i], xNode3, "stat", k);
 					}
 					w=w+1;
 				}
@@ -874,11 +1236,13 @@ void ParseXML::parse(char* filepath)
 			{
 				if (strstr(xNode3.getAttribute("name"),"L2")!=NULL)
 				{
+					L2_signature[i]=param_signature(xNode3);
 					{ //For L20-L2i
 						//Get all params with system.L2?
 						itmp=xNode3.nChildNode("param");
 						for(k=0; k<itmp; k++)
 						{
+							if (read_field(L2_params, &sys.L2[i], xNode3, "param", k)) continue;
 							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"L2_config")==0)
 							{
 								strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -901,11 +1265,7 @@ void ParseXML::parse(char* filepath)
 								chtmp1[0]='\0';
 								continue;
 							}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"clockrate")==0) {sys.L2[i].clockrate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.L2[i].vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.L2[i].power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"merged_dir")==0) {sys.L2[i].merged_dir=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"ports")==0)
 							{
 								strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -928,8 +1288,6 @@ void ParseXML::parse(char* filepath)
 								chtmp1[0]='\0';
 								continue;
 							}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"device_type")==0) {sys.L2[i].device_type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"threeD_stack")==0) {strcpy(sys.L2[i].threeD_stack,(xNode3.getChildNode("param",k).getAttribute("value")));continue;}
 							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"buffer_sizes")==0)
 							{
 								strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -957,36 +1315,7 @@ void ParseXML::parse(char* filepath)
 						itmp=xNode3.nChildNode("stat");
 						for(k=0; k<itmp; k++)
 						{
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) {sys.L2[i].total_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_accesses")==0) {sys.L2[i].read_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_accesses")==0) {sys.L2[i].write_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_hits")==0) {sys.L2[i].total_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_misses")==0) {sys.L2[i].total_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_hits")==0) {sys.L2[i].read_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_hits")==0) {sys.L2[i].write_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_misses")==0) {sys.L2[i].read_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_misses")==0) {sys.L2[i].write_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"replacements")==0) {sys.L2[i].replacements=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_backs")==0) {sys.L2[i].write_backs=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"miss_buffer_accesses")==0) {sys.L2[i].miss_buffer_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"fill_buffer_accesses")==0) {sys.L2[i].fill_buffer_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_accesses")==0) {sys.L2[i].prefetch_buffer_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_writes")==0) {sys.L2[i].prefetch_buffer_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_reads")==0) {sys.L2[i].prefetch_buffer_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_hits")==0) {sys.L2[i].prefetch_buffer_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"wbb_writes")==0) {sys.L2[i].wbb_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"wbb_reads")==0) {sys.L2[i].wbb_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"conflicts")==0) {sys.L2[i].conflicts=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"duty_cycle")==0) {sys.L2[i].duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_read_accesses")==0) {sys.L2[i].homenode_read_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_read_accesses")==0) {sys.L2[i].homenode_read_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_read_hits")==0) {sys.L2[i].homenode_read_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_write_hits")==0) {sys.L2[i].homenode_write_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_read_misses")==0) {sys.L2[i].homenode_read_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_write_misses")==0) {sys.L2[i].homenode_write_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"dir_duty_cycle")==0) {sys.L2[i].dir_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-
+							read_field(L2_stats, &sys.L2[i], xNode3, "stat", k);
 						}
 					}
 					w=w+1;
@@ -1019,6 +1348,7 @@ void ParseXML::parse(char* filepath)
 						itmp=xNode3.nChildNode("param");
 						for(k=0; k<itmp; k++)
 						{
+							if (read_field(L3_params, &sys.L3[i], xNode3, "param", k)) continue;
 							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"L3_config")==0)
 							{
 								strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -1041,10 +1371,6 @@ void ParseXML::parse(char* filepath)
 								chtmp1[0]='\0';
 								continue;
 							}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"clockrate")==0) {sys.L3[i].clockrate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.L3[i].vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.L3[i].power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"merged_dir")==0) {sys.L3[i].merged_dir=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"ports")==0)
 							{
 								strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -1067,8 +1393,6 @@ void ParseXML::parse(char* filepath)
 								chtmp1[0]='\0';
 								continue;
 							}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"device_type")==0) {sys.L3[i].device_type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"threeD_stack")==0) {strcpy(sys.L3[i].threeD_stack,(xNode3.getChildNode("param",k).getAttribute("value")));continue;}
 							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"buffer_sizes")==0)
 							{
 								strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -1096,36 +1420,7 @@ void ParseXML::parse(char* filepath)
 						itmp=xNode3.nChildNode("stat");
 						for(k=0; k<itmp; k++)
 						{
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) {sys.L3[i].total_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_accesses")==0) {sys.L3[i].read_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_accesses")==0) {sys.L3[i].write_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_hits")==0) {sys.L3[i].total_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_misses")==0) {sys.L3[i].total_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_hits")==0) {sys.L3[i].read_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_hits")==0) {sys.L3[i].write_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"read_misses")==0) {sys.L3[i].read_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_misses")==0) {sys.L3[i].write_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"replacements")==0) {sys.L3[i].replacements=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"write_backs")==0) {sys.L3[i].write_backs=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"miss_buffer_accesses")==0) {sys.L3[i].miss_buffer_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"fill_buffer_accesses")==0) {sys.L3[i].fill_buffer_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_accesses")==0) {sys.L3[i].prefetch_buffer_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_writes")==0) {sys.L3[i].prefetch_buffer_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_reads")==0) {sys.L3[i].prefetch_buffer_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"prefetch_buffer_hits")==0) {sys.L3[i].prefetch_buffer_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"wbb_writes")==0) {sys.L3[i].wbb_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"wbb_reads")==0) {sys.L3[i].wbb_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"conflicts")==0) {sys.L3[i].conflicts=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"duty_cycle")==0) {sys.L3[i].duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_read_accesses")==0) {sys.L3[i].homenode_read_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_read_accesses")==0) {sys.L3[i].homenode_read_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_read_hits")==0) {sys.L3[i].homenode_read_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_write_hits")==0) {sys.L3[i].homenode_write_hits=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_read_misses")==0) {sys.L3[i].homenode_read_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"homenode_write_misses")==0) {sys.L3[i].homenode_write_misses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"dir_duty_cycle")==0) {sys.L3[i].dir_duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-
+							read_field(L3_stats, &sys.L3[i], xNode3, "stat", k);
 						}
 					}
 					w=w+1;
@@ -1158,24 +1453,7 @@ void ParseXML::parse(char* filepath)
 						itmp=xNode3.nChildNode("param");
 						for(k=0; k<itmp; k++)
 						{
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"clockrate")==0) {sys.NoC[i].clockrate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"type")==0) {sys.NoC[i].type=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.NoC[i].vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.NoC[i].power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"topology")==0) {strcpy(sys.NoC[i].topology,(xNode3.getChildNode("param",k).getAttribute("value")));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"horizontal_nodes")==0) {sys.NoC[i].horizontal_nodes=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vertical_nodes")==0) {sys.NoC[i].vertical_nodes=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"has_global_link")==0) {sys.NoC[i].has_global_link=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"link_throughput")==0) {sys.NoC[i].link_throughput=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"link_latency")==0) {sys.NoC[i].link_latency=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"input_ports")==0) {sys.NoC[i].input_ports=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"output_ports")==0) {sys.NoC[i].output_ports=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"virtual_channel_per_port")==0) {sys.NoC[i].virtual_channel_per_port=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"flit_bits")==0) {sys.NoC[i].flit_bits=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"input_buffer_entries_per_vc")==0) {sys.NoC[i].input_buffer_entries_per_vc=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"dual_pump")==0) {sys.NoC[i].dual_pump=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"chip_coverage")==0) {sys.NoC[i].chip_coverage=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"link_routing_over_percentage")==0) {sys.NoC[i].route_over_perc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
+							if (read_field(NoC_params, &sys.NoC[i], xNode3, "param", k)) continue;
 							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"ports_of_input_buffer")==0)
 							{
 								strtmp.assign(xNode3.getChildNode("param",k).getAttribute("value"));
@@ -1198,10 +1476,6 @@ void ParseXML::parse(char* filepath)
 								chtmp1[0]='\0';
 								continue;
 							}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"number_of_crossbars")==0) {sys.NoC[i].number_of_crossbars=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"crossbar_type")==0) {strcpy(sys.NoC[i].crossbar_type,(xNode3.getChildNode("param",k).getAttribute("value")));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"crosspoint_type")==0) {strcpy(sys.NoC[i].crosspoint_type,(xNode3.getChildNode("param",k).getAttribute("value")));continue;}
-							if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"arbiter_type")==0) {sys.NoC[i].arbiter_type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 						}
 						NumofCom_4=xNode3.nChildNode("component"); //get the number of components within the third layer
 						for(j=0; j<NumofCom_4; j++)
@@ -1212,10 +1486,7 @@ void ParseXML::parse(char* filepath)
 								itmp=xNode4.nChildNode("param");
 								for(k=0; k<itmp; k++)
 								{ //get all items of param in system.XoC0.xbar0--xbar0
-									if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"number_of_inputs_of_crossbars")==0) {sys.NoC[i].xbar0.number_of_inputs_of_crossbars=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-									if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"number_of_outputs_of_crossbars")==0) {sys.NoC[i].xbar0.number_of_outputs_of_crossbars=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-									if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"flit_bits")==0) {sys.NoC[i].xbar0.flit_bits=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
-									if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"input_buffer_entries_per_port")==0) {sys.NoC[i].xbar0.input_buffer_entries_per_port=atoi(xNode4.getChildNode("param",k).getAttribute("value"));continue;}
+									if (read_field(xbar0_params, &sys.NoC[i].xbar0, xNode4, "param", k)) continue;
 									if (strcmp(xNode4.getChildNode("param",k).getAttribute("name"),"ports_of_input_buffer")==0)
 									{
 										strtmp.assign(xNode4.getChildNode("param",k).getAttribute("value"));
@@ -1241,7 +1512,8 @@ void ParseXML::parse(char* filepath)
 								itmp=xNode4.nChildNode("stat");
 								for(k=0; k<itmp; k++)
 								{ //get all items of stat in system.core0.predictor--PBT
-									if (strcmp(xNode4.getChildNode("stat",k).getAttribute("name"),"predictor_accesses")==0) sys.core[i].predictor.predictor_accesses=atof(xNode4.getChildNode("stat",k).getAttribute("value"));
+									//sic, the stats of xbar0 go to the predictor of core i like they always did
+									read_field(predictor_stats, &sys.core[i].predictor, xNode4, "stat", k);
 								}
 							}
 						}
@@ -1249,8 +1521,7 @@ void ParseXML::parse(char* filepath)
 						itmp=xNode3.nChildNode("stat");
 						for(k=0; k<itmp; k++)
 						{
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_accesses")==0) sys.NoC[i].total_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));
-							if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"duty_cycle")==0) sys.NoC[i].duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));
+							read_field(NoC_stats, &sys.NoC[i], xNode3, "stat", k);
 						}
 					}
 					w=w+1;
@@ -1306,29 +1577,12 @@ void ParseXML::parse(char* filepath)
 			itmp=xNode3.nChildNode("param");
 			for(k=0; k<itmp; k++)
 			{ //get all items of param in system.mem
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"mc_clock")==0) {sys.mc.mc_clock=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.mc.vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.mc.power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"block_size")==0) {sys.mc.llc_line_length=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"number_mcs")==0) {sys.mc.number_mcs=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"memory_channels_per_mc")==0) {sys.mc.memory_channels_per_mc=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"req_window_size_per_channel")==0) {sys.mc.req_window_size_per_channel=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"IO_buffer_size_per_channel")==0) {sys.mc.IO_buffer_size_per_channel=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"databus_width")==0) {sys.mc.databus_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"addressbus_width")==0) {sys.mc.addressbus_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"peak_transfer_rate")==0) {sys.mc.peak_transfer_rate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"number_ranks")==0) {sys.mc.number_ranks=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"LVDS")==0) {sys.mc.LVDS=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"type")==0) {sys.mc.type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"withPHY")==0) {sys.mc.withPHY=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-
+				read_field(mc_params, &sys.mc, xNode3, "param", k);
 			}
 			itmp=xNode3.nChildNode("stat");
 			for(k=0; k<itmp; k++)
 			{ //get all items of stat in system.mendirectory
-				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"memory_accesses")==0) {sys.mc.memory_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"memory_reads")==0) {sys.mc.memory_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"memory_writes")==0) {sys.mc.memory_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
+				read_field(mc_stats, &sys.mc, xNode3, "stat", k);
 			}
 		}
 		else{
@@ -1347,18 +1601,12 @@ void ParseXML::parse(char* filepath)
 			itmp=xNode3.nChildNode("param");
 			for(k=0; k<itmp; k++)
 			{ //get all items of param in system.mem
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"clockrate")==0) {sys.niu.clockrate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"number_units")==0) {sys.niu.number_units=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"type")==0) {sys.niu.type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.niu.vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.niu.power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-
+				read_field(niu_params, &sys.niu, xNode3, "param", k);
 			}
 			itmp=xNode3.nChildNode("stat");
 			for(k=0; k<itmp; k++)
 			{ //get all items of stat in system.mendirectory
-				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"duty_cycle")==0) {sys.niu.duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_load_perc")==0) {sys.niu.total_load_perc=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
+				read_field(niu_stats, &sys.niu, xNode3, "stat", k);
 			}
 		}
 		else{
@@ -1378,20 +1626,12 @@ void ParseXML::parse(char* filepath)
 			itmp=xNode3.nChildNode("param");
 			for(k=0; k<itmp; k++)
 			{ //get all items of param in system.mem
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"clockrate")==0) {sys.pcie.clockrate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"number_units")==0) {sys.pcie.number_units=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"num_channels")==0) {sys.pcie.num_channels=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"type")==0) {sys.pcie.type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.pcie.vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.pcie.power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"withPHY")==0) {sys.pcie.withPHY=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-
+				read_field(pcie_params, &sys.pcie, xNode3, "param", k);
 			}
 			itmp=xNode3.nChildNode("stat");
 			for(k=0; k<itmp; k++)
 			{ //get all items of stat in system.mendirectory
-				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"duty_cycle")==0) {sys.pcie.duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_load_perc")==0) {sys.pcie.total_load_perc=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
+				read_field(pcie_stats, &sys.pcie, xNode3, "stat", k);
 			}
 		}
 		else{
@@ -1410,31 +1650,25 @@ void ParseXML::parse(char* filepath)
 			itmp=xNode3.nChildNode("param");
 			for(k=0; k<itmp; k++)
 			{ //get all items of param in system.mem
+				if (read_field(flashc_params, &sys.flashc, xNode3, "param", k)) continue;
 //				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"flashc_clock")==0) {sys.flashc.mc_clock=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"block_size")==0) {sys.flashc.llc_line_length=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"number_flashcs")==0) {sys.flashc.number_mcs=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"vdd")==0) {sys.flashc.vdd=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"power_gating_vcc")==0) {sys.flashc.power_gating_vcc=atof(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"memory_channels_per_flashc")==0) {sys.flashc.memory_channels_per_mc=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"req_window_size_per_channel")==0) {sys.flashc.req_window_size_per_channel=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"IO_buffer_size_per_channel")==0) {sys.flashc.IO_buffer_size_per_channel=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"databus_width")==0) {sys.flashc.databus_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"addressbus_width")==0) {sys.flashc.addressbus_width=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"peak_transfer_rate")==0) {sys.flashc.peak_transfer_rate=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"number_ranks")==0) {sys.flashc.number_ranks=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"LVDS")==0) {sys.flashc.LVDS=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"type")==0) {sys.flashc.type=atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("param",k).getAttribute("name"),"withPHY")==0) {sys.flashc.withPHY=(bool)atoi(xNode3.getChildNode("param",k).getAttribute("value"));continue;}
 
 			}
 			itmp=xNode3.nChildNode("stat");
 			for(k=0; k<itmp; k++)
 			{ //get all items of stat in system.mendirectory
+				if (read_field(flashc_stats, &sys.flashc, xNode3, "stat", k)) continue;
 //				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"memory_accesses")==0) {sys.flashc.memory_accesses=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"memory_reads")==0) {sys.flashc.memory_reads=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
 //				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"memory_writes")==0) {sys.flashc.memory_writes=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"duty_cycle")==0) {sys.flashc.duty_cycle=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
-				if (strcmp(xNode3.getChildNode("stat",k).getAttribute("name"),"total_load_perc")==0) {sys.flashc.total_load_perc=atof(xNode3.getChildNode("stat",k).getAttribute("value"));continue;}
 
 			}
 		}
@@ -40,7 +40,10 @@
 #include <stdio.h>
 #include "xmlParser.h"
 #include <string.h>
+#include <stddef.h>
 #include <iostream>
+#include <string>
+#include <vector>
 using namespace std;
 
 /*
@@ -596,13 +599,52 @@ typedef struct{
 	system_pcie pcie;
 } root_system;
 
+//how a param or stat is read into its field
+enum field_type { FIELD_INT, FIELD_DOUBLE, FIELD_BOOL, FIELD_STRING };
+enum field_read { READ_ATOI, READ_ATOF, READ_BOOL, READ_STRING };
+
+//a param or stat of a component and its field in the struct of the component
+typedef struct{
+	const char * name;
+	size_t offset;
+	char type;
+	char read;
+} XMLField;
+
+//a value that parse() read into the field at offset in sys, from the
+//param or stat slot "<component id>/<param|stat>/<name>" of the input
+struct XMLWrite
+{
+	string slot;
+	string value;
+	size_t offset;
+	char type;
+	char read;
+	XMLWrite(const string & slot_, const char * value_, size_t offset_, char type_, char read_)
+	:slot(slot_), value(value_ ? value_ : ""), offset(offset_), type(type_), read(read_) {}
+};
+
 class ParseXML
 {
 public:
+	//sys starts zeroed, as it did when ParseXML had no constructor
+	ParseXML():writes(NULL) { memset(&sys, 0, sizeof(sys)); }
 	void parse(char* filepath);
+	void parse(XMLNode xMainNode);
     void initialize();
+	//sets the field at offset in sys as parse() would from value
+	void set_field(size_t offset, char type, char read, const char * value);
 public:
 	root_system sys;
+	//if set, parse() appends the values it reads into sys through the tables
+	//of XML_Parse.cc, in the order it reads them
+	vector<XMLWrite> * writes;
+	//the params of each core and L2 and of their subcomponents,
+	//cores and L2s with the same signature have the same hardware
+	string core_signature[MAX_NUM_CORES];
+	string L2_signature[MAX_NUM_CORES];
+private:
+	bool read_field(const XMLField * fields, void * base, XMLNode xNode, const char * kind, int k);
 };
 
 
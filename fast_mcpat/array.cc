@@ -34,9 +34,12 @@
 #include "decoder.h"
 #include "parameter.h"
 #include "array.h"
+#include "io.h"
 #include <iostream>
 #include <math.h>
 #include <assert.h>
+#include <stddef.h>
+#include <string.h>
 #include "globalvar.h"
 
 using namespace std;
@@ -52,14 +55,119 @@ ArrayST::ArrayST(const InputParameter *configure_interface,
  device_ty(device_ty_),
  opt_local(opt_local_),
  core_ty(core_ty_),
- is_default(_is_default)
+ is_default(_is_default),
+ throughput_warning(false),
+ latency_warning(false)
     {
 
 	if (l_ip.cache_sz<64) l_ip.cache_sz=64;
 	if (l_ip.power_gating && (l_ip.assoc==0)) {l_ip.power_gating = false;}
 	l_ip.error_checking();//not only do the error checking but also fill some missing parameters
-	optimize_array();
 
+	//arrays with the same parameters and timing constraints are optimized once
+	string key = cache_key();
+	if (!load_result(key))
+	{
+		optimize_array();
+		store_result(key);
+	}
+}
+
+/*
+ * Component level cache.  An optimized array is stored in the CACTI cache
+ * (see io.h) under its CACTI key and its timing constraints: the parameters
+ * optimize_array() and update_pg() change, the leading plain data of the
+ * result and of its power gating reference, and the timing warnings.
+ * Arrays with DVS results are not cached.
+ */
+#define ARRAY_INT_PARAMS 11
+#define ARRAY_BOOL_PARAMS 6
+
+static void array_params(InputParameter & ip, int ** ints, bool ** bools)
+{
+	int * i[ARRAY_INT_PARAMS] = {&ip.ed, &ip.delay_wt, &ip.dynamic_power_wt, &ip.leakage_power_wt,
+		&ip.cycle_time_wt, &ip.area_wt, &ip.delay_dev, &ip.dynamic_power_dev, &ip.leakage_power_dev,
+		&ip.cycle_time_dev, &ip.area_dev};
+	bool * b[ARRAY_BOOL_PARAMS] = {&ip.array_power_gated, &ip.bitline_floating, &ip.wl_power_gated,
+		&ip.cl_power_gated, &ip.interconect_power_gated, &ip.power_gating};
+	memcpy(ints, i, sizeof(i));
+	memcpy(bools, b, sizeof(b));
+}
+
+static const size_t result_size = offsetof(uca_org_t, uca_q);
+static const size_t array_value_size = ARRAY_INT_PARAMS * sizeof(int) + ARRAY_BOOL_PARAMS + 2 * result_size + 3;
+
+string ArrayST::cache_key() const
+{
+	char constraints[256];
+	snprintf(constraints, sizeof(constraints), "throughput=%.9g;latency=%.9g;opt_for_clk=%d;opt_local=%d;device_ty=%d;core_ty=%d;",
+			l_ip.throughput, l_ip.latency, (int)opt_for_clk, (int)opt_local, (int)device_ty, (int)core_ty);
+	return "ArrayST;" + cacti_key(l_ip) + constraints;
+}
+
+bool ArrayST::load_result(const string & key)
+{
+	if (!l_ip.dvs_voltage.empty())
+		return false;
+	string value(array_value_size, 0);
+	if (!cacti_cache_get(key, &value[0], value.size()))
+		return false;
+
+	int * ints[ARRAY_INT_PARAMS];
+	bool * bools[ARRAY_BOOL_PARAMS];
+	array_params(l_ip, ints, bools);
+	const char * p = value.data();
+	for (int i = 0; i < ARRAY_INT_PARAMS; i++, p += sizeof(int))
+		memcpy(ints[i], p, sizeof(int));
+	for (int i = 0; i < ARRAY_BOOL_PARAMS; i++)
+		*bools[i] = *p++;
+	memcpy((void *)&local_result, p, result_size);
+	p += result_size;
+	if (*p++)
+	{
+		local_result.uca_pg_reference = new uca_org_t();
+		memcpy((void *)local_result.uca_pg_reference, p, result_size);
+	}
+	p += result_size;
+	throughput_warning = p[0];
+	latency_warning = p[1];
+
+	if (throughput_warning)
+		cout<< "Warning: " << name<<" array structure cannot satisfy throughput constraint." << endl;
+	if (latency_warning)
+		cout<< "Warning: " << name<<" array structure cannot satisfy latency constraint." << endl;
+	//leave g_ip, the technology and the wires as the last cacti_interface() of optimize_array() does
+	cacti_init(&l_ip);
+	cacti_component_hits++;
+	return true;
+}
+
+void ArrayST::store_result(const string & key)
+{
+	cacti_component_built++;
+	const uca_org_t * pg = local_result.uca_pg_reference;
+	if (!l_ip.dvs_voltage.empty() || !local_result.uca_q.empty()
+			|| (pg && (!pg->uca_q.empty() || pg->uca_pg_reference)))
+		return;
+
+	string value(array_value_size, 0);
+	int * ints[ARRAY_INT_PARAMS];
+	bool * bools[ARRAY_BOOL_PARAMS];
+	array_params(l_ip, ints, bools);
+	char * p = &value[0];
+	for (int i = 0; i < ARRAY_INT_PARAMS; i++, p += sizeof(int))
+		memcpy(p, ints[i], sizeof(int));
+	for (int i = 0; i < ARRAY_BOOL_PARAMS; i++)
+		*p++ = *bools[i];
+	memcpy(p, &local_result, result_size);
+	p += result_size;
+	*p++ = pg != 0;
+	if (pg)
+		memcpy(p, pg, result_size);
+	p += result_size;
+	p[0] = throughput_warning;
+	p[1] = latency_warning;
+	cacti_cache_put(key, value.data(), value.size());
 }
 
 
@@ -171,6 +279,8 @@ void ArrayST::optimize_array()
 	if (l_ip.assoc > 0)
 	{
 		//For array structures except CAM and FA, Give warning but still provide a result with best timing found
+		throughput_warning = throughput_overflow;
+		latency_warning = latency_overflow;
 		if (throughput_overflow==true)
 			cout<< "Warning: " << name<<" array structure cannot satisfy throughput constraint." << endl;
 		if (latency_overflow==true)
@@ -338,6 +448,20 @@ void ArrayST::leakage_feedback(double temperature)//TODO: add the code to proces
   }
 }
 
+/*
+ * A copy of the array for a component with the same hardware (see Core::clone()),
+ * the CACTI results that the destructor deletes are copied too.
+ */
+ArrayST * ArrayST::clone() const
+{
+	ArrayST * copy = new ArrayST(*this);
+	for (unsigned int i = 0; i < local_result.uca_q.size(); i++)
+		copy->local_result.uca_q[i] = new uca_org_t(*local_result.uca_q[i]);
+	if (local_result.uca_pg_reference)
+		copy->local_result.uca_pg_reference = new uca_org_t(*local_result.uca_pg_reference);
+	return copy;
+}
+
 ArrayST:: ~ArrayST()
 {
 	local_result.cleanup();
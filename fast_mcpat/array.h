@@ -54,6 +54,8 @@ class ArrayST :public Component{
   enum Core_type core_ty;
   bool           is_default;
   uca_org_t      local_result;
+  bool           throughput_warning;
+  bool           latency_warning;
 
   statsDef       tdp_stats;
   statsDef       rtp_stats;
@@ -62,6 +64,10 @@ class ArrayST :public Component{
 
   virtual void optimize_array();
   virtual void compute_base_power();
+  string cache_key() const;
+  bool load_result(const string & key);
+  void store_result(const string & key);
+  ArrayST * clone() const;
   virtual ~ArrayST();
   
   void leakage_feedback(double temperature);
@@ -75,6 +81,13 @@ public:
   ArrayST* prefetchb;
   powerDef power_t;//temp value holder for both (max) power and runtime power
   InstCache(){caches=0;missb=0;ifb=0;prefetchb=0;};
+  //after a copy of the cache, gives the copy arrays of its own
+  void clone_arrays(){
+	  if (caches)    caches    = caches->clone();
+	  if (missb)     missb     = missb->clone();
+	  if (ifb)       ifb       = ifb->clone();
+	  if (prefetchb) prefetchb = prefetchb->clone();
+   };
   ~InstCache(){
 	  if (caches)    {//caches->local_result.cleanup();
 					  delete caches; caches=0;}
@@ -91,6 +104,10 @@ class DataCache :public InstCache{
 public:
   ArrayST* wbb;
   DataCache(){wbb=0;};
+  void clone_arrays(){
+	  InstCache::clone_arrays();
+	  if (wbb) wbb = wbb->clone();
+   };
   ~DataCache(){
 	  if (wbb) {//wbb->local_result.cleanup();
 				delete wbb; wbb=0;}
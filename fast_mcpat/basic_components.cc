@@ -33,6 +33,8 @@
 #include <iostream>
 #include <assert.h>
 #include <cmath>
+#include <cstdio>
+#include <cstring>
 
 double longer_channel_device_reduction(
 		enum Device_ty device_ty,
@@ -146,3 +148,122 @@ statsDef operator*(const statsDef & x, double const * const y)
 	z.searchAc  = x.searchAc*y;
 	return z;
 }
+
+// the ReportJSON collecting the reported values, if any
+static ReportJSON * report_json = NULL;
+
+void report_component(const string & name, const string & rest)
+{
+	if (report_json)
+		report_json->component(name);
+	else
+		cout << name << rest << endl;
+}
+
+void report_section(const string & indent, const string & name, const string & rest)
+{
+	if (report_json)
+		report_json->section(indent, name);
+	else
+		cout << indent << name << rest << endl;
+}
+
+void report_value(const string & indent, const string & name, double value, const string & unit)
+{
+	if (report_json)
+		report_json->value(name, value);
+	else
+		cout << indent << name << " = " << value << " " << unit << endl;
+}
+
+static string json_string(const string & s)
+{
+	string quoted = "\"";
+	for (size_t i = 0; i < s.size(); i++)
+	{
+		if (s[i] == '"' || s[i] == '\\')
+			quoted += '\\';
+		quoted += s[i];
+	}
+	return quoted + "\"";
+}
+
+static string trim(const string & s)
+{
+	size_t begin = s.find_first_not_of(' ');
+	if (begin == string::npos)
+		return "";
+	return s.substr(begin, s.find_last_not_of(' ') - begin + 1);
+}
+
+ReportJSON::ReportJSON()
+{
+	// the lines that are not reported through report_* only belong to the text report
+	stdout_buf = cout.rdbuf(NULL);
+	report_json = this;
+}
+
+ReportJSON::~ReportJSON()
+{
+	report_json = NULL;
+	cout.rdbuf(stdout_buf);
+}
+
+void ReportJSON::component(const string & name)
+{
+	if (!components.count(name))
+		order.push_back(name);
+	components[name].push_back("");
+	prefix.clear();
+	spaces.clear();
+}
+
+void ReportJSON::section(const string & indent, const string & name)
+{
+	size_t depth = indent.size() + name.find_first_not_of(' ');
+	while (!spaces.empty() && depth <= spaces.back())
+	{
+		spaces.pop_back();
+		prefix.pop_back();
+	}
+	spaces.push_back(depth);
+	prefix.push_back(trim(name.substr(0, name.find_first_of(":("))));
+}
+
+void ReportJSON::value(const string & name, double value)
+{
+	if (order.empty())
+		return;
+	string path;
+	for (size_t i = 0; i < prefix.size(); i++)
+		path += prefix[i] + "/";
+	char number[32];
+	if (std::isnan(value))
+		strcpy(number, "NaN");
+	else if (std::isinf(value))
+		strcpy(number, value > 0 ? "Infinity" : "-Infinity");
+	else
+		snprintf(number, sizeof(number), "%.17g", value);
+	string & values = components[order.back()].back();
+	values += (values.empty() ? "" : ", ") + json_string(trim(path + name)) + ": " + number;
+}
+
+string ReportJSON::str() const
+{
+	string json = "{";
+	for (size_t i = 0; i < order.size(); i++)
+	{
+		const vector<string> & instances = components.find(order[i])->second;
+		json += (i ? ", " : "") + json_string(order[i]) + ": ";
+		if (order[i] == "Core" || order[i] == "L2" || order[i] == "L3")
+		{
+			json += "[";
+			for (size_t j = 0; j < instances.size(); j++)
+				json += (j ? ", " : "") + string("{") + instances[j] + "}";
+			json += "]";
+		}
+		else
+			json += "{" + instances.back() + "}";
+	}
+	return json + "}";
+}
@@ -35,6 +35,7 @@
 #include "XML_Parse.h"
 #include "parameter.h"
 #include <vector>
+#include <map>
 
 const double cdb_overhead = 1.1;
 
@@ -133,6 +134,40 @@ double longer_channel_device_reduction(
 double power_gating_leakage_reduction(
 		bool retain_state=false);
 
+/*
+ * The displayEnergy reports print their components, sections and values
+ * through these.  They print the text report, or while a ReportJSON is
+ * collecting, record the values instead and print nothing.
+ */
+void report_component(const string & name, const string & rest = ":");
+void report_section(const string & indent, const string & name, const string & rest = ":");
+void report_value(const string & indent, const string & name, double value, const string & unit);
+
+/*
+ * Collects the values reported while it exists as one line of JSON:
+ *   {"Processor": {"Area": ..., "Total Cores/Area": ...},
+ *    "Core": [{"Instruction Fetch Unit/Runtime Dynamic": ..., ...}, ...], ...}
+ * Every component is an object of "<section>/<...>/<name>": value, with the
+ * section names cut at ':' or '(' like the text report is parsed.  Core, L2 and
+ * L3 are lists with one object per instance.  Values keep their full precision,
+ * nan and inf are written as NaN and Infinity.
+ */
+class ReportJSON {
+public:
+	ReportJSON();
+	~ReportJSON();
+	string str() const;
+	void component(const string & name);
+	void section(const string & indent, const string & name);
+	void value(const string & name, double value);
+private:
+	vector<string> order;
+	map<string, vector<string> > components;
+	vector<string> prefix;
+	vector<size_t> spaces;
+	std::streambuf * stdout_buf;
+};
+
 class CoreDynParam {
 public:
 	CoreDynParam(){};
@@ -44,16 +44,14 @@
 #include "Ucache.h"
 #include "subarray.h"
 #include "uca.h"
+#include "thread_pool.h"
 
-#include <pthread.h>
 #include <iostream>
 #include <algorithm>
 #include <list>
 
 using namespace std;
 
-const uint32_t nthreads = NTHREADS;
-
 
 void min_values_t::update_min_values(const min_values_t * val)
 {
@@ -95,126 +93,103 @@ void min_values_t::update_min_values(const mem_array * res)
 
 
 
-void * calc_time_mt_wrapper(void * void_obj)
+/*
+ * One task of the design space search: every Ndbl, Ndcm, Ndsam_lev_1 and
+ * Ndsam_lev_2 for one Nspd, wire type and Ndwl.  The valid partitions are
+ * kept per task, so solve() sees them in the same order whichever thread
+ * ran the task.
+ */
+void calc_time_mt_wrapper(void * void_obj, uint32_t task, uint32_t thread)
 {
   calc_time_mt_wrapper_struct * calc_obj = (calc_time_mt_wrapper_struct *) void_obj;
-  uint32_t tid                   = calc_obj->tid;
-  list<mem_array *> & data_arr   = calc_obj->data_arr;
-  list<mem_array *> & tag_arr    = calc_obj->tag_arr;
+  list<mem_array *> & data_arr   = calc_obj->data_arr[task];
+  list<mem_array *> & tag_arr    = calc_obj->tag_arr[task];
   bool is_tag                    = calc_obj->is_tag;
   bool pure_ram                  = calc_obj->pure_ram;
   bool pure_cam					 = calc_obj->pure_cam;
   bool is_main_mem               = calc_obj->is_main_mem;
-  double Nspd_min                = calc_obj->Nspd_min;
-  min_values_t * data_res        = calc_obj->data_res;
-  min_values_t * tag_res         = calc_obj->tag_res;
+  min_values_t * data_res        = &calc_obj->data_res[thread];
+  min_values_t * tag_res         = &calc_obj->tag_res[thread];
 
-  data_arr.clear();
   data_arr.push_back(new mem_array);
-  tag_arr.clear();
   tag_arr.push_back(new mem_array);
 
-  uint32_t Ndwl_niter = _log2(MAXDATAN) + 1;
   uint32_t Ndbl_niter = _log2(MAXDATAN) + 1;
   uint32_t Ndcm_niter = _log2(MAX_COL_MUX) + 1;
-  uint32_t niter      = Ndwl_niter * Ndbl_niter * Ndcm_niter;
-
+  uint32_t niter      = Ndbl_niter * Ndcm_niter;
+  uint32_t nwt        = calc_obj->wt_max - calc_obj->wt_min + 1;
 
-  bool is_valid_partition;
-  int wt_min, wt_max;
+  double Nspd = calc_obj->Nspd[task / (nwt * calc_obj->Ndwl_niter)];
+  int    wr   = calc_obj->wt_min + (task / calc_obj->Ndwl_niter) % nwt;
+  unsigned int Ndwl = 1 << (task % calc_obj->Ndwl_niter);
 
-  if (g_ip->force_wiretype) {
-    if (g_ip->wt == 0) {
-      wt_min = Low_swing;
-      wt_max = Low_swing;
-    }
-    else {
-      wt_min = Global;
-      wt_max = Low_swing-1;
-    }
-  }
-  else {
-    wt_min = Global;
-    wt_max = Low_swing;
+  //for debuging
+  bool force_config = g_ip->force_cache_config && is_tag == false;
+  if (force_config)
+  {
+    niter = 1;
   }
 
-  for (double Nspd = Nspd_min; Nspd <= MAXDATASPD; Nspd *= 2)
+  bool is_valid_partition;
+
+  for (uint32_t iter = 0; iter < niter; iter++)
   {
-    for (int wr = wt_min; wr <= wt_max; wr++)
+    unsigned int Ndbl = 1 << (iter / Ndcm_niter);
+    unsigned int Ndcm = 1 << (iter % Ndcm_niter);
+    if (force_config)
+    {
+      Ndwl = g_ip->ndwl;
+      Ndbl = g_ip->ndbl;
+      Ndcm = g_ip->ndcm;
+    }
+    for(unsigned int Ndsam_lev_1 = 1; Ndsam_lev_1 <= MAX_COL_MUX; Ndsam_lev_1 *= 2)
     {
-      for (uint32_t iter = tid; iter < niter; iter += nthreads)
+      for(unsigned int Ndsam_lev_2 = 1; Ndsam_lev_2 <= MAX_COL_MUX; Ndsam_lev_2 *= 2)
       {
-        // reconstruct Ndwl, Ndbl, Ndcm
-        unsigned int Ndwl = 1 << (iter / (Ndbl_niter * Ndcm_niter));
-        unsigned int Ndbl = 1 << ((iter / (Ndcm_niter))%Ndbl_niter);
-        unsigned int Ndcm = 1 << (iter % Ndcm_niter);
-        for(unsigned int Ndsam_lev_1 = 1; Ndsam_lev_1 <= MAX_COL_MUX; Ndsam_lev_1 *= 2)
+        if (force_config && g_ip->ndsam1 != 0)
         {
-          for(unsigned int Ndsam_lev_2 = 1; Ndsam_lev_2 <= MAX_COL_MUX; Ndsam_lev_2 *= 2)
+          Ndsam_lev_1 = g_ip->ndsam1;
+          Ndsam_lev_2 = g_ip->ndsam2;
+        }
+
+        if (is_tag == true)
+        {
+          is_valid_partition = calculate_time(is_tag, pure_ram, pure_cam, Nspd, Ndwl,
+              Ndbl, Ndcm, Ndsam_lev_1, Ndsam_lev_2,
+              tag_arr.back(), 0, NULL, NULL,
+              is_main_mem);
+        }
+        // If it's a fully-associative cache, the data array partition parameters are identical to that of
+        // the tag array, so compute data array partition properties also here.
+        if (is_tag == false || g_ip->fully_assoc)
+        {
+          is_valid_partition = calculate_time(is_tag/*false*/, pure_ram, pure_cam, Nspd, Ndwl,
+              Ndbl, Ndcm, Ndsam_lev_1, Ndsam_lev_2,
+              data_arr.back(), 0, NULL, NULL,
+              is_main_mem);
+        }
+
+        if (is_valid_partition)
+        {
+          if (is_tag == true)
+          {
+            tag_arr.back()->wt = (enum Wire_type) wr;
+            tag_res->update_min_values(tag_arr.back());
+            tag_arr.push_back(new mem_array);
+          }
+          if (is_tag == false || g_ip->fully_assoc)
           {
-            //for debuging
-            if (g_ip->force_cache_config && is_tag == false)
-            {
-              wr   = g_ip->wt;
-              Ndwl = g_ip->ndwl;
-              Ndbl = g_ip->ndbl;
-              Ndcm = g_ip->ndcm;
-              if(g_ip->nspd != 0) {
-            	  Nspd = g_ip->nspd;
-              }
-              if(g_ip->ndsam1 != 0) {
-            	  Ndsam_lev_1 = g_ip->ndsam1;
-            	  Ndsam_lev_2 = g_ip->ndsam2;
-              }
-            }
-
-            if (is_tag == true)
-            {
-              is_valid_partition = calculate_time(is_tag, pure_ram, pure_cam, Nspd, Ndwl,
-                  Ndbl, Ndcm, Ndsam_lev_1, Ndsam_lev_2,
-                  tag_arr.back(), 0, NULL, NULL,
-                  is_main_mem);
-            }
-            // If it's a fully-associative cache, the data array partition parameters are identical to that of
-            // the tag array, so compute data array partition properties also here.
-            if (is_tag == false || g_ip->fully_assoc)
-            {
-              is_valid_partition = calculate_time(is_tag/*false*/, pure_ram, pure_cam, Nspd, Ndwl,
-                  Ndbl, Ndcm, Ndsam_lev_1, Ndsam_lev_2,
-                  data_arr.back(), 0, NULL, NULL,
-                  is_main_mem);
-            }
-
-            if (is_valid_partition)
-            {
-              if (is_tag == true)
-              {
-                tag_arr.back()->wt = (enum Wire_type) wr;
-                tag_res->update_min_values(tag_arr.back());
-                tag_arr.push_back(new mem_array);
-              }
-              if (is_tag == false || g_ip->fully_assoc)
-              {
-                data_arr.back()->wt = (enum Wire_type) wr;
-                data_res->update_min_values(data_arr.back());
-                data_arr.push_back(new mem_array);
-              }
-            }
-
-            if (g_ip->force_cache_config && is_tag == false)
-            {
-            	wr   = wt_max;
-            	iter = niter;
-            	if(g_ip->nspd != 0) {
-            		Nspd = MAXDATASPD;
-            	}
-            	if (g_ip->ndsam1 != 0) {
-            		Ndsam_lev_1 = MAX_COL_MUX+1;
-            		Ndsam_lev_2 = MAX_COL_MUX+1;
-            	}
-            }
+            data_arr.back()->wt = (enum Wire_type) wr;
+            data_res->update_min_values(data_arr.back());
+            data_arr.push_back(new mem_array);
           }
         }
+
+        if (force_config && g_ip->ndsam1 != 0)
+        {
+          Ndsam_lev_1 = MAX_COL_MUX+1;
+          Ndsam_lev_2 = MAX_COL_MUX+1;
+        }
       }
     }
   }
@@ -223,8 +198,52 @@ void * calc_time_mt_wrapper(void * void_obj)
   delete tag_arr.back();
   data_arr.pop_back();
   tag_arr.pop_back();
+}
+
+
+/*
+ * Sets up the tasks of a design space search starting at Nspd_min, returns
+ * their number.  A forced configuration (g_ip->force_cache_config) only
+ * searches the Nspd values and column muxes it does not set.
+ */
+static uint32_t calc_time_tasks(calc_time_mt_wrapper_struct & calc, double Nspd_min)
+{
+  if (g_ip->force_wiretype) {
+    if (g_ip->wt == 0) {
+      calc.wt_min = Low_swing;
+      calc.wt_max = Low_swing;
+    }
+    else {
+      calc.wt_min = Global;
+      calc.wt_max = Low_swing-1;
+    }
+  }
+  else {
+    calc.wt_min = Global;
+    calc.wt_max = Low_swing;
+  }
+  calc.Ndwl_niter = _log2(MAXDATAN) + 1;
 
-  pthread_exit(NULL);
+  calc.Nspd.clear();
+  for (double Nspd = Nspd_min; Nspd <= MAXDATASPD; Nspd *= 2)
+  {
+    calc.Nspd.push_back(Nspd);
+  }
+
+  if (g_ip->force_cache_config && calc.is_tag == false)
+  {
+    calc.wt_min = calc.wt_max = g_ip->wt;
+    calc.Ndwl_niter = 1;
+    if (g_ip->nspd != 0 && calc.Nspd.empty() == false)
+    {
+      calc.Nspd.assign(1, g_ip->nspd);
+    }
+  }
+
+  uint32_t ntasks = calc.Nspd.size() * (calc.wt_max - calc.wt_min + 1) * calc.Ndwl_niter;
+  calc.data_arr.assign(ntasks, list<mem_array *>());
+  calc.tag_arr.assign(ntasks, list<mem_array *>());
+  return ntasks;
 }
 
 
@@ -750,18 +769,16 @@ void solve(uca_org_t *fin_res)
   fin_res->tag_array.Ndsam_lev_2 = 0;
 
 
-  // distribute calculate_time() execution to multiple threads
-  calc_time_mt_wrapper_struct * calc_array = new calc_time_mt_wrapper_struct[nthreads];
-  pthread_t threads[nthreads];
+  // distribute calculate_time() execution to the threads of the pool
+  ThreadPool * pool = ThreadPool::get();
+  uint32_t nthreads = pool->size();
+  calc_time_mt_wrapper_struct calc;
+  uint32_t ntasks;
 
-  for (uint32_t t = 0; t < nthreads; t++)
-  {
-    calc_array[t].tid         = t;
-    calc_array[t].pure_ram    = pure_ram;
-    calc_array[t].pure_cam    = pure_cam;
-    calc_array[t].data_res    = new min_values_t();
-    calc_array[t].tag_res     = new min_values_t();
-  }
+  calc.pure_ram    = pure_ram;
+  calc.pure_cam    = pure_cam;
+  calc.data_res    = new min_values_t[nthreads];
+  calc.tag_res     = new min_values_t[nthreads];
 
   bool     is_tag;
   uint32_t ram_cell_tech_type;
@@ -774,26 +791,19 @@ void solve(uca_org_t *fin_res)
     is_dram             = ((ram_cell_tech_type == lp_dram) || (ram_cell_tech_type == comm_dram));
     init_tech_params(g_ip->F_sz_um, is_tag);
 
-    for (uint32_t t = 0; t < nthreads; t++)
-    {
-      calc_array[t].is_tag      = is_tag;
-      calc_array[t].is_main_mem = false;
-      calc_array[t].Nspd_min    = 0.125;
-      pthread_create(&threads[t], NULL, calc_time_mt_wrapper, (void *)(&(calc_array[t])));
-    }
+    calc.is_tag      = is_tag;
+    calc.is_main_mem = false;
+    ntasks = calc_time_tasks(calc, 0.125);
+    pool->run(ntasks, calc_time_mt_wrapper, &calc);
 
-    for (uint32_t t = 0; t < nthreads; t++)
+    // in task order, list::sort keeps equal partitions in that order
+    for (uint32_t t = 0; t < ntasks; t++)
     {
-      pthread_join(threads[t], NULL);
-    }
-
-    for (uint32_t t = 0; t < nthreads; t++)
-    {
-      calc_array[t].data_arr.sort(mem_array::lt);
-      data_arr.merge(calc_array[t].data_arr, mem_array::lt);
-      calc_array[t].tag_arr.sort(mem_array::lt);
-      tag_arr.merge(calc_array[t].tag_arr, mem_array::lt);
+      data_arr.splice(data_arr.end(), calc.data_arr[t]);
+      tag_arr.splice(tag_arr.end(), calc.tag_arr[t]);
     }
+    data_arr.sort(mem_array::lt);
+    tag_arr.sort(mem_array::lt);
   }
 
 
@@ -805,33 +815,24 @@ void solve(uca_org_t *fin_res)
     is_dram             = ((ram_cell_tech_type == lp_dram) || (ram_cell_tech_type == comm_dram));
     init_tech_params(g_ip->F_sz_um, is_tag);
 
-    for (uint32_t t = 0; t < nthreads; t++)
+    calc.is_tag      = is_tag;
+    calc.is_main_mem = g_ip->is_main_mem;
+    if (!(pure_cam||g_ip->fully_assoc))
     {
-      calc_array[t].is_tag      = is_tag;
-      calc_array[t].is_main_mem = g_ip->is_main_mem;
-      if (!(pure_cam||g_ip->fully_assoc))
-      {
-    	  calc_array[t].Nspd_min    = (double)(g_ip->out_w)/(double)(g_ip->block_sz*8);
-      }
-      else
-      {
-    	  calc_array[t].Nspd_min    = 1;
-      }
-
-      pthread_create(&threads[t], NULL, calc_time_mt_wrapper, (void *)(&(calc_array[t])));
+      ntasks = calc_time_tasks(calc, (double)(g_ip->out_w)/(double)(g_ip->block_sz*8));
     }
-
-    for (uint32_t t = 0; t < nthreads; t++)
+    else
     {
-      pthread_join(threads[t], NULL);
+      ntasks = calc_time_tasks(calc, 1);
     }
+    pool->run(ntasks, calc_time_mt_wrapper, &calc);
 
     data_arr.clear();
-    for (uint32_t t = 0; t < nthreads; t++)
+    for (uint32_t t = 0; t < ntasks; t++)
     {
-      calc_array[t].data_arr.sort(mem_array::lt);
-      data_arr.merge(calc_array[t].data_arr, mem_array::lt);
+      data_arr.splice(data_arr.end(), calc.data_arr[t]);
     }
+    data_arr.sort(mem_array::lt);
 //  }
 
 
@@ -841,8 +842,8 @@ void solve(uca_org_t *fin_res)
 
   for (uint32_t t = 0; t < nthreads; t++)
   {
-    d_min.update_min_values(calc_array[t].data_res);
-    t_min.update_min_values(calc_array[t].tag_res);
+    d_min.update_min_values(&calc.data_res[t]);
+    t_min.update_min_values(&calc.tag_res[t]);
   }
 
   for (miter = data_arr.begin(); miter != data_arr.end(); miter++)
@@ -914,13 +915,8 @@ void solve(uca_org_t *fin_res)
 
   data_arr.clear();
 
-  for (uint32_t t = 0; t < nthreads; t++)
-  {
-    delete calc_array[t].data_res;
-    delete calc_array[t].tag_res;
-  }
-
-  delete [] calc_array;
+  delete [] calc.data_res;
+  delete [] calc.tag_res;
 }
 
 void update_dvs(uca_org_t *fin_res)
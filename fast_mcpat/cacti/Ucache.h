@@ -34,6 +34,7 @@
 #define __UCACHE_H__
 
 #include <list>
+#include <vector>
 #include "area.h"
 #include "router.h"
 #include "nuca.h"
@@ -97,22 +98,26 @@ void solve(uca_org_t *fin_res);
 void init_tech_params(double tech, bool is_tag);
 
 
+// One design space search of solve(), split into tasks of one Nspd, wire
+// type and Ndwl each
 struct calc_time_mt_wrapper_struct
 {
-  uint32_t tid;
   bool     is_tag;
   bool     pure_ram;
   bool     pure_cam;
   bool     is_main_mem;
-  double   Nspd_min;
+  vector<double> Nspd;
+  int      wt_min;
+  int      wt_max;
+  uint32_t Ndwl_niter;
 
-  min_values_t * data_res;
-  min_values_t * tag_res;
+  min_values_t * data_res;  // one per thread
+  min_values_t * tag_res;   // one per thread
 
-  list<mem_array *> data_arr;
-  list<mem_array *> tag_arr;
+  vector<list<mem_array *> > data_arr;  // one per task
+  vector<list<mem_array *> > tag_arr;   // one per task
 };
 
-void *calc_time_mt_wrapper(void * void_obj);
+void calc_time_mt_wrapper(void * void_obj, uint32_t task, uint32_t thread);
 
 #endif
@@ -0,0 +1,341 @@
+/*****************************************************************************
+ *                                McPAT/CACTI
+ *                      SOFTWARE LICENSE AGREEMENT
+ *            Copyright 2012 Hewlett-Packard Development Company, L.P.
+ *                          All Rights Reserved
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.”
+ *
+ ***************************************************************************/
+
+
+/*
+ * cache_bench: compares the CACTI cache (cacti_cache.h) with the Berkeley DB
+ * cache McPAT used before, on keys and values of the size McPAT stores
+ * (the InputParameter key and the uca_org_t result).
+ *
+ *   cache_bench [-n <arrays>] [-procs <processes>] [-dir <directory>]
+ *
+ * For each store: opening a new store, misses that solve and store a result
+ * (a get and a put, as cacti_interface does), opening the filled store again
+ * (every McPAT process does), hits, misses, and the misses and stores of
+ * -procs processes filling a new store at the same time.  Every hit is
+ * checked against the value stored.  Build with make cache_bench, or with
+ * make cache_bench LIBDB=0 to only measure the CACTI cache.
+ */
+
+#include <sys/types.h>
+#include <sys/stat.h>
+#include <sys/wait.h>
+#include <sys/time.h>
+#include <sys/file.h>
+#include <fcntl.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+#include <stddef.h>
+#include <string>
+#include <vector>
+#include <iostream>
+#ifndef NO_LIBDB
+#include <db.h>
+#endif
+
+#include "cacti_interface.h"
+#include "cacti_cache.h"
+
+using namespace std;
+
+static const uint32_t key_size = offsetof(InputParameter, last) - offsetof(InputParameter, first);
+static const uint32_t value_size = sizeof(uca_org_t);
+
+class Store
+{
+  public:
+    virtual ~Store() {}
+    virtual const char * name() = 0;
+    virtual bool open(const string & dir) = 0;
+    virtual void close() = 0;
+    virtual bool get(const string & key, string & value) = 0;
+    virtual void put(const string & key, const string & value) = 0;
+};
+
+class CactiCacheStore : public Store
+{
+  public:
+    CactiCacheStore() : cache(NULL) {}
+    const char * name() { return "cacti_cache"; }
+    bool open(const string & dir)
+    {
+      cache = CactiCache::open(dir + "/bench.cacti");
+      return cache != NULL;
+    }
+    void close()
+    {
+      delete cache;
+      cache = NULL;
+    }
+    bool get(const string & key, string & value)
+    {
+      value.resize(value_size);
+      return cache->get(key.data(), key.size(), &value[0], value_size);
+    }
+    void put(const string & key, const string & value)
+    {
+      cache->put(key.data(), key.size(), value.data(), value.size());
+    }
+
+  private:
+    CactiCache * cache;
+};
+
+#ifndef NO_LIBDB
+// The Berkeley DB cache as it was opened and used in cacti_interface
+class LibdbStore : public Store
+{
+  public:
+    LibdbStore() : dbenv(NULL), dbp(NULL) {}
+    const char * name() { return "libdb"; }
+    bool open(const string & dir)
+    {
+      string dirname = dir + "/bench.db";
+      mkdir(dirname.c_str(), 0700);
+      int lockfd = ::open((dirname + "/lock").c_str(), O_RDWR | O_CREAT, 0600);
+      if (lockfd < 0)
+        return false;
+      flock(lockfd, LOCK_EX);
+      bool ok = !db_env_create(&dbenv, 0)
+             && !dbenv->open(dbenv, dirname.c_str(), DB_CREATE | DB_INIT_CDB | DB_INIT_MPOOL, 0)
+             && !db_create(&dbp, dbenv, 0)
+             && !dbp->open(dbp, NULL, "cacti.db", NULL, DB_HASH, DB_CREATE, 0);
+      flock(lockfd, LOCK_UN);
+      ::close(lockfd);
+      return ok;
+    }
+    void close()
+    {
+      if (dbp)
+        dbp->close(dbp, 0);
+      if (dbenv)
+        dbenv->close(dbenv, 0);
+      dbp = NULL;
+      dbenv = NULL;
+    }
+    bool get(const string & key, string & value)
+    {
+      DBT k, d;
+      memset(&k, 0, sizeof(DBT));
+      memset(&d, 0, sizeof(DBT));
+      k.data = (void *)key.data();
+      k.size = key.size();
+      if (dbp->get(dbp, NULL, &k, &d, 0) != 0 || d.size != value_size)
+        return false;
+      value.assign((const char *)d.data, d.size);
+      return true;
+    }
+    void put(const string & key, const string & value)
+    {
+      DBT k, d;
+      memset(&k, 0, sizeof(DBT));
+      memset(&d, 0, sizeof(DBT));
+      k.data = (void *)key.data();
+      k.size = key.size();
+      d.data = (void *)value.data();
+      d.size = value.size();
+      dbp->put(dbp, NULL, &k, &d, 0);
+      dbp->sync(dbp, 0);
+    }
+
+  private:
+    DB_ENV * dbenv;
+    DB * dbp;
+};
+#endif
+
+// Deterministic pseudo random bytes for array i
+static string bytes(uint64_t i, uint32_t size)
+{
+  string s(size, 0);
+  uint64_t x = i * 0x9E3779B97F4A7C15ULL + 1;
+  for (uint32_t j = 0; j < size; j++)
+  {
+    x ^= x << 13;
+    x ^= x >> 7;
+    x ^= x << 17;
+    s[j] = (char)x;
+  }
+  return s;
+}
+
+// generated up front, so that only the stores are timed
+static vector<string> keys, values;
+
+static const string & key(int i) { return keys[i]; }
+static const string & value(int i) { return values[i]; }
+
+static double now()
+{
+  struct timeval tv;
+  gettimeofday(&tv, NULL);
+  return tv.tv_sec + tv.tv_usec * 1e-6;
+}
+
+// Looks arrays [begin, end) up and stores the missing ones, returns the misses
+static int fill(Store & store, int begin, int end)
+{
+  int misses = 0;
+  string v;
+  for (int i = begin; i < end; i++)
+    if (!store.get(key(i), v))
+    {
+      store.put(key(i), value(i));
+      misses++;
+    }
+  return misses;
+}
+
+// Returns the arrays of [begin, end) found with the right value
+static int check(Store & store, int begin, int end)
+{
+  int found = 0;
+  string v;
+  for (int i = begin; i < end; i++)
+    if (store.get(key(i), v) && v == value(i))
+      found++;
+  return found;
+}
+
+static void clean(const string & dir)
+{
+  string cmd = "rm -rf '" + dir + "/bench.db' '" + dir + "/bench.cacti'";
+  if (system(cmd.c_str()) != 0)
+    cerr << "cannot remove the stores in " << dir << endl;
+}
+
+static bool bench(Store & store, const string & dir, int n, int procs)
+{
+  clean(dir);
+  double t = now();
+  if (!store.open(dir))
+  {
+    cerr << "cannot open " << store.name() << " in " << dir << endl;
+    return false;
+  }
+  double open_new = now() - t;
+
+  // keys are looked up before they are stored, as in cacti_interface
+  t = now();
+  int misses = fill(store, 0, n);
+  double store_time = now() - t;
+  store.close();
+
+  t = now();
+  store.open(dir);
+  double open_full = now() - t;
+
+  t = now();
+  int found = check(store, 0, n);
+  double hit_time = now() - t;
+
+  t = now();
+  int missing = n - check(store, n, 2 * n);
+  double miss_time = now() - t;
+  store.close();
+
+  clean(dir);
+  t = now();
+  for (int p = 0; p < procs; p++)
+    if (fork() == 0)
+    {
+      // every process looks up all the arrays, starting at its own share
+      if (!store.open(dir))
+        _exit(1);
+      int begin = n * p / procs;
+      fill(store, begin, n);
+      fill(store, 0, begin);
+      int ok = check(store, 0, n);
+      store.close();
+      _exit(ok == n ? 0 : 1);
+    }
+  bool children_ok = true;
+  int status;
+  for (int p = 0; p < procs; p++)
+    if (wait(&status) < 0 || !WIFEXITED(status) || WEXITSTATUS(status) != 0)
+      children_ok = false;
+  double concurrent_time = now() - t;
+  store.open(dir);
+  int concurrent_found = check(store, 0, n);
+  store.close();
+  clean(dir);
+
+  printf("%-12s open new %8.2f ms | %d miss+store %8.1f us/array | open full %8.2f ms | hit %6.1f us | miss %6.1f us | %d procs %8.1f us/array\n",
+         store.name(), open_new * 1e3, misses, store_time * 1e6 / n, open_full * 1e3,
+         hit_time * 1e6 / n, miss_time * 1e6 / n, procs, concurrent_time * 1e6 / n);
+  bool ok = misses == n && found == n && missing == n && children_ok && concurrent_found == n;
+  if (!ok)
+    printf("%-12s FAILED: %d of %d stored, %d found, %d missing, %d found after the concurrent fill%s\n",
+           store.name(), misses, n, found, missing, concurrent_found, children_ok ? "" : ", a process failed");
+  return ok;
+}
+
+int main(int argc, char *argv[])
+{
+  int n = 1000;
+  int procs = 4;
+  string dir = getenv("TMPDIR") ? getenv("TMPDIR") : "/tmp";
+  for (int i = 1; i + 1 < argc; i += 2)
+  {
+    if (argv[i] == string("-n"))
+      n = atoi(argv[i + 1]);
+    else if (argv[i] == string("-procs"))
+      procs = atoi(argv[i + 1]);
+    else if (argv[i] == string("-dir"))
+      dir = argv[i + 1];
+  }
+  if (argc % 2 == 0 || n <= 0 || procs <= 0)
+  {
+    cerr << "usage: cache_bench [-n <arrays>] [-procs <processes>] [-dir <directory>]" << endl;
+    return 1;
+  }
+  dir += "/cache_bench." + string(getenv("USER") ? getenv("USER") : "");
+  mkdir(dir.c_str(), 0700);
+
+  for (int i = 0; i < 2 * n; i++)
+  {
+    keys.push_back(bytes(2 * i, key_size));
+    values.push_back(bytes(2 * i + 1, value_size));
+  }
+
+  printf("%d arrays, %u byte keys, %u byte values\n", n, key_size, value_size);
+  bool ok = true;
+#ifndef NO_LIBDB
+  LibdbStore libdb;
+  ok = bench(libdb, dir, n, procs) && ok;
+#endif
+  CactiCacheStore cache;
+  ok = bench(cache, dir, n, procs) && ok;
+  rmdir(dir.c_str());
+  return ok ? 0 : 1;
+}
@@ -0,0 +1,154 @@
+/*****************************************************************************
+ *                                McPAT/CACTI
+ *                      SOFTWARE LICENSE AGREEMENT
+ *            Copyright 2012 Hewlett-Packard Development Company, L.P.
+ *                          All Rights Reserved
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.”
+ *
+ ***************************************************************************/
+
+
+/*
+ * cachetool: inspects and compacts CACTI caches (see cacti_cache.h)
+ *
+ *   cachetool stats <cache>
+ *   cachetool compact <cache> [<output>] [-capacity <MB>]
+ *
+ * compact keeps the newest valid record of every key and writes them to a
+ * new cache that replaces <output> (the cache itself by default).  The new
+ * cache has the capacity of the old one, or -capacity MB (0 for just the
+ * records, e.g. for a read only seed).  McPAT processes that still have the
+ * old cache mapped keep storing their results there, so compact the cache
+ * in use while no McPAT is running.
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <unistd.h>
+#include <map>
+#include <string>
+#include <iostream>
+
+#include "cacti_cache.h"
+
+using namespace std;
+
+struct Scan
+{
+  map<string, string> newest;
+  uint64_t valid;
+};
+
+static void visit(void * arg, const void * key, uint32_t key_size,
+                  const void * value, uint32_t value_size)
+{
+  Scan * scan = (Scan *)arg;
+  scan->valid++;
+  // records are visited newest first, older ones of a key are stale
+  scan->newest.insert(make_pair(string((const char *)key, key_size),
+                                string((const char *)value, value_size)));
+}
+
+static void usage()
+{
+  cerr << "usage: cachetool stats <cache>" << endl;
+  cerr << "       cachetool compact <cache> [<output>] [-capacity <MB, 0 for just the records>]" << endl;
+  exit(1);
+}
+
+int main(int argc, char *argv[])
+{
+  if (argc < 3)
+    usage();
+  string command = argv[1];
+  string path = argv[2];
+  string output = path;
+  long capacity_mb = -1;
+  for (int i = 3; i < argc; i++)
+  {
+    if (argv[i] == string("-capacity") && i + 1 < argc)
+      capacity_mb = atol(argv[++i]);
+    else if (argv[i][0] != '-')
+      output = argv[i];
+    else
+      usage();
+  }
+
+  CactiCache * cache = CactiCache::open(path, true);
+  if (cache == NULL)
+  {
+    cerr << "cannot open CACTI cache " << path << endl;
+    return 1;
+  }
+  Scan scan;
+  scan.valid = 0;
+  cache->scan(visit, &scan);
+
+  uint64_t live = 0;
+  for (map<string, string>::iterator it = scan.newest.begin(); it != scan.newest.end(); ++it)
+    live += CactiCache::record_size(it->first.size(), it->second.size());
+
+  if (command == "stats")
+  {
+    printf("records:   %llu (%llu valid, %llu current)\n", (unsigned long long)cache->records(),
+           (unsigned long long)scan.valid, (unsigned long long)scan.newest.size());
+    printf("buckets:   %llu\n", (unsigned long long)cache->buckets());
+    printf("used:      %.1f of %.1f MB (%.1f MB current)\n", cache->used() / 1048576.0,
+           cache->capacity() / 1048576.0, live / 1048576.0);
+    return 0;
+  }
+  if (command != "compact")
+    usage();
+
+  uint64_t capacity = capacity_mb < 0 ? cache->capacity()
+                    : capacity_mb == 0 ? live : (uint64_t)capacity_mb << 20;
+  if (capacity < live)
+  {
+    cerr << "the current records need " << live / 1048576.0 << " MB" << endl;
+    return 1;
+  }
+  delete cache;
+
+  string tmp = output + ".compact";
+  unlink(tmp.c_str());
+  CactiCache * compacted = CactiCache::open(tmp, false, capacity);
+  if (compacted == NULL)
+  {
+    cerr << "cannot create " << tmp << endl;
+    return 1;
+  }
+  for (map<string, string>::iterator it = scan.newest.begin(); it != scan.newest.end(); ++it)
+    compacted->put(it->first.data(), it->first.size(), it->second.data(), it->second.size());
+  delete compacted;
+  if (rename(tmp.c_str(), output.c_str()) != 0)
+  {
+    perror(output.c_str());
+    unlink(tmp.c_str());
+    return 1;
+  }
+  printf("%llu records kept, %llu dropped, %.1f MB\n", (unsigned long long)scan.newest.size(),
+         (unsigned long long)(scan.valid - scan.newest.size()), live / 1048576.0);
+  return 0;
+}
@@ -3,20 +3,15 @@ SHELL = /bin/sh
 .PHONY: all depend clean
 .SUFFIXES: .cc .o
 
-ifndef NTHREADS
-  NTHREADS = 8
-endif
-
-
 LIBS = 
 INCS = -lm
 
 ifeq ($(TAG),dbg)
   DBG = -Wall 
-  OPT = -ggdb -g -O0 -DNTHREADS=1  -gstabs+
+  OPT = -ggdb -g -O0 -gstabs+
 else
   DBG = 
-  OPT = -O3 -msse2 -mfpmath=sse -DNTHREADS=$(NTHREADS)
+  OPT = -O3 -msse2 -mfpmath=sse
 endif
 
 #CXXFLAGS = -Wall -Wno-unknown-pragmas -Winline $(DBG) $(OPT) 
@@ -26,7 +21,7 @@ CC  = gcc -m32
 
 SRCS  = area.cc bank.cc mat.cc main.cc Ucache.cc io.cc technology.cc basic_circuit.cc parameter.cc \
 		decoder.cc component.cc uca.cc subarray.cc wire.cc htree2.cc \
-		cacti_interface.cc router.cc nuca.cc crossbar.cc arbiter.cc powergating.cc 
+		cacti_interface.cc router.cc nuca.cc crossbar.cc arbiter.cc powergating.cc thread_pool.cc 
 
 OBJS = $(patsubst %.cc,obj_$(TAG)/%.o,$(SRCS))
 PYTHONLIB_SRCS = $(patsubst main.cc, ,$(SRCS)) obj_$(TAG)/cacti_wrap.cc
@@ -0,0 +1,301 @@
+/*****************************************************************************
+ *                                McPAT/CACTI
+ *                      SOFTWARE LICENSE AGREEMENT
+ *            Copyright 2012 Hewlett-Packard Development Company, L.P.
+ *                          All Rights Reserved
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.”
+ *
+ ***************************************************************************/
+
+#include <sys/types.h>
+#include <sys/stat.h>
+#include <sys/mman.h>
+#include <fcntl.h>
+#include <unistd.h>
+#include <errno.h>
+#include <stdio.h>
+#include <string.h>
+#include <iostream>
+
+#include "cacti_cache.h"
+
+#define CACTI_CACHE_MAGIC   "CACTITB1"
+#define CACTI_CACHE_VERSION 1
+
+struct CactiCacheHeader
+{
+  char     magic[8];
+  uint32_t version;
+  uint32_t header_size;
+  uint64_t nbuckets;     // power of two
+  uint64_t data_start;   // offset of the append area
+  uint64_t data_size;    // bytes of the append area
+  uint64_t end;          // next free offset, grows with atomic adds
+  uint64_t records;      // published records
+};
+
+struct CactiCacheRecord
+{
+  uint64_t next;         // offset of the next record of the bucket, 0 at the end
+  uint64_t hash;         // of the key
+  uint64_t checksum;     // of the hash, sizes, key and value
+  uint32_t key_size;
+  uint32_t value_size;
+  // followed by the key and the value, padded to 8 bytes
+
+  const char * key() const { return (const char *)(this + 1); }
+  const char * value() const { return key() + key_size; }
+};
+
+static inline uint64_t align8(uint64_t n)
+{
+  return (n + 7) & ~(uint64_t)7;
+}
+
+// FNV-1a, 64 bit
+static uint64_t fnv1a(const void * data, size_t size, uint64_t h = 14695981039346656037ULL)
+{
+  const unsigned char * p = (const unsigned char *)data;
+  for (size_t i = 0; i < size; i++)
+  {
+    h ^= p[i];
+    h *= 1099511628211ULL;
+  }
+  return h;
+}
+
+static uint64_t record_checksum(uint64_t hash, const void * key, uint32_t key_size,
+                                const void * value, uint32_t value_size)
+{
+  uint32_t sizes[2] = { key_size, value_size };
+  uint64_t h = fnv1a(&hash, sizeof(hash));
+  h = fnv1a(sizes, sizeof(sizes), h);
+  h = fnv1a(key, key_size, h);
+  return fnv1a(value, value_size, h);
+}
+
+static uint64_t bucket_count(uint64_t capacity)
+{
+  // one bucket per 4KB of records, a CACTI result alone is over 20KB
+  uint64_t n = 1024;
+  while (n < capacity / 4096)
+    n <<= 1;
+  return n;
+}
+
+// Creates an empty cache at path.  The cache is built in a private file and
+// linked into place, so other processes never see a partial header; if
+// another process got there first, its cache is used.
+static bool create(const string & path, uint64_t capacity)
+{
+  char pid[32];
+  snprintf(pid, sizeof(pid), ".%d", (int)getpid());
+  string tmp = path + pid;
+  int fd = ::open(tmp.c_str(), O_RDWR | O_CREAT | O_EXCL, 0600);
+  if (fd < 0)
+    return false;
+
+  CactiCacheHeader header;
+  memset(&header, 0, sizeof(header));
+  memcpy(header.magic, CACTI_CACHE_MAGIC, sizeof(header.magic));
+  header.version = CACTI_CACHE_VERSION;
+  header.header_size = sizeof(header);
+  header.nbuckets = bucket_count(capacity);
+  header.data_start = align8(sizeof(header) + header.nbuckets * sizeof(uint64_t));
+  header.data_size = align8(capacity);
+  header.end = header.data_start;
+
+  // the file is sparse, untouched buckets and records read as zero
+  bool ok = ftruncate(fd, header.data_start + header.data_size) == 0
+         && pwrite(fd, &header, sizeof(header), 0) == (ssize_t)sizeof(header);
+  close(fd);
+  if (ok && link(tmp.c_str(), path.c_str()) != 0 && errno != EEXIST)
+    ok = false;
+  unlink(tmp.c_str());
+  return ok;
+}
+
+CactiCache * CactiCache::open(const string & path, bool read_only, uint64_t capacity)
+{
+  int fd = ::open(path.c_str(), read_only ? O_RDONLY : O_RDWR);
+  if (fd < 0 && errno == ENOENT && !read_only && create(path, capacity))
+    fd = ::open(path.c_str(), O_RDWR);
+  if (fd < 0)
+    return NULL;
+
+  struct stat st;
+  if (fstat(fd, &st) != 0 || (uint64_t)st.st_size < sizeof(CactiCacheHeader))
+  {
+    close(fd);
+    return NULL;
+  }
+  char * base = (char *)mmap(NULL, st.st_size, read_only ? PROT_READ : PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+  if (base == MAP_FAILED)
+  {
+    close(fd);
+    return NULL;
+  }
+
+  const CactiCacheHeader * header = (const CactiCacheHeader *)base;
+  if (memcmp(header->magic, CACTI_CACHE_MAGIC, sizeof(header->magic)) != 0
+      || header->version != CACTI_CACHE_VERSION
+      || header->header_size != sizeof(CactiCacheHeader)
+      || header->nbuckets == 0 || (header->nbuckets & (header->nbuckets - 1)) != 0
+      || header->data_start != align8(sizeof(CactiCacheHeader) + header->nbuckets * sizeof(uint64_t))
+      || header->data_start + header->data_size != (uint64_t)st.st_size)
+  {
+    munmap(base, st.st_size);
+    close(fd);
+    return NULL;
+  }
+  return new CactiCache(fd, base, st.st_size, read_only);
+}
+
+CactiCache::CactiCache(int fd_, char * base_, uint64_t size_, bool read_only_)
+  : fd(fd_), base(base_), size(size_), read_only(read_only_), full_warned(false)
+{
+  header = (CactiCacheHeader *)base;
+  heads = (uint64_t *)(base + sizeof(CactiCacheHeader));
+}
+
+CactiCache::~CactiCache()
+{
+  munmap(base, size);
+  close(fd);
+}
+
+// The record at offset, or NULL if it would not lie within the append area
+const CactiCacheRecord * CactiCache::record(uint64_t offset) const
+{
+  if (offset < header->data_start || offset % 8 != 0
+      || offset + sizeof(CactiCacheRecord) > size)
+    return NULL;
+  const CactiCacheRecord * rec = (const CactiCacheRecord *)(base + offset);
+  if (offset + sizeof(CactiCacheRecord) + (uint64_t)rec->key_size + rec->value_size > size)
+    return NULL;
+  return rec;
+}
+
+bool CactiCache::get(const void * key, uint32_t key_size, void * value, uint32_t value_size) const
+{
+  uint64_t hash = fnv1a(key, key_size);
+  uint64_t offset = __atomic_load_n(&heads[hash & (header->nbuckets - 1)], __ATOMIC_ACQUIRE);
+  // a damaged file could link the chain into a loop
+  uint64_t steps = __atomic_load_n(&header->records, __ATOMIC_RELAXED) + 64;
+  for (; offset && steps; steps--)
+  {
+    const CactiCacheRecord * rec = record(offset);
+    if (!rec)
+      break;
+    if (rec->hash == hash && rec->key_size == key_size && rec->value_size == value_size
+        && memcmp(rec->key(), key, key_size) == 0
+        && rec->checksum == record_checksum(hash, rec->key(), key_size, rec->value(), value_size))
+    {
+      memcpy(value, rec->value(), value_size);
+      return true;
+    }
+    offset = rec->next;
+  }
+  return false;
+}
+
+uint64_t CactiCache::record_size(uint32_t key_size, uint32_t value_size)
+{
+  return align8(sizeof(CactiCacheRecord) + (uint64_t)key_size + value_size);
+}
+
+bool CactiCache::put(const void * key, uint32_t key_size, const void * value, uint32_t value_size)
+{
+  if (read_only)
+    return false;
+
+  uint64_t rec_size = record_size(key_size, value_size);
+  uint64_t offset = __atomic_fetch_add(&header->end, rec_size, __ATOMIC_RELAXED);
+  if (offset + rec_size > size)
+  {
+    if (!full_warned)
+      cerr << "Warning: CACTI cache is full, new results are not stored (run cachetool compact)" << endl;
+    full_warned = true;
+    return false;
+  }
+
+  CactiCacheRecord * rec = (CactiCacheRecord *)(base + offset);
+  rec->hash = fnv1a(key, key_size);
+  rec->key_size = key_size;
+  rec->value_size = value_size;
+  memcpy((char *)rec->key(), key, key_size);
+  memcpy((char *)rec->value(), value, value_size);
+  rec->checksum = record_checksum(rec->hash, key, key_size, value, value_size);
+
+  // publish: the record is complete before it is reachable from its bucket
+  uint64_t * head = &heads[rec->hash & (header->nbuckets - 1)];
+  uint64_t next = __atomic_load_n(head, __ATOMIC_RELAXED);
+  do
+    rec->next = next;
+  while (!__atomic_compare_exchange_n(head, &next, offset, true, __ATOMIC_RELEASE, __ATOMIC_RELAXED));
+  __atomic_fetch_add(&header->records, 1, __ATOMIC_RELAXED);
+  return true;
+}
+
+void CactiCache::scan(void (*visit)(void * arg, const void * key, uint32_t key_size,
+                                    const void * value, uint32_t value_size), void * arg) const
+{
+  uint64_t max_steps = __atomic_load_n(&header->records, __ATOMIC_RELAXED) + 64;
+  for (uint64_t b = 0; b < header->nbuckets; b++)
+  {
+    uint64_t offset = __atomic_load_n(&heads[b], __ATOMIC_ACQUIRE);
+    for (uint64_t steps = max_steps; offset && steps; steps--)
+    {
+      const CactiCacheRecord * rec = record(offset);
+      if (!rec)
+        break;
+      if (rec->checksum == record_checksum(rec->hash, rec->key(), rec->key_size, rec->value(), rec->value_size)
+          && rec->hash == fnv1a(rec->key(), rec->key_size))
+        visit(arg, rec->key(), rec->key_size, rec->value(), rec->value_size);
+      offset = rec->next;
+    }
+  }
+}
+
+uint64_t CactiCache::records() const
+{
+  return __atomic_load_n(&header->records, __ATOMIC_RELAXED);
+}
+
+uint64_t CactiCache::used() const
+{
+  uint64_t end = __atomic_load_n(&header->end, __ATOMIC_RELAXED);
+  return (end < size ? end : size) - header->data_start;
+}
+
+uint64_t CactiCache::capacity() const
+{
+  return header->data_size;
+}
+
+uint64_t CactiCache::buckets() const
+{
+  return header->nbuckets;
+}
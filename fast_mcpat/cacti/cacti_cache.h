@@ -0,0 +1,101 @@
+/*****************************************************************************
+ *                                McPAT/CACTI
+ *                      SOFTWARE LICENSE AGREEMENT
+ *            Copyright 2012 Hewlett-Packard Development Company, L.P.
+ *                          All Rights Reserved
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.”
+ *
+ ***************************************************************************/
+
+
+#ifndef __CACTI_CACHE_H__
+#define __CACTI_CACHE_H__
+
+#include <stdint.h>
+#include <stddef.h>
+#include <string>
+
+using namespace std;
+
+/*
+ * Cache of CACTI results shared by concurrent McPAT processes.
+ *
+ * The cache is one file mapped by every process: a header, a table of
+ * bucket heads and an append area of records.  A writer reserves space for
+ * its record with an atomic add on the end of the append area, fills the
+ * record and then publishes it by swapping it in at the head of its bucket
+ * with a compare-and-swap.  Readers walk the bucket chains without locks,
+ * and records are never modified once published, so the newest record of a
+ * key wins.  Nothing is synced: a record left half written by a crash fails
+ * its checksum and is skipped.  When the append area is full, new results
+ * are no longer stored (cachetool compact makes room).
+ */
+
+struct CactiCacheHeader;
+struct CactiCacheRecord;
+
+class CactiCache
+{
+  public:
+    // Maps the cache at path, creating it if needed.  Returns NULL if the
+    // file cannot be opened or is not a cache of this version.
+    static CactiCache * open(const string & path, bool read_only = false,
+                             uint64_t capacity = default_capacity);
+    ~CactiCache();
+
+    // Copies the newest value stored under key into value (value_size
+    // bytes), returns false if there is none of that size
+    bool get(const void * key, uint32_t key_size, void * value, uint32_t value_size) const;
+    // Appends a value, returns false if the cache is full or read only
+    bool put(const void * key, uint32_t key_size, const void * value, uint32_t value_size);
+
+    // Calls visit on every valid record, newest first within a bucket
+    void scan(void (*visit)(void * arg, const void * key, uint32_t key_size,
+                            const void * value, uint32_t value_size), void * arg) const;
+
+    uint64_t records() const;
+    uint64_t used() const;      // bytes of the append area in use
+    uint64_t capacity() const;  // bytes of the append area
+    uint64_t buckets() const;
+
+    // Bytes of the append area taken by a record
+    static uint64_t record_size(uint32_t key_size, uint32_t value_size);
+
+    static const uint64_t default_capacity = 256ULL << 20;
+
+  private:
+    CactiCache(int fd_, char * base_, uint64_t size_, bool read_only_);
+    const CactiCacheRecord * record(uint64_t offset) const;
+
+    int fd;
+    char * base;
+    uint64_t size;
+    bool read_only;
+    bool full_warned;
+    CactiCacheHeader * header;
+    uint64_t * heads;
+};
+
+#endif
@@ -32,6 +32,7 @@
 #include <sys/wait.h>
 #include <sys/stat.h>
 #include <fcntl.h>
+#include <sys/file.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <unistd.h>
@@ -40,10 +41,11 @@
 #include <fstream>
 #include <iostream>
 #include <sstream>
+#include <map>
 #include <string.h>
 #include <stddef.h>
 #ifdef ENABLE_CACHE
-#include <db.h>
+#include "cacti_cache.h"
 #endif
 
 #include "io.h"
@@ -3287,6 +3289,252 @@ if(0){ //detailed power-gating output
 }
 
 //McPAT's plain interface, please keep !!!
+unsigned long cacti_memory_hits = 0;
+unsigned long cacti_db_hits = 0;
+unsigned long cacti_solved = 0;
+unsigned long cacti_component_hits = 0;
+unsigned long cacti_component_built = 0;
+string cacti_cache_file;
+string cacti_cache_seed;
+
+static void key_int(string & key, const char * name, long long value)
+{
+  char field[96];
+  snprintf(field, sizeof(field), "%s=%lld;", name, value);
+  key += field;
+}
+
+// Floating point parameters are rounded to 9 significant digits, so that
+// values computed in different ways (e.g. 22/1000.0 and 0.022) match
+static void key_real(string & key, const char * name, double value)
+{
+  char field[96];
+  snprintf(field, sizeof(field), "%s=%.9g;", name, value);
+  key += field;
+}
+
+#define KEY_INT(field)  key_int(key, #field, (long long)ip.field)
+#define KEY_REAL(field) key_real(key, #field, ip.field)
+
+string cacti_key(const InputParameter & ip)
+{
+  // bump the version when the parameters or the results change
+  string key = "cacti2;";
+
+  KEY_INT(cache_sz);
+  KEY_INT(line_sz);
+  KEY_INT(assoc);
+  KEY_INT(nbanks);
+  KEY_INT(out_w);
+  KEY_INT(specific_tag);
+  if (ip.specific_tag)
+    KEY_INT(tag_w);
+  KEY_INT(access_mode);
+  KEY_INT(obj_func_dyn_energy);
+  KEY_INT(obj_func_dyn_power);
+  KEY_INT(obj_func_leak_power);
+  KEY_INT(obj_func_cycle_t);
+
+  // F_sz_nm is only printed, user defined voltages only count when enabled
+  KEY_REAL(F_sz_um);
+  KEY_INT(specific_hp_vdd);
+  if (ip.specific_hp_vdd)
+    KEY_REAL(hp_Vdd);
+  KEY_INT(specific_lstp_vdd);
+  if (ip.specific_lstp_vdd)
+    KEY_REAL(lstp_Vdd);
+  KEY_INT(specific_lop_vdd);
+  if (ip.specific_lop_vdd)
+    KEY_REAL(lop_Vdd);
+  KEY_INT(specific_vcc_min);
+  if (ip.specific_vcc_min)
+    KEY_REAL(user_defined_vcc_min);
+
+  KEY_INT(num_rw_ports);
+  KEY_INT(num_rd_ports);
+  KEY_INT(num_wr_ports);
+  KEY_INT(num_se_rd_ports);
+  KEY_INT(num_search_ports);
+  KEY_INT(is_main_mem);
+  KEY_INT(is_cache);
+  KEY_INT(pure_ram);
+  KEY_INT(pure_cam);
+  KEY_INT(rpters_in_htree);
+  KEY_INT(ver_htree_wires_over_array);
+  KEY_INT(broadcast_addr_din_over_ver_htrees);
+  KEY_INT(temp);
+
+  KEY_INT(ram_cell_tech_type);
+  KEY_INT(peri_global_tech_type);
+  KEY_INT(data_arr_ram_cell_tech_type);
+  KEY_INT(data_arr_peri_global_tech_type);
+  KEY_INT(tag_arr_ram_cell_tech_type);
+  KEY_INT(tag_arr_peri_global_tech_type);
+
+  KEY_INT(burst_len);
+  KEY_INT(int_prefetch_w);
+  KEY_INT(page_sz_bits);
+
+  KEY_INT(ic_proj_type);
+  KEY_INT(wire_is_mat_type);
+  KEY_INT(wire_os_mat_type);
+  KEY_INT(wt);
+  KEY_INT(force_wiretype);
+  KEY_INT(force_cache_config);
+  if (ip.force_cache_config)
+  {
+    KEY_INT(ndbl);
+    KEY_INT(ndwl);
+    KEY_INT(nspd);
+    KEY_INT(ndsam1);
+    KEY_INT(ndsam2);
+    KEY_INT(ndcm);
+  }
+
+  KEY_INT(delay_wt);
+  KEY_INT(dynamic_power_wt);
+  KEY_INT(leakage_power_wt);
+  KEY_INT(cycle_time_wt);
+  KEY_INT(area_wt);
+  KEY_INT(delay_dev);
+  KEY_INT(dynamic_power_dev);
+  KEY_INT(leakage_power_dev);
+  KEY_INT(cycle_time_dev);
+  KEY_INT(area_dev);
+  KEY_INT(ed);
+
+  // the cache level, core count and the NUCA weights only matter to NUCA
+  KEY_INT(nuca);
+  if (ip.nuca)
+  {
+    KEY_INT(cache_level);
+    KEY_INT(cores);
+    KEY_INT(nuca_bank_count);
+    KEY_INT(force_nuca_bank);
+    KEY_INT(delay_wt_nuca);
+    KEY_INT(dynamic_power_wt_nuca);
+    KEY_INT(leakage_power_wt_nuca);
+    KEY_INT(cycle_time_wt_nuca);
+    KEY_INT(area_wt_nuca);
+    KEY_INT(delay_dev_nuca);
+    KEY_INT(dynamic_power_dev_nuca);
+    KEY_INT(leakage_power_dev_nuca);
+    KEY_INT(cycle_time_dev_nuca);
+    KEY_INT(area_dev_nuca);
+  }
+
+  KEY_INT(fast_access);
+  KEY_INT(block_sz);
+  KEY_INT(tag_assoc);
+  KEY_INT(data_assoc);
+  KEY_INT(is_seq_acc);
+  KEY_INT(fully_assoc);
+  KEY_INT(nsets);
+  KEY_INT(add_ecc_b_);
+
+  // throughput, latency and the pipelining parameters are McPAT's timing
+  // constraints (see ArrayST::optimize_array), CACTI does not read them
+  KEY_INT(array_power_gated);
+  KEY_INT(bitline_floating);
+  KEY_INT(wl_power_gated);
+  KEY_INT(cl_power_gated);
+  KEY_INT(interconect_power_gated);
+  KEY_INT(power_gating);
+  KEY_REAL(perfloss);
+  KEY_INT(cl_vertical);
+  KEY_INT(long_channel_device);
+  return key;
+}
+
+#undef KEY_INT
+#undef KEY_REAL
+
+#ifdef ENABLE_CACHE
+// The cache is a file mapped by all concurrent McPAT processes, see
+// cacti_cache.h.  A seed (e.g. a pre-warmed cache shipped with the
+// processor template) is only read, its hits are copied to the cache.
+static CactiCache *cache = NULL;
+static CactiCache *seed = NULL;
+
+static void open_cache()
+{
+  static bool cache_opened = false;
+  if (cache_opened)
+    return;
+  cache_opened = true;
+  string path = cacti_cache_file;
+  if (path.empty())
+    path = string(getenv("TMPDIR") ? getenv("TMPDIR") : "/tmp") + "/mcpat-" + (getenv("USER") ? getenv("USER") : "") + ".cacti";
+  cache = CactiCache::open(path);
+  if (cache == NULL)
+    cerr << "Warning: cannot open CACTI cache " << path << ", running uncached" << endl;
+  if (!cacti_cache_seed.empty())
+  {
+    seed = CactiCache::open(cacti_cache_seed, true);
+    if (seed == NULL)
+      cerr << "Warning: cannot open CACTI cache seed " << cacti_cache_seed << ", ignoring it" << endl;
+  }
+}
+#endif
+
+// Results already found by this process (e.g. by an earlier request in
+// McPAT server mode) are served from memory without touching the cache
+static map<string, string> solved;
+
+int cacti_cache_get(const string & key, void * value, unsigned int size)
+{
+  map<string, string>::iterator memo = solved.find(key);
+  if (memo != solved.end() && memo->second.size() == size)
+  {
+    memcpy(value, memo->second.data(), size);
+    return 1;
+  }
+#ifdef ENABLE_CACHE
+  open_cache();
+  if (cache && cache->get(key.data(), key.size(), value, size))
+  {
+    solved[key] = string((char*)value, size);
+    return 2;
+  }
+  if (seed && seed->get(key.data(), key.size(), value, size))
+  {
+    if (cache)
+      cache->put(key.data(), key.size(), value, size);
+    solved[key] = string((char*)value, size);
+    return 2;
+  }
+#endif
+  return 0;
+}
+
+void cacti_cache_put(const string & key, const void * value, unsigned int size)
+{
+  solved[key] = string((const char*)value, size);
+#ifdef ENABLE_CACHE
+  open_cache();
+  if (cache)
+    cache->put(key.data(), key.size(), value, size);
+#endif
+}
+
+bool cacti_cache_shared()
+{
+#ifdef ENABLE_CACHE
+  open_cache();
+  return cache != NULL;
+#else
+  return false;
+#endif
+}
+
+void cacti_init(InputParameter * const local_interface)
+{
+  g_ip = local_interface;
+  if (!g_ip->error_checking()) exit(0);
+  init_tech_params(g_ip->F_sz_um, false);
+  Wire winit; // initializes the wires
+}
+
 uca_org_t cacti_interface(InputParameter  * const local_interface)
 {
 //  g_ip = new InputParameter();
@@ -3414,61 +3662,26 @@ uca_org_t cacti_interface(InputParameter  * const local_interface)
 
 
 
-#ifdef ENABLE_CACHE
-  static DB *dbp = NULL;
+  // Only the leading plain data of the result is cached, solve() leaves
+  // the DVS and power gating results to update_dvs and update_pg
+  string key = cacti_key(*g_ip);
+  int found = cacti_cache_get(key, &fin_res, offsetof(uca_org_t, uca_q));
 
-  if (dbp == NULL)
+  if (found == 1)
   {
-    char filename[1024];
-    snprintf(filename, 1024, "%s/mcpat-%s.db", getenv("TMPDIR") ? getenv("TMPDIR") : "/tmp", getenv("USER"));
-    db_create(&dbp, NULL, 0);
-    dbp->open(dbp, NULL, filename, NULL, DB_HASH, DB_CREATE, 0);
+    cacti_memory_hits++;
   }
-
-  DBT key, data;
-  memset(&key, 0, sizeof(DBT));
-  memset(&data, 0, sizeof(DBT));
-
-  size_t o1 = offsetof(InputParameter, first),
-         o2 = offsetof(InputParameter, last);
-
-  // Create a clean copy of our input parameters, with zeroes on all unused locations
-  InputParameter clean_ip;
-  memset((char*)&clean_ip + o1, 0, o2 - o1); // Set everything to zero
-  clean_ip = *g_ip; // Copies over actual (used) data
-
-  key.data = (char*)&clean_ip + o1;
-  key.size = o2 - o1;
-
-
-  if (DB_NOTFOUND == dbp->get(dbp, NULL, &key, &data, 0) /* Not found in DB */
-      || sizeof(fin_res) != data.size /* Or from a different version */)
+  else if (found == 2)
   {
-    solve(&fin_res);
-
-
-    // If found (but size is wrong): delete it
-    if (DB_NOTFOUND != dbp->get(dbp, NULL, &key, &data, 0))
-      dbp->del(dbp, NULL, &key, 0);
-
-    data.data = &fin_res;
-    data.size = sizeof(fin_res);
-    int res = dbp->put(dbp, NULL, &key, &data, DB_NOOVERWRITE);
-    if (res)
-      printf("DB write error: %d\n", res);
-    dbp->sync(dbp, 0);
-
+    cacti_db_hits++;
   }
   else
   {
-    assert(sizeof(fin_res) == data.size);
-    memcpy(&fin_res, data.data, sizeof(fin_res));
+    solve(&fin_res);
+    cacti_solved++;
+    cacti_cache_put(key, &fin_res, offsetof(uca_org_t, uca_q));
   }
 
-#else
-   solve(&fin_res);
-#endif
-
   if (!g_ip->dvs_voltage.empty())
   {
 	  update_dvs(&fin_res);
@@ -41,5 +41,38 @@
 void output_data_csv(const uca_org_t & fin_res);
 void output_UCA(uca_org_t * fin_res);
 
+// Arrays solved by cacti_interface, and those served from the in-process
+// memo and from the CACTI cache, since the last reset (see mcpat -stats 1)
+extern unsigned long cacti_memory_hits;
+extern unsigned long cacti_db_hits;
+extern unsigned long cacti_solved;
+
+// Whole components (ArrayST) found in the cache, and built
+extern unsigned long cacti_component_hits;
+extern unsigned long cacti_component_built;
+
+// CACTI cache file (default $TMPDIR/mcpat-$USER.cacti) and an optional
+// read only seed cache, see cacti_cache.h
+extern string cacti_cache_file;
+extern string cacti_cache_seed;
+
+// Cache key of the input parameters: only the parameters CACTI's results
+// depend on, with floating point values rounded
+string cacti_key(const InputParameter & ip);
+
+// Looks a result up in memory, in the CACTI cache and in the seed.  Returns
+// 0 if there is none of that size, 1 if it was found in memory and 2 if it
+// was found in the cache or the seed.
+int cacti_cache_get(const string & key, void * value, unsigned int size);
+void cacti_cache_put(const string & key, const void * value, unsigned int size);
+
+// Whether results put in the cache are seen by other processes, i.e. the
+// CACTI cache file could be opened
+bool cacti_cache_shared();
+
+// Sets g_ip, the technology parameters and the wires up for an input, as
+// cacti_interface does
+void cacti_init(InputParameter * const local_interface);
+
 
 #endif
@@ -0,0 +1,263 @@
+/*****************************************************************************
+ *                                McPAT/CACTI
+ *                      SOFTWARE LICENSE AGREEMENT
+ *            Copyright 2012 Hewlett-Packard Development Company, L.P.
+ *                          All Rights Reserved
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.”
+ *
+ ***************************************************************************/
+
+
+#include <unistd.h>
+#include <sched.h>
+#include <stdlib.h>
+#include <iostream>
+
+#include "thread_pool.h"
+
+using namespace std;
+
+static ThreadPool * pool = NULL;
+static uint32_t requested_threads = 0;
+
+struct worker_arg
+{
+  ThreadPool * pool;
+  uint32_t thread;
+};
+
+uint32_t ThreadPool::available_cpus()
+{
+#ifdef CPU_COUNT
+  cpu_set_t cpus;
+  if (sched_getaffinity(0, sizeof(cpus), &cpus) == 0 && CPU_COUNT(&cpus) > 0)
+    return CPU_COUNT(&cpus);
+#endif
+  long n = sysconf(_SC_NPROCESSORS_ONLN);
+  return n > 0 ? n : 1;
+}
+
+void ThreadPool::set_threads(uint32_t nthreads)
+{
+  requested_threads = nthreads;
+}
+
+void ThreadPool::forked(uint32_t nthreads)
+{
+  //the parent's workers do not exist here, its pool cannot be stopped
+  pool = NULL;
+  requested_threads = nthreads;
+}
+
+ThreadPool * ThreadPool::get()
+{
+  uint32_t nthreads = requested_threads ? requested_threads : available_cpus();
+  if (pool && pool->size() != nthreads)
+  {
+    delete pool;
+    pool = NULL;
+  }
+  if (!pool)
+    pool = new ThreadPool(nthreads);
+  return pool;
+}
+
+ThreadPool::ThreadPool(uint32_t nthreads_)
+ : nthreads(nthreads_),
+   ranges(new Range[nthreads_]),
+   threads(new pthread_t[nthreads_]),
+   started(false),
+   stopping(false),
+   job(NULL),
+   job_arg(NULL),
+   generation(0),
+   busy(0)
+{
+  for (uint32_t t = 0; t < nthreads; t++)
+  {
+    pthread_mutex_init(&ranges[t].lock, NULL);
+    ranges[t].begin = ranges[t].end = 0;
+  }
+  pthread_mutex_init(&run_lock, NULL);
+  pthread_mutex_init(&lock, NULL);
+  pthread_cond_init(&start_cond, NULL);
+  pthread_cond_init(&done_cond, NULL);
+}
+
+ThreadPool::~ThreadPool()
+{
+  if (started)
+  {
+    pthread_mutex_lock(&lock);
+    stopping = true;
+    pthread_cond_broadcast(&start_cond);
+    pthread_mutex_unlock(&lock);
+    for (uint32_t t = 1; t < nthreads; t++)
+      pthread_join(threads[t], NULL);
+  }
+  for (uint32_t t = 0; t < nthreads; t++)
+    pthread_mutex_destroy(&ranges[t].lock);
+  pthread_mutex_destroy(&run_lock);
+  pthread_mutex_destroy(&lock);
+  pthread_cond_destroy(&start_cond);
+  pthread_cond_destroy(&done_cond);
+  delete [] ranges;
+  delete [] threads;
+}
+
+void * ThreadPool::worker_main(void * void_arg)
+{
+  worker_arg * arg = (worker_arg *)void_arg;
+  ThreadPool * p = arg->pool;
+  uint32_t thread = arg->thread;
+  delete arg;
+
+  uint64_t seen = 0;
+  pthread_mutex_lock(&p->lock);
+  while (true)
+  {
+    while (p->generation == seen && !p->stopping)
+      pthread_cond_wait(&p->start_cond, &p->lock);
+    if (p->stopping)
+      break;
+    seen = p->generation;
+    pthread_mutex_unlock(&p->lock);
+
+    p->work(thread);
+
+    pthread_mutex_lock(&p->lock);
+    if (--p->busy == 0)
+      pthread_cond_signal(&p->done_cond);
+  }
+  pthread_mutex_unlock(&p->lock);
+  return NULL;
+}
+
+// Takes the next task of the thread's own range, or steals the back half of
+// the largest other range.  Returns false once every range is empty.
+bool ThreadPool::next_task(uint32_t thread, uint32_t & task)
+{
+  Range & own = ranges[thread];
+  while (true)
+  {
+    pthread_mutex_lock(&own.lock);
+    if (own.begin < own.end)
+    {
+      task = own.begin;
+      __atomic_store_n(&own.begin, task + 1, __ATOMIC_RELAXED);
+      pthread_mutex_unlock(&own.lock);
+      return true;
+    }
+    pthread_mutex_unlock(&own.lock);
+
+    // the sizes are only a hint, the victim is checked again under its lock
+    uint32_t victim = thread, largest = 0;
+    for (uint32_t t = 0; t < nthreads; t++)
+    {
+      uint32_t begin = __atomic_load_n(&ranges[t].begin, __ATOMIC_RELAXED);
+      uint32_t end = __atomic_load_n(&ranges[t].end, __ATOMIC_RELAXED);
+      if (t != thread && end > begin && end - begin > largest)
+      {
+        victim = t;
+        largest = end - begin;
+      }
+    }
+    if (victim == thread)
+      return false;
+
+    Range & other = ranges[victim];
+    pthread_mutex_lock(&other.lock);
+    if (other.begin < other.end)
+    {
+      uint32_t mid = other.end - (other.end - other.begin + 1) / 2;
+      uint32_t end = other.end;
+      __atomic_store_n(&other.end, mid, __ATOMIC_RELAXED);
+      pthread_mutex_unlock(&other.lock);
+      // only this thread refills its own empty range
+      task = mid;
+      pthread_mutex_lock(&own.lock);
+      __atomic_store_n(&own.begin, mid + 1, __ATOMIC_RELAXED);
+      __atomic_store_n(&own.end, end, __ATOMIC_RELAXED);
+      pthread_mutex_unlock(&own.lock);
+      return true;
+    }
+    pthread_mutex_unlock(&other.lock);
+  }
+}
+
+void ThreadPool::work(uint32_t thread)
+{
+  uint32_t task;
+  while (next_task(thread, task))
+    job(job_arg, task, thread);
+}
+
+void ThreadPool::run(uint32_t ntasks, task_fn task, void * arg)
+{
+  if (nthreads == 1 || ntasks <= 1 || pthread_mutex_trylock(&run_lock) != 0)
+  {
+    for (uint32_t t = 0; t < ntasks; t++)
+      task(arg, t, 0);
+    return;
+  }
+
+  if (!started)
+  {
+    for (uint32_t t = 1; t < nthreads; t++)
+    {
+      worker_arg * warg = new worker_arg;
+      warg->pool = this;
+      warg->thread = t;
+      if (pthread_create(&threads[t], NULL, worker_main, warg) != 0)
+      {
+        cerr << "cannot start CACTI worker thread " << t << endl;
+        exit(1);
+      }
+    }
+    started = true;
+  }
+
+  job = task;
+  job_arg = arg;
+  for (uint32_t t = 0; t < nthreads; t++)
+  {
+    ranges[t].begin = (uint64_t)ntasks * t / nthreads;
+    ranges[t].end = (uint64_t)ntasks * (t + 1) / nthreads;
+  }
+
+  pthread_mutex_lock(&lock);
+  busy = nthreads - 1;
+  generation++;
+  pthread_cond_broadcast(&start_cond);
+  pthread_mutex_unlock(&lock);
+
+  work(0);
+
+  pthread_mutex_lock(&lock);
+  while (busy)
+    pthread_cond_wait(&done_cond, &lock);
+  pthread_mutex_unlock(&lock);
+  pthread_mutex_unlock(&run_lock);
+}
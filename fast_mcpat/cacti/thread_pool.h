@@ -0,0 +1,104 @@
+/*****************************************************************************
+ *                                McPAT/CACTI
+ *                      SOFTWARE LICENSE AGREEMENT
+ *            Copyright 2012 Hewlett-Packard Development Company, L.P.
+ *                          All Rights Reserved
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.”
+ *
+ ***************************************************************************/
+
+
+
+#ifndef __THREAD_POOL_H__
+#define __THREAD_POOL_H__
+
+#include <stdint.h>
+#include <pthread.h>
+
+/*
+ * Persistent worker threads for the CACTI design space search.
+ *
+ * run() splits its tasks into one contiguous range per thread.  A thread
+ * takes tasks from the front of its own range and, once that is empty,
+ * steals the back half of the largest range left, so all threads stay busy
+ * when some candidates take much longer than others.  The calling thread
+ * works as thread 0, the other threads are started by the first run() and
+ * wait for the next one in between.
+ */
+
+class ThreadPool
+{
+  public:
+    typedef void (*task_fn)(void * arg, uint32_t task, uint32_t thread);
+
+    // The pool of the process, see set_threads
+    static ThreadPool * get();
+    // Number of threads of the pool, 0 for one per CPU the process may
+    // run on.  Takes effect at the next get().
+    static void set_threads(uint32_t nthreads);
+    static uint32_t available_cpus();
+    // In a child of fork(), which only has the calling thread: forgets the
+    // pool of the parent and sets the threads of the child's own pool
+    static void forked(uint32_t nthreads);
+
+    uint32_t size() const { return nthreads; }
+
+    // Calls task(arg, t, thread) for every t < ntasks, returns once all
+    // have returned.  thread < size() is the thread running the task.  When
+    // another run() is in progress, the tasks run in the calling thread.
+    void run(uint32_t ntasks, task_fn task, void * arg);
+
+  private:
+    struct Range
+    {
+      pthread_mutex_t lock;
+      uint32_t begin;
+      uint32_t end;
+    };
+
+    ThreadPool(uint32_t nthreads_);
+    ~ThreadPool();
+    static void * worker_main(void * arg);
+    bool next_task(uint32_t thread, uint32_t & task);
+    void work(uint32_t thread);
+
+    uint32_t nthreads;
+    Range * ranges;
+    pthread_t * threads;
+    bool started;
+    bool stopping;
+
+    task_fn job;
+    void * job_arg;
+
+    pthread_mutex_t run_lock;   // held by the run() in progress
+    pthread_mutex_t lock;
+    pthread_cond_t start_cond;
+    pthread_cond_t done_cond;
+    uint64_t generation;        // of the current run()
+    uint32_t busy;              // workers still in the current run()
+};
+
+#endif
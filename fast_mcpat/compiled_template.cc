@@ -0,0 +1,458 @@
+/*****************************************************************************
+ *                                McPAT
+ *                      SOFTWARE LICENSE AGREEMENT
+ *            Copyright 2012 Hewlett-Packard Development Company, L.P.
+ *                          All Rights Reserved
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.”
+ *
+ ***************************************************************************/
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <set>
+#include "compiled_template.h"
+
+#define TEMPLATE_MAGIC   "MCPATTPL"
+#define TEMPLATE_VERSION 1
+
+CompiledTemplate::CompiledTemplate(XMLNode xMainNode)
+:valid(true)
+{
+  ParseXML * XML = new ParseXML();
+  ParseXML * initial = new ParseXML();
+  vector<XMLWrite> parse_writes;
+  XML->writes = &parse_writes;
+  XML->parse(xMainNode);
+  XML->writes = NULL;
+  initial->initialize();
+
+  //the bytes parse() changed, close changes in one run
+  const char * parsed_sys = (const char *)&XML->sys;
+  const char * initial_sys = (const char *)&initial->sys;
+  for (unsigned int i = 0; i < sizeof(XML->sys); i++)
+  {
+    if (parsed_sys[i] == initial_sys[i])
+      continue;
+    unsigned int end = i + 1;
+    for (unsigned int same = 0; end < sizeof(XML->sys) && same < 16; end++)
+      same = parsed_sys[end] == initial_sys[end] ? same + 1 : 0;
+    while (parsed_sys[end - 1] == initial_sys[end - 1])
+      end--;
+    Run run;
+    run.offset = i;
+    run.bytes.assign(parsed_sys + i, end - i);
+    runs.push_back(run);
+    i = end;
+  }
+  for (int i = 0; i < MAX_NUM_CORES; i++)
+    if (!XML->core_signature[i].empty() || !XML->L2_signature[i].empty())
+      signatures[i] = make_pair(XML->core_signature[i], XML->L2_signature[i]);
+
+  add_items(xMainNode, "");
+
+  set<size_t> stat_fields;
+  for (unsigned int i = 0; i < parse_writes.size(); i++)
+    if (stats.count(parse_writes[i].slot))
+      stat_fields.insert(parse_writes[i].offset);
+  for (unsigned int i = 0; i < parse_writes.size() && valid; i++)
+  {
+    const XMLWrite & parse_write = parse_writes[i];
+    map<string, int>::const_iterator stat = stats.find(parse_write.slot);
+    if (stat == stats.end() && !stat_fields.count(parse_write.offset))
+      continue;
+    if (stat != stats.end() && parse_write.read == READ_STRING)
+      fail("stat " + parse_write.slot + " is not a number");
+    Write write;
+    write.stat = stat == stats.end() ? -1 : stat->second;
+    write.value = parse_write.value;
+    write.offset = parse_write.offset;
+    write.type = parse_write.type;
+    write.read = parse_write.read;
+    writes.push_back(write);
+  }
+
+  //the template has to give back what parse() read
+  if (valid)
+  {
+    parsed(initial);
+    if (memcmp(&initial->sys, &XML->sys, sizeof(XML->sys)) != 0)
+      fail("the template does not give back the parsed processor");
+  }
+  delete XML;
+  delete initial;
+}
+
+bool CompiledTemplate::fail(const string & reason)
+{
+  if (valid)
+    why = reason;
+  valid = false;
+  return false;
+}
+
+//records the elements of xNode in document order, each followed by its
+//children and an end item
+void CompiledTemplate::add_items(XMLNode xNode, const char * parent_id)
+{
+  Item item;
+  item.tag = xNode.getName();
+  item.has = 0;
+  item.stat = -1;
+  const char * id = xNode.getAttribute("id");
+  const char * name = xNode.getAttribute("name");
+  const char * value = xNode.getAttribute("value");
+  if (id) { item.id = id; item.has |= HAS_ID; }
+  if (name) { item.name = name; item.has |= HAS_NAME; }
+  if (value) { item.value = value; item.has |= HAS_VALUE; }
+  if (item.tag == "stat")
+  {
+    string slot = string(parent_id) + "/stat/" + item.name;
+    if (stats.count(slot))
+      fail("two stats " + slot);
+    item.stat = values.size();
+    stats[slot] = item.stat;
+    values.push_back(item.value);
+  }
+  items.push_back(item);
+  for (int i = 0; i < xNode.nChildNode(); i++)
+    add_items(xNode.getChildNode(i), id ? id : "");
+  items.push_back(Item());
+  items.back().has = 0;
+  items.back().stat = -1;
+}
+
+bool CompiledTemplate::set_stat(const string & slot, const char * value)
+{
+  map<string, int>::const_iterator stat = stats.find(slot);
+  if (stat == stats.end())
+    return false;
+  values[stat->second] = value;
+  return true;
+}
+
+void CompiledTemplate::parsed(ParseXML * XML) const
+{
+  vector<const char *> stat_values(values.size());
+  for (unsigned int i = 0; i < values.size(); i++)
+    stat_values[i] = values[i].c_str();
+  XML->initialize();
+  set_fields(XML, stat_values);
+}
+
+void CompiledTemplate::set_fields(ParseXML * XML, const vector<const char *> & stat_values) const
+{
+  char * sys = (char *)&XML->sys;
+  for (unsigned int i = 0; i < runs.size(); i++)
+    memcpy(sys + runs[i].offset, runs[i].bytes.data(), runs[i].bytes.size());
+  for (int i = 0; i < MAX_NUM_CORES; i++)
+  {
+    map<int, pair<string, string> >::const_iterator signature = signatures.find(i);
+    XML->core_signature[i] = signature == signatures.end() ? "" : signature->second.first;
+    XML->L2_signature[i] = signature == signatures.end() ? "" : signature->second.second;
+  }
+  for (unsigned int i = 0; i < writes.size(); i++)
+  {
+    const Write & write = writes[i];
+    XML->set_field(write.offset, write.type, write.read, write.stat < 0 ? write.value.c_str() : stat_values[write.stat]);
+  }
+}
+
+static inline const char * skip_space(const char * p)
+{
+  while (*p == ' ' || *p == '\t' || *p == '\r' || *p == '\n')
+    p++;
+  return p;
+}
+
+static inline bool same(const string & expected, const char * p, size_t length)
+{
+  return expected.size() == length && memcmp(expected.data(), p, length) == 0;
+}
+
+/*
+ * Reads the elements of xml in one pass and compares them with the items.
+ * The values of stats are not copied, stat_values points to them in xml (up
+ * to their closing quote, which ends them for atoi and atof).  An input this
+ * reader does not follow (entities, CDATA) is reported as different, it is
+ * then parsed in full.
+ */
+bool CompiledTemplate::read(const char * xml, ParseXML * XML) const
+{
+  vector<const char *> stat_values(values.size());
+  unsigned int next = 0;
+  int depth = 0;
+  const char * p = xml;
+  while (*p)
+  {
+    if (*p != '<')
+    {
+      p++;
+      continue;
+    }
+    if (p[1] == '?')
+    {
+      if (!(p = strstr(p, "?>"))) return false;
+      p += 2;
+      continue;
+    }
+    if (p[1] == '!')
+    {
+      if (strncmp(p, "<!--", 4) != 0) return false;
+      if (!(p = strstr(p + 4, "-->"))) return false;
+      p += 3;
+      continue;
+    }
+    if (p[1] == '/')
+    {
+      if (next >= items.size() || !items[next].tag.empty()) return false;
+      next++;
+      if (!(p = strchr(p, '>'))) return false;
+      p++;
+      if (--depth == 0) break;
+      continue;
+    }
+
+    const char * tag = ++p;
+    while (*p && *p != '>' && *p != '/' && *p != ' ' && *p != '\t' && *p != '\r' && *p != '\n')
+      p++;
+    if (next >= items.size()) return false;
+    const Item & item = items[next++];
+    if (!same(item.tag, tag, p - tag) || item.tag.empty()) return false;
+    int has = 0;
+    bool closed = false;
+    while (true)
+    {
+      p = skip_space(p);
+      if (p[0] == '/' && p[1] == '>') { p += 2; closed = true; break; }
+      if (p[0] == '>') { p++; break; }
+      const char * attribute = p;
+      while (*p && *p != '=' && *p != '>' && *p != '/' && *p != ' ' && *p != '\t' && *p != '\r' && *p != '\n')
+        p++;
+      size_t attribute_length = p - attribute;
+      p = skip_space(p);
+      if (*p != '=') return false;
+      p = skip_space(p + 1);
+      char quote = *p;
+      if (quote != '"' && quote != '\'') return false;
+      const char * value = ++p;
+      while (*p && *p != quote)
+        if (*p++ == '&') return false;
+      if (!*p) return false;
+      size_t value_length = p++ - value;
+
+      int attribute_bit = 0;
+      if (attribute_length == 2 && memcmp(attribute, "id", 2) == 0)
+      {
+        attribute_bit = HAS_ID;
+        if (!same(item.id, value, value_length)) return false;
+      }
+      else if (attribute_length == 4 && memcmp(attribute, "name", 4) == 0)
+      {
+        attribute_bit = HAS_NAME;
+        if (!same(item.name, value, value_length)) return false;
+      }
+      else if (attribute_length == 5 && memcmp(attribute, "value", 5) == 0)
+      {
+        attribute_bit = HAS_VALUE;
+        if (item.stat >= 0)
+          stat_values[item.stat] = value;
+        else if (!same(item.value, value, value_length))
+          return false;
+      }
+      if (has & attribute_bit) return false;
+      has |= attribute_bit;
+    }
+    if (has != item.has) return false;
+    if (item.stat >= 0 && !(has & HAS_VALUE))
+      stat_values[item.stat] = "";
+    depth++;
+    if (closed)
+    {
+      if (next >= items.size() || !items[next].tag.empty()) return false;
+      next++;
+      if (--depth == 0) break;
+    }
+  }
+  if (next != items.size() || depth != 0)
+    return false;
+
+  XML->initialize();
+  set_fields(XML, stat_values);
+  return true;
+}
+
+static void put_u32(FILE * file, unsigned int value)
+{
+  fwrite(&value, sizeof(value), 1, file);
+}
+
+static void put_string(FILE * file, const string & value)
+{
+  put_u32(file, value.size());
+  fwrite(value.data(), 1, value.size(), file);
+}
+
+static bool get_u32(FILE * file, unsigned int & value)
+{
+  return fread(&value, sizeof(value), 1, file) == 1;
+}
+
+static bool get_string(FILE * file, string & value)
+{
+  unsigned int size;
+  if (!get_u32(file, size) || size > (1u << 28))
+    return false;
+  value.resize(size);
+  return size == 0 || fread(&value[0], 1, size, file) == size;
+}
+
+bool CompiledTemplate::save(const char * path) const
+{
+  if (!valid)
+    return false;
+  FILE * file = fopen(path, "wb");
+  if (file == NULL)
+    return false;
+  fwrite(TEMPLATE_MAGIC, 1, 8, file);
+  put_u32(file, TEMPLATE_VERSION);
+  put_u32(file, sizeof(root_system));
+  put_u32(file, MAX_NUM_CORES);
+
+  put_u32(file, runs.size());
+  for (unsigned int i = 0; i < runs.size(); i++)
+  {
+    put_u32(file, runs[i].offset);
+    put_string(file, runs[i].bytes);
+  }
+  put_u32(file, signatures.size());
+  for (map<int, pair<string, string> >::const_iterator signature = signatures.begin(); signature != signatures.end(); ++signature)
+  {
+    put_u32(file, signature->first);
+    put_string(file, signature->second.first);
+    put_string(file, signature->second.second);
+  }
+  put_u32(file, items.size());
+  for (unsigned int i = 0; i < items.size(); i++)
+  {
+    put_string(file, items[i].tag);
+    put_string(file, items[i].id);
+    put_string(file, items[i].name);
+    put_string(file, items[i].value);
+    put_u32(file, items[i].has);
+  }
+  put_u32(file, writes.size());
+  for (unsigned int i = 0; i < writes.size(); i++)
+  {
+    put_u32(file, writes[i].stat);
+    put_string(file, writes[i].value);
+    put_u32(file, writes[i].offset);
+    put_u32(file, writes[i].type);
+    put_u32(file, writes[i].read);
+  }
+  bool written = !ferror(file);
+  return fclose(file) == 0 && written;
+}
+
+CompiledTemplate::CompiledTemplate(const char * path)
+:valid(true)
+{
+  FILE * file = fopen(path, "rb");
+  if (file == NULL)
+  {
+    fail(string("cannot open ") + path);
+    return;
+  }
+  char magic[8];
+  unsigned int version, sys_size, max_cores, count;
+  if (fread(magic, 1, 8, file) != 8 || memcmp(magic, TEMPLATE_MAGIC, 8) != 0)
+    fail(string(path) + " is not a compiled McPAT template");
+  else if (!get_u32(file, version) || !get_u32(file, sys_size) || !get_u32(file, max_cores)
+      || version != TEMPLATE_VERSION || sys_size != sizeof(root_system) || max_cores != MAX_NUM_CORES)
+    fail(string(path) + " was compiled by another version of McPAT");
+
+  bool complete = valid && get_u32(file, count);
+  for (unsigned int i = 0; complete && i < count; i++)
+  {
+    Run run;
+    complete = get_u32(file, run.offset) && get_string(file, run.bytes)
+      && run.offset + run.bytes.size() <= sizeof(root_system);
+    runs.push_back(run);
+  }
+  complete = complete && get_u32(file, count);
+  for (unsigned int i = 0; complete && i < count; i++)
+  {
+    unsigned int core;
+    pair<string, string> signature;
+    complete = get_u32(file, core) && get_string(file, signature.first) && get_string(file, signature.second)
+      && core < MAX_NUM_CORES;
+    signatures[core] = signature;
+  }
+  complete = complete && get_u32(file, count);
+  vector<string> parent_ids;
+  for (unsigned int i = 0; complete && i < count; i++)
+  {
+    Item item;
+    unsigned int has;
+    complete = get_string(file, item.tag) && get_string(file, item.id) && get_string(file, item.name)
+      && get_string(file, item.value) && get_u32(file, has);
+    item.has = has;
+    item.stat = -1;
+    if (item.tag.empty())
+    {
+      if (parent_ids.empty()) complete = false;
+      else parent_ids.pop_back();
+    }
+    else
+    {
+      if (item.tag == "stat")
+      {
+        item.stat = values.size();
+        stats[(parent_ids.empty() ? string() : parent_ids.back()) + "/stat/" + item.name] = item.stat;
+        values.push_back(item.value);
+      }
+      parent_ids.push_back(item.id);
+    }
+    items.push_back(item);
+  }
+  complete = complete && parent_ids.empty() && get_u32(file, count);
+  for (unsigned int i = 0; complete && i < count; i++)
+  {
+    Write write;
+    unsigned int stat, type, read;
+    complete = get_u32(file, stat) && get_string(file, write.value) && get_u32(file, write.offset)
+      && get_u32(file, type) && get_u32(file, read);
+    write.stat = stat;
+    write.type = type;
+    write.read = read;
+    if (write.stat >= (int)values.size() || write.offset >= sizeof(root_system)
+        || type > FIELD_STRING || read > READ_STRING)
+      complete = false;
+    writes.push_back(write);
+  }
+  if (valid && !complete)
+    fail(string(path) + " is truncated or corrupt");
+  fclose(file);
+}
@@ -0,0 +1,125 @@
+/*****************************************************************************
+ *                                McPAT
+ *                      SOFTWARE LICENSE AGREEMENT
+ *            Copyright 2012 Hewlett-Packard Development Company, L.P.
+ *                          All Rights Reserved
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.”
+ *
+ ***************************************************************************/
+#ifndef COMPILED_TEMPLATE_H_
+#define COMPILED_TEMPLATE_H_
+
+#include <string>
+#include <vector>
+#include <map>
+#include "xmlParser.h"
+#include "XML_Parse.h"
+
+using namespace std;
+
+/*
+ * A processor description parsed once, for inputs that only differ from it
+ * in their stats (WattWatcher only changes stats between runs).
+ *
+ * It keeps sys as ParseXML::parse() left it, the values parse() read into
+ * fields through its tables (see XML_Parse.cc), and the elements of the
+ * description in order.  The processor of an input is then the template
+ * with the fields of its stats set again from the stat values of the input.
+ * read() reads an input in one pass without building a DOM, checking that
+ * its components and params are those of the template.
+ *
+ * save() writes the template in a binary form that load() reads back
+ * without parsing any XML (mcpat -compile / -template).
+ */
+class CompiledTemplate
+{
+  public:
+    // Parses the processor description of xMainNode
+    CompiledTemplate(XMLNode xMainNode);
+    // Reads a template written by save()
+    CompiledTemplate(const char * path);
+
+    // false if the template could not be compiled (two stats of a component
+    // with the same name) or read (not a template of this build of McPAT)
+    bool ok() const { return valid; }
+    const string & error() const { return why; }
+    bool save(const char * path) const;
+
+    // Sets a stat, slot is "<component id>/stat/<name>".  Returns false if
+    // the template has no such stat.
+    bool set_stat(const string & slot, const char * value);
+    // The template with its current stats, as parse() would have read it
+    // into XML
+    void parsed(ParseXML * XML) const;
+    // The processor of an input in memory that has the components and params
+    // of the template in the same order, as parse() would have read it into
+    // XML.  Returns false if it does not, XML is then unchanged.
+    bool read(const char * xml, ParseXML * XML) const;
+
+  private:
+    // An element of the description (or its end)
+    struct Item
+    {
+      string tag;          // empty for the end of an element
+      string id;
+      string name;
+      string value;        // of a param
+      int has;             // HAS_* of the attributes the element has
+      int stat;            // index of its value in values for a stat, else -1
+    };
+    enum { HAS_ID = 1, HAS_NAME = 2, HAS_VALUE = 4 };
+    // A value parse() read into the field at offset in sys: values[stat], or
+    // value for a param.  Only the params written to the field of a stat too
+    // are kept, the others are in runs.
+    struct Write
+    {
+      int stat;
+      string value;
+      unsigned int offset;
+      char type;
+      char read;
+    };
+    // Bytes of sys that parse() changed from what initialize() sets
+    struct Run
+    {
+      unsigned int offset;
+      string bytes;
+    };
+
+    void add_items(XMLNode xNode, const char * parent_id);
+    void set_fields(ParseXML * XML, const vector<const char *> & stat_values) const;
+    bool fail(const string & reason);
+
+    bool valid;
+    string why;
+    vector<Item> items;
+    vector<Write> writes;
+    vector<Run> runs;
+    map<int, pair<string, string> > signatures;   // core and L2 signatures by index
+    vector<string> values;                         // stat values of the template
+    map<string, int> stats;                        // index in values by slot
+};
+
+#endif /* COMPILED_TEMPLATE_H_ */
@@ -1955,57 +1955,47 @@ void BranchPredictor::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 	bool power_gating = XML->sys.power_gating;
 	if (is_tdp)
 	{
-		cout << indent_str<< "Global Predictor:" << endl;
-		cout << indent_str_next << "Area = " << globalBPT->area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << globalBPT->power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? globalBPT->power.readOp.longer_channel_leakage:globalBPT->power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? globalBPT->power.readOp.power_gated_with_long_channel_leakage : globalBPT->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << globalBPT->power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << globalBPT->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Global Predictor");
+		report_value(indent_str_next, "Area", globalBPT->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", globalBPT->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? globalBPT->power.readOp.longer_channel_leakage:globalBPT->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? globalBPT->power.readOp.power_gated_with_long_channel_leakage : globalBPT->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", globalBPT->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", globalBPT->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
-		cout << indent_str << "Local Predictor:" << endl;
-		cout << indent_str << "L1_Local Predictor:" << endl;
-		cout << indent_str_next << "Area = " << L1_localBPT->area.get_area() *1e-6 << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << L1_localBPT->power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? L1_localBPT->power.readOp.longer_channel_leakage:L1_localBPT->power.readOp.leakage)  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel ? L1_localBPT->power.readOp.power_gated_with_long_channel_leakage : L1_localBPT->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << L1_localBPT->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << L1_localBPT->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Local Predictor");
+		report_section(indent_str, "L1_Local Predictor");
+		report_value(indent_str_next, "Area", L1_localBPT->area.get_area() *1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", L1_localBPT->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? L1_localBPT->power.readOp.longer_channel_leakage:L1_localBPT->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel ? L1_localBPT->power.readOp.power_gated_with_long_channel_leakage : L1_localBPT->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", L1_localBPT->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", L1_localBPT->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
-		cout << indent_str << "L2_Local Predictor:" << endl;
-		cout << indent_str_next << "Area = " << L2_localBPT->area.get_area() *1e-6 << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << L2_localBPT->power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? L2_localBPT->power.readOp.longer_channel_leakage:L2_localBPT->power.readOp.leakage)  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel ? L2_localBPT->power.readOp.power_gated_with_long_channel_leakage : L2_localBPT->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << L2_localBPT->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << L2_localBPT->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "L2_Local Predictor");
+		report_value(indent_str_next, "Area", L2_localBPT->area.get_area() *1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", L2_localBPT->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? L2_localBPT->power.readOp.longer_channel_leakage:L2_localBPT->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel ? L2_localBPT->power.readOp.power_gated_with_long_channel_leakage : L2_localBPT->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", L2_localBPT->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", L2_localBPT->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
 
-		cout << indent_str << "Chooser:" << endl;
-		cout << indent_str_next << "Area = " << chooser->area.get_area()  *1e-6 << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << chooser->power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? chooser->power.readOp.longer_channel_leakage:chooser->power.readOp.leakage)  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? chooser->power.readOp.power_gated_with_long_channel_leakage : chooser->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << chooser->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << chooser->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Chooser");
+		report_value(indent_str_next, "Area", chooser->area.get_area()  *1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", chooser->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? chooser->power.readOp.longer_channel_leakage:chooser->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? chooser->power.readOp.power_gated_with_long_channel_leakage : chooser->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", chooser->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", chooser->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
-		cout << indent_str << "RAS:" << endl;
-		cout << indent_str_next << "Area = " << RAS->area.get_area() *1e-6 << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << RAS->power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? RAS->power.readOp.longer_channel_leakage:RAS->power.readOp.leakage)  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? RAS->power.readOp.power_gated_with_long_channel_leakage : RAS->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << RAS->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << RAS->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "RAS");
+		report_value(indent_str_next, "Area", RAS->area.get_area() *1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", RAS->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? RAS->power.readOp.longer_channel_leakage:RAS->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? RAS->power.readOp.power_gated_with_long_channel_leakage : RAS->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", RAS->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", RAS->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
 	}
 	else
@@ -2214,39 +2204,33 @@ void InstFetchU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 	if (is_tdp)
 	{
 
-		cout << indent_str<< "Instruction Cache:" << endl;
-		cout << indent_str_next << "Area = " << icache.area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << icache.power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? icache.power.readOp.longer_channel_leakage:icache.power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? icache.power.readOp.power_gated_with_long_channel_leakage : icache.power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << icache.power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << icache.rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Instruction Cache");
+		report_value(indent_str_next, "Area", icache.area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", icache.power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? icache.power.readOp.longer_channel_leakage:icache.power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? icache.power.readOp.power_gated_with_long_channel_leakage : icache.power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", icache.power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", icache.rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
 		if (coredynp.predictionW>0)
 		{
-			cout << indent_str<< "Branch Target Buffer:" << endl;
-			cout << indent_str_next << "Area = " << BTB->area.get_area() *1e-6 << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << BTB->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? BTB->power.readOp.longer_channel_leakage:BTB->power.readOp.leakage)  << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? BTB->power.readOp.power_gated_with_long_channel_leakage : BTB->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << BTB->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << BTB->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Branch Target Buffer");
+			report_value(indent_str_next, "Area", BTB->area.get_area() *1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", BTB->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? BTB->power.readOp.longer_channel_leakage:BTB->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? BTB->power.readOp.power_gated_with_long_channel_leakage : BTB->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", BTB->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", BTB->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 			if (BPT->exist)
 			{
-				cout << indent_str<< "Branch Predictor:" << endl;
-				cout << indent_str_next << "Area = " << BPT->area.get_area()  *1e-6<< " mm^2" << endl;
-				cout << indent_str_next << "Peak Dynamic = " << BPT->power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "Subthreshold Leakage = "
-					<< (long_channel? BPT->power.readOp.longer_channel_leakage:BPT->power.readOp.leakage)  << " W" << endl;
-				if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? BPT->power.readOp.power_gated_with_long_channel_leakage : BPT->power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str_next << "Gate Leakage = " << BPT->power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str_next << "Runtime Dynamic = " << BPT->rt_power.readOp.dynamic/executionTime << " W" << endl;
+				report_section(indent_str, "Branch Predictor");
+				report_value(indent_str_next, "Area", BPT->area.get_area()  *1e-6, "mm^2");
+				report_value(indent_str_next, "Peak Dynamic", BPT->power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "Subthreshold Leakage", (long_channel? BPT->power.readOp.longer_channel_leakage:BPT->power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? BPT->power.readOp.power_gated_with_long_channel_leakage : BPT->power.readOp.power_gated_leakage), "W");
+				report_value(indent_str_next, "Gate Leakage", BPT->power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "Runtime Dynamic", BPT->rt_power.readOp.dynamic/executionTime, "W");
 				cout <<endl;
 				if (plevel>3)
 				{
@@ -2254,30 +2238,27 @@ void InstFetchU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 				}
 			}
 		}
-		cout << indent_str<< "Instruction Buffer:" << endl;
-		cout << indent_str_next << "Area = " << IB->area.get_area()*1e-6  << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << IB->power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-		<< (long_channel? IB->power.readOp.longer_channel_leakage:IB->power.readOp.leakage)  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? IB->power.readOp.power_gated_with_long_channel_leakage : IB->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << IB->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << IB->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Instruction Buffer");
+		report_value(indent_str_next, "Area", IB->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", IB->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? IB->power.readOp.longer_channel_leakage:IB->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? IB->power.readOp.power_gated_with_long_channel_leakage : IB->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", IB->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", IB->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
-		cout << indent_str<< "Instruction Decoder:" << endl;
-		cout << indent_str_next << "Area = " << (ID_inst->area.get_area() +
+		report_section(indent_str, "Instruction Decoder");
+		report_value(indent_str_next, "Area", (ID_inst->area.get_area() +
 				ID_operand->area.get_area() +
-				ID_misc->area.get_area())*coredynp.decodeW*1e-6  << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << (ID_inst->power.readOp.dynamic +
+				ID_misc->area.get_area())*coredynp.decodeW*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", (ID_inst->power.readOp.dynamic +
 				ID_operand->power.readOp.dynamic +
-				ID_misc->power.readOp.dynamic)*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-		<< (long_channel? (ID_inst->power.readOp.longer_channel_leakage +
+				ID_misc->power.readOp.dynamic)*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? (ID_inst->power.readOp.longer_channel_leakage +
 				ID_operand->power.readOp.longer_channel_leakage +
 				ID_misc->power.readOp.longer_channel_leakage):
 					(ID_inst->power.readOp.leakage +
 							ID_operand->power.readOp.leakage +
-							ID_misc->power.readOp.leakage))  << " W" << endl;
+							ID_misc->power.readOp.leakage)), "W");
 
 		double tot_leakage = (ID_inst->power.readOp.leakage + ID_operand->power.readOp.leakage + ID_misc->power.readOp.leakage);
 		double tot_leakage_longchannel = (ID_inst->power.readOp.longer_channel_leakage + ID_operand->power.readOp.longer_channel_leakage + ID_misc->power.readOp.longer_channel_leakage);
@@ -2285,14 +2266,13 @@ void InstFetchU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 		double tot_leakage_pg_with_long_channel = (ID_inst->power.readOp.power_gated_with_long_channel_leakage + ID_operand->power.readOp.power_gated_with_long_channel_leakage + ID_misc->power.readOp.power_gated_with_long_channel_leakage);
 
 
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel ? tot_leakage_pg_with_long_channel : tot_leakage_pg)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << (ID_inst->power.readOp.gate_leakage +
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel ? tot_leakage_pg_with_long_channel : tot_leakage_pg), "W");
+		report_value(indent_str_next, "Gate Leakage", (ID_inst->power.readOp.gate_leakage +
 				ID_operand->power.readOp.gate_leakage +
-				ID_misc->power.readOp.gate_leakage)  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << (ID_inst->rt_power.readOp.dynamic +
+				ID_misc->power.readOp.gate_leakage), "W");
+		report_value(indent_str_next, "Runtime Dynamic", (ID_inst->rt_power.readOp.dynamic +
 				ID_operand->rt_power.readOp.dynamic +
-				ID_misc->rt_power.readOp.dynamic)/executionTime << " W" << endl;
+				ID_misc->rt_power.readOp.dynamic)/executionTime, "W");
 		cout <<endl;
 	}
 	else
@@ -2665,125 +2645,109 @@ void RENAMINGU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 		if (coredynp.core_ty==OOO)
 		{
-			cout << indent_str<< "Int Front End RAT:" << endl;
-			cout << indent_str_next << "Area = " << iFRAT->area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << iFRAT->power.readOp.dynamic*clockRate << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? iFRAT->power.readOp.longer_channel_leakage:iFRAT->power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? iFRAT->power.readOp.power_gated_with_long_channel_leakage : iFRAT->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << iFRAT->power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << iFRAT->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Int Front End RAT");
+			report_value(indent_str_next, "Area", iFRAT->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", iFRAT->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? iFRAT->power.readOp.longer_channel_leakage:iFRAT->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? iFRAT->power.readOp.power_gated_with_long_channel_leakage : iFRAT->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", iFRAT->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", iFRAT->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
-			cout << indent_str<< "FP Front End RAT:" << endl;
-			cout << indent_str_next << "Area = " << fFRAT->area.get_area()*1e-6  << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << fFRAT->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? fFRAT->power.readOp.longer_channel_leakage:fFRAT->power.readOp.leakage)  << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? fFRAT->power.readOp.power_gated_with_long_channel_leakage : fFRAT->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << fFRAT->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << fFRAT->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "FP Front End RAT");
+			report_value(indent_str_next, "Area", fFRAT->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", fFRAT->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? fFRAT->power.readOp.longer_channel_leakage:fFRAT->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? fFRAT->power.readOp.power_gated_with_long_channel_leakage : fFRAT->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", fFRAT->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", fFRAT->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
-			cout << indent_str<<"Free List:" << endl;
-			cout << indent_str_next << "Area = " << ifreeL->area.get_area()*1e-6  << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << ifreeL->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? ifreeL->power.readOp.longer_channel_leakage:ifreeL->power.readOp.leakage)  << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? ifreeL->power.readOp.power_gated_with_long_channel_leakage : ifreeL->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << ifreeL->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << ifreeL->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Free List");
+			report_value(indent_str_next, "Area", ifreeL->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", ifreeL->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? ifreeL->power.readOp.longer_channel_leakage:ifreeL->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? ifreeL->power.readOp.power_gated_with_long_channel_leakage : ifreeL->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", ifreeL->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", ifreeL->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 
 			if (coredynp.scheu_ty==PhysicalRegFile)
 			{
-				cout << indent_str<< "Int Retire RAT: " << endl;
-				cout << indent_str_next << "Area = " << iRRAT->area.get_area() *1e-6 << " mm^2" << endl;
-				cout << indent_str_next << "Peak Dynamic = " << iRRAT->power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "Subthreshold Leakage = "
-					<< (long_channel? iRRAT->power.readOp.longer_channel_leakage:iRRAT->power.readOp.leakage)  << " W" << endl;
-				if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? iRRAT->power.readOp.power_gated_with_long_channel_leakage : iRRAT->power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str_next << "Gate Leakage = " << iRRAT->power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str_next << "Runtime Dynamic = " << iRRAT->rt_power.readOp.dynamic/executionTime << " W" << endl;
+				report_section(indent_str, "Int Retire RAT", ": ");
+				report_value(indent_str_next, "Area", iRRAT->area.get_area() *1e-6, "mm^2");
+				report_value(indent_str_next, "Peak Dynamic", iRRAT->power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "Subthreshold Leakage", (long_channel? iRRAT->power.readOp.longer_channel_leakage:iRRAT->power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? iRRAT->power.readOp.power_gated_with_long_channel_leakage : iRRAT->power.readOp.power_gated_leakage), "W");
+				report_value(indent_str_next, "Gate Leakage", iRRAT->power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "Runtime Dynamic", iRRAT->rt_power.readOp.dynamic/executionTime, "W");
 				cout <<endl;
-				cout << indent_str<< "FP Retire RAT:" << endl;
-				cout << indent_str_next << "Area = " << fRRAT->area.get_area()  *1e-6<< " mm^2" << endl;
-				cout << indent_str_next << "Peak Dynamic = " << fRRAT->power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "Subthreshold Leakage = "
-					<< (long_channel? fRRAT->power.readOp.longer_channel_leakage:fRRAT->power.readOp.leakage)  << " W" << endl;
-				if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? fRRAT->power.readOp.power_gated_with_long_channel_leakage : fRRAT->power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str_next << "Gate Leakage = " << fRRAT->power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str_next << "Runtime Dynamic = " << fRRAT->rt_power.readOp.dynamic/executionTime << " W" << endl;
+				report_section(indent_str, "FP Retire RAT");
+				report_value(indent_str_next, "Area", fRRAT->area.get_area()  *1e-6, "mm^2");
+				report_value(indent_str_next, "Peak Dynamic", fRRAT->power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "Subthreshold Leakage", (long_channel? fRRAT->power.readOp.longer_channel_leakage:fRRAT->power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? fRRAT->power.readOp.power_gated_with_long_channel_leakage : fRRAT->power.readOp.power_gated_leakage), "W");
+				report_value(indent_str_next, "Gate Leakage", fRRAT->power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "Runtime Dynamic", fRRAT->rt_power.readOp.dynamic/executionTime, "W");
 				cout <<endl;
-				cout << indent_str<< "FP Free List:" << endl;
-				cout << indent_str_next << "Area = " << ffreeL->area.get_area()*1e-6  << " mm^2" << endl;
-				cout << indent_str_next << "Peak Dynamic = " << ffreeL->power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "Subthreshold Leakage = "
-					<< (long_channel? ffreeL->power.readOp.longer_channel_leakage:ffreeL->power.readOp.leakage)  << " W" << endl;
-				if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? ffreeL->power.readOp.power_gated_with_long_channel_leakage : ffreeL->power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str_next << "Gate Leakage = " << ffreeL->power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str_next << "Runtime Dynamic = " << ffreeL->rt_power.readOp.dynamic/executionTime << " W" << endl;
+				report_section(indent_str, "FP Free List");
+				report_value(indent_str_next, "Area", ffreeL->area.get_area()*1e-6, "mm^2");
+				report_value(indent_str_next, "Peak Dynamic", ffreeL->power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "Subthreshold Leakage", (long_channel? ffreeL->power.readOp.longer_channel_leakage:ffreeL->power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? ffreeL->power.readOp.power_gated_with_long_channel_leakage : ffreeL->power.readOp.power_gated_leakage), "W");
+				report_value(indent_str_next, "Gate Leakage", ffreeL->power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "Runtime Dynamic", ffreeL->rt_power.readOp.dynamic/executionTime, "W");
 				cout <<endl;
 			}
 		}
 		else
 		{
-			cout << indent_str<< "Int DCL:" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << idcl->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? idcl->power.readOp.longer_channel_leakage:idcl->power.readOp.leakage)  << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? idcl->power.readOp.power_gated_with_long_channel_leakage : idcl->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << idcl->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << idcl->rt_power.readOp.dynamic/executionTime << " W" << endl;
-			cout << indent_str<<"FP DCL:" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << fdcl->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? fdcl->power.readOp.longer_channel_leakage:fdcl->power.readOp.leakage)  << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? fdcl->power.readOp.power_gated_with_long_channel_leakage : fdcl->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << fdcl->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << fdcl->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Int DCL");
+			report_value(indent_str_next, "Peak Dynamic", idcl->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? idcl->power.readOp.longer_channel_leakage:idcl->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? idcl->power.readOp.power_gated_with_long_channel_leakage : idcl->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", idcl->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", idcl->rt_power.readOp.dynamic/executionTime, "W");
+			report_section(indent_str, "FP DCL");
+			report_value(indent_str_next, "Peak Dynamic", fdcl->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? fdcl->power.readOp.longer_channel_leakage:fdcl->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? fdcl->power.readOp.power_gated_with_long_channel_leakage : fdcl->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", fdcl->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", fdcl->rt_power.readOp.dynamic/executionTime, "W");
 		}
 	}
 	else
 	{
 		if (coredynp.core_ty==OOO)
 		{
-			cout << indent_str_next << "Int Front End RAT    Peak Dynamic = " << iFRAT->rt_power.readOp.dynamic*clockRate << " W" << endl;
-			cout << indent_str_next << "Int Front End RAT    Subthreshold Leakage = " << iFRAT->rt_power.readOp.leakage <<" W" << endl;
-			cout << indent_str_next << "Int Front End RAT    Gate Leakage = " << iFRAT->rt_power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "FP Front End RAT   Peak Dynamic = " << fFRAT->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "FP Front End RAT   Subthreshold Leakage = " << fFRAT->rt_power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next << "FP Front End RAT   Gate Leakage = " << fFRAT->rt_power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Free List   Peak Dynamic = " << ifreeL->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Free List   Subthreshold Leakage = " << ifreeL->rt_power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next << "Free List   Gate Leakage = " << fFRAT->rt_power.readOp.gate_leakage  << " W" << endl;
+			report_value(indent_str_next, "Int Front End RAT    Peak Dynamic", iFRAT->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Int Front End RAT    Subthreshold Leakage", iFRAT->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "Int Front End RAT    Gate Leakage", iFRAT->rt_power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "FP Front End RAT   Peak Dynamic", fFRAT->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "FP Front End RAT   Subthreshold Leakage", fFRAT->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "FP Front End RAT   Gate Leakage", fFRAT->rt_power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Free List   Peak Dynamic", ifreeL->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Free List   Subthreshold Leakage", ifreeL->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "Free List   Gate Leakage", fFRAT->rt_power.readOp.gate_leakage, "W");
 			if (coredynp.scheu_ty==PhysicalRegFile)
 			{
-				cout << indent_str_next << "Int Retire RAT   Peak Dynamic = " << iRRAT->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "Int Retire RAT   Subthreshold Leakage = " << iRRAT->rt_power.readOp.leakage  << " W" << endl;
-				cout << indent_str_next << "Int Retire RAT   Gate Leakage = " << iRRAT->rt_power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str_next << "FP Retire RAT   Peak Dynamic = " << fRRAT->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "FP Retire RAT   Subthreshold Leakage = " << fRRAT->rt_power.readOp.leakage  << " W" << endl;
-				cout << indent_str_next << "FP Retire RAT   Gate Leakage = " << fRRAT->rt_power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str_next << "FP Free List   Peak Dynamic = " << ffreeL->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "FP Free List   Subthreshold Leakage = " << ffreeL->rt_power.readOp.leakage  << " W" << endl;
-				cout << indent_str_next << "FP Free List   Gate Leakage = " << fFRAT->rt_power.readOp.gate_leakage  << " W" << endl;
+				report_value(indent_str_next, "Int Retire RAT   Peak Dynamic", iRRAT->rt_power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "Int Retire RAT   Subthreshold Leakage", iRRAT->rt_power.readOp.leakage, "W");
+				report_value(indent_str_next, "Int Retire RAT   Gate Leakage", iRRAT->rt_power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "FP Retire RAT   Peak Dynamic", fRRAT->rt_power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "FP Retire RAT   Subthreshold Leakage", fRRAT->rt_power.readOp.leakage, "W");
+				report_value(indent_str_next, "FP Retire RAT   Gate Leakage", fRRAT->rt_power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "FP Free List   Peak Dynamic", ffreeL->rt_power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "FP Free List   Subthreshold Leakage", ffreeL->rt_power.readOp.leakage, "W");
+				report_value(indent_str_next, "FP Free List   Gate Leakage", fFRAT->rt_power.readOp.gate_leakage, "W");
 			}
 		}
 		else
 		{
-			cout << indent_str_next << "Int DCL   Peak Dynamic = " << idcl->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Int DCL   Subthreshold Leakage = " << idcl->rt_power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next << "Int DCL   Gate Leakage = " << idcl->rt_power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "FP DCL   Peak Dynamic = " << fdcl->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "FP DCL   Subthreshold Leakage = " << fdcl->rt_power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next << "FP DCL   Gate Leakage = " << fdcl->rt_power.readOp.gate_leakage  << " W" << endl;
+			report_value(indent_str_next, "Int DCL   Peak Dynamic", idcl->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Int DCL   Subthreshold Leakage", idcl->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "Int DCL   Gate Leakage", idcl->rt_power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "FP DCL   Peak Dynamic", fdcl->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "FP DCL   Subthreshold Leakage", fdcl->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "FP DCL   Gate Leakage", fdcl->rt_power.readOp.gate_leakage, "W");
 		}
 	}
 
@@ -2983,51 +2947,43 @@ void SchedulerU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 	{
 		if (coredynp.core_ty==OOO)
 		{
-			cout << indent_str << "Instruction Window:" << endl;
-			cout << indent_str_next << "Area = " << int_inst_window->area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << int_inst_window->power.readOp.dynamic*clockRate << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? int_inst_window->power.readOp.longer_channel_leakage:int_inst_window->power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? int_inst_window->power.readOp.power_gated_with_long_channel_leakage : int_inst_window->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << int_inst_window->power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << int_inst_window->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Instruction Window");
+			report_value(indent_str_next, "Area", int_inst_window->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", int_inst_window->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? int_inst_window->power.readOp.longer_channel_leakage:int_inst_window->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? int_inst_window->power.readOp.power_gated_with_long_channel_leakage : int_inst_window->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", int_inst_window->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", int_inst_window->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
-			cout << indent_str << "FP Instruction Window:" << endl;
-			cout << indent_str_next << "Area = " << fp_inst_window->area.get_area()*1e-6  << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << fp_inst_window->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? fp_inst_window->power.readOp.longer_channel_leakage:fp_inst_window->power.readOp.leakage ) << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? fp_inst_window->power.readOp.power_gated_with_long_channel_leakage : fp_inst_window->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << fp_inst_window->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << fp_inst_window->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "FP Instruction Window");
+			report_value(indent_str_next, "Area", fp_inst_window->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", fp_inst_window->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? fp_inst_window->power.readOp.longer_channel_leakage:fp_inst_window->power.readOp.leakage ), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? fp_inst_window->power.readOp.power_gated_with_long_channel_leakage : fp_inst_window->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", fp_inst_window->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", fp_inst_window->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 			if (XML->sys.core[ithCore].ROB_size >0)
 			{
-				cout << indent_str<<"ROB:" << endl;
-				cout << indent_str_next << "Area = " << ROB->area.get_area() *1e-6 << " mm^2" << endl;
-				cout << indent_str_next << "Peak Dynamic = " << ROB->power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? ROB->power.readOp.longer_channel_leakage:ROB->power.readOp.leakage)  << " W" << endl;
-				if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? ROB->power.readOp.power_gated_with_long_channel_leakage : ROB->power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str_next << "Gate Leakage = " << ROB->power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str_next << "Runtime Dynamic = " << ROB->rt_power.readOp.dynamic/executionTime << " W" << endl;
+				report_section(indent_str, "ROB");
+				report_value(indent_str_next, "Area", ROB->area.get_area() *1e-6, "mm^2");
+				report_value(indent_str_next, "Peak Dynamic", ROB->power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "Subthreshold Leakage", (long_channel? ROB->power.readOp.longer_channel_leakage:ROB->power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? ROB->power.readOp.power_gated_with_long_channel_leakage : ROB->power.readOp.power_gated_leakage), "W");
+				report_value(indent_str_next, "Gate Leakage", ROB->power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "Runtime Dynamic", ROB->rt_power.readOp.dynamic/executionTime, "W");
 				cout <<endl;
 			}
 		}
 		else if (coredynp.multithreaded)
 		{
-			cout << indent_str << "Instruction Window:" << endl;
-			cout << indent_str_next << "Area = " << int_inst_window->area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << int_inst_window->power.readOp.dynamic*clockRate << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? int_inst_window->power.readOp.longer_channel_leakage:int_inst_window->power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? int_inst_window->power.readOp.power_gated_with_long_channel_leakage : int_inst_window->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << int_inst_window->power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << int_inst_window->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Instruction Window");
+			report_value(indent_str_next, "Area", int_inst_window->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", int_inst_window->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? int_inst_window->power.readOp.longer_channel_leakage:int_inst_window->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? int_inst_window->power.readOp.power_gated_with_long_channel_leakage : int_inst_window->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", int_inst_window->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", int_inst_window->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 		}
 	}
@@ -3035,24 +2991,24 @@ void SchedulerU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 	{
 		if (coredynp.core_ty==OOO)
 		{
-			cout << indent_str_next << "Instruction Window    Peak Dynamic = " << int_inst_window->rt_power.readOp.dynamic*clockRate << " W" << endl;
-			cout << indent_str_next << "Instruction Window    Subthreshold Leakage = " << int_inst_window->rt_power.readOp.leakage <<" W" << endl;
-			cout << indent_str_next << "Instruction Window    Gate Leakage = " << int_inst_window->rt_power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "FP Instruction Window   Peak Dynamic = " << fp_inst_window->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "FP Instruction Window   Subthreshold Leakage = " << fp_inst_window->rt_power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next << "FP Instruction Window   Gate Leakage = " << fp_inst_window->rt_power.readOp.gate_leakage  << " W" << endl;
+			report_value(indent_str_next, "Instruction Window    Peak Dynamic", int_inst_window->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Instruction Window    Subthreshold Leakage", int_inst_window->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "Instruction Window    Gate Leakage", int_inst_window->rt_power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "FP Instruction Window   Peak Dynamic", fp_inst_window->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "FP Instruction Window   Subthreshold Leakage", fp_inst_window->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "FP Instruction Window   Gate Leakage", fp_inst_window->rt_power.readOp.gate_leakage, "W");
 			if (XML->sys.core[ithCore].ROB_size >0)
 			{
-				cout << indent_str_next << "ROB   Peak Dynamic = " << ROB->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "ROB   Subthreshold Leakage = " << ROB->rt_power.readOp.leakage  << " W" << endl;
-				cout << indent_str_next << "ROB   Gate Leakage = " << ROB->rt_power.readOp.gate_leakage  << " W" << endl;
+				report_value(indent_str_next, "ROB   Peak Dynamic", ROB->rt_power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "ROB   Subthreshold Leakage", ROB->rt_power.readOp.leakage, "W");
+				report_value(indent_str_next, "ROB   Gate Leakage", ROB->rt_power.readOp.gate_leakage, "W");
 			}
 		}
 		else if (coredynp.multithreaded)
 		{
-			cout << indent_str_next << "Instruction Window    Peak Dynamic = " << int_inst_window->rt_power.readOp.dynamic*clockRate << " W" << endl;
-			cout << indent_str_next << "Instruction Window    Subthreshold Leakage = " << int_inst_window->rt_power.readOp.leakage <<" W" << endl;
-			cout << indent_str_next << "Instruction Window    Gate Leakage = " << int_inst_window->rt_power.readOp.gate_leakage << " W" << endl;
+			report_value(indent_str_next, "Instruction Window    Peak Dynamic", int_inst_window->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Instruction Window    Subthreshold Leakage", int_inst_window->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "Instruction Window    Gate Leakage", int_inst_window->rt_power.readOp.gate_leakage, "W");
 		}
 	}
 
@@ -3260,27 +3216,23 @@ void LoadStoreU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << indent_str << "Data Cache:" << endl;
-		cout << indent_str_next << "Area = " << dcache.area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << dcache.power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? dcache.power.readOp.longer_channel_leakage:dcache.power.readOp.leakage )<<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? dcache.power.readOp.power_gated_with_long_channel_leakage : dcache.power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << dcache.power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << dcache.rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Data Cache");
+		report_value(indent_str_next, "Area", dcache.area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", dcache.power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? dcache.power.readOp.longer_channel_leakage:dcache.power.readOp.leakage ), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? dcache.power.readOp.power_gated_with_long_channel_leakage : dcache.power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", dcache.power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", dcache.rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
 		if (coredynp.core_ty==Inorder)
 		{
-			cout << indent_str << "Load/Store Queue:" << endl;
-			cout << indent_str_next << "Area = " << LSQ->area.get_area()*1e-6  << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << LSQ->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? LSQ->power.readOp.longer_channel_leakage:LSQ->power.readOp.leakage )  << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? LSQ->power.readOp.power_gated_with_long_channel_leakage : LSQ->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << LSQ->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << LSQ->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Load/Store Queue");
+			report_value(indent_str_next, "Area", LSQ->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", LSQ->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? LSQ->power.readOp.longer_channel_leakage:LSQ->power.readOp.leakage ), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? LSQ->power.readOp.power_gated_with_long_channel_leakage : LSQ->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", LSQ->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", LSQ->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 		}
 		else
@@ -3288,48 +3240,44 @@ void LoadStoreU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 		{
 			if (XML->sys.core[ithCore].load_buffer_size >0)
 			{
-				cout << indent_str << "LoadQ:" << endl;
-				cout << indent_str_next << "Area = " << LoadQ->area.get_area() *1e-6 << " mm^2" << endl;
-				cout << indent_str_next << "Peak Dynamic = " << LoadQ->power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? LoadQ->power.readOp.longer_channel_leakage:LoadQ->power.readOp.leakage)  << " W" << endl;
-				if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? LoadQ->power.readOp.power_gated_with_long_channel_leakage : LoadQ->power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str_next << "Gate Leakage = " << LoadQ->power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str_next << "Runtime Dynamic = " << LoadQ->rt_power.readOp.dynamic/executionTime << " W" << endl;
+				report_section(indent_str, "LoadQ");
+				report_value(indent_str_next, "Area", LoadQ->area.get_area() *1e-6, "mm^2");
+				report_value(indent_str_next, "Peak Dynamic", LoadQ->power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "Subthreshold Leakage", (long_channel? LoadQ->power.readOp.longer_channel_leakage:LoadQ->power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? LoadQ->power.readOp.power_gated_with_long_channel_leakage : LoadQ->power.readOp.power_gated_leakage), "W");
+				report_value(indent_str_next, "Gate Leakage", LoadQ->power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "Runtime Dynamic", LoadQ->rt_power.readOp.dynamic/executionTime, "W");
 				cout <<endl;
 			}
-			cout << indent_str<< "StoreQ:" << endl;
-			cout << indent_str_next << "Area = " << LSQ->area.get_area()  *1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << LSQ->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? LSQ->power.readOp.longer_channel_leakage:LSQ->power.readOp.leakage)  << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? LSQ->power.readOp.power_gated_with_long_channel_leakage : LSQ->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << LSQ->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << LSQ->rt_power.readOp.dynamic/executionTime<< " W" << endl;
+			report_section(indent_str, "StoreQ");
+			report_value(indent_str_next, "Area", LSQ->area.get_area()  *1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", LSQ->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? LSQ->power.readOp.longer_channel_leakage:LSQ->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? LSQ->power.readOp.power_gated_with_long_channel_leakage : LSQ->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", LSQ->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", LSQ->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 		}
 	}
 	else
 	{
-		cout << indent_str_next << "Data Cache    Peak Dynamic = " << dcache.rt_power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Data Cache    Subthreshold Leakage = " << dcache.rt_power.readOp.leakage <<" W" << endl;
-		cout << indent_str_next << "Data Cache    Gate Leakage = " << dcache.rt_power.readOp.gate_leakage << " W" << endl;
+		report_value(indent_str_next, "Data Cache    Peak Dynamic", dcache.rt_power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Data Cache    Subthreshold Leakage", dcache.rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Data Cache    Gate Leakage", dcache.rt_power.readOp.gate_leakage, "W");
 		if (coredynp.core_ty==Inorder)
 		{
-			cout << indent_str_next << "Load/Store Queue   Peak Dynamic = " << LSQ->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Load/Store Queue   Subthreshold Leakage = " << LSQ->rt_power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next << "Load/Store Queue   Gate Leakage = " << LSQ->rt_power.readOp.gate_leakage  << " W" << endl;
+			report_value(indent_str_next, "Load/Store Queue   Peak Dynamic", LSQ->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Load/Store Queue   Subthreshold Leakage", LSQ->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "Load/Store Queue   Gate Leakage", LSQ->rt_power.readOp.gate_leakage, "W");
 		}
 		else
 		{
-			cout << indent_str_next << "LoadQ   Peak Dynamic = " << LoadQ->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "LoadQ   Subthreshold Leakage = " << LoadQ->rt_power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next << "LoadQ   Gate Leakage = " << LoadQ->rt_power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "StoreQ   Peak Dynamic = " << LSQ->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "StoreQ   Subthreshold Leakage = " << LSQ->rt_power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next << "StoreQ   Gate Leakage = " << LSQ->rt_power.readOp.gate_leakage  << " W" << endl;
+			report_value(indent_str_next, "LoadQ   Peak Dynamic", LoadQ->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "LoadQ   Subthreshold Leakage", LoadQ->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "LoadQ   Gate Leakage", LoadQ->rt_power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "StoreQ   Peak Dynamic", LSQ->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "StoreQ   Subthreshold Leakage", LSQ->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "StoreQ   Gate Leakage", LSQ->rt_power.readOp.gate_leakage, "W");
 		}
 	}
 
@@ -3399,35 +3347,31 @@ void MemManU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << indent_str << "Itlb:" << endl;
-		cout << indent_str_next << "Area = " << itlb->area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << itlb->power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? itlb->power.readOp.longer_channel_leakage:itlb->power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? itlb->power.readOp.power_gated_with_long_channel_leakage : itlb->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << itlb->power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << itlb->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Itlb");
+		report_value(indent_str_next, "Area", itlb->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", itlb->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? itlb->power.readOp.longer_channel_leakage:itlb->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? itlb->power.readOp.power_gated_with_long_channel_leakage : itlb->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", itlb->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", itlb->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
-		cout << indent_str<< "Dtlb:" << endl;
-		cout << indent_str_next << "Area = " << dtlb->area.get_area()*1e-6  << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << dtlb->power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? dtlb->power.readOp.longer_channel_leakage:dtlb->power.readOp.leakage)  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? dtlb->power.readOp.power_gated_with_long_channel_leakage : dtlb->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << dtlb->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << dtlb->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Dtlb");
+		report_value(indent_str_next, "Area", dtlb->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", dtlb->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? dtlb->power.readOp.longer_channel_leakage:dtlb->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? dtlb->power.readOp.power_gated_with_long_channel_leakage : dtlb->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", dtlb->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", dtlb->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
 	}
 	else
 	{
-		cout << indent_str_next << "Itlb    Peak Dynamic = " << itlb->rt_power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Itlb    Subthreshold Leakage = " << itlb->rt_power.readOp.leakage <<" W" << endl;
-		cout << indent_str_next << "Itlb    Gate Leakage = " << itlb->rt_power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Dtlb   Peak Dynamic = " << dtlb->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Dtlb   Subthreshold Leakage = " << dtlb->rt_power.readOp.leakage  << " W" << endl;
-		cout << indent_str_next << "Dtlb   Gate Leakage = " << dtlb->rt_power.readOp.gate_leakage  << " W" << endl;
+		report_value(indent_str_next, "Itlb    Peak Dynamic", itlb->rt_power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Itlb    Subthreshold Leakage", itlb->rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Itlb    Gate Leakage", itlb->rt_power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Dtlb   Peak Dynamic", dtlb->rt_power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Dtlb   Subthreshold Leakage", dtlb->rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Dtlb   Gate Leakage", dtlb->rt_power.readOp.gate_leakage, "W");
 	}
 
 }
@@ -3536,53 +3480,47 @@ void RegFU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 	bool power_gating = XML->sys.power_gating;
 
 	if (is_tdp)
-	{	cout << indent_str << "Integer RF:" << endl;
-		cout << indent_str_next << "Area = " << IRF->area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << IRF->power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? IRF->power.readOp.longer_channel_leakage:IRF->power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? IRF->power.readOp.power_gated_with_long_channel_leakage : IRF->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << IRF->power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << IRF->rt_power.readOp.dynamic/executionTime << " W" << endl;
+	{	report_section(indent_str, "Integer RF");
+		report_value(indent_str_next, "Area", IRF->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", IRF->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? IRF->power.readOp.longer_channel_leakage:IRF->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? IRF->power.readOp.power_gated_with_long_channel_leakage : IRF->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", IRF->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", IRF->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
-		cout << indent_str<< "Floating Point RF:" << endl;
-		cout << indent_str_next << "Area = " << FRF->area.get_area()*1e-6  << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << FRF->power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? FRF->power.readOp.longer_channel_leakage:FRF->power.readOp.leakage)  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? FRF->power.readOp.power_gated_with_long_channel_leakage : FRF->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << FRF->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << FRF->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Floating Point RF");
+		report_value(indent_str_next, "Area", FRF->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", FRF->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? FRF->power.readOp.longer_channel_leakage:FRF->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? FRF->power.readOp.power_gated_with_long_channel_leakage : FRF->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", FRF->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", FRF->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
 		if (coredynp.regWindowing)
 		{
-			cout << indent_str << "Register Windows:" << endl;
-			cout << indent_str_next << "Area = " << RFWIN->area.get_area() *1e-6 << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << RFWIN->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? RFWIN->power.readOp.longer_channel_leakage:RFWIN->power.readOp.leakage)  << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? RFWIN->power.readOp.power_gated_with_long_channel_leakage : RFWIN->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << RFWIN->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << RFWIN->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Register Windows");
+			report_value(indent_str_next, "Area", RFWIN->area.get_area() *1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", RFWIN->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? RFWIN->power.readOp.longer_channel_leakage:RFWIN->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? RFWIN->power.readOp.power_gated_with_long_channel_leakage : RFWIN->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", RFWIN->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", RFWIN->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 		}
 	}
 	else
 	{
-		cout << indent_str_next << "Integer RF    Peak Dynamic = " << IRF->rt_power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Integer RF    Subthreshold Leakage = " << IRF->rt_power.readOp.leakage <<" W" << endl;
-		cout << indent_str_next << "Integer RF    Gate Leakage = " << IRF->rt_power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Floating Point RF   Peak Dynamic = " << FRF->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Floating Point RF   Subthreshold Leakage = " << FRF->rt_power.readOp.leakage  << " W" << endl;
-		cout << indent_str_next << "Floating Point RF   Gate Leakage = " << FRF->rt_power.readOp.gate_leakage  << " W" << endl;
+		report_value(indent_str_next, "Integer RF    Peak Dynamic", IRF->rt_power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Integer RF    Subthreshold Leakage", IRF->rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Integer RF    Gate Leakage", IRF->rt_power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Floating Point RF   Peak Dynamic", FRF->rt_power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Floating Point RF   Subthreshold Leakage", FRF->rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Floating Point RF   Gate Leakage", FRF->rt_power.readOp.gate_leakage, "W");
 		if (coredynp.regWindowing)
 		{
-			cout << indent_str_next << "Register Windows   Peak Dynamic = " << RFWIN->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Register Windows   Subthreshold Leakage = " << RFWIN->rt_power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next << "Register Windows   Gate Leakage = " << RFWIN->rt_power.readOp.gate_leakage  << " W" << endl;
+			report_value(indent_str_next, "Register Windows   Peak Dynamic", RFWIN->rt_power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Register Windows   Subthreshold Leakage", RFWIN->rt_power.readOp.leakage, "W");
+			report_value(indent_str_next, "Register Windows   Gate Leakage", RFWIN->rt_power.readOp.gate_leakage, "W");
 		}
 	}
 }
@@ -3665,28 +3603,24 @@ void EXECU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 //	cout << indent_str_next << "Results Broadcast Bus Area = " << bypass->area.get_area() *1e-6 << " mm^2" << endl;
 	if (is_tdp)
 	{
-		cout << indent_str << "Register Files:" << endl;
-		cout << indent_str_next << "Area = " << rfu->area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << rfu->power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? rfu->power.readOp.longer_channel_leakage:rfu->power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? rfu->power.readOp.power_gated_with_long_channel_leakage : rfu->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << rfu->power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << rfu->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Register Files");
+		report_value(indent_str_next, "Area", rfu->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", rfu->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? rfu->power.readOp.longer_channel_leakage:rfu->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? rfu->power.readOp.power_gated_with_long_channel_leakage : rfu->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", rfu->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", rfu->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
 		if (plevel>3){
 			rfu->displayEnergy(indent+4,is_tdp);
 		}
-		cout << indent_str << "Instruction Scheduler:" << endl;
-		cout << indent_str_next << "Area = " << scheu->area.get_area()*1e-6  << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << scheu->power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? scheu->power.readOp.longer_channel_leakage:scheu->power.readOp.leakage)  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? scheu->power.readOp.power_gated_with_long_channel_leakage : scheu->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << scheu->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << scheu->rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Instruction Scheduler");
+		report_value(indent_str_next, "Area", scheu->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", scheu->power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? scheu->power.readOp.longer_channel_leakage:scheu->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? scheu->power.readOp.power_gated_with_long_channel_leakage : scheu->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", scheu->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", scheu->rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
 		if (plevel>3){
 			scheu->displayEnergy(indent+4,is_tdp);
@@ -3700,28 +3634,26 @@ void EXECU::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 		{
 			mul->displayEnergy(indent,is_tdp);
 		}
-		cout << indent_str << "Results Broadcast Bus:" << endl;
-		cout << indent_str_next << "Area Overhead = " << bypass.area.get_area()*1e-6  << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << bypass.power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? bypass.power.readOp.longer_channel_leakage:bypass.power.readOp.leakage ) << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? bypass.power.readOp.power_gated_with_long_channel_leakage : bypass.power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << bypass.power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << bypass.rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_section(indent_str, "Results Broadcast Bus");
+		report_value(indent_str_next, "Area Overhead", bypass.area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", bypass.power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? bypass.power.readOp.longer_channel_leakage:bypass.power.readOp.leakage ), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? bypass.power.readOp.power_gated_with_long_channel_leakage : bypass.power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", bypass.power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", bypass.rt_power.readOp.dynamic/executionTime, "W");
 		cout <<endl;
 	}
 	else
 	{
-		cout << indent_str_next << "Register Files    Peak Dynamic = " << rfu->rt_power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Register Files    Subthreshold Leakage = " << rfu->rt_power.readOp.leakage <<" W" << endl;
-		cout << indent_str_next << "Register Files    Gate Leakage = " << rfu->rt_power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Instruction Sheduler   Peak Dynamic = " << scheu->rt_power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Instruction Sheduler   Subthreshold Leakage = " << scheu->rt_power.readOp.leakage  << " W" << endl;
-		cout << indent_str_next << "Instruction Sheduler   Gate Leakage = " << scheu->rt_power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Results Broadcast Bus   Peak Dynamic = " << bypass.rt_power.readOp.dynamic*clockRate  << " W" << endl;
-		cout << indent_str_next << "Results Broadcast Bus   Subthreshold Leakage = " << bypass.rt_power.readOp.leakage  << " W" << endl;
-		cout << indent_str_next << "Results Broadcast Bus   Gate Leakage = " << bypass.rt_power.readOp.gate_leakage  << " W" << endl;
+		report_value(indent_str_next, "Register Files    Peak Dynamic", rfu->rt_power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Register Files    Subthreshold Leakage", rfu->rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Register Files    Gate Leakage", rfu->rt_power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Instruction Sheduler   Peak Dynamic", scheu->rt_power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Instruction Sheduler   Subthreshold Leakage", scheu->rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Instruction Sheduler   Gate Leakage", scheu->rt_power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Results Broadcast Bus   Peak Dynamic", bypass.rt_power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Results Broadcast Bus   Subthreshold Leakage", bypass.rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Results Broadcast Bus   Gate Leakage", bypass.rt_power.readOp.gate_leakage, "W");
 	}
 
 }
@@ -3915,27 +3847,23 @@ void Core::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << "Core:" << endl;
-		cout << indent_str << "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str << "Peak Dynamic = " << power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str << "Subthreshold Leakage = "
-			<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str << "Subthreshold Leakage with power gating = "
-				<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str << "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str << "Runtime Dynamic = " << rt_power.readOp.dynamic/executionTime << " W" << endl;
+		report_component("Core");
+		report_value(indent_str, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str, "Peak Dynamic", power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+		report_value(indent_str, "Gate Leakage", power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Runtime Dynamic", rt_power.readOp.dynamic/executionTime, "W");
 		cout<<endl;
 		if (ifu->exist)
 		{
-			cout << indent_str << "Instruction Fetch Unit:" << endl;
-			cout << indent_str_next << "Area = " << ifu->area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << ifu->power.readOp.dynamic*clockRate << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? ifu->power.readOp.longer_channel_leakage:ifu->power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? ifu->power.readOp.power_gated_with_long_channel_leakage : ifu->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << ifu->power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << ifu->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Instruction Fetch Unit");
+			report_value(indent_str_next, "Area", ifu->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", ifu->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? ifu->power.readOp.longer_channel_leakage:ifu->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? ifu->power.readOp.power_gated_with_long_channel_leakage : ifu->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", ifu->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", ifu->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 			if (plevel >2){
 				ifu->displayEnergy(indent+4,plevel,is_tdp);
@@ -3945,15 +3873,13 @@ void Core::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 		{
 			if (rnu->exist)
 			{
-				cout << indent_str<< "Renaming Unit:" << endl;
-				cout << indent_str_next << "Area = " << rnu->area.get_area()*1e-6  << " mm^2" << endl;
-				cout << indent_str_next << "Peak Dynamic = " << rnu->power.readOp.dynamic*clockRate  << " W" << endl;
-				cout << indent_str_next << "Subthreshold Leakage = "
-					<< (long_channel? rnu->power.readOp.longer_channel_leakage:rnu->power.readOp.leakage)  << " W" << endl;
-				if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? rnu->power.readOp.power_gated_with_long_channel_leakage : rnu->power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str_next << "Gate Leakage = " << rnu->power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str_next << "Runtime Dynamic = " << rnu->rt_power.readOp.dynamic/executionTime << " W" << endl;
+				report_section(indent_str, "Renaming Unit");
+				report_value(indent_str_next, "Area", rnu->area.get_area()*1e-6, "mm^2");
+				report_value(indent_str_next, "Peak Dynamic", rnu->power.readOp.dynamic*clockRate, "W");
+				report_value(indent_str_next, "Subthreshold Leakage", (long_channel? rnu->power.readOp.longer_channel_leakage:rnu->power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? rnu->power.readOp.power_gated_with_long_channel_leakage : rnu->power.readOp.power_gated_leakage), "W");
+				report_value(indent_str_next, "Gate Leakage", rnu->power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "Runtime Dynamic", rnu->rt_power.readOp.dynamic/executionTime, "W");
 				cout <<endl;
 				if (plevel >2){
 					rnu->displayEnergy(indent+4,plevel,is_tdp);
@@ -3963,15 +3889,13 @@ void Core::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 		}
 		if (lsu->exist)
 		{
-			cout << indent_str<< "Load Store Unit:" << endl;
-			cout << indent_str_next << "Area = " << lsu->area.get_area()*1e-6  << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << lsu->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? lsu->power.readOp.longer_channel_leakage:lsu->power.readOp.leakage ) << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? lsu->power.readOp.power_gated_with_long_channel_leakage : lsu->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << lsu->power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << lsu->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Load Store Unit");
+			report_value(indent_str_next, "Area", lsu->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", lsu->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? lsu->power.readOp.longer_channel_leakage:lsu->power.readOp.leakage ), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? lsu->power.readOp.power_gated_with_long_channel_leakage : lsu->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", lsu->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", lsu->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 			if (plevel >2){
 				lsu->displayEnergy(indent+4,plevel,is_tdp);
@@ -3979,14 +3903,12 @@ void Core::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 		}
 		if (mmu->exist)
 		{
-			cout << indent_str<< "Memory Management Unit:" << endl;
-			cout << indent_str_next << "Area = " << mmu->area.get_area() *1e-6 << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << mmu->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? mmu->power.readOp.longer_channel_leakage:mmu->power.readOp.leakage)   << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? mmu->power.readOp.power_gated_with_long_channel_leakage : mmu->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << mmu->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Memory Management Unit");
+			report_value(indent_str_next, "Area", mmu->area.get_area() *1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", mmu->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? mmu->power.readOp.longer_channel_leakage:mmu->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? mmu->power.readOp.power_gated_with_long_channel_leakage : mmu->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Runtime Dynamic", mmu->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 			if (plevel >2){
 				mmu->displayEnergy(indent+4,plevel,is_tdp);
@@ -3994,14 +3916,12 @@ void Core::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 		}
 		if (exu->exist)
 		{
-			cout << indent_str<< "Execution Unit:" << endl;
-			cout << indent_str_next << "Area = " << exu->area.get_area()  *1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << exu->power.readOp.dynamic*clockRate  << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? exu->power.readOp.longer_channel_leakage:exu->power.readOp.leakage)   << " W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? exu->power.readOp.power_gated_with_long_channel_leakage : exu->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << exu->rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_section(indent_str, "Execution Unit");
+			report_value(indent_str_next, "Area", exu->area.get_area()  *1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", exu->power.readOp.dynamic*clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? exu->power.readOp.longer_channel_leakage:exu->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? exu->power.readOp.power_gated_with_long_channel_leakage : exu->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Runtime Dynamic", exu->rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 			if (plevel >2){
 				exu->displayEnergy(indent+4,plevel,is_tdp);
@@ -4045,6 +3965,171 @@ void Core::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 //		cout << indent_str_next << "Execution Unit   Gate Leakage = " << exu->rt_power.readOp.gate_leakage  << " W" << endl;
 	}
 }
+/*
+ * Cores with the same hardware parameters share one model (see Processor::Processor):
+ * a copy of a core that has not been evaluated yet gets copies of its arrays and logic
+ * instead of building and CACTI solving them again. Only what depends on the runtime
+ * stats is rebound: ithCore, and the duty cycles and execution time in coredynp.
+ */
+template <class T> static T * copy_of(const T * component)
+{
+	return component ? new T(*component) : 0;
+}
+
+static ArrayST * clone_array(const ArrayST * array)
+{
+	return array ? array->clone() : 0;
+}
+
+BranchPredictor * BranchPredictor::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	BranchPredictor * copy = new BranchPredictor(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	if (!exist) return copy;
+	copy->globalBPT   = clone_array(globalBPT);
+	copy->localBPT    = clone_array(localBPT);
+	copy->L1_localBPT = clone_array(L1_localBPT);
+	copy->L2_localBPT = clone_array(L2_localBPT);
+	copy->chooser     = clone_array(chooser);
+	copy->RAS         = clone_array(RAS);
+	return copy;
+}
+
+InstFetchU * InstFetchU::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	InstFetchU * copy = new InstFetchU(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	copy->icache.clone_arrays();
+	if (!exist) return copy;
+	copy->IB         = clone_array(IB);
+	copy->ID_inst    = ID_inst    ? ID_inst->clone()    : 0;
+	copy->ID_operand = ID_operand ? ID_operand->clone() : 0;
+	copy->ID_misc    = ID_misc    ? ID_misc->clone()    : 0;
+	if (coredynp.predictionW>0)
+	{
+		copy->BTB = clone_array(BTB);
+		copy->BPT = BPT ? BPT->clone(ithCore_, dyn_p_) : 0;
+	}
+	return copy;
+}
+
+SchedulerU * SchedulerU::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	SchedulerU * copy = new SchedulerU(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	if (!exist) return copy;
+	copy->int_inst_window       = clone_array(int_inst_window);
+	copy->fp_inst_window        = clone_array(fp_inst_window);
+	copy->ROB                   = clone_array(ROB);
+	copy->instruction_selection = copy_of(instruction_selection);
+	return copy;
+}
+
+RENAMINGU * RENAMINGU::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	RENAMINGU * copy = new RENAMINGU(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	if (!exist) return copy;
+	copy->iFRAT  = clone_array(iFRAT);
+	copy->fFRAT  = clone_array(fFRAT);
+	copy->iRRAT  = clone_array(iRRAT);
+	copy->fRRAT  = clone_array(fRRAT);
+	copy->ifreeL = clone_array(ifreeL);
+	copy->ffreeL = clone_array(ffreeL);
+	copy->RAHT   = clone_array(RAHT);
+	copy->idcl   = copy_of(idcl);
+	copy->fdcl   = copy_of(fdcl);
+	if (idcl) copy->idcl->coredynp = dyn_p_;
+	if (fdcl) copy->fdcl->coredynp = dyn_p_;
+	return copy;
+}
+
+LoadStoreU * LoadStoreU::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	LoadStoreU * copy = new LoadStoreU(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	copy->dcache.clone_arrays();
+	if (!exist) return copy;
+	copy->LSQ   = clone_array(LSQ);
+	copy->LoadQ = clone_array(LoadQ);
+	return copy;
+}
+
+MemManU * MemManU::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	MemManU * copy = new MemManU(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	if (!exist) return copy;
+	copy->itlb = clone_array(itlb);
+	copy->dtlb = clone_array(dtlb);
+	return copy;
+}
+
+RegFU * RegFU::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	RegFU * copy = new RegFU(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	if (!exist) return copy;
+	copy->IRF   = clone_array(IRF);
+	copy->FRF   = clone_array(FRF);
+	copy->RFWIN = clone_array(RFWIN);
+	return copy;
+}
+
+EXECU * EXECU::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	EXECU * copy = new EXECU(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	if (!exist) return copy;
+	copy->rfu               = rfu   ? rfu->clone(ithCore_, dyn_p_)   : 0;
+	copy->scheu             = scheu ? scheu->clone(ithCore_, dyn_p_) : 0;
+	copy->fp_u              = fp_u  ? fp_u->clone(ithCore_, dyn_p_)  : 0;
+	copy->exeu              = exeu  ? exeu->clone(ithCore_, dyn_p_)  : 0;
+	copy->mul               = mul   ? mul->clone(ithCore_, dyn_p_)   : 0;
+	copy->int_bypass        = copy_of(int_bypass);
+	copy->intTagBypass      = copy_of(intTagBypass);
+	copy->int_mul_bypass    = copy_of(int_mul_bypass);
+	copy->intTag_mul_Bypass = copy_of(intTag_mul_Bypass);
+	copy->fp_bypass         = copy_of(fp_bypass);
+	copy->fpTagBypass       = copy_of(fpTagBypass);
+	return copy;
+}
+
+Core * Core::clone(int ithCore_) const
+{
+	Core * copy = new Core(*this);
+	copy->ithCore = ithCore_;
+	copy->set_core_param();
+	copy->clockRate     = copy->coredynp.clockRate;
+	copy->executionTime = copy->coredynp.executionTime;
+	copy->ifu        = ifu->clone(ithCore_, copy->coredynp);
+	copy->lsu        = lsu->clone(ithCore_, copy->coredynp);
+	copy->mmu        = mmu->clone(ithCore_, copy->coredynp);
+	copy->exu        = exu->clone(ithCore_, copy->coredynp);
+	copy->undiffCore = undiffCore->clone(ithCore_, copy->coredynp);
+	copy->rnu        = rnu ? rnu->clone(ithCore_, copy->coredynp) : 0;
+	copy->corepipe   = copy_of(corepipe);
+	copy->corepipe->coredynp = copy->coredynp;
+	copy->l2cache    = l2cache ? l2cache->clone(ithCore_) : 0;
+	return copy;
+}
+
 InstFetchU ::~InstFetchU(){
 
 	if (!exist) return;
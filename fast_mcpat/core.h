@@ -59,6 +59,7 @@ class BranchPredictor :public Component {
 	bool exist;
 
 	BranchPredictor(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_,const CoreDynParam & dyn_p_, bool exsit=true);
+	BranchPredictor * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
 	~BranchPredictor();
@@ -85,6 +86,7 @@ class InstFetchU :public Component {
 	bool exist;
 
 	InstFetchU(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_,const CoreDynParam & dyn_p_, bool exsit=true);
+	InstFetchU * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
 	~InstFetchU();
@@ -108,6 +110,7 @@ class SchedulerU :public Component {
     bool exist;
 
     SchedulerU(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_,const CoreDynParam & dyn_p_, bool exist_=true);
+	SchedulerU * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
 	~SchedulerU();
@@ -134,6 +137,7 @@ class RENAMINGU :public Component {
 
 
 	RENAMINGU(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_, const CoreDynParam & dyn_p_, bool exist_=true);
+	RENAMINGU * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
 	~RENAMINGU();
@@ -156,6 +160,7 @@ class LoadStoreU :public Component {
 	bool exist;
 
 	LoadStoreU(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_,const CoreDynParam & dyn_p_, bool exist_=true);
+	LoadStoreU * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
 	~LoadStoreU();
@@ -175,6 +180,7 @@ class MemManU :public Component {
 	bool exist;
 
 	MemManU(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_,const CoreDynParam & dyn_p_, bool exist_=true);
+	MemManU * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
 	~MemManU();
@@ -196,6 +202,7 @@ class RegFU :public Component {
 	bool exist;
 
 	RegFU(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_,const CoreDynParam & dyn_p_, bool exist_=true);
+	RegFU * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
 	~RegFU();
@@ -227,6 +234,7 @@ class EXECU :public Component {
 	bool exist;
 
 	EXECU(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_, double lsq_height_,const CoreDynParam & dyn_p_, bool exist_=true);
+	EXECU * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
     void computeEnergy(bool is_tdp=true);
 	void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
 	~EXECU();
@@ -253,6 +261,7 @@ class Core :public Component {
     //full_decoder 	inst_decoder;
     //clock_network	clockNetwork;
 	Core(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_);
+	Core * clone(int ithCore_) const;
 	void set_core_param();
 	void computeEnergy(bool is_tdp=true);
 	void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
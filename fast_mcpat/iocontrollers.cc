@@ -182,15 +182,13 @@ void NIUController::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << "NIU:" << endl;
-		cout << indent_str<< "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str << "Peak Dynamic = " << power.readOp.dynamic*niup.clockRate  << " W" << endl;
-		cout << indent_str<< "Subthreshold Leakage = "
-			<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str << "Subthreshold Leakage with power gating = "
-				<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str<< "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str << "Runtime Dynamic = " << rt_power.readOp.dynamic*niup.clockRate << " W" << endl;
+		report_component("NIU");
+		report_value(indent_str, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str, "Peak Dynamic", power.readOp.dynamic*niup.clockRate, "W");
+		report_value(indent_str, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+		report_value(indent_str, "Gate Leakage", power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Runtime Dynamic", rt_power.readOp.dynamic*niup.clockRate, "W");
 		cout<<endl;
 	}
 	else
@@ -200,6 +198,14 @@ void NIUController::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 }
 
+// The same NIU, evaluated with the stats now in XML (see Core::clone())
+NIUController * NIUController::clone() const
+{
+	NIUController * copy = new NIUController(*this);
+	copy->set_niu_param();
+	return copy;
+}
+
 void NIUController::set_niu_param()
 {
 	niup.clockRate       = XML->sys.niu.clockrate;
@@ -333,15 +339,13 @@ void PCIeController::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << "PCIe:" << endl;
-		cout << indent_str<< "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str << "Peak Dynamic = " << power.readOp.dynamic*pciep.clockRate  << " W" << endl;
-		cout << indent_str<< "Subthreshold Leakage = "
-			<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str << "Subthreshold Leakage with power gating = "
-				<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str<< "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str << "Runtime Dynamic = " << rt_power.readOp.dynamic*pciep.clockRate << " W" << endl;
+		report_component("PCIe");
+		report_value(indent_str, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str, "Peak Dynamic", power.readOp.dynamic*pciep.clockRate, "W");
+		report_value(indent_str, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+		report_value(indent_str, "Gate Leakage", power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Runtime Dynamic", rt_power.readOp.dynamic*pciep.clockRate, "W");
 		cout<<endl;
 	}
 	else
@@ -351,6 +355,14 @@ void PCIeController::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 }
 
+// The same PCIe controller, evaluated with the stats now in XML (see Core::clone())
+PCIeController * PCIeController::clone() const
+{
+	PCIeController * copy = new PCIeController(*this);
+	copy->set_pcie_param();
+	return copy;
+}
+
 void PCIeController::set_pcie_param()
 {
 	  pciep.clockRate       = XML->sys.pcie.clockrate;
@@ -464,15 +476,13 @@ void FlashController::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << "Flash Controller:" << endl;
-		cout << indent_str<< "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str << "Peak Dynamic = " << power.readOp.dynamic << " W" << endl;//no multiply of clock since this is power already
-		cout << indent_str<< "Subthreshold Leakage = "
-			<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str << "Subthreshold Leakage with power gating = "
-				<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str<< "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str << "Runtime Dynamic = " << rt_power.readOp.dynamic << " W" << endl;
+		report_component("Flash Controller");
+		report_value(indent_str, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str, "Peak Dynamic", power.readOp.dynamic, "W");//no multiply of clock since this is power already
+		report_value(indent_str, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+		report_value(indent_str, "Gate Leakage", power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Runtime Dynamic", rt_power.readOp.dynamic, "W");
 		cout<<endl;
 	}
 	else
@@ -482,6 +492,14 @@ void FlashController::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 }
 
+// The same flash controller, evaluated with the stats now in XML (see Core::clone())
+FlashController * FlashController::clone() const
+{
+	FlashController * copy = new FlashController(*this);
+	copy->set_fc_param();
+	return copy;
+}
+
 void FlashController::set_fc_param()
 {
 //	  fcp.clockRate       = XML->sys.flashc.mc_clock;
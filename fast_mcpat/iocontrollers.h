@@ -50,6 +50,7 @@ class NIUController : public Component {
     powerDef power_t;
     uca_org_t local_result;
     NIUController(ParseXML *XML_interface,InputParameter* interface_ip_);
+    NIUController * clone() const;
     void set_niu_param();
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
@@ -64,6 +65,7 @@ class PCIeController : public Component {
     powerDef power_t;
     uca_org_t local_result;
     PCIeController(ParseXML *XML_interface,InputParameter* interface_ip_);
+    PCIeController * clone() const;
     void set_pcie_param();
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
@@ -78,6 +80,7 @@ class FlashController : public Component {
     powerDef power_t;
     uca_org_t local_result;
     FlashController(ParseXML *XML_interface,InputParameter* interface_ip_);
+    FlashController * clone() const;
     void set_fc_param();
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
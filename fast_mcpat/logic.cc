@@ -30,6 +30,7 @@
  ***************************************************************************/
 
 #include "logic.h"
+#include <sstream>
 
 
 //selection_logic
@@ -565,6 +566,19 @@ FunctionalUnit::FunctionalUnit(ParseXML *XML_interface, int ithCore_, InputParam
 		area.set_area(area.get_area()*macro_layout_overhead);
 }
 
+/*
+ * The same functional unit, evaluated with the stats of core ithCore_.
+ * Nothing that the constructor computes depends on the stats.
+ */
+FunctionalUnit * FunctionalUnit::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	FunctionalUnit * copy = new FunctionalUnit(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	return copy;
+}
+
 void FunctionalUnit::computeEnergy(bool is_tdp)
 {
 	double pppm_t[4]    = {1,1,1,1};
@@ -654,44 +668,44 @@ void FunctionalUnit::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 	{
 		if (fu_type == FPU)
 		{
-			cout << indent_str << "Floating Point Units (FPUs) (Count: "<< coredynp.num_fpus <<" ):" << endl;
-			cout << indent_str_next << "Area = " << area.get_area()*1e-6  << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << power.readOp.dynamic*clockRate  << " W" << endl;
+			ostringstream count;
+			count << " (FPUs) (Count: " << coredynp.num_fpus << " ):";
+			report_section(indent_str, "Floating Point Units", count.str());
+			report_value(indent_str_next, "Area", area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", power.readOp.dynamic*clockRate, "W");
 //			cout << indent_str_next << "Subthreshold Leakage = " << power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next<< "Subthreshold Leakage = "
-						<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 		}
 		else if (fu_type == ALU)
 		{
-			cout << indent_str << "Integer ALUs (Count: "<< coredynp.num_alus <<" ):" << endl;
-			cout << indent_str_next << "Area = " << area.get_area()*1e-6  << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << power.readOp.dynamic*clockRate  << " W" << endl;
+			ostringstream count;
+			count << " (Count: " << coredynp.num_alus << " ):";
+			report_section(indent_str, "Integer ALUs", count.str());
+			report_value(indent_str_next, "Area", area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", power.readOp.dynamic*clockRate, "W");
 //			cout << indent_str_next << "Subthreshold Leakage = " << power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next<< "Subthreshold Leakage = "
-						<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 		}
 		else if (fu_type == MUL)
 		{
-			cout << indent_str << "Complex ALUs (Mul/Div) (Count: "<< coredynp.num_muls <<" ):" << endl;
-			cout << indent_str_next << "Area = " << area.get_area()*1e-6  << " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << power.readOp.dynamic*clockRate  << " W" << endl;
+			ostringstream count;
+			count << " (Mul/Div) (Count: " << coredynp.num_muls << " ):";
+			report_section(indent_str, "Complex ALUs", count.str());
+			report_value(indent_str_next, "Area", area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", power.readOp.dynamic*clockRate, "W");
 //			cout << indent_str_next << "Subthreshold Leakage = " << power.readOp.leakage  << " W" << endl;
-			cout << indent_str_next<< "Subthreshold Leakage = "
-						<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << power.readOp.gate_leakage  << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << rt_power.readOp.dynamic/executionTime << " W" << endl;
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", rt_power.readOp.dynamic/executionTime, "W");
 			cout <<endl;
 
 		}
@@ -859,6 +873,15 @@ UndiffCore::UndiffCore(ParseXML* XML_interface, int ithCore_, InputParameter* in
 }
 
 
+UndiffCore * UndiffCore::clone(int ithCore_, const CoreDynParam & dyn_p_) const
+{
+	UndiffCore * copy = new UndiffCore(*this);
+	copy->ithCore       = ithCore_;
+	copy->coredynp      = dyn_p_;
+	copy->executionTime = dyn_p_.executionTime;
+	return copy;
+}
+
 void UndiffCore::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 {
 	string indent_str(indent, ' ');
@@ -868,25 +891,23 @@ void UndiffCore::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << indent_str << "UndiffCore:" << endl;
-		cout << indent_str_next << "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << power.readOp.dynamic*clockRate << " W" << endl;
+		report_section(indent_str, "UndiffCore");
+		report_value(indent_str_next, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", power.readOp.dynamic*clockRate, "W");
 		//cout << indent_str_next << "Subthreshold Leakage = " << power.readOp.leakage <<" W" << endl;
-		cout << indent_str_next<< "Subthreshold Leakage = "
-					<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", power.readOp.gate_leakage, "W");
 		//cout << indent_str_next << "Runtime Dynamic = " << rt_power.readOp.dynamic/executionTime << " W" << endl;
 		cout <<endl;
 	}
 	else
 	{
-		cout << indent_str << "UndiffCore:" << endl;
-		cout << indent_str_next << "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << power.readOp.dynamic*clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = " << power.readOp.leakage <<" W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
+		report_section(indent_str, "UndiffCore");
+		report_value(indent_str_next, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", power.readOp.dynamic*clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", power.readOp.leakage, "W");
+		report_value(indent_str_next, "Gate Leakage", power.readOp.gate_leakage, "W");
 		//cout << indent_str_next << "Runtime Dynamic = " << rt_power.readOp.dynamic/executionTime << " W" << endl;
 		cout <<endl;
 	}
@@ -1062,6 +1083,28 @@ void inst_decoder::leakage_feedback(double temperature)
 
 }
 
+/*
+ * A copy that owns its own decoders, see Core::clone().
+ */
+inst_decoder * inst_decoder::clone() const
+{
+	inst_decoder * copy = new inst_decoder(*this);
+	copy->final_dec = new Decoder(*final_dec);
+	if (final_dec->sleeptx)
+		copy->final_dec->sleeptx = new Sleep_tx(*final_dec->sleeptx);
+
+	copy->pre_dec       = new Predec(*pre_dec);
+	copy->pre_dec->blk1 = new PredecBlk(*pre_dec->blk1);
+	copy->pre_dec->blk2 = new PredecBlk(*pre_dec->blk2);
+	copy->pre_dec->drv1 = new PredecBlkDrv(*pre_dec->drv1);
+	copy->pre_dec->drv2 = new PredecBlkDrv(*pre_dec->drv2);
+	copy->pre_dec->blk1->dec = copy->pre_dec->blk2->dec = copy->final_dec;
+	copy->pre_dec->drv1->blk = copy->pre_dec->blk1;
+	copy->pre_dec->drv2->blk = copy->pre_dec->blk2;
+	copy->pre_dec->drv1->dec = copy->pre_dec->drv2->dec = copy->final_dec;
+	return copy;
+}
+
 inst_decoder::~inst_decoder()
 {
 	  local_result.cleanup();
@@ -120,6 +120,7 @@ public:
 	statsDef       stats_t;
 	powerDef       power_t;
 	void inst_decoder_delay_power();
+	inst_decoder * clone() const;
 	~inst_decoder();
 	void leakage_feedback(double temperature);
 };
@@ -204,6 +205,7 @@ public:
 	powerDef       power_t;
 
 	FunctionalUnit(ParseXML *XML_interface, int ithCore_, InputParameter* interface_ip_,const CoreDynParam & dyn_p_, enum FU_type fu_type);
+	FunctionalUnit * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
     void computeEnergy(bool is_tdp=true);
 	void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
     void leakage_feedback(double temperature);
@@ -213,6 +215,7 @@ public:
 class UndiffCore :public Component{
 public:
 	UndiffCore(ParseXML* XML_interface, int ithCore_, InputParameter* interface_ip_, const CoreDynParam & dyn_p_, bool exist_=true, bool embedded_=false);
+	UndiffCore * clone(int ithCore_, const CoreDynParam & dyn_p_) const;
 	ParseXML *XML;
 	int  ithCore;
 	InputParameter interface_ip;
@@ -29,9 +29,15 @@
  *
  ***************************************************************************/
 #include "io.h"
+#include "thread_pool.h"
 #include <iostream>
+#include <sstream>
+#include <iterator>
+#include <fstream>
+#include <map>
 #include "xmlParser.h"
 #include "XML_Parse.h"
+#include "compiled_template.h"
 #include "processor.h"
 #include "globalvar.h"
 #include "version.h"
@@ -40,11 +46,21 @@
 using namespace std;
 
 void print_usage(char * argv0);
+void serve(char * fb, int plevel, bool json, bool stats);
+void print_stats();
+XMLNode read_input(char * fb);
+string read_text(char * fb);
+XMLNode parse_text(const string & xml, char * fb);
 
 int main(int argc,char *argv[])
 {
 	char * fb ;
+	char * compile_to         = NULL;
+	char * template_file      = NULL;
 	bool infile_specified     = false;
+	bool server               = false;
+	bool json                 = false;
+	bool stats                = false;
 	int  plevel               = 2;
 	opt_for_clk	=true;
 	//cout.precision(10);
@@ -73,29 +89,285 @@ int main(int argc,char *argv[])
 			i++;
 			opt_for_clk = (bool)atoi(argv[i]);
 		}
+
+		if (argv[i] == string("-server"))
+		{
+			i++;
+			server = (bool)atoi(argv[i]);
+		}
+
+		if (argv[i] == string("-json"))
+		{
+			i++;
+			json = (bool)atoi(argv[i]);
+		}
+
+		if (argv[i] == string("-stats"))
+		{
+			i++;
+			stats = (bool)atoi(argv[i]);
+		}
+
+		if (argv[i] == string("-share"))
+		{
+			i++;
+			share_models = (bool)atoi(argv[i]);
+		}
+
+		if (argv[i] == string("-cache"))
+		{
+			i++;
+			cacti_cache_file = argv[i];
+		}
+
+		if (argv[i] == string("-seed"))
+		{
+			i++;
+			cacti_cache_seed = argv[i];
+		}
+
+		if (argv[i] == string("-threads"))
+		{
+			i++;
+			ThreadPool::set_threads(atoi(argv[i]));
+		}
+
+		if (argv[i] == string("-compile"))
+		{
+			i++;
+			compile_to = argv[i];
+		}
+
+		if (argv[i] == string("-template"))
+		{
+			i++;
+			template_file = argv[i];
+		}
 	}
-	if (infile_specified == false)
+	if (infile_specified == false && (template_file == NULL || server || compile_to))
 	{
 		print_usage(argv[0]);
 	}
 
+	if (compile_to)
+	{
+		CompiledTemplate compiled(read_input(fb));
+		if (!compiled.ok() || !compiled.save(compile_to))
+		{
+			cerr << "Cannot compile " << fb << " to " << compile_to << ": "
+				<< (compiled.ok() ? "cannot write it" : compiled.error()) << endl;
+			return 1;
+		}
+		return 0;
+	}
+
+	CompiledTemplate * compiled = NULL;
+	if (template_file)
+	{
+		compiled = new CompiledTemplate(template_file);
+		if (!compiled->ok())
+		{
+			cerr << "Warning: " << compiled->error() << ", ignoring it" << endl;
+			delete compiled;
+			compiled = NULL;
+			if (!infile_specified)
+				return 1;
+		}
+	}
+
+	if (server)
+	{
+		serve(fb, plevel, json, stats);
+		return 0;
+	}
+
 
-	cout<<"McPAT (version "<< VER_MAJOR <<"."<< VER_MINOR
-		<< " of " << VER_UPDATE << ") is computing the target processor...\n "<<endl;
+	if (!json)
+		cout<<"McPAT (version "<< VER_MAJOR <<"."<< VER_MINOR
+			<< " of " << VER_UPDATE << ") is computing the target processor...\n "<<endl;
 
 	//parse XML-based interface
 	ParseXML *p1= new ParseXML();
-	p1->parse(fb);
+	if (compiled && !infile_specified)
+		compiled->parsed(p1);
+	else if (compiled)
+	{
+		//an input that only changes stats of the template is read in one pass
+		string xml = read_text(fb);
+		if (!compiled->read(xml.c_str(), p1))
+		{
+			cerr << "Warning: " << fb << " differs from " << template_file << " in more than its stats, parsing it in full" << endl;
+			p1->parse(parse_text(xml, fb));
+		}
+	}
+	else
+		p1->parse(read_input(fb));
 	Processor proc(p1);
-	proc.displayEnergy(2, plevel);
+	if (stats)
+		print_stats();
+	if (json)
+		proc.displayJSON(2, plevel);
+	else
+		proc.displayEnergy(2, plevel);
 	delete p1;
 	return 0;
 }
 
+// "-infile -" reads the processor description from stdin, so that generated
+// inputs can be piped in without writing them to a file
+XMLNode read_input(char * fb)
+{
+	if (fb != string("-"))
+		return XMLNode::openFileHelper(fb,"component");
+	return parse_text(read_text(fb), fb);
+}
+
+// The text of the input file, or of stdin for "-"
+string read_text(char * fb)
+{
+	if (fb == string("-"))
+		return string((istreambuf_iterator<char>(cin)), istreambuf_iterator<char>());
+	ifstream input(fb, ios::in | ios::binary);
+	if (!input)
+	{
+		cerr << "Cannot open " << fb << endl;
+		exit(255);
+	}
+	return string((istreambuf_iterator<char>(input)), istreambuf_iterator<char>());
+}
+
+XMLNode parse_text(const string & xml, char * fb)
+{
+	XMLResults results;
+	XMLNode xMainNode=XMLNode::parseString(xml.c_str(),"component",&results);
+	if (results.error != eXMLErrorNone)
+	{
+		cerr << "XML Parsing error in " << (fb == string("-") ? "stdin" : fb) << ": " << XMLNode::getError(results.error)
+			<< " at line " << results.nLine << ", column " << results.nColumn << endl;
+		exit(255);
+	}
+	return xMainNode;
+}
+
+// Records every param/stat node of the template under "<component id>/<param|stat>/<name>"
+static void index_slots(XMLNode node, map<string, XMLNode> & slots)
+{
+	const char * id = node.getAttribute("id");
+	for (int i = 0; i < node.nChildNode(); i++)
+	{
+		XMLNode child = node.getChildNode(i);
+		if (child.getName() == string("component"))
+			index_slots(child, slots);
+		else if (id && child.getAttribute("name"))
+			slots.insert(make_pair(string(id) + "/" + child.getName() + "/" + child.getAttribute("name"), child));
+	}
+}
+
+/*
+ * Server mode: the template is read once, then every request updates it in memory
+ * and is evaluated without starting a new process or touching the file system.
+ * CACTI results stay cached inside the process between requests.  Stats are set
+ * in a compiled template (see compiled_template.h), the template is only parsed
+ * again after a param changed.  The processor is built once and its XML refilled
+ * in place, every run only evaluates it with the new stats (see
+ * Processor::update_stats()); it is built again after a param changed.
+ * Protocol (one command per line on stdin):
+ *   <component id> <param|stat> <name> <value>   update a value of the template
+ *   run                                          evaluate and print the results,
+ *                                                followed by a line "MCPAT_DONE"
+ * "MCPAT_READY" is printed once the template has been loaded.
+ */
+void serve(char * fb, int plevel, bool json, bool stats)
+{
+	XMLNode xMainNode=XMLNode::openFileHelper(fb,"component");
+	map<string, XMLNode> slots;
+	index_slots(xMainNode, slots);
+	CompiledTemplate * compiled = NULL;
+	ParseXML *p1 = NULL;
+	Processor *proc = NULL;
+	cout << "MCPAT_READY" << endl;
+
+	string line;
+	while (getline(cin, line))
+	{
+		if (line == "run")
+		{
+			if (compiled == NULL)
+				compiled = new CompiledTemplate(xMainNode);
+			if (p1 == NULL)
+				p1 = new ParseXML();
+			if (compiled->ok())
+				compiled->parsed(p1);
+			else
+				p1->parse(xMainNode);
+			if (proc == NULL)
+				proc = new Processor(p1, true);
+			else
+				proc->update_stats();
+			if (stats)
+				print_stats();
+			if (json)
+				proc->displayJSON(2, plevel);
+			else
+				proc->displayEnergy(2, plevel);
+			cout << "MCPAT_DONE" << endl;
+			continue;
+		}
+
+		istringstream request(line);
+		string id, kind, name, value;
+		if (!(request >> id >> kind >> name >> value))
+			continue;
+		map<string, XMLNode>::iterator slot = slots.find(id + "/" + kind + "/" + name);
+		if (slot == slots.end())
+		{
+			cerr << "Unknown " << kind << " " << name << " in component " << id << endl;
+			continue;
+		}
+		slot->second.updateAttribute(value.c_str(), NULL, "value");
+		if (kind != "stat" && proc)
+		{
+			delete proc;
+			proc = NULL;
+		}
+		if (compiled && compiled->ok() && (kind != "stat" || !compiled->set_stat(slot->first, value.c_str())))
+		{
+			delete compiled;
+			compiled = NULL;
+		}
+	}
+	delete proc;
+	delete p1;
+}
+
+// One line on how the CACTI arrays since the last call were found, printed
+// before the results so that -json output still ends with the JSON line
+void print_stats()
+{
+	cout << "CACTI_STATS " << cacti_memory_hits << " " << cacti_db_hits << " " << cacti_solved
+		<< " " << cacti_component_hits << " " << cacti_component_built << endl;
+	cacti_memory_hits = 0;
+	cacti_db_hits = 0;
+	cacti_solved = 0;
+	cacti_component_hits = 0;
+	cacti_component_built = 0;
+}
+
 void print_usage(char * argv0)
 {
     cerr << "How to use McPAT:" << endl;
     cerr << "  mcpat -infile <input file name>  -print_level < level of details 0~5 >  -opt_for_clk < 0 (optimize for ED^2P only)/1 (optimzed for target clock rate)>"<< endl;
+    cerr << "  use -infile - to read the input file from stdin" << endl;
+    cerr << "  add -json 1 to print the results as one line of JSON" << endl;
+    cerr << "  add -server 1 to keep the model loaded and evaluate updated stats read from stdin" << endl;
+    cerr << "  add -stats 1 to print how the CACTI arrays of each evaluation were found before the results" << endl;
+    cerr << "  add -share 0 to build every core and L2 separately, even the ones with the same hardware" << endl;
+    cerr << "  add -cache <file> to keep the CACTI cache in that file instead of $TMPDIR/mcpat-$USER.cacti" << endl;
+    cerr << "  add -seed <file> to also look CACTI arrays up in a read only cache (see cachetool)" << endl;
+    cerr << "  add -threads <n> to solve CACTI arrays with n threads (default: one per CPU McPAT may run on)" << endl;
+    cerr << "  add -compile <file> to write the input file as a compiled template to that file and exit" << endl;
+    cerr << "  add -template <file> to read inputs that only change stats of that compiled template in one pass" << endl;
+    cerr << "    (without -infile, the template itself is evaluated)" << endl;
     //cerr << "    Note:default print level is at processor level, please increase it to see the details" << endl;
     exit(1);
 }
@@ -3,21 +3,16 @@ SHELL = /bin/sh
 .PHONY: all depend clean
 .SUFFIXES: .cc .o
 
-ifndef NTHREADS
-  NTHREADS = 4
-endif
-
-
 LIBS =
 INCS = -lm
 
 ifeq ($(TAG),dbg)
   DBG = -Wall
-  OPT = -ggdb -g -O0 -DNTHREADS=1 -Icacti
+  OPT = -ggdb -g -O0 -Icacti
 else
   DBG =
-  OPT = -O3 -msse2 -mfpmath=sse -DNTHREADS=$(NTHREADS) -Icacti
-  #OPT = -O0 -DNTHREADS=$(NTHREADS)
+  OPT = -O3 -msse2 -mfpmath=sse -Icacti
+  #OPT = -O0
 endif
 
 ifeq ($(ARCH),ia32)
@@ -25,7 +20,6 @@ ifeq ($(ARCH),ia32)
 endif
 
 OPT += -DENABLE_CACHE
-LIBS += -ldb
 
 
 #CXXFLAGS = -Wall -Wno-unknown-pragmas -Winline $(DBG) $(OPT)
@@ -44,7 +38,9 @@ SRCS  = \
   bank.cc \
   basic_circuit.cc \
   basic_components.cc \
+  cacti_cache.cc \
   cacti_interface.cc \
+  compiled_template.cc \
   component.cc \
   core.cc \
   crossbar.cc \
@@ -65,6 +61,7 @@ SRCS  = \
   sharedcache.cc \
   subarray.cc \
   technology.cc \
+  thread_pool.cc \
   uca.cc \
   wire.cc \
   xmlParser.cc \
@@ -72,9 +69,26 @@ SRCS  = \
 
 OBJS = $(patsubst %.cc,obj_$(TAG)/%.o,$(SRCS))
 
-all: obj_$(TAG)/$(TARGET)
+all: obj_$(TAG)/$(TARGET) cachetool
 	cp -f obj_$(TAG)/$(TARGET) $(TARGET)$(SUFFIX)
 
+cachetool: obj_$(TAG)/cachetool.o obj_$(TAG)/cacti_cache.o
+	$(CXX) $^ -o $@ $(CXXFLAGS)
+
+# Compares the CACTI cache with Berkeley DB, LIBDB=0 leaves Berkeley DB out
+ifeq ($(LIBDB),0)
+  BENCH_OPT = -DNO_LIBDB
+else
+  BENCH_LIBS = -ldb
+endif
+
+cache_bench: cache_bench.cc obj_$(TAG)/cacti_cache.o
+	$(CXX) $(CXXFLAGS) $(BENCH_OPT) $^ -o $@ $(BENCH_LIBS)
+
+# Times and checks the ways McPAT reads a processor description
+parse_bench: parse_bench.cc obj_$(TAG)/compiled_template.o obj_$(TAG)/XML_Parse.o obj_$(TAG)/xmlParser.o
+	$(CXX) $(CXXFLAGS) $^ -o $@
+
 obj_$(TAG)/$(TARGET) : $(OBJS)
 	$(CXX) $(OBJS) -o $@ $(INCS) $(CXXFLAGS) $(LIBS) -pthread
 
@@ -85,6 +99,6 @@ obj_$(TAG)/%.o : %.cc
 	$(CXX) $(CXXFLAGS) -c $< -o $@
 
 clean:
-	-rm -f *.o $(TARGET)
+	-rm -f *.o $(TARGET) cachetool cache_bench parse_bench
 
 
@@ -471,54 +471,51 @@ void MCFrontEnd::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << indent_str << "Front End ROB:" << endl;
-		cout << indent_str_next << "Area = " << frontendBuffer->area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << frontendBuffer->power.readOp.dynamic*mcp.clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = " << frontendBuffer->power.readOp.leakage <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? frontendBuffer->power.readOp.power_gated_with_long_channel_leakage : frontendBuffer->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << frontendBuffer->power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << frontendBuffer->rt_power.readOp.dynamic/mcp.executionTime << " W" << endl;
+		report_section(indent_str, "Front End ROB");
+		report_value(indent_str_next, "Area", frontendBuffer->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", frontendBuffer->power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", frontendBuffer->power.readOp.leakage, "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? frontendBuffer->power.readOp.power_gated_with_long_channel_leakage : frontendBuffer->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", frontendBuffer->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", frontendBuffer->rt_power.readOp.dynamic/mcp.executionTime, "W");
 
 		cout <<endl;
-		cout << indent_str<< "Read Buffer:" << endl;
-		cout << indent_str_next << "Area = " << readBuffer->area.get_area()*1e-6  << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << readBuffer->power.readOp.dynamic*mcp.clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = " << readBuffer->power.readOp.leakage  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? readBuffer->power.readOp.power_gated_with_long_channel_leakage : readBuffer->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << readBuffer->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << readBuffer->rt_power.readOp.dynamic/mcp.executionTime << " W" << endl;
+		report_section(indent_str, "Read Buffer");
+		report_value(indent_str_next, "Area", readBuffer->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", readBuffer->power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", readBuffer->power.readOp.leakage, "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? readBuffer->power.readOp.power_gated_with_long_channel_leakage : readBuffer->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", readBuffer->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", readBuffer->rt_power.readOp.dynamic/mcp.executionTime, "W");
 		cout <<endl;
-		cout << indent_str << "Write Buffer:" << endl;
-		cout << indent_str_next << "Area = " << writeBuffer->area.get_area() *1e-6 << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << writeBuffer->power.readOp.dynamic*mcp.clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = " << writeBuffer->power.readOp.leakage  << " W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? writeBuffer->power.readOp.power_gated_with_long_channel_leakage : writeBuffer->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << writeBuffer->power.readOp.gate_leakage  << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << writeBuffer->rt_power.readOp.dynamic/mcp.executionTime << " W" << endl;
+		report_section(indent_str, "Write Buffer");
+		report_value(indent_str_next, "Area", writeBuffer->area.get_area() *1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", writeBuffer->power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", writeBuffer->power.readOp.leakage, "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? writeBuffer->power.readOp.power_gated_with_long_channel_leakage : writeBuffer->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", writeBuffer->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", writeBuffer->rt_power.readOp.dynamic/mcp.executionTime, "W");
 		cout <<endl;
 	}
 	else
 	{
-		cout << indent_str << "Front End ROB:" << endl;
-		cout << indent_str_next << "Area = " << frontendBuffer->area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << frontendBuffer->rt_power.readOp.dynamic*mcp.clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = " << frontendBuffer->rt_power.readOp.leakage <<" W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << frontendBuffer->rt_power.readOp.gate_leakage << " W" << endl;
+		report_section(indent_str, "Front End ROB");
+		report_value(indent_str_next, "Area", frontendBuffer->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", frontendBuffer->rt_power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", frontendBuffer->rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Gate Leakage", frontendBuffer->rt_power.readOp.gate_leakage, "W");
 		cout <<endl;
-		cout << indent_str<< "Read Buffer:" << endl;
-		cout << indent_str_next << "Area = " << readBuffer->area.get_area()*1e-6  << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << readBuffer->rt_power.readOp.dynamic*mcp.clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = " << readBuffer->rt_power.readOp.leakage  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << readBuffer->rt_power.readOp.gate_leakage  << " W" << endl;
+		report_section(indent_str, "Read Buffer");
+		report_value(indent_str_next, "Area", readBuffer->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", readBuffer->rt_power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", readBuffer->rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Gate Leakage", readBuffer->rt_power.readOp.gate_leakage, "W");
 		cout <<endl;
-		cout << indent_str << "Write Buffer:" << endl;
-		cout << indent_str_next << "Area = " << writeBuffer->area.get_area() *1e-6 << " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << writeBuffer->rt_power.readOp.dynamic*mcp.clockRate  << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = " << writeBuffer->rt_power.readOp.leakage  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << writeBuffer->rt_power.readOp.gate_leakage  << " W" << endl;
+		report_section(indent_str, "Write Buffer");
+		report_value(indent_str_next, "Area", writeBuffer->area.get_area() *1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", writeBuffer->rt_power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", writeBuffer->rt_power.readOp.leakage, "W");
+		report_value(indent_str_next, "Gate Leakage", writeBuffer->rt_power.readOp.gate_leakage, "W");
 	}
 
 }
@@ -627,65 +624,82 @@ void MemoryController::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << "Memory Controller:" << endl;
-		cout << indent_str<< "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str << "Peak Dynamic = " << power.readOp.dynamic*mcp.clockRate  << " W" << endl;
-		cout << indent_str<< "Subthreshold Leakage = "
-			<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str << "Subthreshold Leakage with power gating = "
-				<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str<< "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str << "Runtime Dynamic = " << rt_power.readOp.dynamic/mcp.executionTime << " W" << endl;
+		report_component("Memory Controller");
+		report_value(indent_str, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str, "Peak Dynamic", power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+		report_value(indent_str, "Gate Leakage", power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Runtime Dynamic", rt_power.readOp.dynamic/mcp.executionTime, "W");
 		cout<<endl;
-		cout << indent_str << "Front End Engine:" << endl;
-		cout << indent_str_next << "Area = " << frontend->area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << frontend->power.readOp.dynamic*mcp.clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? frontend->power.readOp.longer_channel_leakage:frontend->power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? frontend->power.readOp.power_gated_with_long_channel_leakage : frontend->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << frontend->power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << frontend->rt_power.readOp.dynamic/mcp.executionTime << " W" << endl;
+		report_section(indent_str, "Front End Engine");
+		report_value(indent_str_next, "Area", frontend->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", frontend->power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? frontend->power.readOp.longer_channel_leakage:frontend->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? frontend->power.readOp.power_gated_with_long_channel_leakage : frontend->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", frontend->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", frontend->rt_power.readOp.dynamic/mcp.executionTime, "W");
 		cout <<endl;
 		if (plevel >2){
 			frontend->displayEnergy(indent+4,is_tdp);
 		}
-		cout << indent_str << "Transaction Engine:" << endl;
-		cout << indent_str_next << "Area = " << transecEngine->area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << transecEngine->power.readOp.dynamic*mcp.clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? transecEngine->power.readOp.longer_channel_leakage:transecEngine->power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? transecEngine->power.readOp.power_gated_with_long_channel_leakage : transecEngine->power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << transecEngine->power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << transecEngine->rt_power.readOp.dynamic/mcp.executionTime << " W" << endl;
+		report_section(indent_str, "Transaction Engine");
+		report_value(indent_str_next, "Area", transecEngine->area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", transecEngine->power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? transecEngine->power.readOp.longer_channel_leakage:transecEngine->power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? transecEngine->power.readOp.power_gated_with_long_channel_leakage : transecEngine->power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", transecEngine->power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", transecEngine->rt_power.readOp.dynamic/mcp.executionTime, "W");
 		cout <<endl;
 		if (mcp.type==0 || (mcp.type==1&&mcp.withPHY))
 		{
-			cout << indent_str << "PHY:" << endl;
-			cout << indent_str_next << "Area = " << PHY->area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << PHY->power.readOp.dynamic*mcp.clockRate << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? PHY->power.readOp.longer_channel_leakage:PHY->power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? PHY->power.readOp.power_gated_with_long_channel_leakage : PHY->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << PHY->power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << PHY->rt_power.readOp.dynamic/mcp.executionTime << " W" << endl;
+			report_section(indent_str, "PHY");
+			report_value(indent_str_next, "Area", PHY->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", PHY->power.readOp.dynamic*mcp.clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? PHY->power.readOp.longer_channel_leakage:PHY->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? PHY->power.readOp.power_gated_with_long_channel_leakage : PHY->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", PHY->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", PHY->rt_power.readOp.dynamic/mcp.executionTime, "W");
 			cout <<endl;
 		}
 	}
 	else
 	{
-		cout << "Memory Controller:" << endl;
-		cout << indent_str_next << "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << power.readOp.dynamic*mcp.clockRate << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = " << power.readOp.leakage <<" W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
+		report_component("Memory Controller");
+		report_value(indent_str_next, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", power.readOp.dynamic*mcp.clockRate, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", power.readOp.leakage, "W");
+		report_value(indent_str_next, "Gate Leakage", power.readOp.gate_leakage, "W");
 		cout<<endl;
 	}
 
 }
 
+/*
+ * The same memory controller, evaluated with the stats now in XML (see
+ * Core::clone()). mcp is read again and given to the front end, transaction
+ * engine and PHY, which get copies of their arrays and logic.
+ */
+MemoryController * MemoryController::clone() const
+{
+	MemoryController * copy = new MemoryController(*this);
+	copy->set_mc_param();
+	copy->frontend = new MCFrontEnd(*frontend);
+	copy->frontend->mcp            = copy->mcp;
+	copy->frontend->MC_arb         = new selection_logic(*frontend->MC_arb);
+	copy->frontend->frontendBuffer = frontend->frontendBuffer->clone();
+	copy->frontend->readBuffer     = frontend->readBuffer->clone();
+	copy->frontend->writeBuffer    = frontend->writeBuffer->clone();
+	copy->transecEngine = new MCBackend(*transecEngine);
+	copy->transecEngine->mcp = copy->mcp;
+	if (PHY)
+	{
+		copy->PHY = new MCPHY(*PHY);
+		copy->PHY->mcp = copy->mcp;
+	}
+	return copy;
+}
+
 void MemoryController::set_mc_param()
 {
 
@@ -104,6 +104,7 @@ class MemoryController : public Component {
 
     //clock_network clockNetwork;
     MemoryController(ParseXML *XML_interface,InputParameter* interface_ip_, enum MemoryCtrl_type mc_type_);
+    MemoryController * clone() const;
     void set_mc_param();
     void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
@@ -236,76 +236,62 @@ void NoC::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 	 * */
 	if (is_tdp)
 	{
-		cout << name << endl;
-		cout << indent_str << "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str<< "Peak Dynamic = " << power.readOp.dynamic*nocdynp.clockRate << " W" << endl;
-		cout << indent_str << "Subthreshold Leakage = "
-			<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str << "Subthreshold Leakage with power gating = "
-						<< (power.readOp.power_gated_leakage * (long_channel? power.readOp.longer_channel_leakage/power.readOp.leakage:1) )  << " W" << endl;
-		cout << indent_str << "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str<< "Runtime Dynamic = " << rt_power.readOp.dynamic/nocdynp.executionTime << " W" << endl;
+		report_component(name, "");
+		report_value(indent_str, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str, "Peak Dynamic", power.readOp.dynamic*nocdynp.clockRate, "W");
+		report_value(indent_str, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str, "Subthreshold Leakage with power gating", (power.readOp.power_gated_leakage * (long_channel? power.readOp.longer_channel_leakage/power.readOp.leakage:1) ), "W");
+		report_value(indent_str, "Gate Leakage", power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Runtime Dynamic", rt_power.readOp.dynamic/nocdynp.executionTime, "W");
 		cout<<endl;
 
 		if (router_exist)
 		{
-			cout << indent_str << "Router: " << endl;
-			cout << indent_str_next << "Area = " << router->area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next<< "Peak Dynamic = " << router->power.readOp.dynamic*nocdynp.clockRate << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? router->power.readOp.longer_channel_leakage:router->power.readOp.leakage)  <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? router->power.readOp.power_gated_with_long_channel_leakage : router->power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << router->power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next<< "Runtime Dynamic = " << router->rt_power.readOp.dynamic/nocdynp.executionTime << " W" << endl;
+			report_section(indent_str, "Router", ": ");
+			report_value(indent_str_next, "Area", router->area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", router->power.readOp.dynamic*nocdynp.clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? router->power.readOp.longer_channel_leakage:router->power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? router->power.readOp.power_gated_with_long_channel_leakage : router->power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", router->power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", router->rt_power.readOp.dynamic/nocdynp.executionTime, "W");
 			cout<<endl;
 			if (plevel >2){
-				cout << indent_str<< indent_str << "Virtual Channel Buffer:" << endl;
-				cout << indent_str<< indent_str_next << "Area = " << router->buffer.area.get_area()*1e-6*nocdynp.input_ports<< " mm^2" << endl;
-				cout << indent_str<< indent_str_next << "Peak Dynamic = " <<(router->buffer.power.readOp.dynamic + router->buffer.power.writeOp.dynamic)
-				*nocdynp.min_ports*M*nocdynp.clockRate << " W" << endl;
-				cout << indent_str<< indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? router->buffer.power.readOp.longer_channel_leakage*nocdynp.input_ports:router->buffer.power.readOp.leakage*nocdynp.input_ports)  <<" W" << endl;
-				if (power_gating) cout << indent_str<< indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? router->buffer.power.readOp.power_gated_with_long_channel_leakage : router->buffer.power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str<< indent_str_next << "Gate Leakage = " << router->buffer.power.readOp.gate_leakage*nocdynp.input_ports << " W" << endl;
-				cout << indent_str<< indent_str_next << "Runtime Dynamic = " << router->buffer.rt_power.readOp.dynamic/nocdynp.executionTime << " W" << endl;
+				report_section(indent_str + indent_str, "Virtual Channel Buffer");
+				report_value(indent_str + indent_str_next, "Area", router->buffer.area.get_area()*1e-6*nocdynp.input_ports, "mm^2");
+				report_value(indent_str + indent_str_next, "Peak Dynamic", (router->buffer.power.readOp.dynamic + router->buffer.power.writeOp.dynamic)
+				*nocdynp.min_ports*M*nocdynp.clockRate, "W");
+				report_value(indent_str + indent_str_next, "Subthreshold Leakage", (long_channel? router->buffer.power.readOp.longer_channel_leakage*nocdynp.input_ports:router->buffer.power.readOp.leakage*nocdynp.input_ports), "W");
+				if (power_gating) report_value(indent_str + indent_str_next, "Subthreshold Leakage with power gating", (long_channel? router->buffer.power.readOp.power_gated_with_long_channel_leakage : router->buffer.power.readOp.power_gated_leakage), "W");
+				report_value(indent_str + indent_str_next, "Gate Leakage", router->buffer.power.readOp.gate_leakage*nocdynp.input_ports, "W");
+				report_value(indent_str + indent_str_next, "Runtime Dynamic", router->buffer.rt_power.readOp.dynamic/nocdynp.executionTime, "W");
 				cout <<endl;
-				cout << indent_str<< indent_str<< "Crossbar:" << endl;
-				cout << indent_str<< indent_str_next << "Area = " << router->crossbar.area.get_area()*1e-6  << " mm^2" << endl;
-				cout << indent_str<< indent_str_next << "Peak Dynamic = " << router->crossbar.power.readOp.dynamic*nocdynp.clockRate*nocdynp.min_ports*M << " W" << endl;
-				cout << indent_str<< indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? router->crossbar.power.readOp.longer_channel_leakage:router->crossbar.power.readOp.leakage)  << " W" << endl;
-				if (power_gating) cout << indent_str<< indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? router->crossbar.power.readOp.power_gated_with_long_channel_leakage : router->crossbar.power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str<< indent_str_next << "Gate Leakage = " << router->crossbar.power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str<< indent_str_next << "Runtime Dynamic = " << router->crossbar.rt_power.readOp.dynamic/nocdynp.executionTime << " W" << endl;
+				report_section(indent_str + indent_str, "Crossbar");
+				report_value(indent_str + indent_str_next, "Area", router->crossbar.area.get_area()*1e-6, "mm^2");
+				report_value(indent_str + indent_str_next, "Peak Dynamic", router->crossbar.power.readOp.dynamic*nocdynp.clockRate*nocdynp.min_ports*M, "W");
+				report_value(indent_str + indent_str_next, "Subthreshold Leakage", (long_channel? router->crossbar.power.readOp.longer_channel_leakage:router->crossbar.power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str + indent_str_next, "Subthreshold Leakage with power gating", (long_channel? router->crossbar.power.readOp.power_gated_with_long_channel_leakage : router->crossbar.power.readOp.power_gated_leakage), "W");
+				report_value(indent_str + indent_str_next, "Gate Leakage", router->crossbar.power.readOp.gate_leakage, "W");
+				report_value(indent_str + indent_str_next, "Runtime Dynamic", router->crossbar.rt_power.readOp.dynamic/nocdynp.executionTime, "W");
 				cout <<endl;
-				cout << indent_str<< indent_str<< "Arbiter:" << endl;
-				cout << indent_str<< indent_str_next << "Peak Dynamic = " << router->arbiter.power.readOp.dynamic*nocdynp.clockRate*nocdynp.min_ports*M  << " W" << endl;
-				cout << indent_str<< indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? router->arbiter.power.readOp.longer_channel_leakage:router->arbiter.power.readOp.leakage)  << " W" << endl;
-				if (power_gating) cout << indent_str<< indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? router->arbiter.power.readOp.power_gated_with_long_channel_leakage : router->arbiter.power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str<< indent_str_next << "Gate Leakage = " << router->arbiter.power.readOp.gate_leakage  << " W" << endl;
-				cout << indent_str<< indent_str_next << "Runtime Dynamic = " << router->arbiter.rt_power.readOp.dynamic/nocdynp.executionTime << " W" << endl;
+				report_section(indent_str + indent_str, "Arbiter");
+				report_value(indent_str + indent_str_next, "Peak Dynamic", router->arbiter.power.readOp.dynamic*nocdynp.clockRate*nocdynp.min_ports*M, "W");
+				report_value(indent_str + indent_str_next, "Subthreshold Leakage", (long_channel? router->arbiter.power.readOp.longer_channel_leakage:router->arbiter.power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str + indent_str_next, "Subthreshold Leakage with power gating", (long_channel? router->arbiter.power.readOp.power_gated_with_long_channel_leakage : router->arbiter.power.readOp.power_gated_leakage), "W");
+				report_value(indent_str + indent_str_next, "Gate Leakage", router->arbiter.power.readOp.gate_leakage, "W");
+				report_value(indent_str + indent_str_next, "Runtime Dynamic", router->arbiter.rt_power.readOp.dynamic/nocdynp.executionTime, "W");
 				cout <<endl;
 			}
 		}
 		if (link_bus_exist)
 		{
-			cout << indent_str << (nocdynp.type? "Per Router ":"") << link_name<<": " << endl;
-			cout << indent_str_next << "Area = " << link_bus_tot_per_Router.area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next<< "Peak Dynamic = " << link_bus_tot_per_Router.power.readOp.dynamic*
-				nocdynp.clockRate << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? link_bus_tot_per_Router.power.readOp.longer_channel_leakage:link_bus_tot_per_Router.power.readOp.leakage)
-			     <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? link_bus_tot_per_Router.power.readOp.power_gated_with_long_channel_leakage : link_bus_tot_per_Router.power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << link_bus_tot_per_Router.power.readOp.gate_leakage
-				<< " W" << endl;
-			cout << indent_str_next<< "Runtime Dynamic = " << link_bus->rt_power.readOp.dynamic/nocdynp.executionTime << " W" << endl;
+			report_section(indent_str, (nocdynp.type? "Per Router ":"") + link_name, ": ");
+			report_value(indent_str_next, "Area", link_bus_tot_per_Router.area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", link_bus_tot_per_Router.power.readOp.dynamic*
+				nocdynp.clockRate, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? link_bus_tot_per_Router.power.readOp.longer_channel_leakage:link_bus_tot_per_Router.power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? link_bus_tot_per_Router.power.readOp.power_gated_with_long_channel_leakage : link_bus_tot_per_Router.power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", link_bus_tot_per_Router.power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", link_bus->rt_power.readOp.dynamic/nocdynp.executionTime, "W");
 			cout<<endl;
 
 		}
@@ -327,6 +313,19 @@ void NoC::displayEnergy(uint32_t indent,int plevel,bool is_tdp)
 	}
 }
 
+/*
+ * The same NoC, evaluated with the stats now in XML (see Core::clone()).
+ * The router and links get copies, computeEnergy() scales their power.
+ */
+NoC * NoC::clone() const
+{
+	NoC * copy = new NoC(*this);
+	copy->set_noc_param();
+	copy->router   = router   ? new Router(*router)         : 0;
+	copy->link_bus = link_bus ? new interconnect(*link_bus) : 0;
+	return copy;
+}
+
 void NoC::set_noc_param()
 {
 
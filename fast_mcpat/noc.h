@@ -62,6 +62,7 @@ class NoC :public Component {
 	string name, link_name;
 	double M_traffic_pattern;
 	NoC(ParseXML *XML_interface, int ithNoC_, InputParameter* interface_ip_, double M_traffic_pattern_ = 0.6,double link_len_=0);
+	NoC * clone() const;
 	void set_noc_param();
 	void computeEnergy(bool is_tdp=true);
 	void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
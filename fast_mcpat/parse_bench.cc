@@ -0,0 +1,216 @@
+/*****************************************************************************
+ *                                McPAT
+ *                      SOFTWARE LICENSE AGREEMENT
+ *            Copyright 2012 Hewlett-Packard Development Company, L.P.
+ *                          All Rights Reserved
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.”
+ *
+ ***************************************************************************/
+
+
+/*
+ * parse_bench: times the ways McPAT reads a processor description, on the
+ * given templates (e.g. ../mcpat_procs/*.xml), and checks that they give the
+ * same processor.
+ *
+ *   parse_bench [-n <inputs>] <template.xml> ...
+ *
+ * For each template: building the DOM and ParseXML::parse() of inputs that
+ * change every stat of the template (what McPAT did for every input),
+ * compiling the template, saving and loading it, CompiledTemplate::read() of
+ * the same inputs, and CompiledTemplate::parsed() (server mode, and -template
+ * without -infile).  Every input read from the template is compared with its
+ * full parse, and an input that changes a param has to be refused by read().
+ * Build with make parse_bench.
+ */
+
+#include <sys/time.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <string>
+#include <vector>
+#include <fstream>
+#include <iostream>
+#include <iterator>
+#include "xmlParser.h"
+#include "XML_Parse.h"
+#include "compiled_template.h"
+
+using namespace std;
+
+static double now()
+{
+  struct timeval tv;
+  gettimeofday(&tv, NULL);
+  return tv.tv_sec + tv.tv_usec * 1e-6;
+}
+
+// The template with the values of every stat (or of the first param) replaced
+static string vary(const string & xml, const char * tag, bool all, unsigned int seed)
+{
+  string varied;
+  string start = string("<") + tag + " ";
+  size_t done = 0, element;
+  while ((element = xml.find(start, done)) != string::npos)
+  {
+    size_t value = xml.find("value=\"", element);
+    size_t end = xml.find('>', element);
+    if (value == string::npos || value > end)
+      break;
+    value += 7;
+    size_t value_end = xml.find('"', value);
+    char number[32];
+    seed = seed * 1103515245 + 12345;
+    snprintf(number, sizeof(number), (seed >> 16) % 2 ? "%u" : "%.6g", (seed >> 8) % 1000000, ((seed >> 8) % 100000) * 0.37);
+    varied.append(xml, done, value - done).append(number);
+    done = value_end;
+    if (!all)
+      break;
+  }
+  return varied.append(xml, done, string::npos);
+}
+
+static bool same_processor(ParseXML * a, ParseXML * b)
+{
+  if (memcmp(&a->sys, &b->sys, sizeof(a->sys)) != 0)
+    return false;
+  for (int i = 0; i < MAX_NUM_CORES; i++)
+    if (a->core_signature[i] != b->core_signature[i] || a->L2_signature[i] != b->L2_signature[i])
+      return false;
+  return true;
+}
+
+static bool bench(const char * path, int n)
+{
+  ifstream file(path, ios::in | ios::binary);
+  if (!file)
+  {
+    cerr << "cannot open " << path << endl;
+    return false;
+  }
+  string xml((istreambuf_iterator<char>(file)), istreambuf_iterator<char>());
+  vector<string> inputs;
+  for (int i = 0; i < n; i++)
+    inputs.push_back(vary(xml, "stat", true, i));
+  ParseXML * full = new ParseXML();
+  ParseXML * fast = new ParseXML();
+  printf("%s: %u bytes, %d inputs\n", path, (unsigned int)xml.size(), n);
+
+  double begin = now();
+  for (int i = 0; i < n; i++)
+  {
+    XMLNode xMainNode = XMLNode::parseString(inputs[i].c_str(), "component");
+    full->parse(xMainNode);
+  }
+  double parse_time = (now() - begin) / n;
+  printf("  DOM + ParseXML::parse    %8.3f ms\n", parse_time * 1e3);
+
+  begin = now();
+  CompiledTemplate compiled(XMLNode::parseString(xml.c_str(), "component"));
+  printf("  compile                  %8.3f ms\n", (now() - begin) * 1e3);
+  if (!compiled.ok())
+  {
+    cerr << "  cannot compile " << path << ": " << compiled.error() << endl;
+    return false;
+  }
+  string compiled_path = string(getenv("TMPDIR") ? getenv("TMPDIR") : "/tmp") + "/parse_bench.mcpat";
+  if (!compiled.save(compiled_path.c_str()))
+  {
+    cerr << "  cannot write " << compiled_path << endl;
+    return false;
+  }
+  begin = now();
+  CompiledTemplate loaded(compiled_path.c_str());
+  loaded.parsed(fast);
+  printf("  load + parsed            %8.3f ms\n", (now() - begin) * 1e3);
+  remove(compiled_path.c_str());
+
+  begin = now();
+  bool read = true;
+  for (int i = 0; i < n; i++)
+    read = loaded.read(inputs[i].c_str(), fast) && read;
+  double read_time = (now() - begin) / n;
+  printf("  CompiledTemplate::read   %8.3f ms  (%.1fx)\n", read_time * 1e3, parse_time / read_time);
+
+  begin = now();
+  for (int i = 0; i < n; i++)
+    loaded.parsed(fast);
+  printf("  CompiledTemplate::parsed %8.3f ms\n", (now() - begin) / n * 1e3);
+
+  bool ok = read;
+  if (!read)
+    cerr << "  an input that only changes stats was refused" << endl;
+  for (int i = 0; i < n && ok; i++)
+  {
+    memset(&full->sys, 0, sizeof(full->sys));
+    memset(&fast->sys, 0, sizeof(fast->sys));
+    full->parse(XMLNode::parseString(inputs[i].c_str(), "component"));
+    if (!loaded.read(inputs[i].c_str(), fast) || !same_processor(full, fast))
+    {
+      cerr << "  input " << i << " read from the template differs from its full parse" << endl;
+      ok = false;
+    }
+  }
+  memset(&full->sys, 0, sizeof(full->sys));
+  memset(&fast->sys, 0, sizeof(fast->sys));
+  full->parse(XMLNode::parseString(xml.c_str(), "component"));
+  loaded.parsed(fast);
+  if (ok && !same_processor(full, fast))
+  {
+    cerr << "  the loaded template differs from the parsed one" << endl;
+    ok = false;
+  }
+  if (ok && loaded.read(vary(xml, "param", false, 1).c_str(), fast))
+  {
+    cerr << "  an input that changes a param was not refused" << endl;
+    ok = false;
+  }
+  if (ok)
+    printf("  every input read from the template is the same as its full parse\n");
+  delete full;
+  delete fast;
+  return ok;
+}
+
+int main(int argc, char *argv[])
+{
+  int n = 100;
+  int first = 1;
+  if (argc > 2 && argv[1] == string("-n"))
+  {
+    n = atoi(argv[2]);
+    first = 3;
+  }
+  if (first >= argc || n <= 0)
+  {
+    cerr << "usage: parse_bench [-n <inputs>] <template.xml> ..." << endl;
+    return 1;
+  }
+  bool ok = true;
+  for (int i = first; i < argc; i++)
+    ok = bench(argv[i], n) && ok;
+  return ok ? 0 : 1;
+}
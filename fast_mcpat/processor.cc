@@ -36,6 +36,13 @@
 #include <cmath>
 #include <assert.h>
 #include <fstream>
+#include <sstream>
+#include <vector>
+#include <stdlib.h>
+#include <unistd.h>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/wait.h>
 #include "parameter.h"
 #include "array.h"
 #include "const.h"
@@ -43,14 +50,34 @@
 #include "XML_Parse.h"
 #include "processor.h"
 #include "version.h"
+#include "io.h"
+#include "thread_pool.h"
 
 
-Processor::Processor(ParseXML *XML_interface)
+bool share_models = true;
+
+//cores with the same params (and private L2s with the same params)
+static bool same_core(ParseXML *XML, int i, int j)
+{
+	return XML->core_signature[i] == XML->core_signature[j] &&
+		(!XML->sys.Private_L2 || XML->L2_signature[i] == XML->L2_signature[j]);
+}
+
+//the components prebuild() builds
+enum prebuild_kind { PREBUILD_CORE, PREBUILD_L2, PREBUILD_L3, PREBUILD_L1DIR, PREBUILD_L2DIR,
+	PREBUILD_NOC, PREBUILD_MC, PREBUILD_FLASH, PREBUILD_NIU, PREBUILD_PCIE };
+
+Processor::Processor(ParseXML *XML_interface, bool keep_models_)
 :XML(XML_interface),//TODO: using one global copy may have problems.
  mc(0),
  niu(0),
  pcie(0),
- flashcontroller(0)
+ flashcontroller(0),
+ keep_models(keep_models_),
+ mc_model(0),
+ niu_model(0),
+ pcie_model(0),
+ flashcontroller_model(0)
 {
   /*
    *  placement and routing overhead is 10%, core scales worse than cache 40% is accumulated from 90 to 22nm
@@ -58,7 +85,6 @@ Processor::Processor(ParseXML *XML_interface)
    *  thus McPAT only support homogeneous memory controllers.
    */
   int i;
-  double pppm_t[4]    = {1,1,1,1};
   set_proc_param();
   if (procdynp.homoCore)
 	  numCore = procdynp.numCore==0? 0:1;
@@ -102,25 +128,280 @@ Processor::Processor(ParseXML *XML_interface)
   else
 	  numL2Dir = procdynp.numL2Dir;
 
+  prebuild();
+
+  /*
+   * A core (or L2) with the same hardware as an earlier one copies the model of
+   * that one instead of building and CACTI solving it again, only its runtime
+   * stats are its own. The models are kept before they are evaluated.
+   */
+  vector<Core *> shared_cores;
+  vector<SharedCache *> shared_l2s;
+  unsigned int j;
+
   for (i = 0;i < numCore; i++)
   {
-		  cores.push_back(new Core(XML,i, &interface_ip));
+		  for (j = 0; j < shared_cores.size(); j++)
+			  if (same_core(XML, shared_cores[j]->ithCore, i)) break;
+		  if (j < shared_cores.size())
+			  cores.push_back(shared_cores[j]->clone(i));
+		  else
+		  {
+			  cores.push_back(new Core(XML,i, &interface_ip));
+			  if (share_models) shared_cores.push_back(cores[i]->clone(i));
+		  }
+		  if (keep_models) core_models.push_back(cores[i]->clone(i));
+		  tech.push_back(g_tp);
+		  if (procdynp.homoCore){
+			  core.area.set_area(core.area.get_area() + cores[i]->area.get_area()*procdynp.numCore);
+			  area.set_area(area.get_area() + core.area.get_area());//placement and routing overhead is 10%, core scales worse than cache 40% is accumulated from 90 to 22nm
+		  }
+		  else{
+			  core.area.set_area(core.area.get_area() + cores[i]->area.get_area());
+			  area.set_area(area.get_area() + cores[i]->area.get_area());//placement and routing overhead is 10%, core scales worse than cache 40% is accumulated from 90 to 22nm
+		  }
+  }
+
+  if (!XML->sys.Private_L2)
+  {
+  if (numL2 >0)
+	  for (i = 0;i < numL2; i++)
+	  {
+		  for (j = 0; j < shared_l2s.size(); j++)
+			  if (XML->L2_signature[shared_l2s[j]->ithCache] == XML->L2_signature[i]) break;
+		  if (j < shared_l2s.size())
+			  l2array.push_back(shared_l2s[j]->clone(i));
+		  else
+		  {
+			  l2array.push_back(new SharedCache(XML,i, &interface_ip));
+			  if (share_models) shared_l2s.push_back(l2array[i]->clone(i));
+		  }
+		  if (keep_models) l2_models.push_back(l2array[i]->clone(i));
+		  tech.push_back(g_tp);
+		  if (procdynp.homoL2){
+			  l2.area.set_area(l2.area.get_area() + l2array[i]->area.get_area()*procdynp.numL2);
+			  area.set_area(area.get_area() + l2.area.get_area());//placement and routing overhead is 10%, l2 scales worse than cache 40% is accumulated from 90 to 22nm
+		  }
+		  else{
+			  l2.area.set_area(l2.area.get_area() + l2array[i]->area.get_area());
+			  area.set_area(area.get_area() + l2array[i]->area.get_area());//placement and routing overhead is 10%, l2 scales worse than cache 40% is accumulated from 90 to 22nm
+		  }
+	  }
+  }
+
+  while (!shared_cores.empty())
+  {
+	  delete shared_cores.back();
+	  shared_cores.pop_back();
+  }
+  while (!shared_l2s.empty())
+  {
+	  delete shared_l2s.back();
+	  shared_l2s.pop_back();
+  }
+
+  if (numL3 >0)
+	  for (i = 0;i < numL3; i++)
+	  {
+		  l3array.push_back(new SharedCache(XML,i, &interface_ip, L3));
+		  if (keep_models) l3_models.push_back(l3array[i]->clone(i));
+		  tech.push_back(g_tp);
+		  if (procdynp.homoL3){
+			  l3.area.set_area(l3.area.get_area() + l3array[i]->area.get_area()*procdynp.numL3);
+			  area.set_area(area.get_area() + l3.area.get_area());//placement and routing overhead is 10%, l3 scales worse than cache 40% is accumulated from 90 to 22nm
+		  }
+		  else{
+			  l3.area.set_area(l3.area.get_area() + l3array[i]->area.get_area());
+			  area.set_area(area.get_area() + l3array[i]->area.get_area());//placement and routing overhead is 10%, l3 scales worse than cache 40% is accumulated from 90 to 22nm
+		  }
+	  }
+  if (numL1Dir >0)
+	  for (i = 0;i < numL1Dir; i++)
+	  {
+		  l1dirarray.push_back(new SharedCache(XML,i, &interface_ip, L1Directory));
+		  if (keep_models) l1dir_models.push_back(l1dirarray[i]->clone(i));
+		  tech.push_back(g_tp);
+		  if (procdynp.homoL1Dir){
+			  l1dir.area.set_area(l1dir.area.get_area() + l1dirarray[i]->area.get_area()*procdynp.numL1Dir);
+			  area.set_area(area.get_area() + l1dir.area.get_area());//placement and routing overhead is 10%, l1dir scales worse than cache 40% is accumulated from 90 to 22nm
+		  }
+		  else{
+			  l1dir.area.set_area(l1dir.area.get_area() + l1dirarray[i]->area.get_area());
+			  area.set_area(area.get_area() + l1dirarray[i]->area.get_area());
+		  }
+	  }
+
+  if (numL2Dir >0)
+	  for (i = 0;i < numL2Dir; i++)
+	  {
+		  l2dirarray.push_back(new SharedCache(XML,i, &interface_ip, L2Directory));
+		  if (keep_models) l2dir_models.push_back(l2dirarray[i]->clone(i));
+		  tech.push_back(g_tp);
+		  if (procdynp.homoL2Dir){
+			  l2dir.area.set_area(l2dir.area.get_area() + l2dirarray[i]->area.get_area()*procdynp.numL2Dir);
+			  area.set_area(area.get_area() + l2dir.area.get_area());//placement and routing overhead is 10%, l2dir scales worse than cache 40% is accumulated from 90 to 22nm
+		  }
+		  else{
+			  l2dir.area.set_area(l2dir.area.get_area() + l2dirarray[i]->area.get_area());
+			  area.set_area(area.get_area() + l2dirarray[i]->area.get_area());
+		  }
+	  }
+
+  if (XML->sys.mc.number_mcs >0 && XML->sys.mc.memory_channels_per_mc>0)
+  {
+	  mc = new MemoryController(XML, &interface_ip, MC);
+	  if (keep_models) mc_model = mc->clone();
+	  tech.push_back(g_tp);
+	  mcs.area.set_area(mcs.area.get_area()+mc->area.get_area()*XML->sys.mc.number_mcs);
+	  area.set_area(area.get_area()+mc->area.get_area()*XML->sys.mc.number_mcs);
+  }
+
+  if (XML->sys.flashc.number_mcs >0 )//flash controller
+  {
+	  flashcontroller = new FlashController(XML, &interface_ip);
+	  if (keep_models) flashcontroller_model = flashcontroller->clone();
+	  tech.push_back(g_tp);
+	  double number_fcs = flashcontroller->fcp.num_mcs;
+	  flashcontrollers.area.set_area(flashcontrollers.area.get_area()+flashcontroller->area.get_area()*number_fcs);
+	  area.set_area(area.get_area()+flashcontrollers.area.get_area());
+  }
+
+  if (XML->sys.niu.number_units >0)
+  {
+	  niu = new NIUController(XML, &interface_ip);
+	  if (keep_models) niu_model = niu->clone();
+	  tech.push_back(g_tp);
+	  nius.area.set_area(nius.area.get_area()+niu->area.get_area()*XML->sys.niu.number_units);
+	  area.set_area(area.get_area()+niu->area.get_area()*XML->sys.niu.number_units);
+  }
+
+  if (XML->sys.pcie.number_units >0 && XML->sys.pcie.num_channels >0)
+  {
+	  pcie = new PCIeController(XML, &interface_ip);
+	  if (keep_models) pcie_model = pcie->clone();
+	  tech.push_back(g_tp);
+	  pcies.area.set_area(pcies.area.get_area()+pcie->area.get_area()*XML->sys.pcie.number_units);
+	  area.set_area(area.get_area()+pcie->area.get_area()*XML->sys.pcie.number_units);
+  }
+
+  if (numNOC >0)
+  {
+	  for (i = 0;i < numNOC; i++)
+	  {
+		  if (XML->sys.NoC[i].type)
+		  {//First add up area of routers if NoC is used
+			  nocs.push_back(new NoC(XML,i, &interface_ip, 1));
+			  if (procdynp.homoNOC)
+			  {
+				  noc.area.set_area(noc.area.get_area() + nocs[i]->area.get_area()*procdynp.numNOC);
+				  area.set_area(area.get_area() + noc.area.get_area());
+			  }
+			  else
+			  {
+				  noc.area.set_area(noc.area.get_area() + nocs[i]->area.get_area());
+				  area.set_area(area.get_area() + nocs[i]->area.get_area());
+			  }
+		  }
+		  else
+		  {//Bus based interconnect
+			  nocs.push_back(new NoC(XML,i, &interface_ip, 1, sqrt(area.get_area()*XML->sys.NoC[i].chip_coverage)));
+			  if (procdynp.homoNOC){
+				  noc.area.set_area(noc.area.get_area() + nocs[i]->area.get_area()*procdynp.numNOC);
+				  area.set_area(area.get_area() + noc.area.get_area());
+			  }
+			  else
+			  {
+				  noc.area.set_area(noc.area.get_area() + nocs[i]->area.get_area());
+				  area.set_area(area.get_area() + nocs[i]->area.get_area());
+			  }
+		  }
+	  }
+
+	  /*
+	   * Compute global links associated with each NOC, if any. This must be done at the end (even after the NOC router part) since the total chip
+	   * area must be obtain to decide the link routing
+	   */
+	  for (i = 0;i < numNOC; i++)
+	  {
+		  if (nocs[i]->nocdynp.has_global_link && XML->sys.NoC[i].type)
+		  {
+			  nocs[i]->init_link_bus(sqrt(area.get_area()*XML->sys.NoC[i].chip_coverage));//compute global links
+			  if (procdynp.homoNOC)
+			  {
+				  noc.area.set_area(noc.area.get_area() + nocs[i]->link_bus_tot_per_Router.area.get_area()
+						  * nocs[i]->nocdynp.total_nodes
+						  * procdynp.numNOC);
+				  area.set_area(area.get_area() + nocs[i]->link_bus_tot_per_Router.area.get_area()
+						  * nocs[i]->nocdynp.total_nodes
+						  * procdynp.numNOC);
+			  }
+			  else
+			  {
+				  noc.area.set_area(noc.area.get_area() + nocs[i]->link_bus_tot_per_Router.area.get_area()
+						  * nocs[i]->nocdynp.total_nodes);
+				  area.set_area(area.get_area() + nocs[i]->link_bus_tot_per_Router.area.get_area()
+						  * nocs[i]->nocdynp.total_nodes);
+			  }
+		  }
+	  }
+	  if (keep_models)
+		  for (i = 0;i < numNOC; i++)
+			  noc_models.push_back(nocs[i]->clone());
+	  tech.push_back(g_tp);
+  }
+
+//  //clock power
+//  globalClock.init_wire_external(is_default, &interface_ip);
+//  globalClock.clk_area           =area*1e6; //change it from mm^2 to um^2
+//  globalClock.end_wiring_level   =5;//toplevel metal
+//  globalClock.start_wiring_level =5;//toplevel metal
+//  globalClock.l_ip.with_clock_grid=false;//global clock does not drive local final nodes
+//  globalClock.optimize_wire();
+
+  compute();
+}
+
+/*
+ * Evaluates the components built by the constructor with the stats in XML and
+ * adds up their power.  Every component is evaluated with the technology
+ * parameters (g_tp) it was built with, since some of its power is scaled by
+ * them.
+ */
+void Processor::compute()
+{
+  int i;
+  unsigned int t = 0;
+  double pppm_t[4]    = {1,1,1,1};
+
+  power.reset();
+  rt_power.reset();
+  core.power.reset();
+  core.rt_power.reset();
+  l2.power.reset();
+  l2.rt_power.reset();
+  l3.power.reset();
+  l3.rt_power.reset();
+  l1dir.power.reset();
+  l1dir.rt_power.reset();
+  l2dir.power.reset();
+  l2dir.rt_power.reset();
+  noc.power.reset();
+  noc.rt_power.reset();
+
+  for (i = 0;i < numCore; i++)
+  {
+		  g_tp = tech[t++];
 		  cores[i]->computeEnergy();
 		  cores[i]->computeEnergy(false);
 		  if (procdynp.homoCore){
-			  core.area.set_area(core.area.get_area() + cores[i]->area.get_area()*procdynp.numCore);
 			  set_pppm(pppm_t,cores[i]->clockRate*procdynp.numCore, procdynp.numCore,procdynp.numCore,procdynp.numCore);
 			  core.power = core.power + cores[i]->power*pppm_t;
 			  set_pppm(pppm_t,1/cores[i]->executionTime, procdynp.numCore,procdynp.numCore,procdynp.numCore);
 			  core.rt_power = core.rt_power + cores[i]->rt_power*pppm_t;
-			  area.set_area(area.get_area() + core.area.get_area());//placement and routing overhead is 10%, core scales worse than cache 40% is accumulated from 90 to 22nm
 			  power = power  + core.power;
 			  rt_power = rt_power  + core.rt_power;
 		  }
 		  else{
-			  core.area.set_area(core.area.get_area() + cores[i]->area.get_area());
-			  area.set_area(area.get_area() + cores[i]->area.get_area());//placement and routing overhead is 10%, core scales worse than cache 40% is accumulated from 90 to 22nm
-
 			  set_pppm(pppm_t,cores[i]->clockRate, 1, 1, 1);
 			  core.power = core.power + cores[i]->power*pppm_t;
 			  power = power  + cores[i]->power*pppm_t;
@@ -136,23 +417,18 @@ Processor::Processor(ParseXML *XML_interface)
   if (numL2 >0)
 	  for (i = 0;i < numL2; i++)
 	  {
-		  l2array.push_back(new SharedCache(XML,i, &interface_ip));
+		  g_tp = tech[t++];
 		  l2array[i]->computeEnergy();
 		  l2array[i]->computeEnergy(false);
 		  if (procdynp.homoL2){
-			  l2.area.set_area(l2.area.get_area() + l2array[i]->area.get_area()*procdynp.numL2);
 			  set_pppm(pppm_t,l2array[i]->cachep.clockRate*procdynp.numL2, procdynp.numL2,procdynp.numL2,procdynp.numL2);
 			  l2.power = l2.power + l2array[i]->power*pppm_t;
 			  set_pppm(pppm_t,1/l2array[i]->cachep.executionTime, procdynp.numL2,procdynp.numL2,procdynp.numL2);
 			  l2.rt_power = l2.rt_power + l2array[i]->rt_power*pppm_t;
-			  area.set_area(area.get_area() + l2.area.get_area());//placement and routing overhead is 10%, l2 scales worse than cache 40% is accumulated from 90 to 22nm
 			  power = power  + l2.power;
 			  rt_power = rt_power  + l2.rt_power;
 		  }
 		  else{
-			  l2.area.set_area(l2.area.get_area() + l2array[i]->area.get_area());
-			  area.set_area(area.get_area() + l2array[i]->area.get_area());//placement and routing overhead is 10%, l2 scales worse than cache 40% is accumulated from 90 to 22nm
-
 			  set_pppm(pppm_t,l2array[i]->cachep.clockRate, 1, 1, 1);
 			  l2.power = l2.power + l2array[i]->power*pppm_t;
 			  power = power  + l2array[i]->power*pppm_t;;
@@ -166,23 +442,19 @@ Processor::Processor(ParseXML *XML_interface)
   if (numL3 >0)
 	  for (i = 0;i < numL3; i++)
 	  {
-		  l3array.push_back(new SharedCache(XML,i, &interface_ip, L3));
+		  g_tp = tech[t++];
 		  l3array[i]->computeEnergy();
 		  l3array[i]->computeEnergy(false);
 		  if (procdynp.homoL3){
-			  l3.area.set_area(l3.area.get_area() + l3array[i]->area.get_area()*procdynp.numL3);
 			  set_pppm(pppm_t,l3array[i]->cachep.clockRate*procdynp.numL3, procdynp.numL3,procdynp.numL3,procdynp.numL3);
 			  l3.power = l3.power + l3array[i]->power*pppm_t;
 			  set_pppm(pppm_t,1/l3array[i]->cachep.executionTime, procdynp.numL3,procdynp.numL3,procdynp.numL3);
               l3.rt_power = l3.rt_power + l3array[i]->rt_power*pppm_t;
-			  area.set_area(area.get_area() + l3.area.get_area());//placement and routing overhead is 10%, l3 scales worse than cache 40% is accumulated from 90 to 22nm
 			  power = power  + l3.power;
 			  rt_power = rt_power  + l3.rt_power;
 
 		  }
 		  else{
-			  l3.area.set_area(l3.area.get_area() + l3array[i]->area.get_area());
-			  area.set_area(area.get_area() + l3array[i]->area.get_area());//placement and routing overhead is 10%, l3 scales worse than cache 40% is accumulated from 90 to 22nm
 			  set_pppm(pppm_t,l3array[i]->cachep.clockRate, 1, 1, 1);
 			  l3.power = l3.power + l3array[i]->power*pppm_t;
 			  power = power  + l3array[i]->power*pppm_t;
@@ -195,23 +467,19 @@ Processor::Processor(ParseXML *XML_interface)
   if (numL1Dir >0)
 	  for (i = 0;i < numL1Dir; i++)
 	  {
-		  l1dirarray.push_back(new SharedCache(XML,i, &interface_ip, L1Directory));
+		  g_tp = tech[t++];
 		  l1dirarray[i]->computeEnergy();
 		  l1dirarray[i]->computeEnergy(false);
 		  if (procdynp.homoL1Dir){
-			  l1dir.area.set_area(l1dir.area.get_area() + l1dirarray[i]->area.get_area()*procdynp.numL1Dir);
 			  set_pppm(pppm_t,l1dirarray[i]->cachep.clockRate*procdynp.numL1Dir, procdynp.numL1Dir,procdynp.numL1Dir,procdynp.numL1Dir);
 			  l1dir.power = l1dir.power + l1dirarray[i]->power*pppm_t;
 			  set_pppm(pppm_t,1/l1dirarray[i]->cachep.executionTime, procdynp.numL1Dir,procdynp.numL1Dir,procdynp.numL1Dir);
               l1dir.rt_power = l1dir.rt_power + l1dirarray[i]->rt_power*pppm_t;
-			  area.set_area(area.get_area() + l1dir.area.get_area());//placement and routing overhead is 10%, l1dir scales worse than cache 40% is accumulated from 90 to 22nm
 			  power = power  + l1dir.power;
 			  rt_power = rt_power  + l1dir.rt_power;
 
 		  }
 		  else{
-			  l1dir.area.set_area(l1dir.area.get_area() + l1dirarray[i]->area.get_area());
-			  area.set_area(area.get_area() + l1dirarray[i]->area.get_area());
 			  set_pppm(pppm_t,l1dirarray[i]->cachep.clockRate, 1, 1, 1);
 			  l1dir.power = l1dir.power + l1dirarray[i]->power*pppm_t;
 			  power = power  + l1dirarray[i]->power;
@@ -224,23 +492,19 @@ Processor::Processor(ParseXML *XML_interface)
   if (numL2Dir >0)
 	  for (i = 0;i < numL2Dir; i++)
 	  {
-		  l2dirarray.push_back(new SharedCache(XML,i, &interface_ip, L2Directory));
+		  g_tp = tech[t++];
 		  l2dirarray[i]->computeEnergy();
 		  l2dirarray[i]->computeEnergy(false);
 		  if (procdynp.homoL2Dir){
-			  l2dir.area.set_area(l2dir.area.get_area() + l2dirarray[i]->area.get_area()*procdynp.numL2Dir);
 			  set_pppm(pppm_t,l2dirarray[i]->cachep.clockRate*procdynp.numL2Dir, procdynp.numL2Dir,procdynp.numL2Dir,procdynp.numL2Dir);
 			  l2dir.power = l2dir.power + l2dirarray[i]->power*pppm_t;
 			  set_pppm(pppm_t,1/l2dirarray[i]->cachep.executionTime, procdynp.numL2Dir,procdynp.numL2Dir,procdynp.numL2Dir);
               l2dir.rt_power = l2dir.rt_power + l2dirarray[i]->rt_power*pppm_t;
-			  area.set_area(area.get_area() + l2dir.area.get_area());//placement and routing overhead is 10%, l2dir scales worse than cache 40% is accumulated from 90 to 22nm
 			  power = power  + l2dir.power;
 			  rt_power = rt_power  + l2dir.rt_power;
 
 		  }
 		  else{
-			  l2dir.area.set_area(l2dir.area.get_area() + l2dirarray[i]->area.get_area());
-			  area.set_area(area.get_area() + l2dirarray[i]->area.get_area());
 			  set_pppm(pppm_t,l2dirarray[i]->cachep.clockRate, 1, 1, 1);
 			  l2dir.power = l2dir.power + l2dirarray[i]->power*pppm_t;
 			  power = power  + l2dirarray[i]->power*pppm_t;
@@ -250,13 +514,11 @@ Processor::Processor(ParseXML *XML_interface)
 		  }
 	  }
 
-  if (XML->sys.mc.number_mcs >0 && XML->sys.mc.memory_channels_per_mc>0)
+  if (mc)
   {
-	  mc = new MemoryController(XML, &interface_ip, MC);
+	  g_tp = tech[t++];
 	  mc->computeEnergy();
 	  mc->computeEnergy(false);
-	  mcs.area.set_area(mcs.area.get_area()+mc->area.get_area()*XML->sys.mc.number_mcs);
-	  area.set_area(area.get_area()+mc->area.get_area()*XML->sys.mc.number_mcs);
 	  set_pppm(pppm_t,XML->sys.mc.number_mcs*mc->mcp.clockRate, XML->sys.mc.number_mcs,XML->sys.mc.number_mcs,XML->sys.mc.number_mcs);
 	  mcs.power = mc->power*pppm_t;
 	  power = power  + mcs.power;
@@ -266,14 +528,12 @@ Processor::Processor(ParseXML *XML_interface)
 
   }
 
-  if (XML->sys.flashc.number_mcs >0 )//flash controller
+  if (flashcontroller)
   {
-	  flashcontroller = new FlashController(XML, &interface_ip);
+	  g_tp = tech[t++];
 	  flashcontroller->computeEnergy();
 	  flashcontroller->computeEnergy(false);
 	  double number_fcs = flashcontroller->fcp.num_mcs;
-	  flashcontrollers.area.set_area(flashcontrollers.area.get_area()+flashcontroller->area.get_area()*number_fcs);
-	  area.set_area(area.get_area()+flashcontrollers.area.get_area());
 	  set_pppm(pppm_t,number_fcs, number_fcs ,number_fcs, number_fcs );
 	  flashcontrollers.power = flashcontroller->power*pppm_t;
 	  power = power  + flashcontrollers.power;
@@ -283,13 +543,11 @@ Processor::Processor(ParseXML *XML_interface)
 
   }
 
-  if (XML->sys.niu.number_units >0)
+  if (niu)
   {
-	  niu = new NIUController(XML, &interface_ip);
+	  g_tp = tech[t++];
 	  niu->computeEnergy();
 	  niu->computeEnergy(false);
-	  nius.area.set_area(nius.area.get_area()+niu->area.get_area()*XML->sys.niu.number_units);
-	  area.set_area(area.get_area()+niu->area.get_area()*XML->sys.niu.number_units);
 	  set_pppm(pppm_t,XML->sys.niu.number_units*niu->niup.clockRate, XML->sys.niu.number_units,XML->sys.niu.number_units,XML->sys.niu.number_units);
 	  nius.power = niu->power*pppm_t;
 	  power = power  + nius.power;
@@ -299,13 +557,11 @@ Processor::Processor(ParseXML *XML_interface)
 
   }
 
-  if (XML->sys.pcie.number_units >0 && XML->sys.pcie.num_channels >0)
+  if (pcie)
   {
-	  pcie = new PCIeController(XML, &interface_ip);
+	  g_tp = tech[t++];
 	  pcie->computeEnergy();
 	  pcie->computeEnergy(false);
-	  pcies.area.set_area(pcies.area.get_area()+pcie->area.get_area()*XML->sys.pcie.number_units);
-	  area.set_area(area.get_area()+pcie->area.get_area()*XML->sys.pcie.number_units);
 	  set_pppm(pppm_t,XML->sys.pcie.number_units*pcie->pciep.clockRate, XML->sys.pcie.number_units,XML->sys.pcie.number_units,XML->sys.pcie.number_units);
 	  pcies.power = pcie->power*pppm_t;
 	  power = power  + pcies.power;
@@ -317,65 +573,8 @@ Processor::Processor(ParseXML *XML_interface)
 
   if (numNOC >0)
   {
-	  for (i = 0;i < numNOC; i++)
-	  {
-		  if (XML->sys.NoC[i].type)
-		  {//First add up area of routers if NoC is used
-			  nocs.push_back(new NoC(XML,i, &interface_ip, 1));
-			  if (procdynp.homoNOC)
-			  {
-				  noc.area.set_area(noc.area.get_area() + nocs[i]->area.get_area()*procdynp.numNOC);
-				  area.set_area(area.get_area() + noc.area.get_area());
-			  }
-			  else
-			  {
-				  noc.area.set_area(noc.area.get_area() + nocs[i]->area.get_area());
-				  area.set_area(area.get_area() + nocs[i]->area.get_area());
-			  }
-		  }
-		  else
-		  {//Bus based interconnect
-			  nocs.push_back(new NoC(XML,i, &interface_ip, 1, sqrt(area.get_area()*XML->sys.NoC[i].chip_coverage)));
-			  if (procdynp.homoNOC){
-				  noc.area.set_area(noc.area.get_area() + nocs[i]->area.get_area()*procdynp.numNOC);
-				  area.set_area(area.get_area() + noc.area.get_area());
-			  }
-			  else
-			  {
-				  noc.area.set_area(noc.area.get_area() + nocs[i]->area.get_area());
-				  area.set_area(area.get_area() + nocs[i]->area.get_area());
-			  }
-		  }
-	  }
-
-	  /*
-	   * Compute global links associated with each NOC, if any. This must be done at the end (even after the NOC router part) since the total chip
-	   * area must be obtain to decide the link routing
-	   */
-	  for (i = 0;i < numNOC; i++)
-	  {
-		  if (nocs[i]->nocdynp.has_global_link && XML->sys.NoC[i].type)
-		  {
-			  nocs[i]->init_link_bus(sqrt(area.get_area()*XML->sys.NoC[i].chip_coverage));//compute global links
-			  if (procdynp.homoNOC)
-			  {
-				  noc.area.set_area(noc.area.get_area() + nocs[i]->link_bus_tot_per_Router.area.get_area()
-						  * nocs[i]->nocdynp.total_nodes
-						  * procdynp.numNOC);
-				  area.set_area(area.get_area() + nocs[i]->link_bus_tot_per_Router.area.get_area()
-						  * nocs[i]->nocdynp.total_nodes
-						  * procdynp.numNOC);
-			  }
-			  else
-			  {
-				  noc.area.set_area(noc.area.get_area() + nocs[i]->link_bus_tot_per_Router.area.get_area()
-						  * nocs[i]->nocdynp.total_nodes);
-				  area.set_area(area.get_area() + nocs[i]->link_bus_tot_per_Router.area.get_area()
-						  * nocs[i]->nocdynp.total_nodes);
-			  }
-		  }
-	  }
 	  //Compute energy of NoC (w or w/o links) or buses
+	  g_tp = tech[t++];
 	  for (i = 0;i < numNOC; i++)
 	  {
 		  nocs[i]->computeEnergy();
@@ -401,15 +600,60 @@ Processor::Processor(ParseXML *XML_interface)
 		  }
 	  }
   }
+}
 
-//  //clock power
-//  globalClock.init_wire_external(is_default, &interface_ip);
-//  globalClock.clk_area           =area*1e6; //change it from mm^2 to um^2
-//  globalClock.end_wiring_level   =5;//toplevel metal
-//  globalClock.start_wiring_level =5;//toplevel metal
-//  globalClock.l_ip.with_clock_grid=false;//global clock does not drive local final nodes
-//  globalClock.optimize_wire();
+template <class T> static void delete_all(vector<T *> & components)
+{
+	while (!components.empty())
+	{
+		delete components.back();
+		components.pop_back();
+	}
+}
+
+template <class T> static void replace_all(vector<T *> & components, const vector<T *> & models)
+{
+	for (unsigned int i = 0; i < components.size(); i++)
+	{
+		delete components[i];
+		components[i] = models[i]->clone(i);
+	}
+}
+
+template <class T> static void replace(T * & component, const T * model)
+{
+	if (component)
+	{
+		delete component;
+		component = model->clone();
+	}
+}
 
+/*
+ * Evaluates the processor again with the stats now in XML (mcpat -server),
+ * which must have the same hardware as when it was built with keep_models_.
+ * Every component is replaced by a copy of its unevaluated model that reads
+ * its runtime stats, including the duty cycles of the peak power, again (see
+ * Core::clone()), nothing is built or CACTI solved again.
+ */
+void Processor::update_stats()
+{
+	assert(keep_models);
+	replace_all(cores, core_models);
+	replace_all(l2array, l2_models);
+	replace_all(l3array, l3_models);
+	replace_all(l1dirarray, l1dir_models);
+	replace_all(l2dirarray, l2dir_models);
+	replace(mc, mc_model);
+	replace(flashcontroller, flashcontroller_model);
+	replace(niu, niu_model);
+	replace(pcie, pcie_model);
+	for (unsigned int i = 0; i < nocs.size(); i++)
+	{
+		delete nocs[i];
+		nocs[i] = noc_models[i]->clone();
+	}
+	compute();
 }
 
 void Processor::displayDeviceType(int device_type_, uint32_t indent)
@@ -492,154 +736,142 @@ void Processor::displayEnergy(uint32_t indent, int plevel, bool is_tdp)
 		cout <<indent_str<<"Core clock Rate(MHz) "<<XML->sys.core[0].clock_rate<<endl;
     	cout <<endl;
 		cout <<"*****************************************************************************************"<<endl;
-		cout <<"Processor: "<<endl;
-		cout << indent_str << "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str << "Peak Power = " << power.readOp.dynamic +
-			(long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) + power.readOp.gate_leakage <<" W" << endl;
-		cout << indent_str << "Total Leakage = " <<
-			(long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) + power.readOp.gate_leakage <<" W" << endl;
-		cout << indent_str << "Peak Dynamic = " << power.readOp.dynamic << " W" << endl;
-		cout << indent_str << "Subthreshold Leakage = " << (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str << "Subthreshold Leakage with power gating = "
-				<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str << "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str << "Runtime Dynamic = " << rt_power.readOp.dynamic << " W" << endl;
+		report_component("Processor", ": ");
+		report_value(indent_str, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str, "Peak Power", power.readOp.dynamic +
+			(long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) + power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Total Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) + power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Peak Dynamic", power.readOp.dynamic, "W");
+		report_value(indent_str, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+		report_value(indent_str, "Gate Leakage", power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Runtime Dynamic", rt_power.readOp.dynamic, "W");
 		cout <<endl;
 		if (numCore >0){
-		cout <<indent_str<<"Total Cores: "<<XML->sys.number_of_cores << " cores "<<endl;
+		ostringstream count;
+		count << ": " << XML->sys.number_of_cores << " cores ";
+		report_section(indent_str, "Total Cores", count.str());
 		displayDeviceType(XML->sys.device_type,indent);
-		cout << indent_str_next << "Area = " << core.area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str_next << "Peak Dynamic = " << core.power.readOp.dynamic << " W" << endl;
-		cout << indent_str_next << "Subthreshold Leakage = "
-			<< (long_channel? core.power.readOp.longer_channel_leakage:core.power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-				<< (long_channel? core.power.readOp.power_gated_with_long_channel_leakage : core.power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str_next << "Gate Leakage = " << core.power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str_next << "Runtime Dynamic = " << core.rt_power.readOp.dynamic << " W" << endl;
+		report_value(indent_str_next, "Area", core.area.get_area()*1e-6, "mm^2");
+		report_value(indent_str_next, "Peak Dynamic", core.power.readOp.dynamic, "W");
+		report_value(indent_str_next, "Subthreshold Leakage", (long_channel? core.power.readOp.longer_channel_leakage:core.power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? core.power.readOp.power_gated_with_long_channel_leakage : core.power.readOp.power_gated_leakage), "W");
+		report_value(indent_str_next, "Gate Leakage", core.power.readOp.gate_leakage, "W");
+		report_value(indent_str_next, "Runtime Dynamic", core.rt_power.readOp.dynamic, "W");
 		cout <<endl;
 		}
 		if (!XML->sys.Private_L2)
 		{
 			if (numL2 >0){
-				cout <<indent_str<<"Total L2s: "<<endl;
+				report_section(indent_str, "Total L2s", ": ");
 				displayDeviceType(XML->sys.L2[0].device_type,indent);
-				cout << indent_str_next << "Area = " << l2.area.get_area()*1e-6<< " mm^2" << endl;
-				cout << indent_str_next << "Peak Dynamic = " << l2.power.readOp.dynamic << " W" << endl;
-				cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? l2.power.readOp.longer_channel_leakage:l2.power.readOp.leakage) <<" W" << endl;
-				if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-						<< (long_channel? l2.power.readOp.power_gated_with_long_channel_leakage : l2.power.readOp.power_gated_leakage)  << " W" << endl;
-				cout << indent_str_next << "Gate Leakage = " << l2.power.readOp.gate_leakage << " W" << endl;
-				cout << indent_str_next << "Runtime Dynamic = " << l2.rt_power.readOp.dynamic << " W" << endl;
+				report_value(indent_str_next, "Area", l2.area.get_area()*1e-6, "mm^2");
+				report_value(indent_str_next, "Peak Dynamic", l2.power.readOp.dynamic, "W");
+				report_value(indent_str_next, "Subthreshold Leakage", (long_channel? l2.power.readOp.longer_channel_leakage:l2.power.readOp.leakage), "W");
+				if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? l2.power.readOp.power_gated_with_long_channel_leakage : l2.power.readOp.power_gated_leakage), "W");
+				report_value(indent_str_next, "Gate Leakage", l2.power.readOp.gate_leakage, "W");
+				report_value(indent_str_next, "Runtime Dynamic", l2.rt_power.readOp.dynamic, "W");
 				cout <<endl;
 			}
 		}
 		if (numL3 >0){
-			cout <<indent_str<<"Total L3s: "<<endl;
+			report_section(indent_str, "Total L3s", ": ");
 			displayDeviceType(XML->sys.L3[0].device_type, indent);
-			cout << indent_str_next << "Area = " << l3.area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << l3.power.readOp.dynamic << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? l3.power.readOp.longer_channel_leakage:l3.power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? l3.power.readOp.power_gated_with_long_channel_leakage : l3.power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << l3.power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << l3.rt_power.readOp.dynamic << " W" << endl;
+			report_value(indent_str_next, "Area", l3.area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", l3.power.readOp.dynamic, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? l3.power.readOp.longer_channel_leakage:l3.power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? l3.power.readOp.power_gated_with_long_channel_leakage : l3.power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", l3.power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", l3.rt_power.readOp.dynamic, "W");
 			cout <<endl;
 		}
 		if (numL1Dir >0){
-			cout <<indent_str<<"Total First Level Directory: "<<endl;
+			report_section(indent_str, "Total First Level Directory", ": ");
 			displayDeviceType(XML->sys.L1Directory[0].device_type, indent);
-			cout << indent_str_next << "Area = " << l1dir.area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << l1dir.power.readOp.dynamic << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? l1dir.power.readOp.longer_channel_leakage:l1dir.power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? l1dir.power.readOp.power_gated_with_long_channel_leakage : l1dir.power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << l1dir.power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << l1dir.rt_power.readOp.dynamic << " W" << endl;
+			report_value(indent_str_next, "Area", l1dir.area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", l1dir.power.readOp.dynamic, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? l1dir.power.readOp.longer_channel_leakage:l1dir.power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? l1dir.power.readOp.power_gated_with_long_channel_leakage : l1dir.power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", l1dir.power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", l1dir.rt_power.readOp.dynamic, "W");
 			cout <<endl;
 		}
 		if (numL2Dir >0){
-			cout <<indent_str<<"Total Second Level Directory: "<<endl;
+			report_section(indent_str, "Total Second Level Directory", ": ");
 			displayDeviceType(XML->sys.L1Directory[0].device_type, indent);
-			cout << indent_str_next << "Area = " << l2dir.area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << l2dir.power.readOp.dynamic << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? l2dir.power.readOp.longer_channel_leakage:l2dir.power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? l2dir.power.readOp.power_gated_with_long_channel_leakage : l2dir.power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << l2dir.power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << l2dir.rt_power.readOp.dynamic << " W" << endl;
+			report_value(indent_str_next, "Area", l2dir.area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", l2dir.power.readOp.dynamic, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? l2dir.power.readOp.longer_channel_leakage:l2dir.power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? l2dir.power.readOp.power_gated_with_long_channel_leakage : l2dir.power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", l2dir.power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", l2dir.rt_power.readOp.dynamic, "W");
 			cout <<endl;
 		}
 		if (numNOC >0){
-			cout <<indent_str<<"Total NoCs (Network/Bus): "<<endl;
+			report_section(indent_str, "Total NoCs (Network/Bus)", ": ");
 			displayDeviceType(XML->sys.device_type, indent);
-			cout << indent_str_next << "Area = " << noc.area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << noc.power.readOp.dynamic << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? noc.power.readOp.longer_channel_leakage:noc.power.readOp.leakage) <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? noc.power.readOp.power_gated_with_long_channel_leakage : noc.power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << noc.power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << noc.rt_power.readOp.dynamic << " W" << endl;
+			report_value(indent_str_next, "Area", noc.area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", noc.power.readOp.dynamic, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? noc.power.readOp.longer_channel_leakage:noc.power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? noc.power.readOp.power_gated_with_long_channel_leakage : noc.power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", noc.power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", noc.rt_power.readOp.dynamic, "W");
 			cout <<endl;
 		}
 		if (XML->sys.mc.number_mcs >0 && XML->sys.mc.memory_channels_per_mc>0)
 		{
-			cout <<indent_str<<"Total MCs: "<<XML->sys.mc.number_mcs << " Memory Controllers "<<endl;
+			ostringstream count;
+			count << ": " << XML->sys.mc.number_mcs << " Memory Controllers ";
+			report_section(indent_str, "Total MCs", count.str());
 			displayDeviceType(XML->sys.device_type, indent);
-			cout << indent_str_next << "Area = " << mcs.area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << mcs.power.readOp.dynamic << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? mcs.power.readOp.longer_channel_leakage:mcs.power.readOp.leakage)  <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? mcs.power.readOp.power_gated_with_long_channel_leakage : mcs.power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << mcs.power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << mcs.rt_power.readOp.dynamic << " W" << endl;
+			report_value(indent_str_next, "Area", mcs.area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", mcs.power.readOp.dynamic, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? mcs.power.readOp.longer_channel_leakage:mcs.power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? mcs.power.readOp.power_gated_with_long_channel_leakage : mcs.power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", mcs.power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", mcs.rt_power.readOp.dynamic, "W");
 			cout <<endl;
 		}
 		if (XML->sys.flashc.number_mcs >0)
 		{
-			cout <<indent_str<<"Total Flash/SSD Controllers: "<<flashcontroller->fcp.num_mcs << " Flash/SSD Controllers "<<endl;
+			ostringstream count;
+			count << ": " << flashcontroller->fcp.num_mcs << " Flash/SSD Controllers ";
+			report_section(indent_str, "Total Flash/SSD Controllers", count.str());
 			displayDeviceType(XML->sys.device_type, indent);
-			cout << indent_str_next << "Area = " << flashcontrollers.area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << flashcontrollers.power.readOp.dynamic << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? flashcontrollers.power.readOp.longer_channel_leakage:flashcontrollers.power.readOp.leakage)  <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? flashcontrollers.power.readOp.power_gated_with_long_channel_leakage : flashcontrollers.power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << flashcontrollers.power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << flashcontrollers.rt_power.readOp.dynamic << " W" << endl;
+			report_value(indent_str_next, "Area", flashcontrollers.area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", flashcontrollers.power.readOp.dynamic, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? flashcontrollers.power.readOp.longer_channel_leakage:flashcontrollers.power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? flashcontrollers.power.readOp.power_gated_with_long_channel_leakage : flashcontrollers.power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", flashcontrollers.power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", flashcontrollers.rt_power.readOp.dynamic, "W");
 			cout <<endl;
 		}
 		if (XML->sys.niu.number_units >0 )
 		{
-			cout <<indent_str<<"Total NIUs: "<<niu->niup.num_units << " Network Interface Units "<<endl;
+			ostringstream count;
+			count << ": " << niu->niup.num_units << " Network Interface Units ";
+			report_section(indent_str, "Total NIUs", count.str());
 			displayDeviceType(XML->sys.device_type, indent);
-			cout << indent_str_next << "Area = " << nius.area.get_area()*1e-6<< " mm^2" << endl;
-			cout << indent_str_next << "Peak Dynamic = " << nius.power.readOp.dynamic << " W" << endl;
-			cout << indent_str_next << "Subthreshold Leakage = "
-				<< (long_channel? nius.power.readOp.longer_channel_leakage:nius.power.readOp.leakage)  <<" W" << endl;
-			if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-					<< (long_channel? nius.power.readOp.power_gated_with_long_channel_leakage : nius.power.readOp.power_gated_leakage)  << " W" << endl;
-			cout << indent_str_next << "Gate Leakage = " << nius.power.readOp.gate_leakage << " W" << endl;
-			cout << indent_str_next << "Runtime Dynamic = " << nius.rt_power.readOp.dynamic << " W" << endl;
+			report_value(indent_str_next, "Area", nius.area.get_area()*1e-6, "mm^2");
+			report_value(indent_str_next, "Peak Dynamic", nius.power.readOp.dynamic, "W");
+			report_value(indent_str_next, "Subthreshold Leakage", (long_channel? nius.power.readOp.longer_channel_leakage:nius.power.readOp.leakage), "W");
+			if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? nius.power.readOp.power_gated_with_long_channel_leakage : nius.power.readOp.power_gated_leakage), "W");
+			report_value(indent_str_next, "Gate Leakage", nius.power.readOp.gate_leakage, "W");
+			report_value(indent_str_next, "Runtime Dynamic", nius.rt_power.readOp.dynamic, "W");
 			cout <<endl;
 		}
 		if (XML->sys.pcie.number_units >0 && XML->sys.pcie.num_channels>0)
 				{
-					cout <<indent_str<<"Total PCIes: "<<pcie->pciep.num_units << " PCIe Controllers "<<endl;
+					ostringstream count;
+					count << ": " << pcie->pciep.num_units << " PCIe Controllers ";
+					report_section(indent_str, "Total PCIes", count.str());
 					displayDeviceType(XML->sys.device_type, indent);
-					cout << indent_str_next << "Area = " << pcies.area.get_area()*1e-6<< " mm^2" << endl;
-					cout << indent_str_next << "Peak Dynamic = " << pcies.power.readOp.dynamic << " W" << endl;
-					cout << indent_str_next << "Subthreshold Leakage = "
-						<< (long_channel? pcies.power.readOp.longer_channel_leakage:pcies.power.readOp.leakage)  <<" W" << endl;
-					if (power_gating) cout << indent_str_next << "Subthreshold Leakage with power gating = "
-							<< (long_channel? pcies.power.readOp.power_gated_with_long_channel_leakage : pcies.power.readOp.power_gated_leakage)  << " W" << endl;
-					cout << indent_str_next << "Gate Leakage = " << pcies.power.readOp.gate_leakage << " W" << endl;
-					cout << indent_str_next << "Runtime Dynamic = " << pcies.rt_power.readOp.dynamic << " W" << endl;
+					report_value(indent_str_next, "Area", pcies.area.get_area()*1e-6, "mm^2");
+					report_value(indent_str_next, "Peak Dynamic", pcies.power.readOp.dynamic, "W");
+					report_value(indent_str_next, "Subthreshold Leakage", (long_channel? pcies.power.readOp.longer_channel_leakage:pcies.power.readOp.leakage), "W");
+					if (power_gating) report_value(indent_str_next, "Subthreshold Leakage with power gating", (long_channel? pcies.power.readOp.power_gated_with_long_channel_leakage : pcies.power.readOp.power_gated_leakage), "W");
+					report_value(indent_str_next, "Gate Leakage", pcies.power.readOp.gate_leakage, "W");
+					report_value(indent_str_next, "Runtime Dynamic", pcies.rt_power.readOp.dynamic, "W");
 					cout <<endl;
 				}
 		cout <<"*****************************************************************************************"<<endl;
@@ -708,6 +940,113 @@ void Processor::displayEnergy(uint32_t indent, int plevel, bool is_tdp)
 
 }
 
+// Same results as displayEnergy(indent, plevel), as one line of JSON, see ReportJSON.
+// The components report their values to it directly, the text report is not printed.
+void Processor::displayJSON(uint32_t indent, int plevel)
+{
+	string json;
+	{
+		ReportJSON report;
+		displayEnergy(indent, plevel);
+		json = report.str();
+	}
+	cout << json << endl;
+}
+
+/*
+ * Most of the time of a cold run goes to solving the CACTI arrays of the
+ * components, and the components do not depend on each other.  Worker
+ * processes first build the components in parallel, each taking the next one
+ * not taken yet, and only keep the arrays they solve in the shared CACTI
+ * cache (see io.h).  The constructor then builds every component in order
+ * from the cache, so the results and the output are those of a serial
+ * build.  Bus based NoCs are left out, they depend on the area of the others.
+ */
+void Processor::prebuild()
+{
+  static bool prebuilt = false;  //later builds of this process (mcpat -server) are memory hits
+  uint32_t nthreads = ThreadPool::get()->size();
+  if (prebuilt || nthreads < 2 || !cacti_cache_shared())
+	  return;
+  prebuilt = true;
+
+  vector<pair<int, int> > tasks;
+  int i, j;
+  for (i = 0; i < numCore; i++)
+  {
+	  for (j = 0; j < i && share_models; j++)
+		  if (same_core(XML, j, i)) break;
+	  if (j == i || !share_models) tasks.push_back(make_pair(PREBUILD_CORE, i));
+  }
+  if (!XML->sys.Private_L2)
+	  for (i = 0; i < numL2; i++)
+	  {
+		  for (j = 0; j < i && share_models; j++)
+			  if (XML->L2_signature[j] == XML->L2_signature[i]) break;
+		  if (j == i || !share_models) tasks.push_back(make_pair(PREBUILD_L2, i));
+	  }
+  for (i = 0; i < numL3; i++) tasks.push_back(make_pair(PREBUILD_L3, i));
+  for (i = 0; i < numL1Dir; i++) tasks.push_back(make_pair(PREBUILD_L1DIR, i));
+  for (i = 0; i < numL2Dir; i++) tasks.push_back(make_pair(PREBUILD_L2DIR, i));
+  for (i = 0; i < numNOC; i++)
+	  if (XML->sys.NoC[i].type) tasks.push_back(make_pair(PREBUILD_NOC, i));
+  if (XML->sys.mc.number_mcs >0 && XML->sys.mc.memory_channels_per_mc>0) tasks.push_back(make_pair(PREBUILD_MC, 0));
+  if (XML->sys.flashc.number_mcs >0) tasks.push_back(make_pair(PREBUILD_FLASH, 0));
+  if (XML->sys.niu.number_units >0) tasks.push_back(make_pair(PREBUILD_NIU, 0));
+  if (XML->sys.pcie.number_units >0 && XML->sys.pcie.num_channels >0) tasks.push_back(make_pair(PREBUILD_PCIE, 0));
+  if (tasks.size() < 2)
+	  return;
+
+  uint32_t nprocs = min(nthreads, (uint32_t)tasks.size());
+  uint32_t * next = (uint32_t *)mmap(NULL, sizeof(uint32_t), PROT_READ | PROT_WRITE, MAP_SHARED | MAP_ANONYMOUS, -1, 0);
+  if (next == MAP_FAILED)
+	  return;
+  *next = 0;
+  cout.flush();
+  fflush(stdout);
+
+  vector<pid_t> workers;
+  for (uint32_t p = 0; p < nprocs; p++)
+  {
+	  pid_t pid = fork();
+	  if (pid == 0)
+	  {
+		  //only the arrays in the cache are kept, warnings are printed by the real build
+		  int devnull = open("/dev/null", O_WRONLY);
+		  if (devnull >= 0) dup2(devnull, STDOUT_FILENO);
+		  ThreadPool::forked(max(1u, nthreads / nprocs));
+		  uint32_t t;
+		  while ((t = __atomic_fetch_add(next, 1, __ATOMIC_RELAXED)) < tasks.size())
+			  prebuild_component(tasks[t].first, tasks[t].second);
+		  _exit(0);
+	  }
+	  if (pid > 0)
+		  workers.push_back(pid);
+  }
+  for (uint32_t p = 0; p < workers.size(); p++)
+	  waitpid(workers[p], NULL, 0);
+  munmap(next, sizeof(uint32_t));
+}
+
+//builds a component of prebuild() on its own copy of the processor parameters
+void Processor::prebuild_component(int kind, int i)
+{
+  InputParameter ip = interface_ip;
+  switch (kind)
+  {
+  case PREBUILD_CORE:  new Core(XML, i, &ip); break;
+  case PREBUILD_L2:    new SharedCache(XML, i, &ip); break;
+  case PREBUILD_L3:    new SharedCache(XML, i, &ip, L3); break;
+  case PREBUILD_L1DIR: new SharedCache(XML, i, &ip, L1Directory); break;
+  case PREBUILD_L2DIR: new SharedCache(XML, i, &ip, L2Directory); break;
+  case PREBUILD_NOC:   new NoC(XML, i, &ip, 1); break;
+  case PREBUILD_MC:    new MemoryController(XML, &ip, MC); break;
+  case PREBUILD_FLASH: new FlashController(XML, &ip); break;
+  case PREBUILD_NIU:   new NIUController(XML, &ip); break;
+  case PREBUILD_PCIE:  new PCIeController(XML, &ip); break;
+  }
+}
+
 void Processor::set_proc_param()
 {
 	bool debug = false;
@@ -875,4 +1214,14 @@ Processor::~Processor(){
 		delete flashcontroller;
 		flashcontroller = 0;
 	}
+	delete_all(core_models);
+	delete_all(l2_models);
+	delete_all(l3_models);
+	delete_all(l1dir_models);
+	delete_all(l2dir_models);
+	delete_all(noc_models);
+	delete mc_model;
+	delete niu_model;
+	delete pcie_model;
+	delete flashcontroller_model;
 };
@@ -46,6 +46,9 @@
 #include "noc.h"
 #include "iocontrollers.h"
 
+//cores and L2s with the same hardware share one model (see Processor::Processor)
+extern bool share_models;
+
 class Processor : public Component
 {
   public:
@@ -66,10 +69,25 @@ class Processor : public Component
     //clock_network globalClock;
     Component core, l2, l3, l1dir, l2dir, noc, mcs, cc, nius, pcies,flashcontrollers;
     int  numCore, numL2, numL3, numNOC, numL1Dir, numL2Dir;
-    Processor(ParseXML *XML_interface);
+    //with keep_models, unevaluated copies of the components for update_stats()
+    bool keep_models;
+    vector<Core *> core_models;
+    vector<SharedCache *> l2_models, l3_models, l1dir_models, l2dir_models;
+    vector<NoC *> noc_models;
+    MemoryController * mc_model;
+    NIUController    * niu_model;
+    PCIeController   * pcie_model;
+    FlashController  * flashcontroller_model;
+    //the technology parameters every component is evaluated with (see compute())
+    vector<TechnologyParameter> tech;
+    Processor(ParseXML *XML_interface, bool keep_models_ = false);
     void compute();
+    void update_stats();
     void set_proc_param();
+    void prebuild();
+    void prebuild_component(int kind, int i);
     void displayEnergy(uint32_t indent = 0,int plevel = 100, bool is_tdp=true);
+    void displayJSON(uint32_t indent = 0,int plevel = 100);
     void displayDeviceType(int device_type_, uint32_t indent = 0);
     void displayInterconnectType(int interconnect_type_, uint32_t indent = 0);
     ~Processor();
@@ -597,6 +597,20 @@ SharedCache::SharedCache(ParseXML* XML_interface, int ithCache_, InputParameter*
 }
 
 
+/*
+ * A cache with the same hardware as this one, evaluated with the stats of cache
+ * ithCache_ of its level (see Core::clone()). The cache parameters are read
+ * again, of them only the duty cycles and the execution time are runtime stats.
+ */
+SharedCache * SharedCache::clone(int ithCache_) const
+{
+	SharedCache * copy = new SharedCache(*this);
+	copy->ithCache = ithCache_;
+	copy->unicache.clone_arrays();
+	copy->set_cache_param();
+	return copy;
+}
+
 void SharedCache::computeEnergy(bool is_tdp)
 {
 	double homenode_data_access = (cachep.dir_ty==SBT)? 0.9:1.0;
@@ -835,15 +849,16 @@ void SharedCache::displayEnergy(uint32_t indent,bool is_tdp)
 
 	if (is_tdp)
 	{
-		cout << (XML->sys.Private_L2? indent_str:"")<< cachep.name << endl;
-		cout << indent_str << "Area = " << area.get_area()*1e-6<< " mm^2" << endl;
-		cout << indent_str << "Peak Dynamic = " << power.readOp.dynamic*cachep.clockRate << " W" << endl;
-		cout << indent_str << "Subthreshold Leakage = "
-			<< (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage) <<" W" << endl;
-		if (power_gating) cout << indent_str << "Subthreshold Leakage with power gating = "
-				<< (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage)  << " W" << endl;
-		cout << indent_str << "Gate Leakage = " << power.readOp.gate_leakage << " W" << endl;
-		cout << indent_str << "Runtime Dynamic = " << rt_power.readOp.dynamic/cachep.executionTime << " W" << endl;
+		if (XML->sys.Private_L2)
+			report_section(indent_str, cachep.name, "");
+		else
+			report_component(cachep.name, "");
+		report_value(indent_str, "Area", area.get_area()*1e-6, "mm^2");
+		report_value(indent_str, "Peak Dynamic", power.readOp.dynamic*cachep.clockRate, "W");
+		report_value(indent_str, "Subthreshold Leakage", (long_channel? power.readOp.longer_channel_leakage:power.readOp.leakage), "W");
+		if (power_gating) report_value(indent_str, "Subthreshold Leakage with power gating", (long_channel? power.readOp.power_gated_with_long_channel_leakage : power.readOp.power_gated_leakage), "W");
+		report_value(indent_str, "Gate Leakage", power.readOp.gate_leakage, "W");
+		report_value(indent_str, "Runtime Dynamic", rt_power.readOp.dynamic/cachep.executionTime, "W");
 		cout <<endl;
 	}
 	else
@@ -59,6 +59,7 @@ class SharedCache :public Component{
     //   Component L2Tot, cc, cc1, ccTot;
 
     SharedCache(ParseXML *XML_interface, int ithCache_, InputParameter* interface_ip_,enum cache_level cacheL_ =L2);
+    SharedCache * clone(int ithCache_) const;
     void set_cache_param();
 	void computeEnergy(bool is_tdp=true);
     void displayEnergy(uint32_t indent = 0,bool is_tdp=true);
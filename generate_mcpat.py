@@ -28,231 +28,325 @@ import shutil
 import sys
 import collections
 import argparse
+import StringIO
+import numpy
+import stats_array
+import instrument
 
 
-def generate_mcpat(stats, output_dir, input_proc_model, l3_avail, bin_size, CORES, HW_THREADS, TSC_FREQUENCY):
+# For core level stats, we need to merge all the HW_Threads into their shared physical resources
+# threads are merged as follows (for a 4 core machine with 8 threads)
+# 0/4,2/5,3/6,4/7
+# Returns a StatsArray with one cpu per physical core ("core0", ...)
+def merge_threads(stats, CORES, HW_THREADS):
+	cores = stats_array.StatsArray(stats.times, ["core" + str(k) for k in range(0,CORES)])
+	for stat in stats.events():
+		merged = numpy.zeros((len(stats), CORES))
+		for k in range(0,CORES,1):
+			for j in range(k, HW_THREADS, CORES):
+				merged[:, k] += stats[stat, "CPU" + str(j)]
+		cores[stat] = merged
+	return cores
 
-	print "********** Generating McPAT input files **********"
-	shutil.rmtree(output_dir,ignore_errors=True)
-	os.makedirs(output_dir)
+# Computes the McPAT runtime statistics of one interval.
+# total is {stat: value} of the TOTAL category, cores is a list of {stat: value} of each physical core (see merge_threads)
+# Returns a list of (component id, "stat" or "param", name, value) updates for the McPAT template.
+def mcpat_updates(total, cores, l3_avail, bin_size, CORES, HW_THREADS, TSC_FREQUENCY):
+	updates = []
+	def set_stat(component, name, value):
+		updates.append((component, "stat", name, value))
+	def set_param(component, name, value):
+		updates.append((component, "param", name, value))
 
-	# now, import the base McPat config file and augment the runtime statistics with our data
-	tree = ET.parse(input_proc_model)
-	root = tree.getroot()
-	file_num = 0
+	# cycle information
+	# These cycles define the simulation time only, so just express them as the TSC_Frequency into bin szie
+	set_stat("system", "total_cycles", str(bin_size * TSC_FREQUENCY))
 	
-	for time_stamp in stats.itervalues().next().keys():
+	d = total
+	#l3 stats
+	if l3_avail:
+		# lets say 1/4 are writes and 3/4 are reads
+		l3_reads = int(d["l3_accesses"]) * 0.75
+		l3_writes = int(d["l3_accesses"]) * 0.25
+		l3_write_misses =  int(d["l3_misses"]) * 0.25
+		l3_read_misses = int(d["l3_misses"]) * 0.75
+		set_stat("system.L30", "read_accesses", str(l3_reads))
+		set_stat("system.L30", "read_misses", str(l3_read_misses))
+		set_stat("system.L30", "write_accesses", str(l3_writes))
+		set_stat("system.L30", "write_misses", str(l3_write_misses))
 
+	#mc stats
+	if l3_avail:
+		# lets say 1/4 are writes and 3/4 are reads
+		memory_reads = l3_write_misses
+		memory_writes = l3_read_misses
+		set_stat("system.mc", "memory_accesses", str(int(d["l3_misses"])))
+		set_stat("system.mc", "memory_reads", str(memory_reads))
+		set_stat("system.mc", "memory_writes", str(memory_writes))
+	else:
+		set_stat("system.mc", "memory_accesses", str(int(d["l2_write_misses"]) + int(d["l2_read_misses"])))
+		set_stat("system.mc", "memory_reads", str(int(d["l2_read_misses"])))
+		set_stat("system.mc", "memory_writes", str(int(d["l2_write_misses"])))
 
-		total_cycles = []
-		idle_cycles = []
-		busy_cycles = []
+		
+	#Populate core level stats
+	threads_per_core = HW_THREADS / CORES
+	core_id = 0
+	for k in range(0,CORES,1):
+		d = cores[k]
 
-		for i in range(0,HW_THREADS):
-			total_cycles.append(stats["CPU" + str(i)][time_stamp]["total_cycles"])
-			idle_cycles.append(stats["CPU" + str(i)][time_stamp]["idle_cycles"])
-			busy_cycles.append(stats["CPU" + str(i)][time_stamp]["busy_cycles"])
-		total_cycles= max(total_cycles)
-		idle_cycles = min(idle_cycles)
-		busy_cycles = max(busy_cycles)
+		# The frequency and voltage depends on the host power state!
+		set_param("system.core" + str(core_id), "clock_rate", str(int(TSC_FREQUENCY / 1000000)))
+		#set_param("system.core" + str(core_id), "vdd", str(package_voltage))
 	
-		# cycle information
-		# These cycles define the simulation time only, so just express them as the TSC_Frequency into bin szie
-		root.find(".//*[@id='system']/stat[@name='total_cycles']").set        ('value',str(bin_size * TSC_FREQUENCY))
+		set_stat("system.core" + str(core_id), "total_instructions", str(int(d["uops_dispatched"])))
+
+		# estimate int instructions as uops - FP - BR 
+		int_estimate = (d["uops_dispatched"] - d["fp_uops_executed"] - d["branches_executed"])
+		set_stat("system.core" + str(core_id), "int_instructions", str(int(int_estimate)))
+		set_stat("system.core" + str(core_id), "fp_instructions", str(d["fp_uops_executed"]))
+		set_stat("system.core" + str(core_id), "branch_instructions", str(d["branches_executed"]))
+		set_stat("system.core" + str(core_id), "branch_mispredictions", str(d["branches_mispredicted"]))
+		set_stat("system.core" + str(core_id), "load_instructions", str(d["dcache_reads"]))
+		set_stat("system.core" + str(core_id), "store_instructions", str(d["dcache_writes"]))
+		set_stat("system.core" + str(core_id), "committed_instructions", str(d["uops_retired"]))
+		set_stat("system.core" + str(core_id), "committed_int_instructions", str(int_estimate))
+		set_stat("system.core" + str(core_id), "committed_fp_instructions", str(d["fp_uops_retired"]))
+		set_stat("system.core" + str(core_id), "context_switches", str(d["context_switches"]))
 		
-		d = stats["TOTAL"][time_stamp]
-		#l3 stats
-		if l3_avail:
-			# lets say 1/4 are writes and 3/4 are reads
-			l3_reads = int(d["l3_accesses"]) * 0.75
-			l3_writes = int(d["l3_accesses"]) * 0.25
-			l3_write_misses =  int(d["l3_misses"]) * 0.25
-			l3_read_misses = int(d["l3_misses"]) * 0.75
-			root.find(".//*[@id='system.L30']/stat[@name='read_accesses']").set       ('value',str(l3_reads))
-			root.find(".//*[@id='system.L30']/stat[@name='read_misses']").set         ('value',str(l3_read_misses))
-			root.find(".//*[@id='system.L30']/stat[@name='write_accesses']").set       ('value',str(l3_writes))
-			root.find(".//*[@id='system.L30']/stat[@name='write_misses']").set         ('value',str(l3_write_misses))
-
-		#mc stats
-		if l3_avail:
-			# lets say 1/4 are writes and 3/4 are reads
-			memory_reads = l3_write_misses
-			memory_writes = l3_read_misses
-			root.find(".//*[@id='system.mc']/stat[@name='memory_accesses']").set       ('value',str(int(d["l3_misses"])))
-			root.find(".//*[@id='system.mc']/stat[@name='memory_reads']").set         ('value',str(memory_reads))
-			root.find(".//*[@id='system.mc']/stat[@name='memory_writes']").set       ('value',str(memory_writes))
+		# this is a little complicated with hyperthreading
+		# We don't want to count total cycles for each logical thread, only physical core, so devide out the threads per core
+		# We assume that the busy cycles don't overlap, and can be added. This is an estimate and could result in a value greater than total_cycles, so fix that up!
+		per_core_total_cycles = d["total_cycles"] / threads_per_core
+		if (d["busy_cycles"]/2) > per_core_total_cycles:
+			per_core_busy_cycles = per_core_total_cycles
 		else:
-			root.find(".//*[@id='system.mc']/stat[@name='memory_accesses']").set       ('value',str(int(d["l2_write_misses"]) + int(d["l2_read_misses"])))
-			root.find(".//*[@id='system.mc']/stat[@name='memory_reads']").set         ('value',str(int(d["l2_read_misses"])))
-			root.find(".//*[@id='system.mc']/stat[@name='memory_writes']").set       ('value',str(int(d["l2_write_misses"])))
-
-			
-		#Populate core level stats
-		# For core level stats, we need to merge all the HW_Threads into their shared physical resources
-		# threads are merged as follows (for a 4 core machine with 8 threads)
-		# 0/4,2/5,3/6,4/7
-		threads_per_core = HW_THREADS / CORES
-		core_id = 0
-		for k in range(0,CORES,1):
-			d = {}
-			for stat in stats.itervalues().next().itervalues().next().keys():
-				d[stat] = 0
-				for j in range(k, HW_THREADS, CORES):
-					d[stat] += stats["CPU" + str(j)][time_stamp][stat]
-
-			# The frequency and voltage depends on the host power state!
-			root.find(".//*[@id='system.core" + str(core_id) + "']/param[@name='clock_rate']").set        ('value',str(int(TSC_FREQUENCY / 1000000)))
-			#root.find(".//*[@id='system.core" + str(core_id) + "']/param[@name='vdd']").set        ('value',str(package_voltage))
-		
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='total_instructions']").set        ('value',str(int(d["uops_dispatched"])))
-
-			# estimate int instructions as uops - FP - BR 
-			int_estimate = (d["uops_dispatched"] - d["fp_uops_executed"] - d["branches_executed"])
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='int_instructions']").set           ('value',str(int(int_estimate)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='fp_instructions']").set           ('value',str(d["fp_uops_executed"]))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='branch_instructions']").set       ('value',str(d["branches_executed"]))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='branch_mispredictions']").set     ('value',str(d["branches_mispredicted"]))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='load_instructions']").set        ('value',str(d["dcache_reads"]))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='store_instructions']").set        ('value',str(d["dcache_writes"]))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='committed_instructions']").set    ('value',str(d["uops_retired"]))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='committed_int_instructions']").set    ('value',str(int_estimate))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='committed_fp_instructions']").set ('value',str(d["fp_uops_retired"]))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='context_switches']").set          ('value',str(d["context_switches"]))
-			
-			# this is a little complicated with hyperthreading
-			# We don't want to count total cycles for each logical thread, only physical core, so devide out the threads per core
-			# We assume that the busy cycles don't overlap, and can be added. This is an estimate and could result in a value greater than total_cycles, so fix that up!
-			per_core_total_cycles = d["total_cycles"] / threads_per_core
-			if (d["busy_cycles"]/2) > per_core_total_cycles:
-				per_core_busy_cycles = per_core_total_cycles
-			else:
-				per_core_busy_cycles = d["busy_cycles"]/2
-			per_core_idle_cycles = per_core_total_cycles - per_core_busy_cycles
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='total_cycles']").set    ('value',str(bin_size * TSC_FREQUENCY))
-
-			# CORE STATS
-			rob_reads =  d["uops_dispatched"]
-			rob_writes = d["uops_retired"]
-			rename_reads = 2 * int_estimate
-			rename_writes = int_estimate
-			fp_rename_reads = 2 * d["fp_uops_executed"]
-			fp_rename_writes = d["fp_uops_executed"]
-			inst_window_reads = int_estimate + d["branches_executed"]
-			inst_window_writes = int_estimate + d["branches_executed"]
-			inst_window_wakeup_accesses = int_estimate + d["branches_executed"]
-			fp_inst_window_reads = d["fp_uops_executed"]
-			fp_inst_window_writes = d["fp_uops_executed"]
-			fp_inst_window_wakeup_accesses = d["fp_uops_executed"]
-			int_regfile_reads = 2 * int_estimate
-			float_regfile_reads = 2 * d["fp_uops_executed"]
-			int_regfile_writes = int_estimate
-			float_regfile_writes = d["fp_uops_executed"]
-			ialu_accesses = int_estimate
-			fpu_accesses = d["fp_uops_executed"]
-			mul_accesses = 0.05 * int_estimate
-			cdb_alu_accesses = int_estimate
-			cdb_mul_accesses = 0.05 * int_estimate
-			cdb_fpu_accesses = d["fp_uops_executed"]
-
-
-			pipe_d = d["uops_dispatched"] / float(d["total_cycles"]	)		
-			IFU_d = d["uops_dispatched"] / float(d["total_cycles"]	)				
-			LSU_d = (d["dcache_reads"] + d["dcache_writes"]) / float(d["total_cycles"]	)	
-			MemManU_I_d = d["uops_dispatched"] / float(d["total_cycles"]	)	
-			MemManU_D_d = ( d["dcache_reads"] + d["dcache_writes"] ) / float(d["total_cycles"]	)	
-			ALU_d = int_estimate / float(d["total_cycles"]	)	
-			MUL_d = 0.3
-			FPU_d = ( d["fp_uops_executed"] * 20 ) / float(d["total_cycles"]	)	
-			ALU_cdb = int_estimate / float(d["total_cycles"]	)	
-			MUL_cdb = 0.3
-			FPU_cdb = ( d["fp_uops_executed"]  ) / float(d["total_cycles"]	)	
+			per_core_busy_cycles = d["busy_cycles"]/2
+		per_core_idle_cycles = per_core_total_cycles - per_core_busy_cycles
+		set_stat("system.core" + str(core_id), "total_cycles", str(bin_size * TSC_FREQUENCY))
+
+		# CORE STATS
+		rob_reads =  d["uops_dispatched"]
+		rob_writes = d["uops_retired"]
+		rename_reads = 2 * int_estimate
+		rename_writes = int_estimate
+		fp_rename_reads = 2 * d["fp_uops_executed"]
+		fp_rename_writes = d["fp_uops_executed"]
+		inst_window_reads = int_estimate + d["branches_executed"]
+		inst_window_writes = int_estimate + d["branches_executed"]
+		inst_window_wakeup_accesses = int_estimate + d["branches_executed"]
+		fp_inst_window_reads = d["fp_uops_executed"]
+		fp_inst_window_writes = d["fp_uops_executed"]
+		fp_inst_window_wakeup_accesses = d["fp_uops_executed"]
+		int_regfile_reads = 2 * int_estimate
+		float_regfile_reads = 2 * d["fp_uops_executed"]
+		int_regfile_writes = int_estimate
+		float_regfile_writes = d["fp_uops_executed"]
+		ialu_accesses = int_estimate
+		fpu_accesses = d["fp_uops_executed"]
+		mul_accesses = 0.05 * int_estimate
+		cdb_alu_accesses = int_estimate
+		cdb_mul_accesses = 0.05 * int_estimate
+		cdb_fpu_accesses = d["fp_uops_executed"]
+
+
+		pipe_d = d["uops_dispatched"] / float(d["total_cycles"]	)		
+		IFU_d = d["uops_dispatched"] / float(d["total_cycles"]	)				
+		LSU_d = (d["dcache_reads"] + d["dcache_writes"]) / float(d["total_cycles"]	)	
+		MemManU_I_d = d["uops_dispatched"] / float(d["total_cycles"]	)	
+		MemManU_D_d = ( d["dcache_reads"] + d["dcache_writes"] ) / float(d["total_cycles"]	)	
+		ALU_d = int_estimate / float(d["total_cycles"]	)	
+		MUL_d = 0.3
+		FPU_d = ( d["fp_uops_executed"] * 20 ) / float(d["total_cycles"]	)	
+		ALU_cdb = int_estimate / float(d["total_cycles"]	)	
+		MUL_cdb = 0.3
+		FPU_cdb = ( d["fp_uops_executed"]  ) / float(d["total_cycles"]	)	
  
-			pipeline_duty_cycle = 1.0 if pipe_d > 1.0 else pipe_d
-			IFU_duty_cycle = 1.0 if IFU_d > 1.0 else IFU_d
-			LSU_duty_cycle = 1.0 if LSU_d > 1.0 else LSU_d
-			MemManU_I_duty_cycle = 1.0 if MemManU_I_d > 1.0 else MemManU_I_d
-			MemManU_D_duty_cycle = 1.0 if MemManU_D_d > 1.0 else MemManU_D_d
-			ALU_duty_cycle = 1.0 if ALU_d > 1.0 else ALU_d
-			MUL_duty_cycle = 1.0 if MUL_d > 1.0 else MUL_d
-			FPU_duty_cycle = 1.0 if FPU_d > 1.0 else FPU_d
-			ALU_cdb_duty_cycle = 1.0 if ALU_cdb > 1.0 else ALU_cdb
-			MUL_cdb_duty_cycle = 1.0 if MUL_cdb > 1.0 else MUL_cdb
-			FPU_cdb_duty_cycle = 1.0 if FPU_cdb > 1.0 else FPU_cdb
-			
-			# mcpat requires the duty cycles for max dynamic power AND for regular dynamic power
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='pipeline_duty_cycle']").set      ('value',str(pipeline_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='IFU_duty_cycle']").set           ('value',str(IFU_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='LSU_duty_cycle']").set           ('value',str(LSU_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='MemManU_I_duty_cycle']").set     ('value',str(MemManU_I_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='MemManU_D_duty_cycle']").set     ('value',str(MemManU_D_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='ALU_duty_cycle']").set           ('value',str(ALU_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='MUL_duty_cycle']").set           ('value',str(MUL_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='FPU_duty_cycle']").set           ('value',str(FPU_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='ALU_cdb_duty_cycle']").set       ('value',str(ALU_cdb_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='MUL_cdb_duty_cycle']").set       ('value',str(MUL_cdb_duty_cycle))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='FPU_cdb_duty_cycle']").set       ('value',str(FPU_cdb_duty_cycle))
-
-
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='ROB_reads']").set           ('value',str(int(rob_reads)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='ROB_writes']").set           ('value',str(int(rob_writes)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='rename_reads']").set       ('value',str(int(rename_reads)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='rename_writes']").set     ('value',str(int(rename_writes)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='fp_rename_reads']").set        ('value',str(int(fp_rename_reads)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='fp_rename_writes']").set        ('value',str(int(fp_rename_writes)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='inst_window_reads']").set              ('value',str(int(inst_window_reads)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='inst_window_writes']").set            ('value',str(int(inst_window_writes)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='inst_window_wakeup_accesses']").set   ('value',str(int(inst_window_wakeup_accesses)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='fp_inst_window_reads']").set          ('value',str(int(fp_inst_window_reads)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='fp_inst_window_writes']").set           ('value',str(int(fp_inst_window_writes)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='fp_inst_window_wakeup_accesses']").set           ('value',str(int(fp_inst_window_wakeup_accesses)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='int_regfile_reads']").set         ('value',str(int(int_regfile_reads)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='float_regfile_reads']").set       ('value',str(int(float_regfile_reads)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='int_regfile_writes']").set        ('value',str(int(int_regfile_writes)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='float_regfile_writes']").set     ('value',str(int(float_regfile_writes)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='ialu_accesses']").set             ('value',str(int(ialu_accesses)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='fpu_accesses']").set              ('value',str(int(fpu_accesses)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='mul_accesses']").set              ('value',str(int(mul_accesses)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='cdb_alu_accesses']").set          ('value',str(int(cdb_alu_accesses)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='cdb_mul_accesses']").set          ('value',str(int(cdb_mul_accesses)))
-			root.find(".//*[@id='system.core" + str(core_id) + "']/stat[@name='cdb_fpu_accesses']").set          ('value',str(int(cdb_fpu_accesses)))
-
-			# haswell doesnt keep track of icache reads, so assume that we have a read every 3 instructions
-			icache_reads = int(d["instructions"]) / 3
-
-			dcache_accesses = int(d["dcache_reads"]) + int(d["dcache_writes"])
-
-			#itlb stats
-			root.find(".//*[@id='system.core" + str(core_id) + ".itlb']/stat[@name='total_accesses']").set       ('value',str(icache_reads))
-			root.find(".//*[@id='system.core" + str(core_id) + ".itlb']/stat[@name='total_misses']").set         ('value',str(int(d["itlb_misses"])))
-
-			#dtlb stats
-			root.find(".//*[@id='system.core" + str(core_id) + ".dtlb']/stat[@name='total_accesses']").set       ('value',str(dcache_accesses))
-			root.find(".//*[@id='system.core" + str(core_id) + ".dtlb']/stat[@name='total_misses']").set         ('value',str(int(d["dtlb_misses"])))
-
-			#icache stats
-			root.find(".//*[@id='system.core" + str(core_id) + ".icache']/stat[@name='read_accesses']").set       ('value',str(icache_reads))
-			root.find(".//*[@id='system.core" + str(core_id) + ".icache']/stat[@name='read_misses']").set         ('value',str(int(d["icache_misses"])))
-
-			#dcache stats
-			root.find(".//*[@id='system.core" + str(core_id) + ".dcache']/stat[@name='read_accesses']").set       ('value',str(int(d["dcache_reads"])))
-			root.find(".//*[@id='system.core" + str(core_id) + ".dcache']/stat[@name='read_misses']").set         ('value',str(int(d["dcache_read_misses"])))
-			root.find(".//*[@id='system.core" + str(core_id) + ".dcache']/stat[@name='write_accesses']").set       ('value',str(int(d["dcache_writes"])))
-			root.find(".//*[@id='system.core" + str(core_id) + ".dcache']/stat[@name='write_misses']").set         ('value',str(int(d["dcache_write_misses"])))
-
-			#l2 stats
-			# lets say 1/4 are writes and 3/4 are reads
-			l2_reads = int(d["l2_accesses"]) * 0.75
-			l2_writes = int(d["l2_accesses"]) * 0.25
-			l2_write_misses =  int(d["l2_misses"]) * 0.25
-			l2_read_misses = int(d["l2_misses"]) * 0.75
-			root.find(".//*[@id='system.L2" + str(core_id) + "']/stat[@name='read_accesses']").set       ('value',str(l2_reads))
-			root.find(".//*[@id='system.L2" + str(core_id) + "']/stat[@name='read_misses']").set         ('value',str(l2_read_misses))
-			root.find(".//*[@id='system.L2" + str(core_id) + "']/stat[@name='write_accesses']").set       ('value',str(l2_writes))
-			root.find(".//*[@id='system.L2" + str(core_id) + "']/stat[@name='write_misses']").set         ('value',str(l2_write_misses))
-
-			core_id +=1
-
-		tree.write(output_dir + "/config_" + str(file_num) + ".xml")
+		pipeline_duty_cycle = 1.0 if pipe_d > 1.0 else pipe_d
+		IFU_duty_cycle = 1.0 if IFU_d > 1.0 else IFU_d
+		LSU_duty_cycle = 1.0 if LSU_d > 1.0 else LSU_d
+		MemManU_I_duty_cycle = 1.0 if MemManU_I_d > 1.0 else MemManU_I_d
+		MemManU_D_duty_cycle = 1.0 if MemManU_D_d > 1.0 else MemManU_D_d
+		ALU_duty_cycle = 1.0 if ALU_d > 1.0 else ALU_d
+		MUL_duty_cycle = 1.0 if MUL_d > 1.0 else MUL_d
+		FPU_duty_cycle = 1.0 if FPU_d > 1.0 else FPU_d
+		ALU_cdb_duty_cycle = 1.0 if ALU_cdb > 1.0 else ALU_cdb
+		MUL_cdb_duty_cycle = 1.0 if MUL_cdb > 1.0 else MUL_cdb
+		FPU_cdb_duty_cycle = 1.0 if FPU_cdb > 1.0 else FPU_cdb
+		
+		# mcpat requires the duty cycles for max dynamic power AND for regular dynamic power
+		set_stat("system.core" + str(core_id), "pipeline_duty_cycle", str(pipeline_duty_cycle))
+		set_stat("system.core" + str(core_id), "IFU_duty_cycle", str(IFU_duty_cycle))
+		set_stat("system.core" + str(core_id), "LSU_duty_cycle", str(LSU_duty_cycle))
+		set_stat("system.core" + str(core_id), "MemManU_I_duty_cycle", str(MemManU_I_duty_cycle))
+		set_stat("system.core" + str(core_id), "MemManU_D_duty_cycle", str(MemManU_D_duty_cycle))
+		set_stat("system.core" + str(core_id), "ALU_duty_cycle", str(ALU_duty_cycle))
+		set_stat("system.core" + str(core_id), "MUL_duty_cycle", str(MUL_duty_cycle))
+		set_stat("system.core" + str(core_id), "FPU_duty_cycle", str(FPU_duty_cycle))
+		set_stat("system.core" + str(core_id), "ALU_cdb_duty_cycle", str(ALU_cdb_duty_cycle))
+		set_stat("system.core" + str(core_id), "MUL_cdb_duty_cycle", str(MUL_cdb_duty_cycle))
+		set_stat("system.core" + str(core_id), "FPU_cdb_duty_cycle", str(FPU_cdb_duty_cycle))
+
+
+		set_stat("system.core" + str(core_id), "ROB_reads", str(int(rob_reads)))
+		set_stat("system.core" + str(core_id), "ROB_writes", str(int(rob_writes)))
+		set_stat("system.core" + str(core_id), "rename_reads", str(int(rename_reads)))
+		set_stat("system.core" + str(core_id), "rename_writes", str(int(rename_writes)))
+		set_stat("system.core" + str(core_id), "fp_rename_reads", str(int(fp_rename_reads)))
+		set_stat("system.core" + str(core_id), "fp_rename_writes", str(int(fp_rename_writes)))
+		set_stat("system.core" + str(core_id), "inst_window_reads", str(int(inst_window_reads)))
+		set_stat("system.core" + str(core_id), "inst_window_writes", str(int(inst_window_writes)))
+		set_stat("system.core" + str(core_id), "inst_window_wakeup_accesses", str(int(inst_window_wakeup_accesses)))
+		set_stat("system.core" + str(core_id), "fp_inst_window_reads", str(int(fp_inst_window_reads)))
+		set_stat("system.core" + str(core_id), "fp_inst_window_writes", str(int(fp_inst_window_writes)))
+		set_stat("system.core" + str(core_id), "fp_inst_window_wakeup_accesses", str(int(fp_inst_window_wakeup_accesses)))
+		set_stat("system.core" + str(core_id), "int_regfile_reads", str(int(int_regfile_reads)))
+		set_stat("system.core" + str(core_id), "float_regfile_reads", str(int(float_regfile_reads)))
+		set_stat("system.core" + str(core_id), "int_regfile_writes", str(int(int_regfile_writes)))
+		set_stat("system.core" + str(core_id), "float_regfile_writes", str(int(float_regfile_writes)))
+		set_stat("system.core" + str(core_id), "ialu_accesses", str(int(ialu_accesses)))
+		set_stat("system.core" + str(core_id), "fpu_accesses", str(int(fpu_accesses)))
+		set_stat("system.core" + str(core_id), "mul_accesses", str(int(mul_accesses)))
+		set_stat("system.core" + str(core_id), "cdb_alu_accesses", str(int(cdb_alu_accesses)))
+		set_stat("system.core" + str(core_id), "cdb_mul_accesses", str(int(cdb_mul_accesses)))
+		set_stat("system.core" + str(core_id), "cdb_fpu_accesses", str(int(cdb_fpu_accesses)))
+
+		# haswell doesnt keep track of icache reads, so assume that we have a read every 3 instructions
+		icache_reads = int(d["instructions"]) / 3
+
+		dcache_accesses = int(d["dcache_reads"]) + int(d["dcache_writes"])
+
+		#itlb stats
+		set_stat("system.core" + str(core_id) + ".itlb", "total_accesses", str(icache_reads))
+		set_stat("system.core" + str(core_id) + ".itlb", "total_misses", str(int(d["itlb_misses"])))
+
+		#dtlb stats
+		set_stat("system.core" + str(core_id) + ".dtlb", "total_accesses", str(dcache_accesses))
+		set_stat("system.core" + str(core_id) + ".dtlb", "total_misses", str(int(d["dtlb_misses"])))
+
+		#icache stats
+		set_stat("system.core" + str(core_id) + ".icache", "read_accesses", str(icache_reads))
+		set_stat("system.core" + str(core_id) + ".icache", "read_misses", str(int(d["icache_misses"])))
+
+		#dcache stats
+		set_stat("system.core" + str(core_id) + ".dcache", "read_accesses", str(int(d["dcache_reads"])))
+		set_stat("system.core" + str(core_id) + ".dcache", "read_misses", str(int(d["dcache_read_misses"])))
+		set_stat("system.core" + str(core_id) + ".dcache", "write_accesses", str(int(d["dcache_writes"])))
+		set_stat("system.core" + str(core_id) + ".dcache", "write_misses", str(int(d["dcache_write_misses"])))
+
+		#l2 stats
+		# lets say 1/4 are writes and 3/4 are reads
+		l2_reads = int(d["l2_accesses"]) * 0.75
+		l2_writes = int(d["l2_accesses"]) * 0.25
+		l2_write_misses =  int(d["l2_misses"]) * 0.25
+		l2_read_misses = int(d["l2_misses"]) * 0.75
+		set_stat("system.L2" + str(core_id), "read_accesses", str(l2_reads))
+		set_stat("system.L2" + str(core_id), "read_misses", str(l2_read_misses))
+		set_stat("system.L2" + str(core_id), "write_accesses", str(l2_writes))
+		set_stat("system.L2" + str(core_id), "write_misses", str(l2_write_misses))
+
+		core_id +=1
+
+	return updates
+
+
+# The McPAT template preprocessed into the text between its stat/param values.
+# An input file is produced by filling the value slots, instead of looking up
+# every updated element in the tree and serializing the whole tree again.
+# The output is byte for byte what ElementTree writes for the updated tree.
+class CompiledTemplate:
+	MARKER = "@@WATTWATCHER_SLOT_%d@@"
+
+	def __init__(self, input_proc_model):
+		tree = ET.parse(input_proc_model)
+		original = StringIO.StringIO()
+		tree.write(original)
+		original = original.getvalue()
+
+		# slots are the value attributes of the stat and param children of every component, keyed
+		# like the updates by (component id, "stat" or "param", name).  First match wins, as with find().
+		self.slots = {}
+		elements = []
+		for component in tree.getroot().iter():
+			if component.get('id') is None:
+				continue
+			for child in component:
+				if child.tag in ("stat", "param") and child.get('name') is not None and child.get('value') is not None:
+					key = (component.get('id'), child.tag, child.get('name'))
+					if key not in self.slots:
+						self.slots[key] = len(elements)
+						elements.append(child)
+		for i, element in enumerate(elements):
+			element.set('value', self.MARKER % i)
+		marked = StringIO.StringIO()
+		tree.write(marked)
+		marked = marked.getvalue()
+
+		# split the marked document into the literal text around each slot, and recover the
+		# (escaped) default values from the same positions of the original document
+		prefix = self.MARKER.split("%d")[0]
+		self.text = []
+		self.order = []
+		self.defaults = [None] * len(elements)
+		pos = 0
+		original_pos = 0
+		start = marked.find(prefix)
+		while start >= 0:
+			end = marked.index("@@", start + len(prefix)) + 2
+			i = int(marked[start + len(prefix):end - 2])
+			self.text.append(marked[pos:start])
+			self.order.append(i)
+			original_pos += start - pos
+			default_end = original.index('"', original_pos)
+			self.defaults[i] = original[original_pos:default_end]
+			original_pos = default_end
+			pos = end
+			start = marked.find(prefix, pos)
+		self.text.append(marked[pos:])
+
+		# number the slots by their position in the document text, so a file is one join
+		position = dict([(i, 2 * n + 1) for n, i in enumerate(self.order)])
+		self.slots = dict([(key, position[i]) for key, i in self.slots.iteritems()])
+		self.parts = [None] * (2 * len(self.order) + 1)
+		self.parts[0::2] = self.text
+		self.parts[1::2] = [self.defaults[i] for i in self.order]
+
+	# Positions of the slots of a list of updates.  Every interval has the same layout of
+	# updates, so this can be done once and passed to fill.
+	def resolve(self, updates):
+		slots = self.slots
+		return [slots[(component, kind, name)] for component, kind, name, value in updates]
+
+	# Returns the McPAT input for a list of (component id, "stat" or "param", name, value) updates.
+	# Values are written as is, they are expected to be numbers.
+	def fill(self, updates, positions=None):
+		with instrument.timer("generate_mcpat.fill"):
+			if positions is None:
+				positions = self.resolve(updates)
+			parts = list(self.parts)
+			for position, update in zip(positions, updates):
+				parts[position] = update[3]
+			return "".join(parts)
+
+	def write(self, updates, filename, positions=None):
+		with open(filename, 'wb') as output_f:
+			output_f.write(self.fill(updates, positions))
+
+def generate_mcpat(stats, output_dir, input_proc_model, l3_avail, bin_size, CORES, HW_THREADS, TSC_FREQUENCY):
+
+	print "********** Generating McPAT input files **********"
+	shutil.rmtree(output_dir,ignore_errors=True)
+	os.makedirs(output_dir)
+
+	# now, import the base McPat config file and augment the runtime statistics with our data
+	template = CompiledTemplate(input_proc_model)
+	file_num = 0
+	
+	stats = stats_array.StatsArray.from_stats(stats)
+	cores = merge_threads(stats, CORES, HW_THREADS)
+	for t in range(0, len(stats)):
+		core_stats = [cores.row(t, core) for core in cores.cpus]
+		template.write(mcpat_updates(stats.row(t, "TOTAL"), core_stats, l3_avail, bin_size, CORES, HW_THREADS, TSC_FREQUENCY), output_dir + "/config_" + str(file_num) + ".xml")
 		file_num = file_num +1
 	print "********** McPAT input File Generation Complete **********"
 
@@ -0,0 +1,213 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Instrumentation of the post-processor
+# @date: 10/18/2026
+#
+# process.py starts a report and the stages record into it:
+#   stage(name, iterable, upstream)
+#                           wall and CPU time spent producing the items of a
+#                           pipeline stage, and the number of items
+#   timer(name)             time spent in a block, e.g. McPAT input generation
+#   observe(name, seconds)  one latency sample, e.g. a McPAT run
+#   cacti(output)           how McPAT found its CACTI arrays (mcpat -stats 1)
+# finish() writes everything as JSON, with the peak memory.  The pipeline
+# stages are chained generators, so the time of a stage is its own total minus
+# the total of the upstream stage it reads from.  CPU times are of the whole
+# process, McPAT runs in other processes.
+# Optionally a progress event (one line of JSON) is written every few seconds.
+# Without a report all of these do nothing.
+
+import time, json, resource, threading, collections
+
+REPORT = None
+
+# Upper bounds of the latency histogram buckets, in seconds
+BUCKETS = [0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
+
+def cpu_time():
+	usage = resource.getrusage(resource.RUSAGE_SELF)
+	return usage.ru_utime + usage.ru_stime
+
+class Report:
+
+	def __init__(self, progress_f=None, progress_interval=10.0):
+		self.lock = threading.Lock()
+		self.start = time.time()
+		self.start_cpu = cpu_time()
+		# stage: [wall, cpu, items, upstream stage]
+		self.stages = collections.OrderedDict()
+		# timer: [wall, calls]
+		self.timers = collections.OrderedDict()
+		self.latencies = collections.OrderedDict()
+		self.counters = collections.Counter()
+		self.progress_f = progress_f
+		self.progress_interval = progress_interval
+		self.last_progress = self.start
+
+	def stage(self, name, iterable, upstream, size):
+		with self.lock:
+			totals = self.stages.setdefault(name, [0.0, 0.0, 0, upstream])
+		return self.timed(totals, iter(iterable), size)
+
+	def timed(self, totals, iterator, size):
+		while True:
+			begin = time.time()
+			begin_cpu = cpu_time()
+			try:
+				item = iterator.next()
+			finally:
+				totals[0] += time.time() - begin
+				totals[1] += cpu_time() - begin_cpu
+			totals[2] += size(item) if size else 1
+			if self.progress_f and time.time() - self.last_progress >= self.progress_interval:
+				self.progress()
+			yield item
+
+	def progress(self):
+		self.last_progress = time.time()
+		event = collections.OrderedDict([("event", "progress"), ("elapsed", self.last_progress - self.start)])
+		event["items"] = collections.OrderedDict([(name, totals[2]) for name, totals in self.stages.items()])
+		event["mcpat_runs"] = sum([len(samples) for samples in self.latencies.values()])
+		event["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+		self.progress_f.write(json.dumps(event) + "\n")
+		self.progress_f.flush()
+
+	def add_time(self, name, elapsed):
+		with self.lock:
+			totals = self.timers.setdefault(name, [0.0, 0])
+			totals[0] += elapsed
+			totals[1] += 1
+
+	def observe(self, name, seconds):
+		with self.lock:
+			self.latencies.setdefault(name, []).append(seconds)
+
+	def count(self, name, n):
+		with self.lock:
+			self.counters[name] += n
+
+	# output_wall is the time spent reading the last stage and writing the results
+	def summary(self, output_wall, last_stage):
+		report = collections.OrderedDict()
+		report["wall"] = time.time() - self.start
+		report["cpu"] = cpu_time() - self.start_cpu
+		stages = collections.OrderedDict()
+		for name, (wall, cpu, items, upstream) in self.stages.items():
+			upstream = self.stages.get(upstream, [0.0, 0.0])
+			stage = collections.OrderedDict([("wall", wall - upstream[0]), ("cpu", cpu - upstream[1]), ("items", items)])
+			stage["items_per_s"] = items / stage["wall"] if stage["wall"] > 0 else None
+			stages[name] = stage
+		stages["output"] = {"wall": output_wall - self.stages.get(last_stage, [0.0])[0]}
+		report["stages"] = stages
+		report["timers"] = collections.OrderedDict([(name, {"wall": wall, "calls": calls}) for name, (wall, calls) in self.timers.items()])
+		report["latency"] = collections.OrderedDict([(name, latency_summary(samples)) for name, samples in self.latencies.items()])
+		lookups = self.counters["cacti_memory_hits"] + self.counters["cacti_db_hits"] + self.counters["cacti_solved"]
+		arrays = self.counters["cacti_component_hits"] + self.counters["cacti_component_built"]
+		if lookups or arrays:
+			report["cacti"] = collections.OrderedDict([("memory_hits", self.counters["cacti_memory_hits"]), ("db_hits", self.counters["cacti_db_hits"]),
+				("solved", self.counters["cacti_solved"]), ("hit_rate", 1 - float(self.counters["cacti_solved"]) / lookups if lookups else None),
+				("component_hits", self.counters["cacti_component_hits"]), ("component_built", self.counters["cacti_component_built"]),
+				("component_hit_rate", float(self.counters["cacti_component_hits"]) / arrays if arrays else None)])
+		report["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+		report["peak_rss_mcpat_mb"] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024.0
+		return report
+
+def latency_summary(samples):
+	samples = sorted(samples)
+	def percentile(p):
+		return samples[min(len(samples) - 1, int(p * len(samples)))]
+	histogram = collections.OrderedDict()
+	start = 0
+	for bound in BUCKETS + [float("inf")]:
+		end = start
+		while end < len(samples) and samples[end] <= bound:
+			end += 1
+		if end > start:
+			histogram["<=%gs" % bound if bound != float("inf") else ">%gs" % BUCKETS[-1]] = end - start
+		start = end
+	return collections.OrderedDict([("count", len(samples)), ("mean", sum(samples) / len(samples)), ("min", samples[0]),
+		("p50", percentile(0.5)), ("p90", percentile(0.9)), ("p99", percentile(0.99)), ("max", samples[-1]), ("histogram", histogram)])
+
+class NullTimer:
+	def __enter__(self):
+		pass
+	def __exit__(self, *exc):
+		return False
+
+class Timer:
+	def __init__(self, name):
+		self.name = name
+	def __enter__(self):
+		self.begin = time.time()
+	def __exit__(self, *exc):
+		if REPORT:
+			REPORT.add_time(self.name, time.time() - self.begin)
+		return False
+
+NULL_TIMER = NullTimer()
+
+def start(progress_f=None, progress_interval=10.0):
+	global REPORT
+	REPORT = Report(progress_f, progress_interval)
+	return REPORT
+
+# upstream is the stage iterable reads from.
+# size(item) is the number of items an item of the stage counts for, 1 if not set.
+def stage(name, iterable, upstream=None, size=None):
+	if REPORT is None:
+		return iterable
+	return REPORT.stage(name, iterable, upstream, size)
+
+def timer(name):
+	return Timer(name) if REPORT else NULL_TIMER
+
+def observe(name, seconds):
+	if REPORT:
+		REPORT.observe(name, seconds)
+
+# Counts the CACTI_STATS line of mcpat -stats 1 output
+def cacti(output):
+	if REPORT is None:
+		return
+	start = output.find("CACTI_STATS ")
+	if start < 0:
+		return
+	fields = output[start:output.find("\n", start)].split()
+	REPORT.count("cacti_memory_hits", int(fields[1]))
+	REPORT.count("cacti_db_hits", int(fields[2]))
+	REPORT.count("cacti_solved", int(fields[3]))
+	# component level hits, see fast_mcpat/array.cc
+	if len(fields) > 5:
+		REPORT.count("cacti_component_hits", int(fields[4]))
+		REPORT.count("cacti_component_built", int(fields[5]))
+
+# Writes the report to path and stops recording.
+# output_wall is the time spent writing the results of last_stage, including that stage.
+def finish(path, output_wall, last_stage):
+	global REPORT
+	if REPORT is None:
+		return None
+	report = REPORT.summary(output_wall, last_stage)
+	REPORT = None
+	with open(path, 'wb') as f:
+		json.dump(report, f, indent=1)
+	return report
@@ -0,0 +1,227 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+# Live power telemetry
+# @date: 10/18/2026
+#
+# Follows the records of perf_collector.py (or the output of perf stat -x , -I
+# <ms> -a -A) while they are being written and publishes the power of every
+# interval as soon as the interval is complete, as one line of JSON:
+#   {"time": ..., "latency": ..., "total": {"dynamic": {component: W}, "static": W},
+#    "cores": {"CPU0": {"dynamic": {component: W}, "static": W}, ...}, "rapl": {...}}
+# Each sample interval is one bin, so nothing waits for later samples.  The power
+# is computed from the McPAT model (see mcpat_model.py), and only the interval
+# being read is held in memory.
+
+import os, sys, csv, json, time, argparse, collections
+import process
+import generate_mcpat
+import run_mcpat
+import mcpat_model
+import mcpat_surrogate
+import perf_collector
+
+# Yields the complete lines of a file that may still be written to, starting
+# with partial if it was already read.  At the end of the file, waits for more
+# if follow is set.
+def follow_lines(input_f, follow, poll, partial=""):
+	while True:
+		line = input_f.readline()
+		if line.endswith("\n"):
+			yield partial + line
+			partial = ""
+		elif line:
+			partial += line
+		elif follow:
+			time.sleep(poll)
+		else:
+			if partial:
+				yield partial
+			return
+
+# Groups the rows of perf stat -I output by interval, yields (time_stamp, rows).
+# An interval is complete once it has as many rows as the first one, so it is
+# published without waiting for the next interval.  Other lines are skipped.
+def intervals(lines):
+	rows = []
+	sample_time = None
+	expected = None
+	for row in csv.reader(lines):
+		try:
+			time_stamp = float(row[0])
+		except (ValueError, IndexError):
+			continue
+		if time_stamp != sample_time:
+			if rows:
+				if expected is None:
+					expected = len(rows)
+				yield sample_time, rows
+			rows = []
+			sample_time = time_stamp
+		elif rows is None:
+			# the rest of an interval that was already complete
+			continue
+		rows.append(row)
+		if len(rows) == expected:
+			yield sample_time, rows
+			rows = None
+	if rows:
+		yield sample_time, rows
+
+# Yields (time_stamp, rows) of every interval of a file that may still be written to, from
+# perf_collector.py records or perf stat -I output.  Records are given as the rows perf would print.
+def counter_intervals(input_f, follow, poll):
+	magic = ""
+	while len(magic) < len(perf_collector.MAGIC):
+		more = input_f.read(len(perf_collector.MAGIC) - len(magic))
+		if more:
+			magic += more
+		elif follow:
+			time.sleep(poll)
+			input_f.seek(0, os.SEEK_CUR)
+		else:
+			break
+	if magic != perf_collector.MAGIC:
+		for interval in intervals(follow_lines(input_f, follow, poll, magic)):
+			yield interval
+		return
+	for header, time_stamp, values in perf_collector.follow_records(input_f, follow, poll):
+		yield time_stamp, [[time_stamp, cpu, "<not counted>" if value != value else value, "", event] for (cpu, event), value in zip(header["columns"], values)]
+
+# Yields the reading of every interval of (time_stamp, rows), see the top of this file.
+# sample_period is the sample interval in seconds, time stamps are START_TIME + sample time.
+# With surrogate (a mcpat_surrogate.SurrogateEvaluator) the power comes from it instead of the McPAT model.
+def readings(samples, microarch, sample_period, START_TIME, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs=None, surrogate=None):
+	mcpatdir = process.WATTWATCHER_HOME + "/fast_mcpat"
+	input_proc_model = process.WATTWATCHER_HOME + "/mcpat_procs/" + microarch + ".xml"
+	HW_THREADS = NUM_CORES * THREADS_PER_CORE
+	stat_map = process.read_stat_map(microarch)
+	run_mcpat.use_cacti_seed(input_proc_model)
+	model = None
+	cpus = None
+	template = generate_mcpat.CompiledTemplate(input_proc_model)
+	compiled = False
+	def mcpat_power_dat(updates):
+		return run_mcpat.parse_mcpat_output(run_mcpat.mcpat_pipe(template.fill(updates), mcpatdir))
+	for time_stamp, rows in samples:
+		received = time.time()
+		sample = collections.OrderedDict()
+		rapl = collections.OrderedDict()
+		for row in rows:
+			process.add_row(sample, rapl, row, stat_map)
+		if cpus is None:
+			cpus = sample.keys()
+			events = sample.itervalues().next().keys()
+			rapl_events = rapl.keys()
+			RAPL_AVAIL, L3_AVAIL, FP_AVAIL = process.available(events, rapl_events)
+		stats, cpu_rapl = process.samples_array([START_TIME + time_stamp], [sample], [rapl], cpus, events, rapl_events)
+		bins = process.derive([(stats, cpu_rapl if RAPL_AVAIL else None)], L3_AVAIL, FP_AVAIL, sample_period, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE)
+		for bin_time, bin_stats, rapl_row, cores in bins:
+			updates = generate_mcpat.mcpat_updates(bin_stats["TOTAL"], cores, L3_AVAIL, sample_period, NUM_CORES, HW_THREADS, TSC_FREQUENCY)
+			if not compiled:
+				# every interval has the params of the first one, McPAT reads them from a compiled template
+				run_mcpat.use_compiled_template(template, updates, mcpatdir)
+				compiled = True
+			if surrogate:
+				power_dat = surrogate.evaluate(updates, mcpat_power_dat)
+			else:
+				if model is None:
+					# probing McPAT for a new template is not counted in the latency
+					model = mcpat_model.McpatModel.get(updates, mcpatdir, input_proc_model, jobs)
+					received = time.time()
+				power_dat = model.power_dat([updates])[0]
+			power = run_mcpat.interval_power(power_dat, process.bin_stats(bin_time, bin_stats), bin_time, NUM_CORES, HW_THREADS)
+			reading = collections.OrderedDict()
+			reading["time"] = bin_time
+			reading["total"] = power.pop("TOTAL")
+			reading["cores"] = collections.OrderedDict(sorted(power.items(), key=lambda core: int(core[0][3:])))
+			if rapl_row is not None:
+				reading["rapl"] = rapl_row
+			reading["latency"] = time.time() - received
+			yield reading
+
+# Writes each reading as a line to output_f, and the latest one to latest_file if set.
+# Returns the number of readings and the largest latency.
+def publish(readings, output_f, latest_file, sample_period):
+	count = 0
+	worst = 0.0
+	for reading in readings:
+		line = json.dumps(reading) + "\n"
+		output_f.write(line)
+		output_f.flush()
+		if latest_file:
+			# replaced atomically, readers never see a partial reading
+			tmp = latest_file + "." + str(os.getpid())
+			with open(tmp, 'wb') as latest_f:
+				latest_f.write(line)
+			os.rename(tmp, latest_file)
+		count += 1
+		worst = max(worst, reading["latency"])
+		if reading["latency"] > sample_period:
+			print >> sys.stderr, "interval at %.3f published %.3f s after it was read, longer than the sample period" % (reading["time"], reading["latency"])
+	return count, worst
+
+# Run in standalone script mode
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Publishes per core power estimates while perf_collector.py or perf stat -I is running")
+	parser.add_argument("counters", help="perf_collector.py records (counters.bin) or perf stat -x , -I -a -A output being written, or - for stdin")
+	parser.add_argument("microarch", help="microarchitecture name for McPAT config and counter mapping")
+	parser.add_argument("sample_period", help="sample interval in seconds", type=float)
+	parser.add_argument("TSC_FREQUENCY", help="Freqeuncy of the internal TSC", type=int)
+	parser.add_argument("NUM_CORES", help="Number of physical cores", type=int)
+	parser.add_argument("THREADS_PER_CORE", help="Threads per physical core", type=int)
+	parser.add_argument("--output", help="append the readings to this file instead of stdout")
+	parser.add_argument("--latest", help="also keep the latest reading in this file")
+	parser.add_argument("--start-time", help="time stamp of sample time 0 (default: now)", type=float)
+	parser.add_argument("--no-follow", help="stop at the end of the counters file instead of waiting for more", action="store_true")
+	parser.add_argument("--poll", help="seconds between checks for new samples", type=float, default=0.01)
+	parser.add_argument("--jobs", help="Concurrent McPAT processes used to build the McPAT model", type=int)
+	parser.add_argument("--surrogate", help="Use a McPAT surrogate of degree D (1 or 2) instead of the McPAT model, see process.py --mcpat-surrogate",type=int,default=0,choices=[0,1,2],metavar="D")
+	parser.add_argument("--surrogate-calibration", help="McPAT runs the surrogate is fit to",type=int,default=200,metavar="N")
+	parser.add_argument("--surrogate-check", help="Also run every N-th interval through McPAT as a spot check (0 for none)",type=int,default=100,metavar="N")
+	parser.add_argument("--surrogate-drift", help="Recalibrate the surrogate when a spot check is off by more than this relative error",type=float,default=0.05,metavar="TOL")
+	args = parser.parse_args()
+
+	START_TIME = args.start_time if args.start_time is not None else time.time()
+	if args.counters == "-":
+		samples = counter_intervals(sys.stdin, False, args.poll)
+	else:
+		# the collector may not have created the file yet
+		while not os.path.exists(args.counters) and not args.no_follow:
+			time.sleep(args.poll)
+		samples = counter_intervals(open(args.counters, 'rb'), not args.no_follow, args.poll)
+	output_f = open(args.output, 'ab') if args.output else sys.stdout
+	# only the readings go to the output, progress messages go to stderr
+	sys.stdout = sys.stderr
+	surrogate = None
+	if args.surrogate:
+		surrogate = mcpat_surrogate.SurrogateEvaluator(process.WATTWATCHER_HOME + "/mcpat_procs/" + args.microarch + ".xml", args.surrogate,
+			args.surrogate_calibration, args.surrogate_check, args.surrogate_drift)
+	try:
+		count, worst = publish(readings(samples, args.microarch, args.sample_period, START_TIME, args.TSC_FREQUENCY, args.NUM_CORES, args.THREADS_PER_CORE, args.jobs, surrogate),
+			output_f, args.latest, args.sample_period)
+		print >> sys.stderr, "%d intervals published, max latency %.3f s" % (count, worst)
+		if surrogate:
+			surrogate.report()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		if args.output:
+			output_f.close()
@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+# Memoized McPAT results
+# @date: 10/18/2026
+#
+# Idle bins and steady phases generate the same McPAT inputs over and over.
+# The McPAT results of an interval are cached under its runtime statistics,
+# each rounded to a geometric grid of ratio 1 + tolerance.  Intervals whose
+# statistics all round to the same steps share a result, so a reused result is
+# for statistics within about tolerance / 2 of the real ones.  The cache is an
+# LRU of a fixed number of results, and can be kept on disk and shared by all
+# runs on the same processor template and McPAT binary (in
+# /tmp/mcpat-$USER.results/).
+
+import os, math, json, hashlib, getpass, tempfile, threading, collections
+import stage_cache
+
+def cache_dir():
+	return os.path.join(tempfile.gettempdir(), "mcpat-" + getpass.getuser() + ".results")
+
+# Quantizes a value to the nearest step of a geometric grid of ratio 1 + tolerance
+def quantize(value, tolerance):
+	value = float(value)
+	if value == 0 or tolerance <= 0:
+		return value
+	step = int(round(math.log(abs(value)) / math.log1p(tolerance)))
+	return step if value > 0 else "-" + str(step)
+
+class McpatCache:
+
+	def __init__(self, input_proc_model, mcpatdir, tolerance, size, persist=False):
+		self.tolerance = tolerance
+		self.size = size
+		self.entries = collections.OrderedDict()
+		# keys being evaluated, and the event set once they are
+		self.pending = {}
+		self.lock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+		self.path = None
+		if persist:
+			h = hashlib.sha1()
+			with open(input_proc_model, 'rb') as f:
+				h.update(f.read())
+			# results of an earlier McPAT build are not reused
+			h.update(stage_cache.file_hash(mcpatdir + "/mcpat"))
+			h.update(repr(tolerance))
+			self.path = os.path.join(cache_dir(), h.hexdigest() + ".json")
+			for key, value in self.read().iteritems():
+				self.entries[key] = value
+			self.evict()
+
+	# updates is a list of (component id, "stat" or "param", name, value), see generate_mcpat.mcpat_updates
+	def key(self, updates):
+		return hashlib.sha1(repr([(u[0], u[1], u[2], quantize(u[3], self.tolerance)) for u in updates])).hexdigest()
+
+	def evict(self):
+		while len(self.entries) > self.size:
+			self.entries.popitem(last=False)
+
+	# Returns the cached result of the updates, or evaluate(updates) if there is none.
+	# Concurrent lookups of a key that is being evaluated wait for that result.
+	def evaluate(self, updates, evaluate):
+		key = self.key(updates)
+		while True:
+			with self.lock:
+				value = self.entries.pop(key, None)
+				if value is not None:
+					self.entries[key] = value
+					self.hits += 1
+					return value
+				pending = self.pending.get(key)
+				if pending is None:
+					self.misses += 1
+					pending = self.pending[key] = threading.Event()
+					break
+			pending.wait()
+		try:
+			value = evaluate(updates)
+			with self.lock:
+				self.entries[key] = value
+				self.evict()
+		finally:
+			with self.lock:
+				del self.pending[key]
+			pending.set()
+		return value
+
+	def read(self):
+		if not os.path.isfile(self.path):
+			return {}
+		with open(self.path, 'rb') as f:
+			return json.load(f, object_pairs_hook=collections.OrderedDict)
+
+	# Merges the cached results into the ones saved by other runs since this one started
+	def save(self):
+		if not self.path:
+			return
+		if not os.path.isdir(cache_dir()):
+			os.makedirs(cache_dir())
+		with self.lock:
+			entries = self.read()
+			for key, value in self.entries.iteritems():
+				entries.pop(key, None)
+				entries[key] = value
+			while len(entries) > self.size:
+				entries.popitem(last=False)
+			tmp = self.path + "." + str(os.getpid())
+			with open(tmp, 'wb') as f:
+				json.dump(entries, f)
+			os.rename(tmp, self.path)
+
+	def report(self):
+		lookups = self.hits + self.misses
+		print "McPAT result cache: %d hits, %d misses (%.1f%% hit rate), %d results cached" % (self.hits, self.misses,
+			100.0 * self.hits / lookups if lookups else 0.0, len(self.entries))
@@ -0,0 +1,241 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+# Static/runtime split of McPAT
+# @date: 10/18/2026
+#
+# Area, peak power and leakage only depend on the hardware constants in the
+# processor template.  Runtime dynamic power is per access energy times access
+# counts, plus pipeline terms scaled by products of duty cycles.  So for a given
+# template, clock and bin size every McPAT output is
+#
+#   base + sum(linear[slot] * value[slot]) + sum(pair[a,b] * value[a] * value[b])
+#
+# where the pairs are the duty cycles of one component.  The coefficients are
+# extracted once by probing McPAT (one run per slot and duty cycle pair), cached
+# on disk, and then all intervals are evaluated as one matrix product.
+
+import os, sys, json, hashlib, getpass, tempfile
+import numpy
+import run_mcpat
+
+# Slots that define the time base of an interval.  They are part of the model
+# key instead of being modeled.
+FIXED_SLOTS = ("clock_rate", "total_cycles")
+
+def model_dir():
+	return os.path.join(tempfile.gettempdir(), "mcpat-" + getpass.getuser() + ".models")
+
+def is_duty_cycle(slot):
+	return slot[2].endswith("_duty_cycle")
+
+# Flattens a parsed McPAT output into {"Component[#index]/path": value}
+def flatten(power_dat):
+	flat = {}
+	for component, values in power_dat.iteritems():
+		if isinstance(values, list):
+			for index, item in enumerate(values):
+				for path, value in item.iteritems():
+					flat[component + "#" + str(index) + "/" + path] = value
+		else:
+			for path, value in values.iteritems():
+				flat[component + "/" + path] = value
+	return flat
+
+# Inverse of flatten
+def unflatten(outputs, row):
+	power_dat = {}
+	for name, value in zip(outputs, row):
+		component, path = name.split("/", 1)
+		if "#" in component:
+			component, index = component.split("#")
+			items = power_dat.setdefault(component, [])
+			index = int(index)
+			while len(items) <= index:
+				items.append({})
+			items[index][path] = value
+		else:
+			power_dat.setdefault(component, {})[path] = value
+	return power_dat
+
+# Turns a list of interval updates into an (intervals x slots) matrix
+def slot_values(slots, interval_updates):
+	index = dict([(tuple(s), i) for i, s in enumerate(slots)])
+	x = numpy.zeros((len(interval_updates), len(slots)))
+	for row, updates in enumerate(interval_updates):
+		for update in updates:
+			i = index.get(update[:3])
+			if i is not None:
+				x[row, i] = float(update[3])
+	return x
+
+class McpatModel:
+
+	def __init__(self, key, slots, fixed, outputs, base, linear, pairs, pair_coef):
+		self.key = key
+		self.slots = slots
+		self.fixed = fixed
+		self.outputs = outputs
+		self.base = numpy.array(base)
+		self.linear = numpy.array(linear).reshape(len(slots), len(outputs))
+		self.pairs = pairs
+		self.pair_coef = numpy.array(pair_coef).reshape(len(pairs), len(outputs))
+
+	# Identifies the model by the template contents, the time base and the runtime slots
+	@staticmethod
+	def model_key(input_proc_model, fixed, slots):
+		h = hashlib.sha1()
+		with open(input_proc_model, 'rb') as f:
+			h.update(f.read())
+		h.update(json.dumps([fixed, slots]))
+		return h.hexdigest()
+
+	@staticmethod
+	def split_updates(updates):
+		fixed = sorted([list(u) for u in updates if u[2] in FIXED_SLOTS])
+		slots = [u[:3] for u in updates if u[2] not in FIXED_SLOTS]
+		return fixed, [list(s) for s in slots]
+
+	# Probes McPAT for the coefficients of every slot and duty cycle pair
+	@classmethod
+	def build(cls, updates, mcpatdir, input_proc_model, jobs=None):
+		fixed, slots = cls.split_updates(updates)
+		key = cls.model_key(input_proc_model, fixed, slots)
+		fixed_updates = [tuple(f) for f in fixed]
+		# one access per cycle, or a fully busy unit, keeps the probe deltas well above the printed precision
+		count_probe = max([float(f[3]) for f in fixed if f[2] == "total_cycles"])
+
+		def probe_value(slot):
+			return 1.0 if is_duty_cycle(slot) else count_probe
+
+		def probe(values):
+			return fixed_updates + [(s[0], s[1], s[2], str(values.get(i, 0))) for i, s in enumerate(slots)]
+
+		pairs = []
+		for a in range(0, len(slots)):
+			for b in range(a + 1, len(slots)):
+				if is_duty_cycle(slots[a]) and is_duty_cycle(slots[b]) and slots[a][0] == slots[b][0]:
+					pairs.append([a, b])
+
+		requests = [probe({})]
+		requests += [probe({i: probe_value(s)}) for i, s in enumerate(slots)]
+		requests += [probe({a: 1.0, b: 1.0}) for a, b in pairs]
+		print "probing McPAT with", len(requests), "runs for", len(slots), "runtime slots and", len(pairs), "duty cycle pairs"
+		results = [flatten(run_mcpat.parse_mcpat_output(output)) for output in run_mcpat.mcpat_serve_all(requests, mcpatdir, input_proc_model, jobs)]
+
+		outputs = sorted(results[0].keys())
+		table = numpy.array([[result.get(name, 0.0) for name in outputs] for result in results])
+		base = table[0]
+		linear = numpy.array([(table[1 + i] - base) / probe_value(s) for i, s in enumerate(slots)])
+		pair_coef = numpy.array([table[1 + len(slots) + p] - base - linear[a] - linear[b] for p, (a, b) in enumerate(pairs)])
+		return cls(key, slots, fixed, outputs, base.tolist(), linear.tolist(), pairs, pair_coef.tolist())
+
+	@classmethod
+	def load(cls, path):
+		with open(path, 'rb') as f:
+			d = json.load(f)
+		slots = [list(s) for s in d["slots"]]
+		outputs = d["outputs"]
+		linear = numpy.zeros((len(slots), len(outputs)))
+		for i, j, c in d["linear"]:
+			linear[i, j] = c
+		pair_coef = numpy.zeros((len(d["pairs"]), len(outputs)))
+		for i, j, c in d["pair_coef"]:
+			pair_coef[i, j] = c
+		return cls(d["key"], slots, d["fixed"], outputs, d["base"], linear, d["pairs"], pair_coef)
+
+	# Only the non zero coefficients are stored, most outputs do not depend on most slots
+	def save(self, path):
+		def sparse(m):
+			return [[int(i), int(j), float(m[i, j])] for i, j in zip(*numpy.nonzero(m))]
+		d = {"key": self.key, "slots": self.slots, "fixed": self.fixed, "outputs": self.outputs,
+			"base": self.base.tolist(), "linear": sparse(self.linear), "pairs": self.pairs, "pair_coef": sparse(self.pair_coef)}
+		tmp = path + "." + str(os.getpid())
+		with open(tmp, 'wb') as f:
+			json.dump(d, f)
+		os.rename(tmp, path)
+
+	# Returns a cached model matching the template and updates, probing McPAT if there is none
+	@classmethod
+	def get(cls, updates, mcpatdir, input_proc_model, jobs=None):
+		fixed, slots = cls.split_updates(updates)
+		path = os.path.join(model_dir(), cls.model_key(input_proc_model, fixed, slots) + ".json")
+		if os.path.isfile(path):
+			print "using McPAT model", path
+			return cls.load(path)
+		model = cls.build(updates, mcpatdir, input_proc_model, jobs)
+		if not os.path.isdir(model_dir()):
+			os.makedirs(model_dir())
+		model.save(path)
+		print "saved McPAT model", path
+		return model
+
+	def values(self, interval_updates):
+		return slot_values(self.slots, interval_updates)
+
+	# All McPAT outputs of all intervals, (intervals x outputs)
+	def evaluate(self, x):
+		a = [p[0] for p in self.pairs]
+		b = [p[1] for p in self.pairs]
+		return self.base + x.dot(self.linear) + (x[:, a] * x[:, b]).dot(self.pair_coef)
+
+	def power_dat(self, interval_updates):
+		return [unflatten(self.outputs, row) for row in self.evaluate(self.values(interval_updates))]
+
+# Compares the model against full McPAT runs on a sample of intervals.
+# Returns the largest relative error of any Runtime Dynamic output.
+def validate(model, interval_updates, mcpatdir, input_proc_model, samples, jobs=None):
+	step = max(1, len(interval_updates) / samples)
+	sample = interval_updates[::step][:samples]
+	predicted = model.evaluate(model.values(sample))
+	reference = [flatten(run_mcpat.parse_mcpat_output(output)) for output in run_mcpat.mcpat_serve_all(sample, mcpatdir, input_proc_model, jobs)]
+	worst = 0.0
+	worst_name = None
+	for row, ref in enumerate(reference):
+		for j, name in enumerate(model.outputs):
+			if not name.endswith("Runtime Dynamic"):
+				continue
+			expected = ref.get(name, 0.0)
+			error = abs(predicted[row, j] - expected) / max(abs(expected), 1e-6)
+			if error > worst:
+				worst = error
+				worst_name = name
+	print "McPAT model validation on %d intervals: max relative error %.2e (%s)" % (len(sample), worst, worst_name)
+	return worst
+
+# Per core and total power of a set of intervals, see run_mcpat.interval_power
+def model_power(model, interval_updates, stats, CORES, HW_THREADS):
+	timestamps = interval_updates.keys()
+	power = {}
+	for timestamp, power_dat in zip(timestamps, model.power_dat([interval_updates[timestamp] for timestamp in timestamps])):
+		power[timestamp] = run_mcpat.interval_power(power_dat, stats, timestamp, CORES, HW_THREADS)
+	return power
+
+# Same as run_mcpat.run_mcpat_server, but McPAT is only run to build the model
+# and every interval is evaluated from it.  If validate is set, that many
+# intervals are also run through full McPAT and compared.
+def run_mcpat_model(interval_updates, mcpatdir, input_proc_model, stats, CORES, HW_THREADS, jobs=None, validate_samples=0):
+	updates = interval_updates.values()
+	model = McpatModel.get(updates[0], mcpatdir, input_proc_model, jobs)
+	if validate_samples:
+		validate(model, updates, mcpatdir, input_proc_model, validate_samples, jobs)
+	power = model_power(model, interval_updates, stats, CORES, HW_THREADS)
+	print len(updates), " intervals evaluated with the McPAT model"
+	return power
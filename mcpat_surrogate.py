@@ -0,0 +1,191 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Surrogate McPAT model
+# @date: 10/18/2026
+#
+# A regression of every McPAT output on the runtime statistics of an interval
+# (linear, or quadratic with the squares and the products of the duty cycles of
+# each component), fit to a calibration batch of real McPAT runs.  It is saved
+# per template, clock and bin size (in /tmp/mcpat-$USER.surrogates/) and used
+# for all later intervals.  Every so often an interval is also run through
+# McPAT as a spot check.  When the total runtime dynamic power of a spot check
+# is off by more than the drift threshold, the surrogate is dropped, intervals
+# go through McPAT again and the next calibration batch is used for a new fit.
+
+import os, json, getpass, tempfile, threading
+import numpy
+import mcpat_model
+
+# Relative weight of the ridge term, keeps the fit defined with fewer calibration runs than features
+RIDGE = 1e-6
+
+def surrogate_dir():
+	return os.path.join(tempfile.gettempdir(), "mcpat-" + getpass.getuser() + ".surrogates")
+
+# Total runtime dynamic power of a flattened McPAT output, the sum over the top level components
+def total_dynamic(outputs, row):
+	return sum([value for name, value in zip(outputs, row) if name.count("/") == 1 and name.endswith("/Runtime Dynamic")])
+
+class Surrogate:
+
+	def __init__(self, key, degree, slots, outputs, pairs, scale, coef):
+		self.key = key
+		self.degree = degree
+		self.slots = slots
+		self.outputs = outputs
+		self.pairs = pairs
+		self.scale = numpy.array(scale)
+		self.coef = numpy.array(coef).reshape(-1, len(outputs))
+
+	@staticmethod
+	def model_key(input_proc_model, updates, degree):
+		fixed, slots = mcpat_model.McpatModel.split_updates(updates)
+		return mcpat_model.McpatModel.model_key(input_proc_model, fixed, slots) + "-" + str(degree)
+
+	# (intervals x features) design matrix of (intervals x slots) runtime statistics
+	def design(self, x):
+		x = x / self.scale
+		columns = [numpy.ones((len(x), 1)), x]
+		if self.degree > 1:
+			a = [p[0] for p in self.pairs]
+			b = [p[1] for p in self.pairs]
+			columns += [x ** 2, x[:, a] * x[:, b]]
+		return numpy.hstack(columns)
+
+	# Least squares fit of x (intervals x slots) to the flattened McPAT outputs y (intervals x outputs)
+	@classmethod
+	def fit(cls, key, degree, slots, outputs, x, y):
+		pairs = []
+		if degree > 1:
+			for a in range(0, len(slots)):
+				for b in range(a + 1, len(slots)):
+					if mcpat_model.is_duty_cycle(slots[a]) and mcpat_model.is_duty_cycle(slots[b]) and slots[a][0] == slots[b][0]:
+						pairs.append([a, b])
+		scale = numpy.abs(x).max(axis=0)
+		scale[scale == 0] = 1
+		model = cls(key, degree, slots, outputs, pairs, scale, numpy.zeros((0, len(outputs))))
+		d = model.design(x)
+		ridge = numpy.sqrt(RIDGE * len(x)) * numpy.eye(d.shape[1])
+		model.coef = numpy.linalg.lstsq(numpy.vstack((d, ridge)), numpy.vstack((y, numpy.zeros((d.shape[1], y.shape[1])))), rcond=None)[0]
+		return model
+
+	@classmethod
+	def load(cls, path):
+		with open(path, 'rb') as f:
+			d = json.load(f)
+		return cls(d["key"], d["degree"], d["slots"], d["outputs"], d["pairs"], d["scale"], d["coef"])
+
+	def save(self, path):
+		d = {"key": self.key, "degree": self.degree, "slots": self.slots, "outputs": self.outputs,
+			"pairs": self.pairs, "scale": self.scale.tolist(), "coef": self.coef.tolist()}
+		tmp = path + "." + str(os.getpid())
+		with open(tmp, 'wb') as f:
+			json.dump(d, f)
+		os.rename(tmp, path)
+
+	def values(self, interval_updates):
+		return mcpat_model.slot_values(self.slots, interval_updates)
+
+	def evaluate(self, x):
+		return self.design(x).dot(self.coef)
+
+	def power_dat(self, interval_updates):
+		return [mcpat_model.unflatten(self.outputs, row) for row in self.evaluate(self.values(interval_updates))]
+
+# Evaluates intervals with the surrogate of their template, calibrating it from
+# real McPAT runs first and recalibrating it when a spot check drifts
+class SurrogateEvaluator:
+
+	def __init__(self, input_proc_model, degree, calibration, check_every, drift):
+		self.input_proc_model = input_proc_model
+		self.degree = degree
+		self.calibration = calibration
+		self.check_every = check_every
+		self.drift = drift
+		self.model = None
+		self.path = None
+		self.samples = []
+		self.lock = threading.Lock()
+		self.predicted = 0
+		self.mcpat_runs = 0
+		self.errors = []
+		self.fits = 0
+
+	def load(self, updates):
+		key = Surrogate.model_key(self.input_proc_model, updates, self.degree)
+		self.path = os.path.join(surrogate_dir(), key + ".json")
+		if os.path.isfile(self.path):
+			print "using McPAT surrogate", self.path
+			self.model = Surrogate.load(self.path)
+
+	# Returns the parsed McPAT output of the updates, from the surrogate or evaluate(updates)
+	def evaluate(self, updates, evaluate):
+		with self.lock:
+			if self.path is None:
+				self.load(updates)
+			model = self.model
+			if model is not None:
+				self.predicted += 1
+				check = self.check_every and self.predicted % self.check_every == 0
+		if model is not None and not check:
+			return model.power_dat([updates])[0]
+
+		power_dat = evaluate(updates)
+		flat = mcpat_model.flatten(power_dat)
+		with self.lock:
+			self.mcpat_runs += 1
+			if model is not None:
+				# spot check
+				predicted = model.evaluate(model.values([updates]))[0]
+				expected = total_dynamic(model.outputs, [flat.get(name, 0.0) for name in model.outputs])
+				error = abs(total_dynamic(model.outputs, predicted) - expected) / max(abs(expected), 1e-6)
+				self.errors.append(error)
+				if error > self.drift and self.model is model:
+					print "McPAT surrogate drifted by %.2f%% on a spot check, recalibrating" % (100 * error)
+					self.model = None
+					self.samples = []
+			elif self.model is None:
+				self.samples.append((updates, flat))
+				if len(self.samples) >= self.calibration:
+					self.refit()
+		return power_dat
+
+	def refit(self):
+		fixed, slots = mcpat_model.McpatModel.split_updates(self.samples[0][0])
+		outputs = sorted(self.samples[0][1].keys())
+		x = mcpat_model.slot_values(slots, [updates for updates, flat in self.samples])
+		y = numpy.array([[flat.get(name, 0.0) for name in outputs] for updates, flat in self.samples])
+		self.model = Surrogate.fit(os.path.basename(self.path)[:-5], self.degree, slots, outputs, x, y)
+		self.samples = []
+		self.fits += 1
+		if not os.path.isdir(surrogate_dir()):
+			os.makedirs(surrogate_dir())
+		self.model.save(self.path)
+		print "saved McPAT surrogate", self.path, "fit on", len(x), "intervals"
+
+	def report(self):
+		errors = numpy.array(self.errors)
+		print "McPAT surrogate: %d intervals predicted, %d McPAT runs, %d fits" % (self.predicted - len(errors), self.mcpat_runs, self.fits),
+		if len(errors):
+			print "- spot check error mean %.2f%%, max %.2f%% on %d checks" % (100 * errors.mean(), 100 * errors.max(), len(errors))
+		else:
+			print
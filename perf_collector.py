@@ -0,0 +1,490 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Native perf_event collector
+# @date: 10/18/2026
+#
+# Counts the events of a counter_lists/<microarch>.txt list on every cpu with
+# perf_event_open, in place of perf stat -x , -I -a -A.  The events of a cpu
+# are opened in groups of at most --group-size hardware events (the kernel
+# multiplexes the groups like perf stat does with single events), and each
+# group is read with one read() per interval.  Events of other PMUs (e.g.
+# power/energy-pkg/) are grouped per PMU on the cpus of its cpumask.
+#
+# The output is a header and one fixed size record per interval:
+#   "WWPERF01", <u32 length>, JSON {"start_time": epoch seconds of time 0,
+#       "interval": seconds, "columns": [[cpu, perf event], ...]}
+#   <f64 seconds since time 0> <f64 count of each column>...
+# Counts are scaled by time enabled / time running like perf stat does, and
+# in the unit of the event (Joules for RAPL).  NaN is an event that was not
+# counted in the interval.  Records are appended as they are read, so the
+# file can be followed while it is written (see live_power.py).
+#
+# Only the standard library is used, so this runs on the measured system as
+# is.  A ReplaySource replays a perf stat text trace through the same code on
+# machines without PMU access, see run_scripts/check_perf_collector.py.
+
+import os, re, sys, csv, json, time, errno, fcntl, struct, signal, ctypes, decimal, argparse, platform, collections
+
+MAGIC = "WWPERF01"
+
+# perf_event_attr up to config2 (PERF_ATTR_SIZE_VER1)
+class PerfEventAttr(ctypes.Structure):
+	_fields_ = [("type", ctypes.c_uint32), ("size", ctypes.c_uint32), ("config", ctypes.c_uint64),
+		("sample_period", ctypes.c_uint64), ("sample_type", ctypes.c_uint64), ("read_format", ctypes.c_uint64),
+		("flags", ctypes.c_uint64), ("wakeup_events", ctypes.c_uint32), ("bp_type", ctypes.c_uint32),
+		("config1", ctypes.c_uint64), ("config2", ctypes.c_uint64)]
+
+PERF_TYPE_HARDWARE = 0
+PERF_TYPE_SOFTWARE = 1
+PERF_TYPE_HW_CACHE = 3
+PERF_TYPE_RAW = 4
+PERF_FORMAT_TOTAL_TIME_ENABLED = 1 << 0
+PERF_FORMAT_TOTAL_TIME_RUNNING = 1 << 1
+PERF_FORMAT_GROUP = 1 << 3
+PERF_ATTR_FLAG_DISABLED = 1 << 0
+PERF_FLAG_FD_CLOEXEC = 1 << 3
+PERF_EVENT_IOC_ENABLE = 0x2400
+PERF_IOC_FLAG_GROUP = 1
+PERF_EVENT_OPEN = {"x86_64": 298, "i386": 336, "i686": 336, "aarch64": 241, "armv7l": 364, "ppc64": 319, "ppc64le": 319, "s390x": 331}
+
+HARDWARE_EVENTS = {"cycles": 0, "cpu-cycles": 0, "instructions": 1, "cache-references": 2, "cache-misses": 3,
+	"branches": 4, "branch-instructions": 4, "branch-misses": 5, "bus-cycles": 6,
+	"stalled-cycles-frontend": 7, "idle-cycles-frontend": 7, "stalled-cycles-backend": 8, "idle-cycles-backend": 8, "ref-cycles": 9}
+SOFTWARE_EVENTS = {"cpu-clock": 0, "task-clock": 1, "page-faults": 2, "faults": 2, "context-switches": 3, "cs": 3,
+	"cpu-migrations": 4, "migrations": 4, "minor-faults": 5, "major-faults": 6, "alignment-faults": 7, "emulation-faults": 8}
+CACHE_EVENT = re.compile(r"^(L1-dcache|L1-icache|LLC|dTLB|iTLB|branch|node)-(loads?|stores?|prefetch(?:es)?)(-misses)?$")
+CACHES = {"L1-dcache": 0, "L1-icache": 1, "LLC": 2, "dTLB": 3, "iTLB": 4, "branch": 5, "node": 6}
+CACHE_OPS = {"load": 0, "store": 1, "prefetch": 2}
+
+SYSFS_PMUS = "/sys/bus/event_source/devices/"
+
+# An event to open: its perf_event_attr type and configs, the divisor of its raw
+# count into its unit, the PMU whose events may share a group (None for the
+# cpu), whether it takes a hardware counter, and the cpus it is counted on
+# (None for every cpu)
+Event = collections.namedtuple("Event", ["name", "type", "config", "config1", "config2", "divisor", "pmu", "counter", "cpus"])
+
+# The cpus of a sysfs cpu list such as "0-3,8"
+def cpu_list(text):
+	cpus = []
+	for part in text.strip().split(","):
+		if "-" in part:
+			first, last = part.split("-")
+			cpus.extend(range(int(first), int(last) + 1))
+		elif part:
+			cpus.append(int(part))
+	return cpus
+
+def read_sysfs(path, default=None):
+	try:
+		with open(path, 'rb') as input_f:
+			return input_f.read().strip()
+	except IOError:
+		return default
+
+# The (config, config1, config2) of the terms of a PMU event, e.g. "event=0x02,umask=0x1",
+# placed according to the format of the PMU (e.g. format/umask is "config:8-15")
+def pmu_configs(pmu, terms):
+	configs = {"config": 0, "config1": 0, "config2": 0}
+	for term in terms.split(","):
+		name, _, value = term.partition("=")
+		value = int(value, 0) if value else 1
+		fields = read_sysfs(SYSFS_PMUS + pmu + "/format/" + name)
+		if fields is None:
+			raise ValueError("PMU " + pmu + " has no format " + name)
+		config, _, bits = fields.partition(":")
+		for bit_range in bits.split(","):
+			first, _, last = bit_range.partition("-")
+			first = int(first)
+			width = int(last) - first + 1 if last else 1
+			configs[config] |= (value & ((1 << width) - 1)) << first
+			value >>= width
+	return configs["config"], configs["config1"], configs["config2"]
+
+# Events of the perf_event_open interface of this machine
+class PerfEventSource:
+
+	def __init__(self):
+		self.libc = ctypes.CDLL(None, use_errno=True)
+		self.libc.syscall.restype = ctypes.c_long
+		self.number = PERF_EVENT_OPEN.get(platform.machine())
+		if self.number is None:
+			raise OSError("perf_event_open is not known on " + platform.machine())
+		self.fds = []
+		self.leaders = []
+		self.started = None
+		self.stopped = False
+		self.start_time = None
+
+	def cpus(self):
+		return cpu_list(read_sysfs("/sys/devices/system/cpu/online", "0"))
+
+	# The Event of a perf event name as perf stat -e takes it
+	def resolve(self, name):
+		if name in HARDWARE_EVENTS:
+			return Event(name, PERF_TYPE_HARDWARE, HARDWARE_EVENTS[name], 0, 0, 1.0, None, True, None)
+		if name in SOFTWARE_EVENTS:
+			return Event(name, PERF_TYPE_SOFTWARE, SOFTWARE_EVENTS[name], 0, 0, 1.0, None, False, None)
+		match = CACHE_EVENT.match(name)
+		if match:
+			op = [key for key in CACHE_OPS if match.group(2).startswith(key)][0]
+			config = CACHES[match.group(1)] | (CACHE_OPS[op] << 8) | ((1 if match.group(3) else 0) << 16)
+			return Event(name, PERF_TYPE_HW_CACHE, config, 0, 0, 1.0, None, True, None)
+		if re.match(r"^r[0-9a-fA-F]+$", name):
+			return Event(name, PERF_TYPE_RAW, int(name[1:], 16), 0, 0, 1.0, None, True, None)
+		if name.count("/") == 2 and name.endswith("/"):
+			pmu, terms = name[:-1].split("/")
+			pmu_type = read_sysfs(SYSFS_PMUS + pmu + "/type")
+			if pmu_type is None:
+				raise ValueError("no PMU " + pmu + " for " + name)
+			scale = 1.0
+			if "=" not in terms:
+				alias = SYSFS_PMUS + pmu + "/events/" + terms
+				scale = float(read_sysfs(alias + ".scale", "1"))
+				terms = read_sysfs(alias)
+				if terms is None:
+					raise ValueError("PMU " + pmu + " has no event " + name)
+			config, config1, config2 = pmu_configs(pmu, terms)
+			cpumask = read_sysfs(SYSFS_PMUS + pmu + "/cpumask")
+			return Event(name, int(pmu_type), config, config1, config2, 1.0 / scale, pmu, True, cpu_list(cpumask) if cpumask else None)
+		raise ValueError("unknown perf event " + name)
+
+	# Opens a group of events on a cpu, returns the group to read or None if
+	# its events are not supported.  Unsupported events are left out of the group.
+	def open_group(self, cpu, events):
+		leader = -1
+		opened = []
+		for event in events:
+			attr = PerfEventAttr(type=event.type, size=ctypes.sizeof(PerfEventAttr), config=event.config,
+				config1=event.config1, config2=event.config2,
+				read_format=PERF_FORMAT_GROUP | PERF_FORMAT_TOTAL_TIME_ENABLED | PERF_FORMAT_TOTAL_TIME_RUNNING,
+				flags=PERF_ATTR_FLAG_DISABLED if leader == -1 else 0)
+			fd = self.libc.syscall(self.number, ctypes.byref(attr), -1, cpu, leader, PERF_FLAG_FD_CLOEXEC)
+			if fd < 0:
+				error = ctypes.get_errno()
+				if error in (errno.EACCES, errno.EPERM):
+					raise OSError(error, "not allowed to count " + event.name + " on every cpu, see /proc/sys/kernel/perf_event_paranoid")
+				print >> sys.stderr, "cannot count %s on cpu %d: %s, leaving it out" % (event.name, cpu, os.strerror(error))
+				continue
+			self.fds.append(fd)
+			if leader == -1:
+				leader = fd
+				self.leaders.append(fd)
+			opened.append(event)
+		return (leader, opened) if opened else None
+
+	def enable(self):
+		for leader in self.leaders:
+			fcntl.ioctl(leader, PERF_EVENT_IOC_ENABLE, PERF_IOC_FLAG_GROUP)
+		self.started = time.time()
+		self.start_time = self.started
+
+	# The read() of a group: u64 nr, time enabled, time running, the count of each event
+	def read(self, group):
+		return os.read(group[0], 8 * (3 + len(group[1])))
+
+	# Seconds since enable()
+	def now(self):
+		return time.time() - self.started
+
+	# Sleeps until deadline (seconds since enable()), returns False once stop() was called
+	def wait(self, deadline):
+		while not self.stopped:
+			left = deadline - self.now()
+			if left <= 0:
+				return True
+			time.sleep(left)
+		return False
+
+	def stop(self):
+		self.stopped = True
+
+	def close(self):
+		for fd in reversed(self.fds):
+			os.close(fd)
+		self.fds = []
+		self.leaders = []
+
+# Replays a perf stat -x , -I -a -A trace (as process.py reads it) as if its
+# counts were read from the PMU, for machines without PMU access.  The trace
+# is replayed as fast as it is read.  Values with decimals are counted in
+# millionths, so the replayed counts are exactly those of the trace; an event
+# that was <not counted> leaves the time running of its whole group unchanged.
+class ReplaySource:
+
+	def __init__(self, trace):
+		self.times = []
+		self.intervals = []
+		self.start_time = 0.0
+		self.event_cpus = collections.OrderedDict()
+		self.decimals = set()
+		with open(trace, 'rb') as input_f:
+			for row in csv.reader(input_f):
+				if not row:
+					continue
+				if row[0] == "START TIME":
+					self.start_time = float(row[1])
+					continue
+				if row[0] == "END TIME":
+					continue
+				if not self.times or row[0] != self.times[-1][0]:
+					# the time stamp, as a number and in nanoseconds
+					self.times.append((row[0], float(row[0]), int(decimal.Decimal(row[0]) * 1000000000)))
+					self.intervals.append({})
+				cpu = int(row[1][3:])
+				self.event_cpus.setdefault(row[-1], [])
+				if cpu not in self.event_cpus[row[-1]]:
+					self.event_cpus[row[-1]].append(cpu)
+				if "." in row[2]:
+					self.decimals.add(row[-1])
+				self.intervals[-1][(cpu, row[-1])] = row[2]
+		self.all_cpus = sorted(set(cpu for cpus in self.event_cpus.values() for cpu in cpus))
+		self.groups = []
+		self.counts = {}
+		self.next = 0
+		self.stopped = False
+
+	def cpus(self):
+		return self.all_cpus
+
+	def resolve(self, name):
+		if name not in self.event_cpus:
+			raise ValueError("no " + name + " in the replayed trace")
+		divisor = 1000000.0 if name in self.decimals else 1.0
+		cpus = self.event_cpus[name]
+		if sorted(cpus) == self.all_cpus:
+			return Event(name, PERF_TYPE_RAW, 0, 0, 0, divisor, None, True, None)
+		return Event(name, PERF_TYPE_RAW, 0, 0, 0, divisor, "replay", True, cpus)
+
+	def open_group(self, cpu, events):
+		group = (cpu, events, [0, 0])
+		self.groups.append(group)
+		return group
+
+	def enable(self):
+		pass
+
+	def read(self, group):
+		cpu, events, times = group
+		return struct.pack("<%dQ" % (3 + len(events)), len(events), times[0], times[1],
+			*[self.counts.get((cpu, event.name), 0) for event in events])
+
+	def now(self):
+		return self.times[self.next - 1][1]
+
+	# Moves on to the counts of the next interval of the trace
+	def wait(self, deadline):
+		if self.stopped or self.next == len(self.intervals):
+			return False
+		interval = self.intervals[self.next]
+		elapsed = self.times[self.next][2] - (self.times[self.next - 1][2] if self.next else 0)
+		for cpu, events, times in self.groups:
+			values = [interval.get((cpu, event.name), "0") for event in events]
+			times[0] += elapsed
+			if "<not counted>" in values:
+				continue
+			times[1] += elapsed
+			for event, value in zip(events, values):
+				scale = 1000000 if event.divisor != 1.0 else 1
+				self.counts[(cpu, event.name)] = self.counts.get((cpu, event.name), 0) + int(decimal.Decimal(value) * scale)
+		self.next += 1
+		return True
+
+	def stop(self):
+		self.stopped = True
+
+	def close(self):
+		pass
+
+# The groups to open on each cpu as [(cpu, [Event])] and the columns of the
+# records as [(cpu, event name)].  Events of the cpu are split into groups of
+# up to group_size events that take a hardware counter, events of other PMUs
+# are grouped per PMU.  Columns are ordered by cpu, then as in the event list.
+def plan_groups(source, event_names, group_size):
+	events = []
+	for name in event_names:
+		try:
+			events.append(source.resolve(name))
+		except ValueError as e:
+			print >> sys.stderr, str(e) + ", leaving it out"
+	groups = []
+	for cpu in source.cpus():
+		cpu_groups = []
+		pmu_groups = collections.OrderedDict()
+		counters = 0
+		for event in events:
+			if event.cpus is not None and cpu not in event.cpus:
+				continue
+			if event.pmu is not None:
+				pmu_groups.setdefault(event.pmu, []).append(event)
+				continue
+			if not cpu_groups or (event.counter and counters == group_size):
+				cpu_groups.append([])
+				counters = 0
+			cpu_groups[-1].append(event)
+			counters += event.counter
+		groups.extend([(cpu, group) for group in cpu_groups + pmu_groups.values()])
+	return groups
+
+# Counts the events of a list on every cpu of source and appends a record to
+# output_f every interval seconds, until the source stops.  Returns the number
+# of records.
+def collect(source, event_names, interval, output_f, group_size=4):
+	opened = []
+	for cpu, events in plan_groups(source, event_names, group_size):
+		group = source.open_group(cpu, events)
+		if group is not None:
+			opened.append((cpu, group))
+	# the columns of a cpu in the order of the event list, whatever group their events are in
+	order = dict([(name, i) for i, name in enumerate(event_names)])
+	slots = sorted([(cpu, order[event.name], n, g) for g, (cpu, group) in enumerate(opened) for n, event in enumerate(group[1])])
+	columns = [("CPU" + str(cpu), opened[g][1][1][n].name) for cpu, position, n, g in slots]
+	column_of = dict([((g, n), c) for c, (cpu, position, n, g) in enumerate(slots)])
+	placement = [[column_of[(g, n)] for n in range(0, len(group[1]))] for g, (cpu, group) in enumerate(opened)]
+	divisors = [[event.divisor for event in group[1]] for cpu, group in opened]
+
+	source.enable()
+	header = json.dumps({"start_time": source.start_time, "interval": interval, "columns": columns})
+	output_f.write(MAGIC + struct.pack("<I", len(header)) + header)
+	output_f.flush()
+	record = struct.Struct("<%dd" % (1 + len(columns)))
+	previous = [struct.unpack("<%dQ" % (3 + len(group[1])), source.read(group)) for cpu, group in opened]
+	nan = float("nan")
+	records = 0
+	deadline = interval
+	while source.wait(deadline):
+		deadline += interval
+		values = [nan] * len(columns)
+		time_stamp = source.now()
+		for g, (cpu, group) in enumerate(opened):
+			reading = struct.unpack("<%dQ" % (3 + len(group[1])), source.read(group))
+			last = previous[g]
+			previous[g] = reading
+			enabled = reading[1] - last[1]
+			running = reading[2] - last[2]
+			if running == 0:
+				continue
+			for n, column in enumerate(placement[g]):
+				value = float(reading[3 + n] - last[3 + n]) / divisors[g][n]
+				values[column] = value if running == enabled else value * enabled / running
+		output_f.write(record.pack(time_stamp, *values))
+		output_f.flush()
+		records += 1
+	return records
+
+def is_record_file(path):
+	with open(path, 'rb') as input_f:
+		return input_f.read(len(MAGIC)) == MAGIC
+
+# Reads the header of a record file, input_f is left at the first record
+def read_header(input_f):
+	if input_f.read(len(MAGIC)) != MAGIC:
+		raise ValueError("not a perf_collector.py record file")
+	length = struct.unpack("<I", input_f.read(4))[0]
+	return parse_header(input_f.read(length))
+
+# The header of a record file, with the cpu and event names as str like in perf stat output
+def parse_header(text):
+	header = json.loads(text)
+	header["columns"] = [(str(cpu), str(event)) for cpu, event in header["columns"]]
+	return header
+
+def record_size(header):
+	return 8 * (1 + len(header["columns"]))
+
+# Yields the bytes of up to chunk_size whole records at a time.  A partial
+# record at the end (still being written) is left out.
+def record_chunks(input_f, header, chunk_size):
+	size = record_size(header)
+	while True:
+		data = input_f.read(size * chunk_size)
+		data = data[:len(data) - len(data) % size]
+		if not data:
+			return
+		yield data
+
+# Seconds since time 0 of the last record of a record file, None if it has none
+def last_time(path):
+	with open(path, 'rb') as input_f:
+		header = read_header(input_f)
+		first = input_f.tell()
+		input_f.seek(0, os.SEEK_END)
+		records = (input_f.tell() - first) // record_size(header)
+		if not records:
+			return None
+		input_f.seek(first + (records - 1) * record_size(header))
+		return struct.unpack("<d", input_f.read(8))[0]
+
+# Yields (header, time stamp, values) of every record of a file that may still be
+# written to, after the magic string was read from it.  At the end of the file,
+# waits for more if follow is set.
+def follow_records(input_f, follow, poll):
+	def read(size):
+		data = ""
+		while len(data) < size:
+			more = input_f.read(size - len(data))
+			if more:
+				data += more
+			elif follow:
+				time.sleep(poll)
+				# clears the end of file of the stream, to see what was written since
+				input_f.seek(0, os.SEEK_CUR)
+			else:
+				return None
+		return data
+	length = read(4)
+	header = parse_header(read(struct.unpack("<I", length)[0])) if length else None
+	if header is None:
+		return
+	record = struct.Struct("<%dd" % (1 + len(header["columns"])))
+	while True:
+		data = read(record.size)
+		if data is None:
+			return
+		values = record.unpack(data)
+		yield header, values[0], values[1:]
+
+# Run in standalone script mode
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Counts the events of a counter list on every cpu, in place of perf stat -I -a -A")
+	parser.add_argument("counter_list", help="counter mapping, e.g. $WATTWATCHER_HOME/counter_lists/haswell.txt")
+	parser.add_argument("sample_period", help="sample interval in seconds", type=float)
+	parser.add_argument("--output", help="record file to write (default: counters.bin)", default="counters.bin")
+	parser.add_argument("--group-size", help="Hardware events per group, at most the counters of a cpu", type=int, default=4)
+	parser.add_argument("--replay", help="replay this perf stat -x , -I -a -A trace instead of counting events", metavar="TRACE")
+	args = parser.parse_args()
+
+	event_names = []
+	with open(args.counter_list, 'rb') as input_f:
+		for row in csv.reader(input_f):
+			if row and row[0] and not row[0].startswith('#'):
+				event_names.append(row[0])
+	source = ReplaySource(args.replay) if args.replay else PerfEventSource()
+	# the record being read is finished before stopping
+	signal.signal(signal.SIGTERM, lambda signum, frame: source.stop())
+	signal.signal(signal.SIGINT, lambda signum, frame: source.stop())
+	try:
+		with open(args.output, 'wb') as output_f:
+			records = collect(source, event_names, args.sample_period, output_f, args.group_size)
+	finally:
+		source.close()
+	print >> sys.stderr, "%d samples of %d events written to %s" % (records, len(event_names), args.output)
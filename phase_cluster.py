@@ -0,0 +1,107 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Representative intervals
+# @date: 10/18/2026
+#
+# Long runs spend most of their bins in a few program phases.  The bins are
+# clustered on their normalized per cpu counter rates (utilization, frequency,
+# IPC, miss rates and MPKI, see process_cntrs.py) with k-means, and McPAT is
+# only run on the bin nearest each cluster centroid.  Every other bin gets the
+# McPAT results of its representative, scaled by its own activity.  A random
+# sample of the other bins is also run through full McPAT to bound the error.
+
+import math
+import numpy
+
+METRICS = ["frequency", "ipc", "branch_miss_rate", "dcache_miss_rate", "l2_miss_rate", "l3_miss_rate", "itlb_mpki", "dtlb_mpki"]
+
+# Feature vector of one bin, stats is {cpu: {stat: value}} (see process.derive)
+def features(stats):
+	vector = []
+	for cpu, cpu_stats in stats.iteritems():
+		if cpu == "TOTAL":
+			continue
+		vector.append(cpu_stats["busy_cycles"] / cpu_stats["total_cycles"] if cpu_stats["total_cycles"] else 0.0)
+		vector += [cpu_stats.get(metric, 0.0) for metric in METRICS]
+	return vector
+
+# Scales every feature to zero mean and unit variance, in place.  Idle cpus give nan and inf rates, they count as 0.
+def normalize(X):
+	X[~numpy.isfinite(X)] = 0
+	X -= X.mean(axis=0)
+	std = X.std(axis=0)
+	std[std == 0] = 1
+	X /= std
+	return X
+
+# Squared distance of every row of X to every centroid, a chunk of rows at a time
+def distances(X, centroids, chunk=65536):
+	d = numpy.empty((len(X), len(centroids)), dtype=numpy.float64)
+	c2 = (centroids.astype(numpy.float64) ** 2).sum(axis=1)
+	for start in range(0, len(X), chunk):
+		x = X[start:start + chunk].astype(numpy.float64)
+		d[start:start + chunk] = (x ** 2).sum(axis=1)[:, None] - 2 * numpy.dot(x, centroids.T) + c2
+	return numpy.maximum(d, 0, out=d)
+
+# k-means++ seeding followed by Lloyd iterations.  Returns (centroids, labels).
+def kmeans(X, k, rng, iterations=100):
+	k = min(k, len(X))
+	centroids = [X[rng.randint(len(X))]]
+	closest = distances(X, numpy.array(centroids))[:, 0]
+	for i in range(1, k):
+		total = closest.sum()
+		if total == 0:
+			# fewer distinct bins than clusters
+			break
+		centroids.append(X[numpy.searchsorted(numpy.cumsum(closest), rng.uniform(0, total))])
+		closest = numpy.minimum(closest, distances(X, numpy.array(centroids[-1:]))[:, 0])
+	centroids = numpy.array(centroids, dtype=numpy.float64)
+	labels = None
+	for iteration in range(0, iterations):
+		new_labels = distances(X, centroids).argmin(axis=1)
+		if labels is not None and (new_labels == labels).all():
+			break
+		labels = new_labels
+		for c in range(0, len(centroids)):
+			members = X[labels == c]
+			if len(members):
+				centroids[c] = members.mean(axis=0)
+	return centroids, labels
+
+# Index of the bin nearest each centroid, and the cluster of every bin relabeled to those
+def representatives(X, centroids, labels):
+	reps = []
+	for c in range(0, len(centroids)):
+		members = numpy.flatnonzero(labels == c)
+		if len(members):
+			reps.append(members[distances(X[members], centroids[c:c + 1])[:, 0].argmin()])
+	reps = numpy.array(reps)
+	return reps, numpy.searchsorted(numpy.unique(labels), labels)
+
+# Summary of the relative errors of the sampled bins: (mean, 95% bound on the mean, max)
+def error_bounds(errors):
+	errors = numpy.asarray(errors, dtype=numpy.float64)
+	if not len(errors):
+		return float("nan"), float("nan"), float("nan")
+	mean = errors.mean()
+	bound = mean + 1.96 * errors.std(ddof=1) / math.sqrt(len(errors)) if len(errors) > 1 else float("nan")
+	return mean, bound, errors.max()
@@ -25,89 +25,167 @@ import os
 import shutil
 import sys
 import collections
+import itertools
+import multiprocessing
+import time
+from multiprocessing.pool import ThreadPool
 import process_cntrs
 import generate_mcpat
 import argparse
 import run_mcpat
+import mcpat_model
+import mcpat_cache
+import mcpat_surrogate
+import stage_cache
+import results_store
+import phase_cluster
+import instrument
+import numpy
+import stats_array
+import perf_collector
 
 WATTWATCHER_HOME = os.environ['WATTWATCHER_HOME']
-print WATTWATCHER_HOME
+
+# Samples and bins handled per NumPy batch
+CHUNK = 1024
 
 def create_total_category(stats):
     # Just for ease of use, create a TOTAL category for the sum of all cores...
-    cores = stats.keys()
-    time_stamps = stats.itervalues().next().keys()
-    all_stats = stats.itervalues().next().itervalues().next().keys()
-    stats["TOTAL"] = collections.OrderedDict()
-    for time_stamp in time_stamps:
-        stats["TOTAL"][time_stamp] = collections.OrderedDict()
-        for stat in all_stats:
-            total = 0
-            for core in cores: 
-                total += stats[core][time_stamp][stat]
-            stats["TOTAL"][time_stamp][stat] = total
+    total = {}
+    for stat in stats.events():
+        column = stats[stat]
+        total[stat] = numpy.zeros(len(stats))
+        for core in range(0, len(stats.cpus)):
+            total[stat] += column[:, core]
+    stats.add_cpu("TOTAL", total)
 
-def normalize_stats(bin_size, stats, START_TIME):
+class Rebinner:
     # Ok, so our sample rate may not be perfect, or may not be what we want to bin with.
     # We want to massage the numbers into uniform bin sizes.
-    scaled_stats = collections.OrderedDict()
-    for stat in stats.itervalues().next().keys():
-        even_bin = 1
-        even_bin_time_left = bin_size
-        even_bin_stat_value = 0
-        real_bin_time_left = 0
-        prev_time_stamp = 0
-        for time_stamp in stats.keys():
-            while real_bin_time_left > 0:
-            # If we have enough time left to fill the even bin....
-                if even_bin_time_left < real_bin_time_left:
-                    # what is left in the real_bin afterwards?
-                    next_real_bin_time_left = real_bin_time_left - even_bin_time_left
-                    next_real_bin_stat_value = ( next_real_bin_time_left / real_bin_time_left) * real_bin_stat_value
-                    # fill up the current bin
-                    even_bin_stat_value += real_bin_stat_value - next_real_bin_stat_value
-                    scaled_stats.setdefault(even_bin + START_TIME, collections.OrderedDict())[stat] = even_bin_stat_value
-                    # update the real bin and the current bin
-                    even_bin_time_left = bin_size
-                    even_bin += bin_size
-                    even_bin_stat_value = 0
-                    real_bin_time_left = next_real_bin_time_left
-                    real_bin_stat_value = next_real_bin_stat_value
-                    # We don't have enough time to fill the even bin........
-                else:
-                    even_bin_stat_value += real_bin_stat_value
-                    even_bin_time_left -= real_bin_time_left
-                    real_bin_time_left = 0
-            real_bin_stat_value = stats[time_stamp][stat]
-            real_bin_time_left = time_stamp - prev_time_stamp
-            prev_time_stamp = time_stamp
-    # might need an assert here to check the size of scaled_stats
-    return scaled_stats
+    # Each sample counts the events since the previous one, spread evenly over that interval, so
+    # the cumulative count is piecewise linear in time and a bin is the difference of the cumulative
+    # count at its two ends.  This is done for all cpus and stats at once, a chunk of samples at a time.
+    # Missing samples just make the next interval longer.  As before, a bin is only emitted once a
+    # later sample has been drained past its end, so the last sample and the trailing partial bin are dropped.
+    def __init__(self, bin_size, START_TIME):
+        self.bin_size = bin_size
+        self.START_TIME = START_TIME
+        self.prev_time_stamp = 0.0
+        # bins emitted so far, and the key of the next one (accumulated like the time stamps always were)
+        self.bins = 0
+        self.even_bin = 1
+        # count already accumulated in the open bin
+        self.partial = 0.0
+        # the last sample, drained when the next chunk arrives
+        self.pending_time = None
+        self.pending = None
 
+    # times is (time), values is (time x ...).  Returns the keys and values of the completed bins.
+    def add(self, times, values):
+        times = numpy.asarray(times, dtype=numpy.float64)
+        values = numpy.asarray(values, dtype=numpy.float64)
+        if self.pending is not None:
+            times = numpy.concatenate(([self.pending_time], times))
+            values = numpy.concatenate((self.pending[numpy.newaxis], values))
+        self.pending_time = times[-1]
+        self.pending = values[-1]
+        ends = times[:-1]
+        values = values[:-1]
+        if len(ends) == 0:
+            return numpy.zeros(0), numpy.zeros((0,) + self.pending.shape)
 
-#  So we want this function the following
-#  - Define the variables
-#    (time: refers to timestep of interest)
-#    (core: refers to core of interest) (CORE0...COREN,TOTAL)
-#    (component: refers to subcomponent in the power dictionaries
-#    (type: refers to the type of power (static,dynamic,total)
-#       - stats[core][time][stat]           
-#       - cpu_mcpat[time][component][type]
-#       - cpu_rapl[time][stat]
-#  - Move the stats from the input file to the data frame
-#  - Normalize the stats according to the bin time
-#  - Add the per core power information to the stats data frame
-def process(raw_cntr_file, output_dir,  microarch, bin_size,  TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE):
-    
-    # Format is {time:{core:{stat:value}}}
-    stats = collections.OrderedDict()
-    cpu_mcpat = collections.OrderedDict()   
-    cpu_rapl = collections.OrderedDict()
+        starts = numpy.concatenate(([self.prev_time_stamp], ends[:-1]))
+        cumulative = numpy.cumsum(values, axis=0)
+        self.prev_time_stamp = ends[-1]
 
-    START_TIME=0
-    END_TIME=0
-    
-    # translate counter events to names WattWatcher knows about
+        # the ends of the bins covered by the drained intervals
+        last = int(numpy.ceil(ends[-1] / self.bin_size)) + 1
+        bounds = numpy.arange(self.bins + 1, max(self.bins + 1, last)) * self.bin_size
+        bounds = bounds[bounds < ends[-1]]
+
+        # cumulative count at each bin end, interpolated inside the interval that contains it
+        interval = numpy.searchsorted(ends, bounds, 'left')
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            fraction = (bounds - starts[interval]) / (ends[interval] - starts[interval])
+        fraction = numpy.where(numpy.isfinite(fraction), fraction, 0)
+        fraction = fraction.reshape((len(bounds),) + (1,) * (values.ndim - 1))
+        before = numpy.concatenate((numpy.zeros((1,) + values.shape[1:]), cumulative[:-1]))
+        at_bounds = before[interval] + fraction * values[interval]
+
+        binned = numpy.diff(numpy.concatenate((numpy.zeros((1,) + values.shape[1:]), at_bounds)), axis=0)
+        if len(bounds):
+            binned[0] += self.partial
+            self.partial = cumulative[-1] - at_bounds[-1]
+        else:
+            self.partial = self.partial + cumulative[-1]
+
+        keys = numpy.cumsum(numpy.concatenate(([self.even_bin], numpy.repeat(self.bin_size, len(bounds)))))
+        self.even_bin = keys[-1]
+        self.bins += len(bounds)
+        return keys[:-1] + self.START_TIME, binned
+
+    # Same as add, for a StatsArray chunk
+    def add_stats(self, stats):
+        keys, binned = self.add(stats.times, stats.array())
+        return stats_array.StatsArray.from_array(keys, stats.cpus, stats.events(), binned)
+
+class AdaptiveBinner:
+    # Long steady phases do not need a McPAT run per bin, bursts need short bins.  So runs of uniform
+    # bins are merged into adaptive bins.  A bin joins the open run while none of its counters is
+    # further than threshold from the mean of the run, relative to that mean plus 1% of the largest
+    # count of the counter seen so far (so counters near zero do not split runs).  Otherwise, or once
+    # the run is max_bins long, the run is closed and the bin starts the next one: a change point.
+    def __init__(self, threshold, max_bins):
+        self.threshold = threshold
+        self.max_bins = max_bins
+        self.times = []
+        self.values = []
+        self.rapl = []
+        self.total = None
+        self.scale = None
+
+    # times is (time), values is (time x ...) and rapl (time x ...) or None.
+    # Returns the (times, values, rapl) of the runs closed by this chunk.
+    def add(self, times, values, rapl=None):
+        runs = []
+        for t in range(0, len(times)):
+            row = values[t]
+            self.scale = numpy.abs(row) if self.scale is None else numpy.maximum(self.scale, numpy.abs(row))
+            if self.times:
+                mean = self.total / len(self.times)
+                with numpy.errstate(divide='ignore', invalid='ignore'):
+                    change = numpy.nan_to_num(numpy.abs(row - mean) / (numpy.abs(mean) + 0.01 * self.scale)).max()
+                if change > self.threshold or len(self.times) >= self.max_bins:
+                    runs.append(self.close())
+            self.times.append(times[t])
+            self.values.append(row)
+            self.rapl.append(rapl[t] if rapl is not None else None)
+            self.total = row.copy() if self.total is None else self.total + row
+        return runs
+
+    # Closes the open run, if any
+    def flush(self):
+        return [self.close()] if self.times else []
+
+    def close(self):
+        run = (numpy.array(self.times), numpy.array(self.values), numpy.array(self.rapl) if self.rapl[0] is not None else None)
+        self.times = []
+        self.values = []
+        self.rapl = []
+        self.total = None
+        return run
+
+def normalize_stats(bin_size, stats, START_TIME):
+    # {time: {stat: value}} version of the Rebinner
+    all_stats = stats.itervalues().next().keys()
+    keys, binned = Rebinner(bin_size, START_TIME).add(stats.keys(), [[stats[time_stamp][stat] for stat in all_stats] for time_stamp in stats.keys()])
+    scaled_stats = collections.OrderedDict()
+    for key, values in zip(keys.tolist(), binned.tolist()):
+        scaled_stats[key] = collections.OrderedDict(zip(all_stats, values))
+    return scaled_stats
+
+# translate counter events to names WattWatcher knows about
+def read_stat_map(microarch):
     stat_map = {}
     with open(WATTWATCHER_HOME + "/counter_lists/" + microarch + ".txt", 'rb') as input_f:
         reader = csv.reader(input_f)
@@ -115,132 +193,597 @@ def process(raw_cntr_file, output_dir,  microarch, bin_size,  TSC_FREQUENCY, NUM
             if row:
                 if not row[0].startswith('#'):
                     stat_map[row[0]] = row[1]
-        input_f.close()
+    return stat_map
 
-    # read the stats from the file into the stats dictionary
+# perf stat output ends with the START TIME and END TIME lines marshal_perf appended to it,
+# so read them from the tail instead of the whole file.  A perf_collector.py record file
+# has the start time in its header and ends with its last record.
+def read_time_range(raw_cntr_file):
+    START_TIME = 0
+    END_TIME = 0
+    if perf_collector.is_record_file(raw_cntr_file):
+        with open(raw_cntr_file, 'rb') as input_f:
+            START_TIME = perf_collector.read_header(input_f)["start_time"]
+        last = perf_collector.last_time(raw_cntr_file)
+        return START_TIME, START_TIME + last if last is not None else 0
     with open(raw_cntr_file, 'rb') as input_f:
-        reader = csv.reader(input_f)
-        for row in reader:
-            if not row:
-                continue
-            if row[0] == "START TIME":
-                START_TIME=float(row[1])
-            elif row[0] == "END TIME":
-                END_TIME=float(row[1])
-            else:
-                translated_stat_name = stat_map[row[-1]]
-                if row[2] == "<not counted>":
-                    stats.setdefault(row[1], collections.OrderedDict()).setdefault(float(row[0]),collections.OrderedDict())[translated_stat_name] = 1
-                elif translated_stat_name == "energy_cores" or translated_stat_name == "energy_pkg" or translated_stat_name == "energy_ram" or translated_stat_name == "energy_gpu":
-                    cpu_rapl.setdefault(float(row[0]), collections.OrderedDict())[translated_stat_name] = float(row[2])
-                else:
-                    stats.setdefault(row[1], collections.OrderedDict()).setdefault(float(row[0]),collections.OrderedDict())[translated_stat_name] = float(row[2])
-    
+        input_f.seek(0, os.SEEK_END)
+        input_f.seek(max(0, input_f.tell() - 4096))
+        for row in csv.reader(input_f.read().splitlines()):
+            if row and row[0] == "START TIME":
+                START_TIME = float(row[1])
+            elif row and row[0] == "END TIME":
+                END_TIME = float(row[1])
+    return START_TIME, END_TIME
+
+RAPL_EVENTS = ("energy_cores", "energy_pkg", "energy_ram", "energy_gpu")
+
+# Adds one row of perf stat -x , -A output to the {cpu: {stat: value}} and {stat: value} RAPL energies of its sample
+def add_row(sample, rapl, row, stat_map):
+    translated_stat_name = stat_map[row[-1]]
+    if row[2] == "<not counted>":
+        sample.setdefault(row[1], collections.OrderedDict())[translated_stat_name] = 1
+    elif translated_stat_name in RAPL_EVENTS:
+        rapl[translated_stat_name] = float(row[2])
+    else:
+        sample.setdefault(row[1], collections.OrderedDict())[translated_stat_name] = float(row[2])
+
+# Builds the (StatsArray, StatsArray of the RAPL energies) of a list of samples
+# The stats include the TOTAL category.  Counters missing from a sample count as 0.
+def samples_array(times, samples, rapl, cpus, events, rapl_events):
+    values = numpy.array([[[sample.get(cpu, {}).get(event, 0) for event in events] for cpu in cpus] for sample in samples])
+    rapl_values = numpy.array([[energies.get(event, 0) for event in rapl_events] for energies in rapl])
+    return stats_arrays(times, cpus, events, values, rapl_events, rapl_values)
+
+# Same as samples_array, from a (time x cpu x event) array of the counters and a (time x RAPL event) array of the energies
+def stats_arrays(times, cpus, events, values, rapl_events, rapl_values):
+    stats = stats_array.StatsArray(times, cpus)
+    for i, event in enumerate(events):
+        stats[event] = values[:, :, i]
     create_total_category(stats)
-    
-    # test for the existance of RAPL,FP,and L3 cache
+    cpu_rapl = stats_array.StatsArray(times, ["RAPL"])
+    for i, event in enumerate(rapl_events):
+        cpu_rapl[event] = rapl_values[:, i:i + 1]
+    return stats, cpu_rapl
+
+# test for the existance of RAPL,FP,and L3 cache in the events and RAPL events of the first sample
+# Returns RAPL_AVAIL, L3_AVAIL, FP_AVAIL
+def available(first_sample, rapl_events):
     RAPL_AVAIL = 0
     L3_AVAIL = 0
     FP_AVAIL = 0
-    if "energy_cores" in stats.itervalues().next().itervalues().next():
+    # the RAPL power is computed from both package and core energies
+    if "energy_cores" in rapl_events and "energy_pkg" in rapl_events:
         RAPL_AVAIL = 1
-    if "l3_misses" in stats.itervalues().next().itervalues().next():
+    if "l3_misses" in first_sample:
         L3_AVAIL = 1
-    if "fp_uops_executed" in stats.itervalues().next().itervalues().next():
+    if "fp_uops_executed" in first_sample:
         L3_AVAIL = 1
-    
-    # smooth based on the requested_bin_size
-    for core in stats.keys():
-        stats[core] = normalize_stats(bin_size,stats[core],START_TIME)
-    if RAPL_AVAIL:
-        cpu_rapl = normalize_stats(bin_size,cpu_rapl,START_TIME)
-
-    # for each core, compute the derived stats
-    for core in stats.keys(): 
-        for time_stamp in stats[core].keys():
-
-            # compute derived statistics for each core (and in total)
-            if core == "TOTAL":
-                process_cntrs.process_cntrs(stats[core][time_stamp], L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES * THREADS_PER_CORE)
+    return RAPL_AVAIL, L3_AVAIL, FP_AVAIL
+
+# Yields the perf samples in chunks of up to chunk_size as (StatsArray, StatsArray of the RAPL energies)
+# The stats of every chunk include the TOTAL category.  Counters missing from a sample count as 0.
+def read_samples(raw_cntr_file, stat_map, chunk_size):
+    if perf_collector.is_record_file(raw_cntr_file):
+        for chunk in read_records(raw_cntr_file, stat_map, chunk_size):
+            yield chunk
+        return
+    cpus = None
+    events = None
+    rapl_events = None
+    times = []
+    samples = []
+    rapl = []
+    with open(raw_cntr_file, 'rb') as input_f:
+        reader = csv.reader(input_f)
+        sample_time = None
+        for row in reader:
+            if not row or row[0] == "START TIME" or row[0] == "END TIME":
+                continue
+            time_stamp = float(row[0])
+            if time_stamp != sample_time:
+                if samples and cpus is None:
+                    cpus = samples[0].keys()
+                    events = samples[0].itervalues().next().keys()
+                    rapl_events = rapl[0].keys()
+                if len(times) == chunk_size:
+                    yield samples_array(times, samples, rapl, cpus, events, rapl_events)
+                    times = []
+                    samples = []
+                    rapl = []
+                sample_time = time_stamp
+                times.append(time_stamp)
+                samples.append(collections.OrderedDict())
+                rapl.append(collections.OrderedDict())
+            add_row(samples[-1], rapl[-1], row, stat_map)
+        if times:
+            if cpus is None:
+                cpus = samples[0].keys()
+                events = samples[0].itervalues().next().keys()
+                rapl_events = rapl[0].keys()
+            yield samples_array(times, samples, rapl, cpus, events, rapl_events)
+
+# read_samples of a perf_collector.py record file.  The columns are placed like add_row places the
+# rows of perf stat output: the last column of a cpu and counter wins, and not counted (NaN) is 1.
+def read_records(raw_cntr_file, stat_map, chunk_size):
+    with open(raw_cntr_file, 'rb') as input_f:
+        header = perf_collector.read_header(input_f)
+        cpus = collections.OrderedDict()
+        rapl_events = collections.OrderedDict()
+        for cpu, event in header["columns"]:
+            translated_stat_name = stat_map[event]
+            if translated_stat_name in RAPL_EVENTS:
+                rapl_events[translated_stat_name] = None
             else:
-                process_cntrs.process_cntrs(stats[core][time_stamp], L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, 0 )
+                cpus.setdefault(cpu, collections.OrderedDict())[translated_stat_name] = None
+        # the counters of the first cpu, like the events of the first sample
+        events = cpus.values()[0].keys() if cpus else []
+        cpu_index = dict([(cpu, i) for i, cpu in enumerate(cpus)])
+        event_index = dict([(event, i) for i, event in enumerate(events)])
+        rapl_index = dict([(event, i) for i, event in enumerate(rapl_events)])
+        # the counters are gathered from the record columns, the last index being a column of zeros
+        zero = 1 + len(header["columns"])
+        gather = numpy.empty((len(cpus), len(events)), dtype=int)
+        gather[:] = zero
+        rapl_gather = numpy.empty(len(rapl_events), dtype=int)
+        rapl_gather[:] = zero
+        for column, (cpu, event) in enumerate(header["columns"]):
+            translated_stat_name = stat_map[event]
+            if translated_stat_name in RAPL_EVENTS:
+                rapl_gather[rapl_index[translated_stat_name]] = 1 + column
+            elif translated_stat_name in event_index:
+                gather[cpu_index[cpu], event_index[translated_stat_name]] = 1 + column
+        for data in perf_collector.record_chunks(input_f, header, chunk_size):
+            records = numpy.frombuffer(data, dtype='<f8').reshape(-1, zero)
+            records = numpy.hstack((numpy.where(numpy.isnan(records), 1.0, records), numpy.zeros((len(records), 1))))
+            yield stats_arrays(records[:, 0], cpus.keys(), events, records[:, gather], rapl_events.keys(), records[:, rapl_gather])
 
-    if RAPL_AVAIL:
-        for time_stamp in cpu_rapl.keys():
+# Yields the uniform bins of every chunk of samples as (StatsArray, StatsArray of the RAPL energies)
+def rebin(chunks, bin_size, START_TIME, RAPL_AVAIL):
+    rebinner = Rebinner(bin_size, START_TIME)
+    rapl_rebinner = Rebinner(bin_size, START_TIME)
+    for stats, cpu_rapl in chunks:
+        bins = rebinner.add_stats(stats)
+        if RAPL_AVAIL:
+            rapl_bins = rapl_rebinner.add_stats(cpu_rapl)
+        else:
+            rapl_bins = None
+        if len(bins):
+            yield bins, rapl_bins
+
+# Merges the rebinned chunks into adaptive bins, see AdaptiveBinner.  Yields (stats, cpu_rapl) chunks
+# of the adaptive bins: each is stamped with the time of its last uniform bin and holds the mean of
+# their counts, so it still covers bin_size.  If runs is set (a deque), (stats, cpu_rapl, lengths) of
+# the uniform bins of each yielded chunk are appended to it, lengths being the uniform bins per adaptive bin.
+def adaptive(chunks, threshold, max_bins, runs=None):
+    binner = AdaptiveBinner(threshold, max_bins)
+    counts = [0, 0]
+    def merged(closed, stats, cpu_rapl):
+        lengths = [len(run_times) for run_times, run_values, run_rapl in closed]
+        times = numpy.array([run_times[-1] for run_times, run_values, run_rapl in closed])
+        means = numpy.array([run_values.mean(axis=0) for run_times, run_values, run_rapl in closed])
+        bins = stats_array.StatsArray.from_array(times, stats.cpus, stats.events(), means)
+        rapl_bins = None
+        if cpu_rapl is not None:
+            rapl_bins = stats_array.StatsArray.from_array(times, cpu_rapl.cpus, cpu_rapl.events(), numpy.array([run_rapl.mean(axis=0) for run_times, run_values, run_rapl in closed]))
+        if runs is not None:
+            member_times = numpy.concatenate([run_times for run_times, run_values, run_rapl in closed])
+            members = stats_array.StatsArray.from_array(member_times, stats.cpus, stats.events(), numpy.concatenate([run_values for run_times, run_values, run_rapl in closed]))
+            member_rapl = None
+            if cpu_rapl is not None:
+                member_rapl = stats_array.StatsArray.from_array(member_times, cpu_rapl.cpus, cpu_rapl.events(), numpy.concatenate([run_rapl for run_times, run_values, run_rapl in closed]))
+            runs.append((members, member_rapl, lengths))
+        counts[0] += len(lengths)
+        counts[1] += sum(lengths)
+        return bins, rapl_bins
+    stats = cpu_rapl = None
+    for stats, cpu_rapl in chunks:
+        closed = binner.add(stats.times, stats.array(), cpu_rapl.array() if cpu_rapl is not None else None)
+        if closed:
+            yield merged(closed, stats, cpu_rapl)
+    closed = binner.flush()
+    if closed:
+        yield merged(closed, stats, cpu_rapl)
+    print "%d adaptive bins for %d uniform bins" % (counts[0], counts[1])
+
+# Computes the derived stats of each chunk of bins, and merges the HW threads of each physical core
+# Yields (stats, cpu_rapl, cores) for every chunk
+def derive_chunks(chunks, L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE):
+    for stats, cpu_rapl in chunks:
+        # compute derived statistics for each core (and in total)
+        process_cntrs.process_cntrs(stats, L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, [NUM_CORES * THREADS_PER_CORE if core == "TOTAL" else 0 for core in stats.cpus])
+        cores = generate_mcpat.merge_threads(stats, NUM_CORES, NUM_CORES * THREADS_PER_CORE)
+        if cpu_rapl is not None:
             # Create a power category from energy and bin_size
-            cpu_rapl[time_stamp]["power_pkg"] = float(cpu_rapl[time_stamp]["energy_pkg"]) / bin_size
-            cpu_rapl[time_stamp]["power_cores"] = float(cpu_rapl[time_stamp]["energy_cores"]) / bin_size
+            cpu_rapl["power_pkg"] = cpu_rapl["energy_pkg"] / bin_size
+            cpu_rapl["power_cores"] = cpu_rapl["energy_cores"] / bin_size
+        yield stats, cpu_rapl, cores
 
-    generate_mcpat.generate_mcpat(stats, output_dir + "/mcpat", WATTWATCHER_HOME + "/mcpat_procs/" + microarch + ".xml", L3_AVAIL, bin_size, NUM_CORES, NUM_CORES * THREADS_PER_CORE, TSC_FREQUENCY)
-    # run the McPAT engine 
-    cpu_mcpat = run_mcpat.run_mcpat(output_dir + "/mcpat/", WATTWATCHER_HOME + "/fast_mcpat", stats, NUM_CORES, NUM_CORES * THREADS_PER_CORE)
-    
-    
-    # Print the core stats
-    for core in stats.keys():
-        with open(output_dir + "/cntrs_processed_" + core + ".csv", 'wb') as output_f:
-            header = ["timestamp"] + stats.itervalues().next().itervalues().next().keys()
-            writer = csv.writer(output_f)
-            writer.writerow(header)
-            for time_stamp in stats.itervalues().next().keys():
-                line = [time_stamp] + stats[core][time_stamp].values()
-                writer.writerow(line)
-        output_f.close
-        
-    # Print the rapl stats
-    if RAPL_AVAIL:
-        with open(output_dir + "/rapl.csv", 'wb') as output_f:
-            header = ["timestamp"] + cpu_rapl.itervalues().next().keys()
+# Yields (time_stamp, {core: {stat: value}}, {stat: value}, [{stat: value} of each physical core]) for every bin of derive_chunks
+def derived_rows(chunks):
+    for stats, cpu_rapl, cores in chunks:
+        for t, time_stamp in enumerate(stats.times.tolist()):
+            yield time_stamp, collections.OrderedDict([(core, stats.row(t, core)) for core in stats.cpus]), cpu_rapl.row(t, "RAPL") if cpu_rapl is not None else None, [cores.row(t, core) for core in cores.cpus]
+
+def derive(chunks, L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE):
+    return derived_rows(derive_chunks(chunks, L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE))
+
+# The stats of a single bin in the {core: {time: {stat: value}}} layout the McPAT functions expect
+def bin_stats(time_stamp, stats):
+    return collections.OrderedDict([(core, {time_stamp: stats[core]}) for core in stats.keys()])
+
+# Yields (time_stamp, stats, cpu_rapl, power_dat) for every bin, in order, where power_dat is the
+# parsed McPAT output (see run_mcpat.parse_mcpat_output).  At most a few bins per McPAT job (or one
+# chunk with the model) are in flight at any time.  McPAT inputs are handed over in memory; with
+# dump_xml they are also written to <output_dir>/mcpat/config_<N>.xml.
+# McPAT results are looked up in cache (a mcpat_cache.McpatCache) first, if set, and
+# predicted by surrogate (a mcpat_surrogate.SurrogateEvaluator) if set.  With stages (a stage_cache.StageCache),
+# McPAT results are stored under the McPAT input and reused by later runs.
+def mcpat_results(bins, output_dir, microarch, L3_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs, mcpat_server, use_model, validate_model, dump_xml=False, cache=None, surrogate=None, stages=None):
+    mcpatdir = WATTWATCHER_HOME + "/fast_mcpat"
+    input_proc_model = WATTWATCHER_HOME + "/mcpat_procs/" + microarch + ".xml"
+    HW_THREADS = NUM_CORES * THREADS_PER_CORE
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+
+    run_mcpat.use_cacti_seed(input_proc_model)
+    template = generate_mcpat.CompiledTemplate(input_proc_model)
+    # every interval updates the same slots, so their positions are resolved once
+    positions = []
+    def updates(stats, cores):
+        with instrument.timer("generate_mcpat.mcpat_updates"):
+            return generate_mcpat.mcpat_updates(stats["TOTAL"], cores, L3_AVAIL, bin_size, NUM_CORES, HW_THREADS, TSC_FREQUENCY)
+    def fill(interval_updates):
+        if not positions:
+            positions.append(template.resolve(interval_updates))
+        return template.fill(interval_updates, positions[0])
+
+    shutil.rmtree(output_dir + "/mcpat", ignore_errors=True)
+    if dump_xml:
+        os.makedirs(output_dir + "/mcpat")
+    def dumped(bins):
+        for file_num, (time_stamp, stats, cpu_rapl, cores) in enumerate(bins):
+            interval_updates = updates(stats, cores)
+            if file_num == 0:
+                # every interval has the params of the first one, McPAT reads them from a compiled template
+                run_mcpat.use_compiled_template(template, interval_updates, mcpatdir)
+            if dump_xml:
+                with open(output_dir + "/mcpat/config_" + str(file_num) + ".xml", 'wb') as output_f:
+                    output_f.write(fill(interval_updates))
+            yield time_stamp, stats, cpu_rapl, interval_updates
+    requests = dumped(bins)
+
+    if use_model:
+        # evaluate the intervals a chunk at a time from the per access energies extracted from McPAT
+        model = None
+        while True:
+            chunk = list(itertools.islice(requests, CHUNK))
+            if not chunk:
+                break
+            interval_updates = [request_updates for time_stamp, stats, cpu_rapl, request_updates in chunk]
+            if model is None:
+                model = mcpat_model.McpatModel.get(interval_updates[0], mcpatdir, input_proc_model, jobs)
+                if validate_model:
+                    mcpat_model.validate(model, interval_updates, mcpatdir, input_proc_model, validate_model, jobs)
+            for (time_stamp, stats, cpu_rapl, request_updates), power_dat in zip(chunk, model.power_dat(interval_updates)):
+                yield time_stamp, stats, cpu_rapl, power_dat
+        return
+
+    if stages:
+        mcpat_hash = stage_cache.file_hash(mcpatdir + "/mcpat")
+    pool = ThreadPool(processes=jobs)
+    servers = None
+    try:
+        if mcpat_server:
+            # stream the runtime stats of each interval to long-lived McPAT servers
+            servers = run_mcpat.McpatServerPool(mcpatdir, input_proc_model, jobs)
+            def evaluate(interval_updates):
+                return servers.evaluate(interval_updates)
+        else:
+            # run McPAT once per interval on the filled template, piped to its stdin
+            def evaluate(interval_updates):
+                return run_mcpat.mcpat_pipe(fill(interval_updates), mcpatdir, run_mcpat.mcpat_threads(jobs))
+        def mcpat_power_dat(interval_updates):
+            if stages:
+                return stages.evaluate("mcpat", stage_cache.key(mcpat_hash, fill(interval_updates)), lambda: run_mcpat.parse_mcpat_output(evaluate(interval_updates)))
+            return run_mcpat.parse_mcpat_output(evaluate(interval_updates))
+        def cached_power_dat(interval_updates):
+            if cache:
+                return cache.evaluate(interval_updates, mcpat_power_dat)
+            return mcpat_power_dat(interval_updates)
+        def run(request):
+            time_stamp, stats, cpu_rapl, interval_updates = request
+            if surrogate:
+                power_dat = surrogate.evaluate(interval_updates, cached_power_dat)
+            else:
+                power_dat = cached_power_dat(interval_updates)
+            return time_stamp, stats, cpu_rapl, power_dat
+        for result in run_mcpat.bounded_imap(pool, run, requests, 2 * jobs):
+            yield result
+    finally:
+        pool.close()
+        pool.join()
+        if servers:
+            servers.close()
+
+# Yields (time_stamp, stats, cpu_rapl, cpu_mcpat) for every bin, in order, see mcpat_results
+def evaluate_mcpat(bins, output_dir, microarch, L3_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs, mcpat_server, use_model, validate_model, dump_xml=False, cache=None, surrogate=None, stages=None):
+    results = mcpat_results(bins, output_dir, microarch, L3_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs, mcpat_server, use_model, validate_model, dump_xml, cache, surrogate, stages)
+    for time_stamp, stats, cpu_rapl, power_dat in results:
+        yield time_stamp, stats, cpu_rapl, run_mcpat.interval_power(power_dat, bin_stats(time_stamp, stats), time_stamp, NUM_CORES, NUM_CORES * THREADS_PER_CORE)
+
+# Yields (time_stamp, stats, cpu_rapl, cpu_mcpat) for every bin like evaluate_mcpat, but only runs McPAT on the bin
+# nearest the centroid of each of num_clusters phases and on validate randomly sampled bins, see phase_cluster.py.
+# The other bins get the McPAT results of their phase.  bins streams the derived bins once, rebins() streams them again.
+def cluster_mcpat(bins, rebins, num_clusters, validate, seed, output_dir, microarch, L3_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs, mcpat_server, use_model, validate_model, dump_xml=False, cache=None, surrogate=None, stages=None):
+    HW_THREADS = NUM_CORES * THREADS_PER_CORE
+    def total_power(power_dat, time_stamp, stats):
+        power = run_mcpat.interval_power(power_dat, bin_stats(time_stamp, stats), time_stamp, NUM_CORES, HW_THREADS)
+        return sum(power["TOTAL"]["dynamic"].values()) + power["TOTAL"]["static"]
+
+    # features of every bin, a chunk at a time
+    X = []
+    rows = []
+    for time_stamp, stats, cpu_rapl, cores in bins:
+        rows.append(phase_cluster.features(stats))
+        if len(rows) == CHUNK:
+            X.append(numpy.array(rows, dtype=numpy.float32))
+            rows = []
+    if rows:
+        X.append(numpy.array(rows, dtype=numpy.float32))
+    if not X:
+        return
+    X = phase_cluster.normalize(numpy.concatenate(X))
+
+    rng = numpy.random.RandomState(seed)
+    centroids, labels = phase_cluster.kmeans(X, num_clusters, rng)
+    reps, labels = phase_cluster.representatives(X, centroids, labels)
+    others = numpy.setdiff1d(numpy.arange(len(X)), reps)
+    sampled = set(rng.choice(others, min(validate, len(others)), replace=False).tolist() if len(others) else [])
+    wanted = set(reps.tolist()) | sampled
+    evaluated = sorted(wanted)
+
+    # full McPAT runs of the representatives and the sampled bins
+    power_dats = {}
+    sampled_stats = []
+    selected = (b for i, b in enumerate(rebins()) if i in wanted)
+    results = mcpat_results(selected, output_dir, microarch, L3_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs, mcpat_server, use_model, validate_model, dump_xml, cache, surrogate, stages)
+    for i, (time_stamp, stats, cpu_rapl, power_dat) in itertools.izip(evaluated, results):
+        power_dats[i] = power_dat
+        if i in sampled:
+            sampled_stats.append((i, time_stamp, stats))
+
+    errors = []
+    for i, time_stamp, stats in sampled_stats:
+        exact = total_power(power_dats[i], time_stamp, stats)
+        estimate = total_power(power_dats[reps[labels[i]]], time_stamp, stats)
+        errors.append(abs(estimate - exact) / exact if exact else 0.0)
+    mean, bound, worst = phase_cluster.error_bounds(errors)
+    print "%d phases, %d McPAT runs for %d intervals" % (len(reps), len(evaluated), len(X))
+    print "total power error on %d sampled intervals: mean %.2f%% (95%% bound %.2f%%), max %.2f%%" % (len(errors), 100 * mean, 100 * bound, 100 * worst)
+
+    for i, (time_stamp, stats, cpu_rapl, cores) in enumerate(rebins()):
+        power_dat = power_dats[i] if i in power_dats else power_dats[reps[labels[i]]]
+        yield time_stamp, stats, cpu_rapl, run_mcpat.interval_power(power_dat, bin_stats(time_stamp, stats), time_stamp, NUM_CORES, HW_THREADS)
+
+# Expands the McPAT results of adaptive bins back to the uniform bins they merge (see adaptive), runs is the
+# deque adaptive filled.  Yields (time_stamp, stats, cpu_rapl, cpu_mcpat) of every uniform bin, with its own stats
+# and the McPAT results of its adaptive bin.
+def expand_bins(results, runs, L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE):
+    members = None
+    lengths = iter([])
+    for time_stamp, stats, cpu_rapl, power_dat in results:
+        length = next(lengths, None)
+        if length is None:
+            member_stats, member_rapl, run_lengths = runs.popleft()
+            members = derive([(member_stats, member_rapl)], L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE)
+            lengths = iter(run_lengths)
+            length = lengths.next()
+        for member_time, member_stats, member_rapl, cores in itertools.islice(members, length):
+            yield member_time, member_stats, member_rapl, run_mcpat.interval_power(power_dat, bin_stats(member_time, member_stats), member_time, NUM_CORES, NUM_CORES * THREADS_PER_CORE)
+
+# Writes each row to all of writers
+class TeeWriter:
+    def __init__(self, writers):
+        self.writers = writers
+
+    def writerow(self, row):
+        for writer in self.writers:
+            writer.writerow(row)
+
+# Writes the processed counters, RAPL and McPAT results of every bin as they arrive
+# With results_format "npy" they go to the columnar store in <output_dir>/results instead (see results_store.py), "both" writes both
+def write_results(results, output_dir, NUM_CORES, RAPL_AVAIL, results_format="csv"):
+    files = []
+    store = results_store.ResultsWriter(output_dir + "/results") if results_format != "csv" else None
+    def open_csv(name, header):
+        writers = []
+        if results_format != "npy":
+            output_f = open(output_dir + "/" + name, 'wb')
+            files.append(output_f)
             writer = csv.writer(output_f)
             writer.writerow(header)
-            for time_stamp in cpu_rapl.keys():
-                line = [time_stamp] + cpu_rapl[time_stamp].values()
-                writer.writerow(line)
-            output_f.close
+            writers.append(writer)
+        if store:
+            writers.append(store.table(name[:-len(".csv")], header))
+        return writers[0] if len(writers) == 1 else TeeWriter(writers)
+    bins = 0
+    try:
+        for time_stamp, stats, cpu_rapl, cpu_mcpat in results:
+            if bins == 0:
+                # Print the core stats
+                header = ["timestamp"] + stats.itervalues().next().keys()
+                core_writers = collections.OrderedDict([(core, open_csv("cntrs_processed_" + core + ".csv", header)) for core in stats.keys()])
+                # Print the rapl stats
+                if RAPL_AVAIL:
+                    rapl_writer = open_csv("rapl.csv", ["timestamp"] + cpu_rapl.keys())
+                # Print the McPat stats, and massage for idle vs active
+                mcpat_writers = []
+                for core in range(0,NUM_CORES):
+                    components = cpu_mcpat["CPU0"]["dynamic"].keys()
+                    mcpat_writers.append(open_csv("mcpat_" + str(core) + ".csv", [" "] + [x + "_dynamic" for x in components] + ["static"] + ["sum"]))
+                components = cpu_mcpat["TOTAL"]["dynamic"].keys()
+                total_writer = open_csv("mcpat.csv", [" "] + [x + "_dynamic" for x in components]  + ["dynamic"] + ["static"] + ["sum"])
+            bins += 1
+
+            for core, writer in core_writers.iteritems():
+                writer.writerow([time_stamp] + stats[core].values())
+            if RAPL_AVAIL:
+                rapl_writer.writerow([time_stamp] + cpu_rapl.values())
+            for core in range(0,NUM_CORES):
+                mcpat_writers[core].writerow([time_stamp] + 
+                    cpu_mcpat["CPU" + str(core)]["dynamic"].values() + 
+                    [cpu_mcpat["CPU" + str(core)]["static"]] + 
+                    [sum(cpu_mcpat["CPU" + str(core)]["dynamic"].values()) + cpu_mcpat["CPU" + str(core)]["static"]])
+            total_writer.writerow([time_stamp] + 
+                cpu_mcpat["TOTAL"]["dynamic"].values() + 
+                [sum(cpu_mcpat["TOTAL"]["dynamic"].values())] +  
+                [cpu_mcpat["TOTAL"]["static"]] + 
+                [sum(cpu_mcpat["TOTAL"]["dynamic"].values()) + cpu_mcpat["TOTAL"]["static"]])
+    finally:
+        for output_f in files:
+            output_f.close()
+        if store:
+            store.close()
+    return bins
+
+
+#  So we want this function the following
+#  - Define the variables
+#    (time: refers to timestep of interest)
+#    (core: refers to core of interest) (CORE0...COREN,TOTAL)
+#    (component: refers to subcomponent in the power dictionaries
+#    (type: refers to the type of power (static,dynamic,total)
+#       - stats[core][stat]           
+#       - cpu_mcpat[component][type]
+#       - cpu_rapl[stat]
+#  - Stream the samples from the input file
+#  - Normalize the stats according to the bin time
+#  - Add the per core power information to each bin and write it out
+#  Each stage is a generator working on one bin at a time, so memory does not grow with the trace length
+def process(raw_cntr_file, output_dir,  microarch, bin_size,  TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs=None, mcpat_server=False, use_model=False, validate_model=0, dump_xml=False, cache_tolerance=None, cache_size=100000, cache_persist=False, num_clusters=0, cluster_validate=20, cluster_seed=0,
+            surrogate_degree=0, surrogate_calibration=200, surrogate_check=100, surrogate_drift=0.05,
+            adaptive_threshold=0, adaptive_max_bins=60, expand=False, stage_dir=None, results_format="csv", progress=0):
     
+    # time the stages, and write a progress event to stderr every progress seconds
+    instrument.start(sys.stderr if progress else None, progress)
+    stat_map = read_stat_map(microarch)
+    START_TIME, END_TIME = read_time_range(raw_cntr_file)
+
+    # read the stats from the file a chunk of samples at a time
+    chunks = read_samples(raw_cntr_file, stat_map, CHUNK)
+    try:
+        with instrument.timer("parse.first_chunk"):
+            first_chunk = chunks.next()
+    except StopIteration:
+        print "no samples in", raw_cntr_file
+        return
+    chunks = itertools.chain([first_chunk], chunks)
+    first_sample = first_chunk[0].events()
     
-    # Print the McPat stats, and massage for idle vs active
-    for core in range(0,NUM_CORES):
-        with open(output_dir + "/mcpat_" + str(core) + ".csv", 'wb') as output_f:
-            writer = csv.writer(output_f)
-            components = cpu_mcpat.itervalues().next()["CPU0"]["dynamic"].keys()
-            total_header = [" "] + [x + "_dynamic" for x in components] + ["static"] + ["sum"]
-            writer.writerow(total_header)
-            times = cpu_mcpat.keys()
-            times.sort()
-            for time in times:
-                writer.writerow([time] + 
-				cpu_mcpat[time]["CPU" + str(core)]["dynamic"].values() + 
-				[cpu_mcpat[time]["CPU" + str(core)]["static"]] + 
-				[sum(cpu_mcpat[time]["CPU" + str(core)]["dynamic"].values()) + cpu_mcpat[time]["CPU" + str(core)]["static"]])
-            output_f.close()
+    RAPL_AVAIL, L3_AVAIL, FP_AVAIL = available(first_sample, first_chunk[1].events())
+    
+    # reuse the stages of earlier runs whose inputs did not change
+    stages = None
+    if stage_dir:
+        stages = stage_cache.StageCache(stage_dir)
+        rebin_key = stage_cache.key(stage_cache.file_hash(raw_cntr_file), sorted(stat_map.items()), bin_size, START_TIME, RAPL_AVAIL, adaptive_threshold, adaptive_max_bins)
+        derive_key = stage_cache.key(rebin_key, L3_AVAIL, FP_AVAIL, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE)
 
-    with open(output_dir + "/mcpat.csv", 'wb') as output_f:
-        writer = csv.writer(output_f)
-	components = cpu_mcpat.itervalues().next()["TOTAL"]["dynamic"].keys()
-        total_header = [" "] + [x + "_dynamic" for x in components]  + ["dynamic"] + ["static"] + ["sum"]
-        writer.writerow(total_header)
-        times = cpu_mcpat.keys()
-        times.sort()
-        for time in times:
-            writer.writerow([time] + 
-			    cpu_mcpat[time]["TOTAL"]["dynamic"].values() + 
-			    [sum(cpu_mcpat[time]["TOTAL"]["dynamic"].values())] +  
-			    [cpu_mcpat[time]["TOTAL"]["static"]] + 
-			    [sum(cpu_mcpat[time]["TOTAL"]["dynamic"].values()) + cpu_mcpat[time]["TOTAL"]["static"]])
-        output_f.close()
-        
+    samples = lambda chunk: len(chunk[0])
+    def derived_bins(chunks, runs=None):
+        def rebinned():
+            # smooth based on the requested_bin_size
+            bins = rebin(instrument.stage("parse", chunks, size=samples), bin_size, START_TIME, RAPL_AVAIL)
+            bins = instrument.stage("normalize_stats", bins, "parse", samples)
+
+            # merge the steady stretches into longer bins
+            if adaptive_threshold:
+                bins = instrument.stage("adaptive", adaptive(bins, adaptive_threshold, adaptive_max_bins, runs), "normalize_stats", samples)
+            return bins
+
+        # for each core, compute the derived stats
+        def derived():
+            # the uniform bins of adaptive bins are only kept while expanding them
+            bins = stages.chunks("rebin", rebin_key, rebinned) if stages and runs is None else rebinned()
+            return derive_chunks(bins, L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE)
+        bins = derived_rows(stages.chunks("derived", derive_key, derived) if stages and runs is None else derived())
+        return instrument.stage("process_cntrs", bins, "adaptive" if adaptive_threshold else "normalize_stats")
+    runs = collections.deque() if adaptive_threshold and expand else None
+    bins = derived_bins(chunks, runs)
 
+    # reuse the McPAT results of intervals with (nearly) the same stats
+    cache = None
+    if cache_tolerance is not None and not use_model:
+        cache = mcpat_cache.McpatCache(WATTWATCHER_HOME + "/mcpat_procs/" + microarch + ".xml", WATTWATCHER_HOME + "/fast_mcpat", cache_tolerance, cache_size, cache_persist)
+
+    # predict the McPAT results from a regression fit to real McPAT runs
+    surrogate = None
+    if surrogate_degree and not use_model:
+        surrogate = mcpat_surrogate.SurrogateEvaluator(WATTWATCHER_HOME + "/mcpat_procs/" + microarch + ".xml", surrogate_degree, surrogate_calibration, surrogate_check, surrogate_drift)
+
+    # run the McPAT engine 
+    if num_clusters:
+        rebins = lambda: derived_bins(read_samples(raw_cntr_file, stat_map, CHUNK))
+        results = cluster_mcpat(bins, rebins, num_clusters, cluster_validate, cluster_seed, output_dir, microarch, L3_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs, mcpat_server, use_model, validate_model, dump_xml, cache, surrogate, stages)
+    elif runs is not None:
+        results = mcpat_results(bins, output_dir, microarch, L3_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs, mcpat_server, use_model, validate_model, dump_xml, cache, surrogate, stages)
+        results = instrument.stage("mcpat", results, "process_cntrs")
+        results = instrument.stage("expand_bins", expand_bins(results, runs, L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE), "mcpat")
+    else:
+        results = evaluate_mcpat(bins, output_dir, microarch, L3_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, jobs, mcpat_server, use_model, validate_model, dump_xml, cache, surrogate, stages)
+    if runs is None:
+        results = instrument.stage("mcpat", results, "process_cntrs")
+
+    begin = time.time()
+    print write_results(results, output_dir, NUM_CORES, RAPL_AVAIL, results_format), "intervals processed"
+    instrument.finish(output_dir + "/report.json", time.time() - begin, "mcpat" if runs is None else "expand_bins")
+    print "stage times, McPAT latencies and peak memory written to", output_dir + "/report.json"
+    if cache:
+        cache.save()
+        cache.report()
+    if surrogate:
+        surrogate.report()
+    if stages:
+        stages.report()
+        
 
 # Run in standalone script mode
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Calculates DRAM Energy/Power")
-    parser.add_argument("raw_cntr_file", help="raw perf output")
+    parser.add_argument("raw_cntr_file", help="counter records of perf_collector.py, or perf stat -x , output")
     parser.add_argument("output_dir", help="output results directory")
     parser.add_argument("microarch", help="microarchitecture name for McPAT config and counter mapping")
     parser.add_argument("bin_size", help="Binning time for results",type=float)
     parser.add_argument("TSC_FREQUENCY", help="Freqeuncy of the internal TSC",type=int)
     parser.add_argument("NUM_CORES", help="Number of physical cores",type=int)
     parser.add_argument("THREADS_PER_CORE", help="Threads per physical core",type=int)
+    parser.add_argument("--jobs", help="Concurrent McPAT processes (default: number of cores)",type=int)
+    parser.add_argument("--mcpat-server", help="Keep McPAT running and stream the stats of each interval to it instead of starting McPAT per interval",action="store_true")
+    parser.add_argument("--mcpat-model", help="Extract per access energies from McPAT once (cached per template) and compute the power of all intervals from them",action="store_true")
+    parser.add_argument("--validate-model", help="Also run N sampled intervals through full McPAT and report the model error",type=int,default=0,metavar="N")
+    parser.add_argument("--dump-mcpat-xml", help="Also write the McPAT input of every interval to <output_dir>/mcpat/config_<N>.xml, for debugging",action="store_true")
+    parser.add_argument("--mcpat-cache", help="Reuse the McPAT results of intervals whose stats are all within relative tolerance TOL (0 for exact matches)",type=float,metavar="TOL")
+    parser.add_argument("--mcpat-cache-size", help="McPAT results kept in the cache (least recently used are dropped first)",type=int,default=100000)
+    parser.add_argument("--mcpat-cache-persist", help="Keep the McPAT result cache on disk and share it with other runs on the same template",action="store_true")
+    parser.add_argument("--representative-intervals", help="Cluster the intervals into K phases and only run McPAT on the interval nearest the center of each",type=int,default=0,metavar="K")
+    parser.add_argument("--cluster-validate", help="Also run N randomly sampled intervals through McPAT and report the error of the phase results",type=int,default=20,metavar="N")
+    parser.add_argument("--cluster-seed", help="Random seed of the clustering and the sampled intervals",type=int,default=0)
+    parser.add_argument("--mcpat-surrogate", help="Predict the McPAT results with a regression of degree D (1 or 2) fit to real McPAT runs (saved per template)",type=int,default=0,choices=[0,1,2],metavar="D")
+    parser.add_argument("--surrogate-calibration", help="McPAT runs the surrogate is fit to",type=int,default=200,metavar="N")
+    parser.add_argument("--surrogate-check", help="Also run every N-th predicted interval through McPAT as a spot check (0 for none)",type=int,default=100,metavar="N")
+    parser.add_argument("--surrogate-drift", help="Recalibrate the surrogate when a spot check is off by more than this relative error",type=float,default=0.05,metavar="TOL")
+    parser.add_argument("--adaptive-bins", help="Merge stretches of bins whose counters stay within relative tolerance TOL of their mean into one McPAT run",type=float,default=0,metavar="TOL")
+    parser.add_argument("--adaptive-max-bins", help="Longest adaptive bin, in bins",type=int,default=60,metavar="N")
+    parser.add_argument("--expand-bins", help="Write the results of adaptive bins back on the uniform bin_size grid",action="store_true")
+    parser.add_argument("--stage-cache", help="Store the results of every stage under a hash of its inputs in DIR, and reuse them when the inputs did not change",metavar="DIR")
+    parser.add_argument("--progress", help="Write a progress event (a line of JSON) to stderr every SECONDS seconds",type=float,default=0,metavar="SECONDS")
+    parser.add_argument("--results-format", help="Write the results as CSV files, as a columnar store of .npy files in <output_dir>/results (see results_store.py), or both",choices=["csv","npy","both"],default="csv")
     args = parser.parse_args()
-    process(args.raw_cntr_file, args.output_dir,  args.microarch, args.bin_size, args.TSC_FREQUENCY, args.NUM_CORES, args.THREADS_PER_CORE)
+    if args.expand_bins and args.representative_intervals:
+        parser.error("--expand-bins does not work with --representative-intervals")
+    print WATTWATCHER_HOME
+    process(args.raw_cntr_file, args.output_dir,  args.microarch, args.bin_size, args.TSC_FREQUENCY, args.NUM_CORES, args.THREADS_PER_CORE, args.jobs, args.mcpat_server, args.mcpat_model, args.validate_model, args.dump_mcpat_xml,
+            args.mcpat_cache, args.mcpat_cache_size, args.mcpat_cache_persist, args.representative_intervals, args.cluster_validate, args.cluster_seed,
+            args.mcpat_surrogate, args.surrogate_calibration, args.surrogate_check, args.surrogate_drift,
+            args.adaptive_bins, args.adaptive_max_bins, args.expand_bins, args.stage_cache, args.results_format, args.progress)
@@ -25,33 +25,35 @@ import shutil
 import sys
 import collections
 import argparse
+import numpy
 
+# stats is a StatsArray, so every stats[event] below is a whole (time x cpu) array.
+# num_threads has one entry per cpu: 0 for a logical cpu, the number of HW threads for TOTAL
 def process_cntrs(stats, l3_avail, fp_avail, bin_size, TSC_FREQUENCY, num_threads):
-	stats["frequency"] = TSC_FREQUENCY * float(stats["cycles"])/float(stats["ref-cycles"]) / 1000000
-	
-	if num_threads == 0:
-		stats["total_cycles"] = bin_size * stats["frequency"] * 1000000
-    	else:
-        	stats["total_cycles"] = bin_size * stats["frequency"] * 1000000 * num_threads
-	stats["busy_cycles"] = stats["cycles"] 
-	stats["idle_cycles"] = stats["total_cycles"] - stats["busy_cycles"]
-	stats["ipc"] = float(stats["instructions"])/float(stats["cycles"])
+	num_threads = numpy.asarray(num_threads)
+	with numpy.errstate(divide='ignore', invalid='ignore'):
+		stats["frequency"] = TSC_FREQUENCY * stats["cycles"] / stats["ref-cycles"] / 1000000
+
+		stats["total_cycles"] = bin_size * stats["frequency"] * 1000000 * numpy.where(num_threads == 0, 1, num_threads)
+		stats["busy_cycles"] = stats["cycles"] 
+		stats["idle_cycles"] = stats["total_cycles"] - stats["busy_cycles"]
+		stats["ipc"] = stats["instructions"] / stats["cycles"]
 	
-	stats["branch_miss_rate"] = float(stats["branches_mispredicted"])/float(stats["branches_executed"])
+		stats["branch_miss_rate"] = stats["branches_mispredicted"] / stats["branches_executed"]
 	
-	#TODO: Add in icache miss rate
-	stats["icache_miss_rate"] = 0
-	stats["dcache_miss_rate"] = float(stats["dcache_read_misses"] + stats["dcache_writes"]) / float(stats["dcache_reads"] + stats["dcache_writes"])
+		#TODO: Add in icache miss rate
+		stats["icache_miss_rate"] = 0
+		stats["dcache_miss_rate"] = (stats["dcache_read_misses"] + stats["dcache_writes"]) / (stats["dcache_reads"] + stats["dcache_writes"])
 
-	if l3_avail:
-	    stats["l2_miss_rate"] = float(stats["l2_misses"]) / float(stats["l2_accesses"])
-	    stats["l3_miss_rate"] = float(stats["l3_misses"]) / float(stats["l3_accesses"])
-	else:
-	    stats["l2_miss_rate"] = float(stats["l2_misses"]) / float(stats["l2_accesses"])
-	    stats["l3_miss_rate"] = 0
+		if l3_avail:
+		    stats["l2_miss_rate"] = stats["l2_misses"] / stats["l2_accesses"]
+		    stats["l3_miss_rate"] = stats["l3_misses"] / stats["l3_accesses"]
+		else:
+		    stats["l2_miss_rate"] = stats["l2_misses"] / stats["l2_accesses"]
+		    stats["l3_miss_rate"] = 0
 
-	stats["itlb_mpki"] = float(stats["itlb_misses"]) / float(stats["instructions"]) * 1000
-	stats["dtlb_mpki"] = float(stats["dtlb_misses"]) / float(stats["instructions"]) * 1000
+		stats["itlb_mpki"] = stats["itlb_misses"] / stats["instructions"] * 1000
+		stats["dtlb_mpki"] = stats["dtlb_misses"] / stats["instructions"] * 1000
 	
 	#TODO: Account for SIMD instructions here
 	if fp_avail:
@@ -0,0 +1,133 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Columnar results store
+# @date: 10/18/2026
+#
+# The same tables as the CSV results (cntrs_processed_<core>, rapl, mcpat_<core>
+# and mcpat), one uncompressed .npy file of float64 per column:
+#   <dir>/index.json                  {"bins": N, "tables": {table: [column, ...]}}
+#   <dir>/<table>/<column>.npy        (N) array, the first column is "timestamp"
+# Rows are buffered and appended to the column files a chunk at a time.  The
+# loader memory maps the column files, so reading one metric of a long trace
+# only reads that metric from disk.
+
+import os, json, shutil, struct, urllib
+import numpy
+
+# Size of the .npy header, fixed so the row count can be filled in once all rows are written
+HEADER_SIZE = 128
+
+# Rows buffered per table before they are appended to the column files
+CHUNK = 1024
+
+def npy_header(rows):
+	header = "{'descr': '<f8', 'fortran_order': False, 'shape': (%d,), }" % rows
+	header = header.ljust(HEADER_SIZE - 11) + "\n"
+	return "\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header
+
+def column_file(directory, table, column):
+	return os.path.join(directory, table, urllib.quote(column, safe=" -_.,()") + ".npy")
+
+class Table:
+
+	def __init__(self, directory, name, header):
+		self.directory = directory
+		self.name = name
+		self.columns = ["timestamp"] + list(header[1:])
+		self.rows = []
+		self.count = 0
+		os.makedirs(os.path.join(directory, name))
+		for column in self.columns:
+			with open(column_file(directory, name, column), 'wb') as f:
+				f.write(npy_header(0))
+
+	# Same as csv.writer.writerow
+	def writerow(self, row):
+		self.rows.append(row)
+		if len(self.rows) == CHUNK:
+			self.flush()
+
+	def flush(self):
+		if not self.rows:
+			return
+		rows = numpy.array(self.rows, dtype='<f8').reshape((len(self.rows), len(self.columns)))
+		for j, column in enumerate(self.columns):
+			with open(column_file(self.directory, self.name, column), 'ab') as f:
+				f.write(numpy.ascontiguousarray(rows[:, j]).tostring())
+		self.count += len(self.rows)
+		self.rows = []
+
+	def close(self):
+		self.flush()
+		for column in self.columns:
+			with open(column_file(self.directory, self.name, column), 'r+b') as f:
+				f.write(npy_header(self.count))
+
+class ResultsWriter:
+
+	def __init__(self, directory):
+		self.directory = directory
+		self.tables = []
+		# replaces the results of an earlier run
+		shutil.rmtree(directory, ignore_errors=True)
+		os.makedirs(directory)
+
+	# Returns a writer of the rows of a table, header is the CSV header
+	def table(self, name, header):
+		table = Table(self.directory, name, header)
+		self.tables.append(table)
+		return table
+
+	def close(self):
+		for table in self.tables:
+			table.close()
+		index = {"bins": max([table.count for table in self.tables] or [0]),
+			"tables": dict([(table.name, table.columns) for table in self.tables])}
+		with open(os.path.join(self.directory, "index.json"), 'wb') as f:
+			json.dump(index, f, indent=1, sort_keys=True)
+
+# Reads a store written by ResultsWriter, e.g.
+#   store = ResultsStore(output_dir + "/results")
+#   ipc = store.column("cntrs_processed_CPU0", "ipc")
+class ResultsStore:
+
+	def __init__(self, directory):
+		self.directory = directory
+		with open(os.path.join(directory, "index.json"), 'rb') as f:
+			index = json.load(f)
+		self.bins = index["bins"]
+		self.index = dict([(str(table), [str(column) for column in columns]) for table, columns in index["tables"].iteritems()])
+
+	def tables(self):
+		return sorted(self.index.keys())
+
+	def columns(self, table):
+		return self.index[table]
+
+	# Memory mapped (N) array of one column
+	def column(self, table, column):
+		if column not in self.index[table]:
+			raise KeyError("no column %s in %s" % (column, table))
+		return numpy.load(column_file(self.directory, table, column), mmap_mode='r')
+
+	def times(self, table):
+		return self.column(table, "timestamp")
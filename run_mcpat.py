@@ -18,138 +18,311 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import os, sys, math, re, collections, re,  csv, argparse, subprocess
+import os, sys, math, re, collections, re,  csv, argparse, subprocess, time, json
+import hashlib, getpass, tempfile
+import multiprocessing, Queue
 import buildstack, sniper_lib
+import instrument
 from multiprocessing.pool import ThreadPool
 
-# Parts of this function was modified from the Sniper simulator's McPAT plugin.
-def run_mcpat(input_dir, mcpatdir, stats, CORES, HW_THREADS):
-	all_items = [
-		[ 'core',     .01,    'core-ooo' ],
-		[ 'ifetch',   .01,    'core-ifetch' ],
-		[ 'alu',      .01,    'core-alu-complex' ],
-		[ 'int',      .01,    'core-alu-int' ],
-		[ 'fp',       .01,    'core-alu-fp' ],
-		[ 'mem',      .01,    'core-mem' ],
-		[ 'icache',   .01,    'core-icache' ],
-		[ 'dcache',   .01,    'core-dcache' ],
-		[ 'l2',       .01,    'l2' ],
-		[ 'l3',       .01,    'l3' ],
-		[ 'noc',      .01,    'noc' ],
-		[ 'other',    .01,    'other' ],
-	]
-
-	def mcpat_run(inputfile,mcpatdir):
-		return subprocess.check_output("LD_LIBRARY_PATH=$LD_LIBRARY_PATH:" + mcpatdir + " " + mcpatdir + "/mcpat -print_level 5 -opt_for_clk 1 -infile " + inputfile, shell=True)
-
-	def power_stack(power_dat, scale=[1.0], powertype = 'total', core = 'all', nocollapse = False):
-		def getpower(powers, index=-1, key = None):
-			def getcomponent(suffix):
-				if key: return powers.get(key+'/'+suffix, 0)
-				else: return powers.get(suffix, 0)
-			index = -1
-			if index == -1:
-				scale_factor = 1.0
-			else:
-				scale_factor = scale[index]
-			if powertype == 'dynamic':
-				return getcomponent('Runtime Dynamic')
-			elif powertype == 'static':
-				return getcomponent('Subthreshold Leakage') * scale_factor + getcomponent('Subthreshold Leakage with power gating') * (1 - scale_factor) + getcomponent('Gate Leakage')
-			elif powertype == 'total':
-				dyn=getcomponent('Runtime Dynamic') 
-				sub_leak = getcomponent('Subthreshold Leakage') * scale_factor 
-				sub_leak_gate =  getcomponent('Subthreshold Leakage with power gating') * (1 - scale_factor) 
-				gate_leak = getcomponent('Gate Leakage')
-				return dyn + sub_leak + sub_leak_gate + gate_leak
-			elif powertype == 'area':
-				return getcomponent('Area') + getcomponent('Area Overhead')
-			else:
-				raise ValueError('Unknown powertype %s' % powertype)
-	  
-		
-		if core == "all":
-			data = {
-				'l2':              	5 * sum([ getpower(cache,index) for index,cache in enumerate(power_dat.get('L2', []) )])  # shared L2
-								+ 5 * sum([ getpower(core, index, 'L2') for index,core in enumerate(power_dat['Core']) ]), # private L2
-				'l3':               5 * sum([ getpower(cache) for index,cache in enumerate(power_dat.get('L3', [])) ]),
-				'core-ooo':             sum([ getpower(core, index, 'Execution Unit/Instruction Scheduler')
-									  + getpower(core, index, 'Execution Unit/Register Files')
-									  + getpower(core, index, 'Execution Unit/Results Broadcast Bus')
-									  + getpower(core, index, 'Renaming Unit')
-									  for index,core in enumerate(power_dat['Core'])
-									]),
-				'core-ifetch':      sum([ getpower(core, index, 'Instruction Fetch Unit/Branch Predictor')
-									  + getpower(core, index, 'Instruction Fetch Unit/Branch Target Buffer')
-									  + getpower(core, index, 'Instruction Fetch Unit/Instruction Buffer')
-									  + getpower(core, index, 'Instruction Fetch Unit/Instruction Decoder')
-									  for index,core in enumerate(power_dat['Core'])
-									]),
-				'core-icache':           sum([ getpower(core, index, 'Instruction Fetch Unit/Instruction Cache') for index, core in enumerate(power_dat['Core']) ]),
-				'core-dcache':           sum([ getpower(core, index, 'Load Store Unit/Data Cache') for index,core in enumerate(power_dat['Core'] )]),
-				'core-alu-complex': sum([ getpower(core, index, 'Execution Unit/Complex ALUs') for index,core in enumerate(power_dat['Core']) ]),
-				'core-alu-fp':      sum([ getpower(core, index, 'Execution Unit/Floating Point Units') for index,core in enumerate(power_dat['Core'] )]),
-				'core-alu-int':     sum([ getpower(core, index, 'Execution Unit/Integer ALUs') for index,core in enumerate(power_dat['Core']) ]),
-				'core-mem':         sum([ getpower(core, index, 'Load Store Unit/LoadQ')
-									  + getpower(core, index, 'Load Store Unit/StoreQ')
-									  + getpower(core, index, 'Memory Management Unit')
-									  for index,core in enumerate(power_dat['Core'])
-									]),
-			}
-			#data['other'] = getpower(power_dat["Processor"]) -  (sum(data.values()))# - data['dram'])
+# Extra options of every McPAT run, see use_cacti_seed and use_compiled_template
+MCPAT_OPTS = []
+
+# Pre-warmed CACTI cache of a template, see warm_cacti.py
+def seed_file(input_proc_model):
+	return os.path.splitext(input_proc_model)[0] + ".cache"
+
+# Has McPAT look up CACTI arrays in the pre-warmed cache of the template too, if there is one
+def use_cacti_seed(input_proc_model):
+	seed = seed_file(input_proc_model)
+	MCPAT_OPTS[:] = ["-seed", seed] if os.path.isfile(seed) else []
+
+# Environment of McPAT processes, which find the libraries of mcpatdir too
+def mcpat_env(mcpatdir):
+	env = dict(os.environ)
+	env["LD_LIBRARY_PATH"] = env.get("LD_LIBRARY_PATH", "") + ":" + mcpatdir
+	return env
+
+# Compiled McPAT templates (mcpat -compile), in /tmp/mcpat-$USER.templates/
+def template_dir():
+	return os.path.join(tempfile.gettempdir(), "mcpat-" + getpass.getuser() + ".templates")
+
+# Has McPAT read its inputs in one pass from a compiled template (mcpat -template) of the params of
+# updates filled into template (a generate_mcpat.CompiledTemplate).  Inputs that only differ from it
+# in their stats skip the XML parser, others are parsed in full as before.  A template is compiled
+# once per McPAT binary, and none is used if McPAT cannot compile it.  Call after use_cacti_seed.
+def use_compiled_template(template, updates, mcpatdir):
+	mcpat = mcpatdir + "/mcpat"
+	xml = template.fill([update for update in updates if update[1] == "param"])
+	binary = os.stat(mcpat)
+	path = os.path.join(template_dir(), hashlib.sha1(xml + repr((binary.st_size, binary.st_mtime))).hexdigest() + ".mcpatc")
+	opts = MCPAT_OPTS[:]
+	if "-template" in opts:
+		del opts[opts.index("-template"):opts.index("-template") + 2]
+	if not os.path.isfile(path):
+		if not os.path.isdir(template_dir()):
+			try:
+				os.makedirs(template_dir())
+			except OSError:
+				pass
+		tmp = path + "." + str(os.getpid())
+		proc = subprocess.Popen([mcpat, "-infile", "-", "-compile", tmp], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=mcpat_env(mcpatdir))
+		error = proc.communicate(xml)[1]
+		if proc.returncode or not os.path.isfile(tmp):
+			print "McPAT could not compile the template, inputs are parsed in full:", error.strip() or "exit status %d" % proc.returncode
+			MCPAT_OPTS[:] = opts
+			return
+		os.rename(tmp, path)
+	MCPAT_OPTS[:] = opts + ["-template", path]
+
+# CACTI threads of each of jobs concurrent McPAT processes, so that together
+# they run no more threads than there are CPUs
+def mcpat_threads(jobs):
+	return max(1, multiprocessing.cpu_count() // jobs)
+
+# McPAT options for threads CACTI threads, None lets McPAT use every CPU
+def thread_opts(threads):
+	return ["-threads", str(threads)] if threads else []
+
+def mcpat_run(inputfile,mcpatdir,threads=None):
+	begin = time.time()
+	output = subprocess.check_output("LD_LIBRARY_PATH=$LD_LIBRARY_PATH:" + mcpatdir + " " + mcpatdir + "/mcpat -print_level 5 -opt_for_clk 1 -json 1 -stats 1 " + "".join(opt + " " for opt in MCPAT_OPTS + thread_opts(threads)) + "-infile " + inputfile, shell=True)
+	instrument.observe("mcpat_run", time.time() - begin)
+	instrument.cacti(output)
+	return output
+
+# Same as mcpat_run, but the input is passed in memory on McPAT's stdin (mcpat -infile -)
+def mcpat_pipe(xml, mcpatdir, threads=None):
+	begin = time.time()
+	proc = subprocess.Popen([mcpatdir + "/mcpat", "-print_level", "5", "-opt_for_clk", "1", "-json", "1", "-stats", "1"] + MCPAT_OPTS + thread_opts(threads) + ["-infile", "-"],
+				stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=mcpat_env(mcpatdir))
+	output = proc.communicate(xml)[0]
+	if proc.returncode:
+		raise subprocess.CalledProcessError(proc.returncode, mcpatdir + "/mcpat -infile -", output)
+	instrument.observe("mcpat_pipe", time.time() - begin)
+	instrument.cacti(output)
+	return output
+
+# The McPAT input files of a directory as (N, file name) of config_<N>.xml, in interval order.
+# os.listdir order is arbitrary, and a plain sort puts config_10 before config_2.
+def config_files(input_dir):
+	files = []
+	for f in os.listdir(input_dir):
+		res = re.match('config_([0-9]+)\.xml$', f)
+		if res and os.path.isfile(os.path.join(input_dir, f)):
+			files.append((int(res.group(1)), f))
+	return sorted(files)
+
+# Evaluates every input file with its own McPAT process, jobs at a time.
+# The processes share the CACTI cache. Outputs are returned in input order.
+def mcpat_run_all(inputfiles, mcpatdir, jobs=None):
+	if jobs is None:
+		jobs = multiprocessing.cpu_count()
+	pool = ThreadPool(processes=jobs)
+	try:
+		outputs = pool.map(lambda inputfile: mcpat_run(inputfile, mcpatdir, mcpat_threads(jobs)), inputfiles, 1)
+	finally:
+		pool.close()
+		pool.join()
+	return outputs
+
+# A long-lived McPAT process (mcpat -server 1) holding one processor template.
+# Each evaluation only sends the updated stats, so the template is parsed once
+# and CACTI results stay in memory across intervals.
+class McpatServer:
+	READY = "MCPAT_READY"
+	DONE = "MCPAT_DONE"
+
+	def __init__(self, mcpatdir, input_proc_model, threads=None):
+		self.proc = subprocess.Popen([mcpatdir + "/mcpat", "-print_level", "5", "-opt_for_clk", "1", "-json", "1", "-stats", "1", "-server", "1"] + MCPAT_OPTS + thread_opts(threads) + ["-infile", input_proc_model],
+					stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=mcpat_env(mcpatdir))
+		self.read_until(self.READY)
+
+	def read_until(self, marker):
+		lines = []
+		while True:
+			line = self.proc.stdout.readline()
+			if not line:
+				raise RuntimeError("McPAT server exited with code %s" % self.proc.wait())
+			if line.rstrip("\n") == marker:
+				return "".join(lines)
+			lines.append(line)
+
+	# updates is a list of (component id, "stat" or "param", name, value), see generate_mcpat.mcpat_updates
+	def evaluate(self, updates):
+		begin = time.time()
+		request = "".join(["%s %s %s %s\n" % update for update in updates])
+		self.proc.stdin.write(request + "run\n")
+		self.proc.stdin.flush()
+		output = self.read_until(self.DONE)
+		instrument.observe("mcpat_server", time.time() - begin)
+		instrument.cacti(output)
+		return output
+
+	def close(self):
+		self.proc.stdin.close()
+		self.proc.wait()
+
+# A set of McPAT servers shared by worker threads.  evaluate() borrows an idle
+# server for the duration of one evaluation.
+class McpatServerPool:
+
+	def __init__(self, mcpatdir, input_proc_model, jobs):
+		self.servers = Queue.Queue()
+		for i in range(0, jobs):
+			self.servers.put(McpatServer(mcpatdir, input_proc_model, mcpat_threads(jobs)))
+
+	def evaluate(self, updates):
+		server = self.servers.get()
+		try:
+			return server.evaluate(updates)
+		finally:
+			self.servers.put(server)
+
+	def close(self):
+		while not self.servers.empty():
+			self.servers.get().close()
+
+# Like pool.imap, but keeps at most window tasks in flight so that a long
+# stream of intervals is never queued up in memory.  Results are in input order.
+def bounded_imap(pool, func, iterable, window):
+	pending = collections.deque()
+	for item in iterable:
+		pending.append(pool.apply_async(func, (item,)))
+		if len(pending) >= window:
+			yield pending.popleft().get()
+	while pending:
+		yield pending.popleft().get()
+
+# Evaluates a list of interval updates on jobs McPAT servers.
+# Outputs are returned in input order.
+def mcpat_serve_all(interval_updates, mcpatdir, input_proc_model, jobs=None):
+	if jobs is None:
+		jobs = multiprocessing.cpu_count()
+	jobs = max(1, min(jobs, len(interval_updates)))
+	servers = McpatServerPool(mcpatdir, input_proc_model, jobs)
+	pool = ThreadPool(processes=jobs)
+	try:
+		outputs = pool.map(servers.evaluate, interval_updates, 1)
+	finally:
+		pool.close()
+		pool.join()
+		servers.close()
+	return outputs
+
+# Parts of these functions were modified from the Sniper simulator's McPAT plugin.
+all_items = [
+	[ 'core',     .01,    'core-ooo' ],
+	[ 'ifetch',   .01,    'core-ifetch' ],
+	[ 'alu',      .01,    'core-alu-complex' ],
+	[ 'int',      .01,    'core-alu-int' ],
+	[ 'fp',       .01,    'core-alu-fp' ],
+	[ 'mem',      .01,    'core-mem' ],
+	[ 'icache',   .01,    'core-icache' ],
+	[ 'dcache',   .01,    'core-dcache' ],
+	[ 'l2',       .01,    'l2' ],
+	[ 'l3',       .01,    'l3' ],
+	[ 'noc',      .01,    'noc' ],
+	[ 'other',    .01,    'other' ],
+]
+
+def power_stack(power_dat, scale=[1.0], powertype = 'total', core = 'all', nocollapse = False):
+	def getpower(powers, index=-1, key = None):
+		def getcomponent(suffix):
+			if key: return powers.get(key+'/'+suffix, 0)
+			else: return powers.get(suffix, 0)
+		index = -1
+		if index == -1:
+			scale_factor = 1.0
 		else:
-			data = {
-				'l2':               5 * getpower(power_dat['Core'][core], -1, 'L2'), # private L2
-				'core-ooo':         getpower(power_dat['Core'][core], -1, 'Execution Unit/Instruction Scheduler')
-									  + getpower(power_dat['Core'][core], -1, 'Execution Unit/Register Files')
-									  + getpower(power_dat['Core'][core], -1, 'Execution Unit/Results Broadcast Bus')
-									  + getpower(power_dat['Core'][core], -1, 'Renaming Unit'),
-				'core-ifetch':      getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Branch Predictor')
-									  + getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Branch Target Buffer')
-									  + getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Instruction Buffer')
-									  + getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Instruction Decoder'),
-				'core-icache':      getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Instruction Cache'),
-				'core-dcache':      getpower(power_dat['Core'][core], -1, 'Load Store Unit/Data Cache'),
-				'core-alu-complex': getpower(power_dat['Core'][core], -1, 'Execution Unit/Complex ALUs'),
-				'core-alu-fp':      getpower(power_dat['Core'][core], -1, 'Execution Unit/Floating Point Units'),
-				'core-alu-int':     getpower(power_dat['Core'][core], -1, 'Execution Unit/Integer ALUs'),
-				'core-mem':         getpower(power_dat['Core'][core], -1, 'Load Store Unit/LoadQ')
-									  + getpower(power_dat['Core'][core], -1, 'Load Store Unit/StoreQ')
-									  + getpower(power_dat['Core'][core], -1, 'Memory Management Unit'),
-			}
-		return data
-
-	onlyfiles = [ f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir,f)) ]
-
-	WORKER_THREADS = 1
-	power_threads = [None] * len(onlyfiles)
-	pt_results = [None] * WORKER_THREADS
-	power = {}
+			scale_factor = scale[index]
+		if powertype == 'dynamic':
+			return getcomponent('Runtime Dynamic')
+		elif powertype == 'static':
+			return getcomponent('Subthreshold Leakage') * scale_factor + getcomponent('Subthreshold Leakage with power gating') * (1 - scale_factor) + getcomponent('Gate Leakage')
+		elif powertype == 'total':
+			dyn=getcomponent('Runtime Dynamic') 
+			sub_leak = getcomponent('Subthreshold Leakage') * scale_factor 
+			sub_leak_gate =  getcomponent('Subthreshold Leakage with power gating') * (1 - scale_factor) 
+			gate_leak = getcomponent('Gate Leakage')
+			return dyn + sub_leak + sub_leak_gate + gate_leak
+		elif powertype == 'area':
+			return getcomponent('Area') + getcomponent('Area Overhead')
+		else:
+			raise ValueError('Unknown powertype %s' % powertype)
+  
+	
+	if core == "all":
+		data = {
+			'l2':              	5 * sum([ getpower(cache,index) for index,cache in enumerate(power_dat.get('L2', []) )])  # shared L2
+							+ 5 * sum([ getpower(core, index, 'L2') for index,core in enumerate(power_dat['Core']) ]), # private L2
+			'l3':               5 * sum([ getpower(cache) for index,cache in enumerate(power_dat.get('L3', [])) ]),
+			'core-ooo':             sum([ getpower(core, index, 'Execution Unit/Instruction Scheduler')
+								  + getpower(core, index, 'Execution Unit/Register Files')
+								  + getpower(core, index, 'Execution Unit/Results Broadcast Bus')
+								  + getpower(core, index, 'Renaming Unit')
+								  for index,core in enumerate(power_dat['Core'])
+								]),
+			'core-ifetch':      sum([ getpower(core, index, 'Instruction Fetch Unit/Branch Predictor')
+								  + getpower(core, index, 'Instruction Fetch Unit/Branch Target Buffer')
+								  + getpower(core, index, 'Instruction Fetch Unit/Instruction Buffer')
+								  + getpower(core, index, 'Instruction Fetch Unit/Instruction Decoder')
+								  for index,core in enumerate(power_dat['Core'])
+								]),
+			'core-icache':           sum([ getpower(core, index, 'Instruction Fetch Unit/Instruction Cache') for index, core in enumerate(power_dat['Core']) ]),
+			'core-dcache':           sum([ getpower(core, index, 'Load Store Unit/Data Cache') for index,core in enumerate(power_dat['Core'] )]),
+			'core-alu-complex': sum([ getpower(core, index, 'Execution Unit/Complex ALUs') for index,core in enumerate(power_dat['Core']) ]),
+			'core-alu-fp':      sum([ getpower(core, index, 'Execution Unit/Floating Point Units') for index,core in enumerate(power_dat['Core'] )]),
+			'core-alu-int':     sum([ getpower(core, index, 'Execution Unit/Integer ALUs') for index,core in enumerate(power_dat['Core']) ]),
+			'core-mem':         sum([ getpower(core, index, 'Load Store Unit/LoadQ')
+								  + getpower(core, index, 'Load Store Unit/StoreQ')
+								  + getpower(core, index, 'Memory Management Unit')
+								  for index,core in enumerate(power_dat['Core'])
+								]),
+		}
+		#data['other'] = getpower(power_dat["Processor"]) -  (sum(data.values()))# - data['dram'])
+	else:
+		data = {
+			'l2':               5 * getpower(power_dat['Core'][core], -1, 'L2'), # private L2
+			'core-ooo':         getpower(power_dat['Core'][core], -1, 'Execution Unit/Instruction Scheduler')
+								  + getpower(power_dat['Core'][core], -1, 'Execution Unit/Register Files')
+								  + getpower(power_dat['Core'][core], -1, 'Execution Unit/Results Broadcast Bus')
+								  + getpower(power_dat['Core'][core], -1, 'Renaming Unit'),
+			'core-ifetch':      getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Branch Predictor')
+								  + getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Branch Target Buffer')
+								  + getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Instruction Buffer')
+								  + getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Instruction Decoder'),
+			'core-icache':      getpower(power_dat['Core'][core], -1, 'Instruction Fetch Unit/Instruction Cache'),
+			'core-dcache':      getpower(power_dat['Core'][core], -1, 'Load Store Unit/Data Cache'),
+			'core-alu-complex': getpower(power_dat['Core'][core], -1, 'Execution Unit/Complex ALUs'),
+			'core-alu-fp':      getpower(power_dat['Core'][core], -1, 'Execution Unit/Floating Point Units'),
+			'core-alu-int':     getpower(power_dat['Core'][core], -1, 'Execution Unit/Integer ALUs'),
+			'core-mem':         getpower(power_dat['Core'][core], -1, 'Load Store Unit/LoadQ')
+								  + getpower(power_dat['Core'][core], -1, 'Load Store Unit/StoreQ')
+								  + getpower(power_dat['Core'][core], -1, 'Memory Management Unit'),
+		}
+	return data
 
-	#TODO: Mutlithreaded McPAT invocation occasionally causes DB corruption
-	# disabled for now
-	timestamps = stats.itervalues().next().keys()
-	START_TIME = timestamps[0]
-	pool = ThreadPool(processes=WORKER_THREADS)
-	for i in range(0, len(onlyfiles), WORKER_THREADS):
-		print "launching mcpat thread"
-		for j in range(0,WORKER_THREADS):
-			if (i + j) < len(onlyfiles):
-				pt_results[j] = pool.apply_async(mcpat_run, (input_dir + onlyfiles[i + j],mcpatdir))
-		for j in range(0,WORKER_THREADS):
-			if (i + j) < len(onlyfiles):
-				power_threads[i + j]     = pt_results[j].get()
-		print WORKER_THREADS, " mcpat runs finished" , i
-
-	for i,files in enumerate(onlyfiles):
-	  result = re.findall('\_(.*?)\.', files)
-	  timestamp = float(result[0]) + START_TIME
-	  power[timestamp] = {}
-	  components = power_threads[i].split('*'*89)[2:-1]
-
-	  # Parse output
-	  power_dat = {}
-	  for component in components:
+# Returns the McPAT results as {component: {path: value}}, with a list of
+# those for Core, L2 and L3.  McPAT is run with -json 1 and prints them as the
+# last line, the print_level 5 text of older McPAT builds is parsed instead.
+def parse_mcpat_output(output):
+	last_line = output.rstrip().rsplit('\n', 1)[-1]
+	if last_line.startswith('{'):
+		# nan is read as 0 like in the text report, see parse_mcpat_text
+		power_dat = json.loads(last_line, parse_int=float, parse_constant=lambda constant: 0. if constant == 'NaN' else float(constant))
+		if not power_dat:
+			raise ValueError('No valid McPAT output found')
+		return power_dat
+	return parse_mcpat_text(output)
+
+# Rebuilds the McPAT component hierarchy from the print_level 5 text output
+def parse_mcpat_text(output):
+	components = output.split('*'*89)[2:-1]
+
+	# Parse output
+	power_dat = {}
+	for component in components:
 		lines = component.strip().split('\n')
 		componentname = lines[0].strip().strip(':')
 		values = {}
@@ -194,40 +367,79 @@ def run_mcpat(input_dir, mcpatdir, stats, CORES, HW_THREADS):
 
 		if not power_dat:
 			raise ValueError('No valid McPAT output found')
-		
-	  # Now, we will massage the power consumption based on how idle/active the core was for this quanta of time
-	  # For core level stats, we need to merge all the HW_Threads into their shared physical resources
-	  # scale represents precent active
-	  threads_per_core = HW_THREADS / CORES
-	  core_id = 0
-	  active = []
-	  for k in range(0,CORES,1):
+	return power_dat
+
+# Per core and total power of one interval, massaged by how busy each core was
+def interval_power(power_dat, stats, timestamp, CORES, HW_THREADS):
+	# Now, we will massage the power consumption based on how idle/active the core was for this quanta of time
+	# For core level stats, we need to merge all the HW_Threads into their shared physical resources
+	# scale represents precent active
+	threads_per_core = HW_THREADS / CORES
+	core_id = 0
+	active = []
+	for k in range(0,CORES,1):
 		active.append(0)
 		active[k] =max([stats["CPU" + str(j)][timestamp]["busy_cycles"]  for j in range(k, HW_THREADS, CORES)]) / 2400000000.0
 		
-	  # Plot stack
-	  print_stack = 1
-	  power[timestamp]["TOTAL"] = {}		
-	  power[timestamp]["TOTAL"]["static"] = 0
+	# Plot stack
+	print_stack = 1
+	power = {}
+	power["TOTAL"] = {}		
+	power["TOTAL"]["static"] = 0
+
+	# TODO: this is very primitive, need a better way to model idle states
+	for k in range(0,CORES,1):
+		power["CPU" + str(k)] = {}		
+		power["CPU" + str(k)]["dynamic"] = power_stack(power_dat, active, "dynamic", k) 
+		power["CPU" + str(k)]["static"] = active[k] * 2.2 + (1-active[k]) * 1.00
+		power["TOTAL"]["static"] += active[k] * 2.2 + (1-active[k]) * 1.00
 
-	  # TODO: this is very primitive, need a better way to model idle states
-          for k in range(0,CORES,1):
-		power[timestamp]["CPU" + str(k)] = {}		
-	  	power[timestamp]["CPU" + str(k)]["dynamic"] = power_stack(power_dat, active, "dynamic", k) 
-	  	power[timestamp]["CPU" + str(k)]["static"] = active[k] * 2.2 + (1-active[k]) * 1.00
-	  	power[timestamp]["TOTAL"]["static"] += active[k] * 2.2 + (1-active[k]) * 1.00
+	power["TOTAL"]["dynamic"] = power_stack(power_dat, active, "dynamic", "all")
+	return power
+
+def run_mcpat(input_dir, mcpatdir, stats, CORES, HW_THREADS, jobs=None):
+	onlyfiles = config_files(input_dir)
+
+	power = {}
+
+	# config_<N>.xml holds the N-th interval of the stats
+	timestamps = stats.itervalues().next().keys()
+	if jobs is None:
+		jobs = multiprocessing.cpu_count()
+	print "launching", len(onlyfiles), "mcpat runs on", jobs, "workers"
+	power_threads = mcpat_run_all([os.path.join(input_dir, f) for num, f in onlyfiles], mcpatdir, jobs)
+	print len(onlyfiles), " mcpat runs finished"
 
-	  power[timestamp]["TOTAL"]["dynamic"] = power_stack(power_dat, active, "dynamic", "all")  
+	for (num, f), output in zip(onlyfiles, power_threads):
+		timestamp = timestamps[num]
+		power[timestamp] = interval_power(parse_mcpat_output(output), stats, timestamp, CORES, HW_THREADS)
 
 	return power
-  
+
+# Same as run_mcpat, but streams the stats of every interval to McPAT servers
+# instead of running McPAT once per generated input file.
+# interval_updates is {timestamp: updates} as produced by generate_mcpat.mcpat_updates
+def run_mcpat_server(interval_updates, mcpatdir, input_proc_model, stats, CORES, HW_THREADS, jobs=None):
+	timestamps = interval_updates.keys()
+	print "launching", len(timestamps), "mcpat evaluations on", jobs if jobs else multiprocessing.cpu_count(), "mcpat servers"
+	outputs = mcpat_serve_all([interval_updates[timestamp] for timestamp in timestamps], mcpatdir, input_proc_model, jobs)
+	print len(timestamps), " mcpat evaluations finished"
+
+	power = {}
+	for timestamp, output in zip(timestamps, outputs):
+		power[timestamp] = interval_power(parse_mcpat_output(output), stats, timestamp, CORES, HW_THREADS)
+	return power
+
   # Run in standalone script mode
 if __name__ == '__main__':
-    parser = argparse.ArgumentParser(description="Runs McPAT and reports results")
+    parser = argparse.ArgumentParser(description="Runs McPAT on every input in a directory and reports the elapsed time")
     parser.add_argument("input_dir", help="directory containg McPAT inputs")
     parser.add_argument("mcpatdir", help="directory containing McPAT")
-    parser.add_argument("stats", help="stats dictionary")
-    parser.add_argument("cores", help="hw cores")
-    parser.add_argument("threads", help="threads per core")
+    parser.add_argument("--jobs", help="number of concurrent McPAT processes (default: number of cores)", type=int)
     args = parser.parse_args()
-    run_mcpat(args.input_dir, args.mcpatdir, args.stats, args.cores, args.threads)
+    inputfiles = [ os.path.join(args.input_dir, f) for num, f in config_files(args.input_dir) ]
+    jobs = args.jobs if args.jobs else multiprocessing.cpu_count()
+    start = time.time()
+    mcpat_run_all(inputfiles, args.mcpatdir, jobs)
+    elapsed = time.time() - start
+    print "%d runs, %d jobs, %.2f s, %.2f runs/s" % (len(inputfiles), jobs, elapsed, len(inputfiles) / elapsed)
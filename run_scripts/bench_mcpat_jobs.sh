@@ -0,0 +1,17 @@
+#!/bin/bash
+# Measures how the McPAT stage scales with the number of concurrent McPAT
+# processes.  Run it on the mcpat/ directory of a results directory processed
+# with WATTWATCHER_OPTS="--dump-mcpat-xml".
+# $1 = Directory containing the McPAT input files (config_*.xml)
+# $2 = Space separated list of job counts to try (default "1 2 4 8 16")
+
+INPUT_DIR=$1
+JOBS=${2:-"1 2 4 8 16"}
+
+# warm the CACTI cache first so every measurement sees the same cache state
+PYTHONPATH=:$PYTHONPATH:$WATTWATCHER_HOME/sniper_libs $WATTWATCHER_HOME/run_mcpat.py $INPUT_DIR $WATTWATCHER_HOME/fast_mcpat --jobs 1 > /dev/null
+
+for N in $JOBS
+do
+    PYTHONPATH=:$PYTHONPATH:$WATTWATCHER_HOME/sniper_libs $WATTWATCHER_HOME/run_mcpat.py $INPUT_DIR $WATTWATCHER_HOME/fast_mcpat --jobs $N
+done
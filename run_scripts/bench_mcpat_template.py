@@ -0,0 +1,74 @@
+#!/usr/bin/python
+# Benchmarks McPAT input generation from the compiled template against the
+# ElementTree find()/write() generation it replaced, and checks that both
+# produce the same files.
+#
+# PYTHONPATH=$WATTWATCHER_HOME run_scripts/bench_mcpat_template.py $WATTWATCHER_HOME/mcpat_procs/haswell.xml
+import os, time, argparse, collections, random, tempfile, shutil
+import xml.etree.ElementTree as ET
+import generate_mcpat
+
+# Updates of one interval for random counter values
+def random_updates(rng, cores, threads_per_core):
+	def row():
+		return collections.defaultdict(lambda: float(rng.randint(1000, 10000000)))
+	return generate_mcpat.mcpat_updates(row(), [row() for k in range(0, cores)], 1, 1.0, cores, cores * threads_per_core, 2200000000)
+
+def elementtree_write(tree, updates, filename):
+	root = tree.getroot()
+	for component, kind, name, value in updates:
+		root.find(".//*[@id='" + component + "']/" + kind + "[@name='" + name + "']").set('value', value)
+	tree.write(filename)
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Benchmarks McPAT input generation")
+	parser.add_argument("input_proc_model", help="McPAT template")
+	parser.add_argument("--cores", help="physical cores in the template", type=int, default=4)
+	parser.add_argument("--threads-per-core", help="HW threads per physical core", type=int, default=2)
+	parser.add_argument("--configs", help="configs generated from the compiled template", type=int, default=20000)
+	parser.add_argument("--tree-configs", help="configs generated with ElementTree", type=int, default=100)
+	args = parser.parse_args()
+
+	rng = random.Random(0)
+	intervals = [random_updates(rng, args.cores, args.threads_per_core) for i in range(0, 100)]
+	output_dir = tempfile.mkdtemp()
+	try:
+		begin = time.time()
+		template = generate_mcpat.CompiledTemplate(args.input_proc_model)
+		print "compile: %d slots in %.3f s" % (len(template.slots), time.time() - begin)
+
+		begin = time.time()
+		for i in range(0, args.configs):
+			template.fill(intervals[i % len(intervals)])
+		elapsed = time.time() - begin
+		print "compiled fill:         %d configs in %.2f s, %.0f configs/s" % (args.configs, elapsed, args.configs / elapsed)
+
+		# every interval has the same layout, so the slot positions are resolved once
+		positions = template.resolve(intervals[0])
+		begin = time.time()
+		for i in range(0, args.configs):
+			template.fill(intervals[i % len(intervals)], positions)
+		elapsed = time.time() - begin
+		print "compiled fill, resolved: %d configs in %.2f s, %.0f configs/s" % (args.configs, elapsed, args.configs / elapsed)
+
+		begin = time.time()
+		for i in range(0, args.configs):
+			template.write(intervals[i % len(intervals)], output_dir + "/config_" + str(i % 1000) + ".xml", positions)
+		elapsed = time.time() - begin
+		print "compiled fill + write: %d configs in %.2f s, %.0f configs/s" % (args.configs, elapsed, args.configs / elapsed)
+
+		tree = ET.parse(args.input_proc_model)
+		begin = time.time()
+		for i in range(0, args.tree_configs):
+			elementtree_write(tree, intervals[i % len(intervals)], output_dir + "/tree_" + str(i) + ".xml")
+		tree_elapsed = time.time() - begin
+		print "ElementTree:           %d configs in %.2f s, %.0f configs/s" % (args.tree_configs, tree_elapsed, args.tree_configs / tree_elapsed)
+
+		for i in range(0, min(args.tree_configs, len(intervals))):
+			with open(output_dir + "/tree_" + str(i) + ".xml", 'rb') as f:
+				tree_config = f.read()
+				assert tree_config == template.fill(intervals[i]), "config %d differs" % i
+				assert tree_config == template.fill(intervals[i], positions), "config %d differs" % i
+		print "compiled and ElementTree configs are identical"
+	finally:
+		shutil.rmtree(output_dir)
@@ -0,0 +1,140 @@
+#!/usr/bin/python
+# Times every stage of process.py on a synthetic perf trace (see
+# gen_perf_trace.py): parsing, rebinning (normalize_stats), process_cntrs,
+# generate_mcpat, McPAT and writing the results.  The stages are streamed and
+# timed like in process.py (see instrument.py), and the stage times and peak
+# RSS are read from the report.  Prints samples/s of every stage.
+# McPAT is run on the first --mcpat-runs bins and its results reused for the
+# rest, or the McPAT model is used for all bins with --mcpat-model.
+#
+# --save keeps the numbers in a JSON file, --compare checks them against a
+# saved file and fails when a stage got slower than --tolerance.
+#
+# WATTWATCHER_HOME=... PYTHONPATH=$WATTWATCHER_HOME:$WATTWATCHER_HOME/sniper_libs run_scripts/bench_pipeline.py --cpus 16 --duration 3600
+import os, sys, json, time, argparse, resource, tempfile, shutil, itertools, collections
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import gen_perf_trace
+import process
+import generate_mcpat
+import run_mcpat
+import mcpat_model
+import instrument
+
+# Runs the stages of process.py on trace with an instrument report, see instrument.py.
+# Returns the report, which is also written to output_dir/report.json.
+def run(trace, microarch, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE, mcpat_runs, use_model, output_dir, results_format):
+	HW_THREADS = NUM_CORES * THREADS_PER_CORE
+	mcpatdir = process.WATTWATCHER_HOME + "/fast_mcpat"
+	input_proc_model = process.WATTWATCHER_HOME + "/mcpat_procs/" + microarch + ".xml"
+	stat_map = process.read_stat_map(microarch)
+	START_TIME, END_TIME = process.read_time_range(trace)
+	instrument.start()
+
+	samples = lambda chunk: len(chunk[0])
+	chunks = process.read_samples(trace, stat_map, process.CHUNK)
+	with instrument.timer("parse.first_chunk"):
+		first_chunk = chunks.next()
+	RAPL_AVAIL, L3_AVAIL, FP_AVAIL = process.available(first_chunk[0].events(), first_chunk[1].events())
+	chunks = instrument.stage("parse", itertools.chain([first_chunk], chunks), size=samples)
+	bins = instrument.stage("normalize_stats", process.rebin(chunks, bin_size, START_TIME, RAPL_AVAIL), "parse", samples)
+	bins = instrument.stage("process_cntrs", process.derive(bins, L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE), "normalize_stats")
+
+	template = generate_mcpat.CompiledTemplate(input_proc_model)
+	positions = []
+	def generate(bins):
+		for time_stamp, stats, cpu_rapl, cores in bins:
+			updates = generate_mcpat.mcpat_updates(stats["TOTAL"], cores, L3_AVAIL, bin_size, NUM_CORES, HW_THREADS, TSC_FREQUENCY)
+			if not positions:
+				positions.append(template.resolve(updates))
+			xml = template.fill(updates, positions[0])
+			yield time_stamp, stats, cpu_rapl, updates, xml
+	requests = instrument.stage("generate_mcpat", generate(bins), "process_cntrs")
+
+	def mcpat(requests):
+		model = None
+		results = []
+		for i, (time_stamp, stats, cpu_rapl, updates, xml) in enumerate(requests):
+			if use_model:
+				if model is None:
+					model = mcpat_model.McpatModel.get(updates, mcpatdir, input_proc_model)
+				power_dat = model.power_dat([updates])[0]
+			elif len(results) < mcpat_runs:
+				power_dat = run_mcpat.parse_mcpat_output(run_mcpat.mcpat_pipe(xml, mcpatdir))
+				results.append(power_dat)
+			else:
+				power_dat = results[i % len(results)]
+			yield time_stamp, stats, cpu_rapl, power_dat
+	power_dats = instrument.stage("mcpat", mcpat(requests), "generate_mcpat")
+
+	def power(power_dats):
+		for time_stamp, stats, cpu_rapl, power_dat in power_dats:
+			yield time_stamp, stats, cpu_rapl, run_mcpat.interval_power(power_dat, process.bin_stats(time_stamp, stats), time_stamp, NUM_CORES, HW_THREADS)
+
+	begin = time.time()
+	process.write_results(power(power_dats), output_dir, NUM_CORES, RAPL_AVAIL, results_format)
+	return instrument.finish(output_dir + "/report.json", time.time() - begin, "mcpat")
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Benchmarks the stages of process.py on a synthetic perf trace")
+	parser.add_argument("--trace", help="perf trace to use instead of generating one")
+	parser.add_argument("--microarch", help="microarchitecture name for McPAT config and counter mapping", default="haswell")
+	parser.add_argument("--cores", help="physical cores", type=int, default=4)
+	parser.add_argument("--threads-per-core", help="HW threads per physical core", type=int, default=2)
+	parser.add_argument("--duration", help="seconds of generated trace", type=float, default=3600)
+	parser.add_argument("--interval", help="perf sample interval of the generated trace, in seconds", type=float, default=1.0)
+	parser.add_argument("--bin-size", help="bin size in seconds", type=float, default=1.0)
+	parser.add_argument("--tsc-frequency", help="TSC frequency", type=int, default=2200000000)
+	parser.add_argument("--mcpat-runs", help="bins run through McPAT, the rest reuse their results", type=int, default=4)
+	parser.add_argument("--mcpat-model", help="use the McPAT model for every bin", action="store_true")
+	parser.add_argument("--results-format", help="see process.py", choices=["csv", "npy", "both"], default="csv")
+	parser.add_argument("--save", help="write the results to this JSON file")
+	parser.add_argument("--compare", help="compare with the results saved in this JSON file")
+	parser.add_argument("--tolerance", help="largest accepted slowdown of a stage with --compare", type=float, default=0.2)
+	args = parser.parse_args()
+
+	work_dir = tempfile.mkdtemp()
+	try:
+		trace = args.trace
+		if trace is None:
+			trace = os.path.join(work_dir, "counters.csv")
+			begin = time.time()
+			with open(trace, 'wb') as output_f:
+				mapping = gen_perf_trace.read_mapping(process.WATTWATCHER_HOME + "/counter_lists/" + args.microarch + ".txt")
+				samples = gen_perf_trace.write_trace(output_f, mapping, args.cores * args.threads_per_core, args.duration, args.interval, args.tsc_frequency)
+			print "generated %d samples x %d cpus (%.1f MB) in %.1f s" % (samples, args.cores * args.threads_per_core, os.path.getsize(trace) / 1e6, time.time() - begin)
+		output_dir = os.path.join(work_dir, "results")
+		os.makedirs(output_dir)
+		rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+		report = run(trace, args.microarch, args.bin_size, args.tsc_frequency, args.cores, args.threads_per_core, args.mcpat_runs, args.mcpat_model, output_dir, args.results_format)
+	finally:
+		shutil.rmtree(work_dir)
+
+	stages = collections.OrderedDict([(name, stage["wall"]) for name, stage in report["stages"].iteritems()])
+	# the first chunk is read before the stages start
+	stages["parse"] += report["timers"]["parse.first_chunk"]["wall"]
+	samples = report["stages"]["parse"]["items"]
+	bins = report["stages"]["mcpat"]["items"]
+	mcpat_runs = report["latency"]["mcpat_pipe"]["count"] if "mcpat_pipe" in report["latency"] else 0
+	result = collections.OrderedDict()
+	print "%d samples, %d bins, %d McPAT runs" % (samples, bins, mcpat_runs)
+	print "%-16s %10s %14s %12s" % ("stage", "seconds", "samples/s", "bins/s")
+	for name, elapsed in stages.iteritems():
+		print "%-16s %10.3f %14.0f %12.0f" % (name, elapsed, samples / max(elapsed, 1e-9), bins / max(elapsed, 1e-9))
+		result[name] = samples / max(elapsed, 1e-9)
+	total = sum(stages.values())
+	print "%-16s %10.3f %14.0f %12.0f" % ("total", total, samples / total, bins / total)
+	rss = int(report["peak_rss_mb"] * 1024)
+	print "peak RSS: %.1f MB (%.1f MB before the run), McPAT processes %.1f MB" % (report["peak_rss_mb"], rss_before / 1024.0, report["peak_rss_mcpat_mb"])
+
+	if args.save:
+		with open(args.save, 'wb') as f:
+			json.dump({"samples_per_second": result, "peak_rss_kb": rss}, f, indent=1)
+	if args.compare:
+		with open(args.compare, 'rb') as f:
+			baseline = json.load(f)["samples_per_second"]
+		regressions = [name for name in result if name in baseline and result[name] < baseline[name] * (1 - args.tolerance)]
+		for name in regressions:
+			print "REGRESSION: %s %.0f samples/s, was %.0f" % (name, result[name], baseline[name])
+		if regressions:
+			sys.exit(1)
+		print "no stage is more than %.0f%% slower than %s" % (100 * args.tolerance, args.compare)
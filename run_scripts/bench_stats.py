@@ -0,0 +1,119 @@
+#!/usr/bin/python
+# Benchmarks the array backed stats against the previous dict of dicts code on
+# a synthetic trace: TOTAL category, derived stats and the HW thread merge.
+# The dict code is timed on a slice of the trace and extrapolated, it does not
+# fit in memory for the full trace.  Both are checked to give the same numbers.
+#
+# PYTHONPATH=$WATTWATCHER_HOME:$WATTWATCHER_HOME/sniper_libs run_scripts/bench_stats.py --cpus 64 --samples 100000
+import sys, time, argparse, collections
+import numpy
+import stats_array
+import process_cntrs
+import generate_mcpat
+import process
+
+EVENTS = ["cycles", "ref-cycles", "instructions", "uops_dispatched", "context_switches", "migrations",
+	"branches_executed", "branches_mispredicted", "uops_retired", "icache_misses", "itlb_misses",
+	"dtlb_misses", "dcache_reads", "dcache_writes", "dcache_read_misses", "dcache_write_misses",
+	"l2_accesses", "l2_misses", "l3_accesses", "l3_misses"]
+
+# The dict implementations this replaced, for reference
+def dict_total_category(stats):
+	cores = stats.keys()
+	time_stamps = stats.itervalues().next().keys()
+	all_stats = stats.itervalues().next().itervalues().next().keys()
+	stats["TOTAL"] = collections.OrderedDict()
+	for time_stamp in time_stamps:
+		stats["TOTAL"][time_stamp] = collections.OrderedDict()
+		for stat in all_stats:
+			total = 0
+			for core in cores:
+				total += stats[core][time_stamp][stat]
+			stats["TOTAL"][time_stamp][stat] = total
+
+def dict_process_cntrs(stats, l3_avail, fp_avail, bin_size, TSC_FREQUENCY, num_threads):
+	stats["frequency"] = TSC_FREQUENCY * float(stats["cycles"])/float(stats["ref-cycles"]) / 1000000
+	if num_threads == 0:
+		stats["total_cycles"] = bin_size * stats["frequency"] * 1000000
+	else:
+		stats["total_cycles"] = bin_size * stats["frequency"] * 1000000 * num_threads
+	stats["busy_cycles"] = stats["cycles"]
+	stats["idle_cycles"] = stats["total_cycles"] - stats["busy_cycles"]
+	stats["ipc"] = float(stats["instructions"])/float(stats["cycles"])
+	stats["branch_miss_rate"] = float(stats["branches_mispredicted"])/float(stats["branches_executed"])
+	stats["icache_miss_rate"] = 0
+	stats["dcache_miss_rate"] = float(stats["dcache_read_misses"] + stats["dcache_writes"]) / float(stats["dcache_reads"] + stats["dcache_writes"])
+	stats["l2_miss_rate"] = float(stats["l2_misses"]) / float(stats["l2_accesses"])
+	stats["l3_miss_rate"] = float(stats["l3_misses"]) / float(stats["l3_accesses"])
+	stats["itlb_mpki"] = float(stats["itlb_misses"]) / float(stats["instructions"]) * 1000
+	stats["dtlb_mpki"] = float(stats["dtlb_misses"]) / float(stats["instructions"]) * 1000
+	stats["fp_uops_executed"] = 0
+	stats["fp_uops_retired"] = 0
+
+def dict_merge_threads(stats, time_stamp, CORES, HW_THREADS):
+	cores = []
+	for k in range(0,CORES,1):
+		d = {}
+		for stat in stats.itervalues().next().itervalues().next().keys():
+			d[stat] = 0
+			for j in range(k, HW_THREADS, CORES):
+				d[stat] += stats["CPU" + str(j)][time_stamp][stat]
+		cores.append(d)
+	return cores
+
+def synthetic(samples, cpus, seed):
+	rng = numpy.random.RandomState(seed)
+	stats = stats_array.StatsArray(numpy.arange(1, samples + 1, dtype=numpy.float64), ["CPU" + str(c) for c in range(0, cpus)])
+	for event in EVENTS:
+		stats[event] = rng.randint(1000, 10000000, (samples, cpus)).astype(numpy.float64)
+	stats["cycles"] = rng.randint(100000000, 2000000000, (samples, cpus)).astype(numpy.float64)
+	stats["ref-cycles"] = rng.randint(100000000, 2000000000, (samples, cpus)).astype(numpy.float64)
+	return stats
+
+def run_array(stats, threads_per_core):
+	cpus = len(stats.cpus)
+	process.create_total_category(stats)
+	process_cntrs.process_cntrs(stats, 1, 0, 1.0, 2200000000, [cpus if cpu == "TOTAL" else 0 for cpu in stats.cpus])
+	return generate_mcpat.merge_threads(stats, cpus / threads_per_core, cpus)
+
+def run_dict(stats, threads_per_core):
+	cpus = len(stats.keys())
+	dict_total_category(stats)
+	for cpu in stats.keys():
+		for time_stamp in stats[cpu].keys():
+			dict_process_cntrs(stats[cpu][time_stamp], 1, 0, 1.0, 2200000000, cpus if cpu == "TOTAL" else 0)
+	return [dict_merge_threads(stats, time_stamp, cpus / threads_per_core, cpus) for time_stamp in stats.itervalues().next().keys()]
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Benchmarks the array backed stats against the dict based stats")
+	parser.add_argument("--cpus", help="logical cpus", type=int, default=64)
+	parser.add_argument("--samples", help="samples in the trace", type=int, default=100000)
+	parser.add_argument("--threads-per-core", help="HW threads per physical core", type=int, default=2)
+	parser.add_argument("--chunk", help="samples per array batch", type=int, default=1024)
+	parser.add_argument("--dict-samples", help="samples timed with the dict code", type=int, default=500)
+	args = parser.parse_args()
+
+	elapsed = 0.0
+	for seed, start in enumerate(range(0, args.samples, args.chunk)):
+		stats = synthetic(min(args.chunk, args.samples - start), args.cpus, seed)
+		begin = time.time()
+		run_array(stats, args.threads_per_core)
+		elapsed += time.time() - begin
+	print "array: %d samples x %d cpus in %.2f s, %.0f samples/s" % (args.samples, args.cpus, elapsed, args.samples / elapsed)
+
+	stats = synthetic(args.dict_samples, args.cpus, 0)
+	dict_stats = stats.to_stats()
+	begin = time.time()
+	dict_cores = run_dict(dict_stats, args.threads_per_core)
+	dict_elapsed = time.time() - begin
+	print "dict:  %d samples x %d cpus in %.2f s, %.0f samples/s (%.1f s extrapolated to %d samples)" % (args.dict_samples, args.cpus, dict_elapsed,
+		args.dict_samples / dict_elapsed, dict_elapsed * args.samples / args.dict_samples, args.samples)
+	print "speedup: %.1fx" % ((dict_elapsed / args.dict_samples) / (elapsed / args.samples))
+
+	cores = run_array(stats, args.threads_per_core)
+	for t, time_stamp in enumerate(stats.times.tolist()):
+		for stat in EVENTS + ["frequency", "total_cycles", "ipc", "dcache_miss_rate", "dtlb_mpki"]:
+			assert stats[stat, "TOTAL"][t] == dict_stats["TOTAL"][time_stamp][stat], stat
+			for k, core in enumerate(cores.cpus):
+				assert cores[stat, core][t] == dict_cores[t][k][stat], stat
+	print "array and dict results match"
@@ -0,0 +1,88 @@
+#!/usr/bin/python
+# Checks the McPAT model (see mcpat_model.py) against full McPAT on a synthetic
+# perf trace (see gen_perf_trace.py).  The trace is binned and derived like in
+# process.py, then randomly sampled intervals are evaluated with the model and
+# run through McPAT.  Prints the largest relative error of every component over
+# all its outputs and fails when one is above --tolerance.
+#
+# WATTWATCHER_HOME=... PYTHONPATH=$WATTWATCHER_HOME:$WATTWATCHER_HOME/sniper_libs run_scripts/check_mcpat_model.py --samples 20
+import os, sys, argparse, tempfile, shutil, collections
+import numpy
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import gen_perf_trace
+import process
+import generate_mcpat
+import run_mcpat
+import mcpat_model
+
+# The McPAT updates of every bin of trace
+def interval_updates(trace, microarch, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE):
+	HW_THREADS = NUM_CORES * THREADS_PER_CORE
+	stat_map = process.read_stat_map(microarch)
+	START_TIME, END_TIME = process.read_time_range(trace)
+	chunks = process.read_samples(trace, stat_map, process.CHUNK)
+	first_chunk = chunks.next()
+	RAPL_AVAIL, L3_AVAIL, FP_AVAIL = process.available(first_chunk[0].events(), first_chunk[1].events())
+	bins = process.rebin([first_chunk] + list(chunks), bin_size, START_TIME, RAPL_AVAIL)
+	return [generate_mcpat.mcpat_updates(stats["TOTAL"], cores, L3_AVAIL, bin_size, NUM_CORES, HW_THREADS, TSC_FREQUENCY)
+		for time_stamp, stats, cpu_rapl, cores in process.derive(bins, L3_AVAIL, FP_AVAIL, bin_size, TSC_FREQUENCY, NUM_CORES, THREADS_PER_CORE)]
+
+# The component of a flattened output name, "Core#0/Execution Unit/Area" -> "Core#0"
+def component(name):
+	return name.split("/", 1)[0]
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Compares the McPAT model with full McPAT on sampled intervals of a synthetic perf trace")
+	parser.add_argument("--trace", help="perf trace to use instead of generating one")
+	parser.add_argument("--microarch", help="microarchitecture name for McPAT config and counter mapping", default="haswell")
+	parser.add_argument("--cores", help="physical cores", type=int, default=4)
+	parser.add_argument("--threads-per-core", help="HW threads per physical core", type=int, default=2)
+	parser.add_argument("--duration", help="seconds of generated trace", type=float, default=600)
+	parser.add_argument("--interval", help="perf sample interval of the generated trace, in seconds", type=float, default=1.0)
+	parser.add_argument("--bin-size", help="bin size in seconds", type=float, default=1.0)
+	parser.add_argument("--tsc-frequency", help="TSC frequency", type=int, default=2200000000)
+	parser.add_argument("--samples", help="intervals run through McPAT", type=int, default=20)
+	parser.add_argument("--seed", help="seed of the interval sample", type=int, default=0)
+	parser.add_argument("--tolerance", help="largest accepted relative error of a component", type=float, default=1e-3)
+	parser.add_argument("--jobs", help="McPAT processes", type=int)
+	args = parser.parse_args()
+
+	mcpatdir = process.WATTWATCHER_HOME + "/fast_mcpat"
+	input_proc_model = process.WATTWATCHER_HOME + "/mcpat_procs/" + args.microarch + ".xml"
+	work_dir = tempfile.mkdtemp()
+	try:
+		trace = args.trace
+		if trace is None:
+			trace = os.path.join(work_dir, "counters.csv")
+			with open(trace, 'wb') as output_f:
+				mapping = gen_perf_trace.read_mapping(process.WATTWATCHER_HOME + "/counter_lists/" + args.microarch + ".txt")
+				gen_perf_trace.write_trace(output_f, mapping, args.cores * args.threads_per_core, args.duration, args.interval, args.tsc_frequency)
+		updates = interval_updates(trace, args.microarch, args.bin_size, args.tsc_frequency, args.cores, args.threads_per_core)
+	finally:
+		shutil.rmtree(work_dir)
+
+	run_mcpat.use_cacti_seed(input_proc_model)
+	model = mcpat_model.McpatModel.get(updates[0], mcpatdir, input_proc_model, args.jobs)
+	rng = numpy.random.RandomState(args.seed)
+	sample = sorted(rng.choice(len(updates), min(args.samples, len(updates)), replace=False).tolist())
+	predicted = model.evaluate(model.values([updates[i] for i in sample]))
+	reference = [mcpat_model.flatten(run_mcpat.parse_mcpat_output(output))
+		for output in run_mcpat.mcpat_serve_all([updates[i] for i in sample], mcpatdir, input_proc_model, args.jobs)]
+
+	# largest relative error of every component and the output it is in
+	worst = collections.OrderedDict()
+	for row, ref in enumerate(reference):
+		for j, name in enumerate(model.outputs):
+			expected = ref.get(name, 0.0)
+			error = abs(predicted[row, j] - expected) / max(abs(expected), 1e-6)
+			if error >= worst.get(component(name), (0.0, None))[0]:
+				worst[component(name)] = (error, name)
+
+	print "%d of %d intervals run through McPAT" % (len(sample), len(updates))
+	print "%-24s %12s  %s" % ("component", "max error", "output")
+	for name, (error, output) in worst.iteritems():
+		print "%-24s %12.2e  %s" % (name, error, output)
+	failed = [name for name, (error, output) in worst.iteritems() if error > args.tolerance]
+	if failed:
+		raise SystemExit("McPAT model error above %.0e in %s" % (args.tolerance, ", ".join(failed)))
+	print "the McPAT model is within %.0e of McPAT in every component" % args.tolerance
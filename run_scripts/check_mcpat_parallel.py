@@ -0,0 +1,36 @@
+#!/usr/bin/python
+# Checks that a cold McPAT run that builds the processor components in
+# parallel prints the same results as a serial one, and times both.  Each run
+# starts from an empty CACTI cache of its own.
+#
+# run_scripts/check_mcpat_parallel.py $WATTWATCHER_HOME/fast_mcpat $WATTWATCHER_HOME/mcpat_procs/haswell.xml --threads 8
+import os, time, argparse, tempfile, shutil, subprocess, difflib
+
+# McPAT output of a cold run, without its CACTI_STATS line, and the time it took
+def cold_run(mcpatdir, input_proc_model, threads, cache):
+	begin = time.time()
+	output = subprocess.check_output([mcpatdir + "/mcpat", "-print_level", "5", "-opt_for_clk", "1", "-json", "1", "-stats", "1",
+		"-threads", str(threads), "-cache", cache, "-infile", input_proc_model])
+	elapsed = time.time() - begin
+	return [line for line in output.splitlines() if not line.startswith("CACTI_STATS")], elapsed
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Compares parallel and serial cold McPAT runs")
+	parser.add_argument("mcpatdir", help="directory of the mcpat binary")
+	parser.add_argument("input_proc_model", help="McPAT input file")
+	parser.add_argument("--threads", help="threads of the parallel run", type=int, default=4)
+	args = parser.parse_args()
+
+	cache_dir = tempfile.mkdtemp()
+	try:
+		serial, serial_time = cold_run(args.mcpatdir, args.input_proc_model, 1, cache_dir + "/serial.cacti")
+		print "serial:     %.1f s" % serial_time
+		parallel, parallel_time = cold_run(args.mcpatdir, args.input_proc_model, args.threads, cache_dir + "/parallel.cacti")
+		print "%2d threads: %.1f s (%.2fx)" % (args.threads, parallel_time, serial_time / parallel_time)
+	finally:
+		shutil.rmtree(cache_dir)
+	if serial != parallel:
+		for line in difflib.unified_diff(serial, parallel, "serial", "parallel", lineterm="", n=1):
+			print line
+		raise SystemExit("parallel and serial McPAT results differ")
+	print "parallel and serial McPAT results are identical"
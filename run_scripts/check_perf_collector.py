@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# Replays a synthetic perf stat trace (see gen_perf_trace.py) through
+# perf_collector.py and checks that process.py reads the same samples and time
+# range from the records as from the text.  Also times the collector per
+# interval and the parse of both files.
+#
+# WATTWATCHER_HOME=... PYTHONPATH=$WATTWATCHER_HOME:$WATTWATCHER_HOME/sniper_libs run_scripts/check_perf_collector.py --cpus 8 --duration 3600
+import os, time, argparse, tempfile, shutil
+import numpy
+import process
+import perf_collector
+import gen_perf_trace
+
+# The samples of a counter file as one (StatsArray, StatsArray of the RAPL energies), and the time the parse took
+def read_all(raw_cntr_file, stat_map):
+	begin = time.time()
+	chunks = list(process.read_samples(raw_cntr_file, stat_map, 1000))
+	elapsed = time.time() - begin
+	return [chunk[0] for chunk in chunks], [chunk[1] for chunk in chunks], elapsed
+
+def same_arrays(a, b):
+	if len(a) != len(b):
+		return False
+	for x, y in zip(a, b):
+		if x.cpus != y.cpus or x.events() != y.events() or not numpy.array_equal(x.times, y.times):
+			return False
+		for event in x.events():
+			if not numpy.array_equal(x[event], y[event]):
+				return False
+	return True
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Checks perf_collector.py records against perf stat text")
+	parser.add_argument("--microarch", help="counter list to use", default="haswell")
+	parser.add_argument("--cpus", help="logical cpus", type=int, default=8)
+	parser.add_argument("--duration", help="seconds of trace", type=float, default=600)
+	parser.add_argument("--interval", help="sample interval in seconds", type=float, default=1.0)
+	parser.add_argument("--group-size", help="hardware events per group", type=int, default=4)
+	args = parser.parse_args()
+
+	counter_list = process.WATTWATCHER_HOME + "/counter_lists/" + args.microarch + ".txt"
+	stat_map = process.read_stat_map(args.microarch)
+	tmp_dir = tempfile.mkdtemp()
+	try:
+		text = tmp_dir + "/counters.csv"
+		records = tmp_dir + "/counters.bin"
+		with open(text, 'wb') as output_f:
+			samples = gen_perf_trace.write_trace(output_f, gen_perf_trace.read_mapping(counter_list), args.cpus, args.duration, args.interval, 2200000000)
+		source = perf_collector.ReplaySource(text)
+		# the time spent moving the replay to the next interval is not the collector's
+		replay_time = [0.0]
+		wait = source.wait
+		def timed_wait(deadline):
+			begin = time.time()
+			more = wait(deadline)
+			replay_time[0] += time.time() - begin
+			return more
+		source.wait = timed_wait
+		event_names = [event for event, name in gen_perf_trace.read_mapping(counter_list)]
+		begin = time.time()
+		with open(records, 'wb') as output_f:
+			written = perf_collector.collect(source, event_names, args.interval, output_f, args.group_size)
+		collect_time = time.time() - begin - replay_time[0]
+		print "%d samples, %d groups: collector %.3f ms per sample" % (written, len(source.groups), 1000 * collect_time / max(1, written))
+
+		text_stats, text_rapl, text_time = read_all(text, stat_map)
+		record_stats, record_rapl, record_time = read_all(records, stat_map)
+		print "perf stat text:    %8d bytes, parsed in %.3f s" % (os.path.getsize(text), text_time)
+		print "collector records: %8d bytes, parsed in %.3f s (%.1fx)" % (os.path.getsize(records), record_time, text_time / record_time)
+	finally:
+		shutil.rmtree(tmp_dir)
+	failures = []
+	if written != samples:
+		failures.append("%d samples were replayed out of %d" % (written, samples))
+	if not same_arrays(text_stats, record_stats):
+		failures.append("the counters of the records differ from the text")
+	if not same_arrays(text_rapl, record_rapl):
+		failures.append("the RAPL energies of the records differ from the text")
+	if failures:
+		raise SystemExit("\n".join(failures))
+	print "the records read the same as the perf stat text"
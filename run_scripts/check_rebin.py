@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# Property checks for process.Rebinner on random traces: irregular intervals,
+# gaps from missing samples, random chunking and awkward bin sizes.
+#  - the bins (keys and values) match the scalar normalize_stats it replaced
+#  - counts are conserved: emitted bins + the open bin + the held back sample
+#    add up to the input, and the emitted bins add up to the exact integral of
+#    the piecewise constant rates up to the end of the last bin
+#
+# WATTWATCHER_HOME=... PYTHONPATH=$WATTWATCHER_HOME:$WATTWATCHER_HOME/sniper_libs run_scripts/check_rebin.py
+import sys, argparse, collections, random
+import numpy
+import process
+
+# The scalar implementation this replaced, for reference
+def reference_normalize_stats(bin_size, stats, START_TIME):
+    scaled_stats = collections.OrderedDict()
+    for stat in stats.itervalues().next().keys():
+        even_bin = 1
+        even_bin_time_left = bin_size
+        even_bin_stat_value = 0
+        real_bin_time_left = 0
+        prev_time_stamp = 0
+        for time_stamp in stats.keys():
+            while real_bin_time_left > 0:
+                if even_bin_time_left < real_bin_time_left:
+                    next_real_bin_time_left = real_bin_time_left - even_bin_time_left
+                    next_real_bin_stat_value = ( next_real_bin_time_left / real_bin_time_left) * real_bin_stat_value
+                    even_bin_stat_value += real_bin_stat_value - next_real_bin_stat_value
+                    scaled_stats.setdefault(even_bin + START_TIME, collections.OrderedDict())[stat] = even_bin_stat_value
+                    even_bin_time_left = bin_size
+                    even_bin += bin_size
+                    even_bin_stat_value = 0
+                    real_bin_time_left = next_real_bin_time_left
+                    real_bin_stat_value = next_real_bin_stat_value
+                else:
+                    even_bin_stat_value += real_bin_stat_value
+                    even_bin_time_left -= real_bin_time_left
+                    real_bin_time_left = 0
+            real_bin_stat_value = stats[time_stamp][stat]
+            real_bin_time_left = time_stamp - prev_time_stamp
+            prev_time_stamp = time_stamp
+    return scaled_stats
+
+# Exact count of the piecewise constant rates over (0, end]
+def integral(times, values, end):
+    total = numpy.zeros(values.shape[1:])
+    start = 0.0
+    for time_stamp, value in zip(times, values):
+        if time_stamp <= end:
+            total += value
+        elif start < end:
+            total += value * (end - start) / (time_stamp - start)
+        start = time_stamp
+    return total
+
+def random_trace(rng):
+    samples = rng.randint(1, 200)
+    aligned = rng.random() < 0.3
+    times = []
+    t = 0.0
+    for i in range(0, samples):
+        if aligned:
+            t += rng.choice([1, 1, 1, 2, 5])
+        else:
+            t += rng.uniform(0.01, 3.0)
+            # a dropped perf interval
+            if rng.random() < 0.05:
+                t += rng.uniform(1.0, 10.0)
+        times.append(t)
+    values = numpy.array([[rng.choice([0.0, 1.0, rng.uniform(0, 1e9)]) for stat in range(0, 3)] for i in range(0, samples)])
+    bin_size = rng.choice([1, 2, 0.5, 0.1, 0.3, 2.5, 7]) if not aligned else rng.choice([1, 2, 5])
+    return numpy.array(times), values, bin_size
+
+def check(rng):
+    times, values, bin_size = random_trace(rng)
+    START_TIME = rng.choice([0, 1444444444.0])
+    stats = collections.OrderedDict([(t, collections.OrderedDict([("s" + str(i), v) for i, v in enumerate(row)])) for t, row in zip(times.tolist(), values.tolist())])
+    expected = reference_normalize_stats(bin_size, stats, START_TIME)
+
+    # feed the same trace in random chunks
+    rebinner = process.Rebinner(bin_size, START_TIME)
+    keys = []
+    binned = []
+    start = 0
+    while start < len(times):
+        end = start + rng.randint(1, 50)
+        k, b = rebinner.add(times[start:end], values[start:end])
+        keys += k.tolist()
+        binned += b.tolist()
+        start = end
+
+    assert keys == expected.keys(), (bin_size, keys[-3:], expected.keys()[-3:])
+    for key, row in zip(keys, binned):
+        for i, value in enumerate(row):
+            ref = expected[key]["s" + str(i)]
+            assert abs(value - ref) <= 1e-9 * max(1.0, abs(ref), values[:, i].max()), (key, value, ref)
+
+    binned = numpy.array(binned).reshape((len(keys), values.shape[1]))
+    total = binned.sum(axis=0) + rebinner.partial + rebinner.pending
+    assert numpy.allclose(total, values.sum(axis=0), rtol=1e-12, atol=1e-6), (total, values.sum(axis=0))
+    if keys:
+        exact = integral(times, values, rebinner.bins * bin_size)
+        assert numpy.allclose(binned.sum(axis=0), exact, rtol=1e-9, atol=1e-6), (binned.sum(axis=0), exact)
+    return len(keys)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Property checks for the cumulative sum rebinning")
+    parser.add_argument("--traces", help="random traces to check", type=int, default=2000)
+    parser.add_argument("--seed", help="random seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    bins = 0
+    for i in range(0, args.traces):
+        bins += check(rng)
+    print "%d traces, %d bins: rebinning matches normalize_stats and conserves counts" % (args.traces, bins)
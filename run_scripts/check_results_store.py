@@ -0,0 +1,39 @@
+#!/usr/bin/python
+# Checks that the columnar results store of a run holds the same numbers as its
+# CSV files (process.py --results-format both), and times reading one column
+# from each.
+#
+# PYTHONPATH=$WATTWATCHER_HOME run_scripts/check_results_store.py <output_dir>
+import os, csv, time, argparse
+import numpy
+import results_store
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Compares the columnar results store with the CSV results")
+	parser.add_argument("output_dir", help="output directory of process.py --results-format both")
+	args = parser.parse_args()
+
+	store = results_store.ResultsStore(args.output_dir + "/results")
+	for table in store.tables():
+		with open(os.path.join(args.output_dir, table + ".csv"), 'rb') as f:
+			rows = list(csv.reader(f))
+		assert len(rows) - 1 == store.bins, (table, len(rows) - 1, store.bins)
+		values = numpy.array(rows[1:], dtype=numpy.float64).reshape((len(rows) - 1, len(rows[0])))
+		for j, column in enumerate(store.columns(table)):
+			assert numpy.array_equal(store.column(table, column), values[:, j]), (table, column)
+	print "%d tables, %d bins: the store matches the CSV files" % (len(store.tables()), store.bins)
+
+	table = store.tables()[0]
+	column = store.columns(table)[-1]
+	begin = time.time()
+	with open(os.path.join(args.output_dir, table + ".csv"), 'rb') as f:
+		reader = csv.reader(f)
+		reader.next()
+		j = store.columns(table).index(column)
+		csv_column = numpy.array([float(row[j]) for row in reader])
+	csv_elapsed = time.time() - begin
+	begin = time.time()
+	total = float(store.column(table, column).sum())
+	store_elapsed = time.time() - begin
+	assert total == csv_column.sum()
+	print "%s of %s: %.4f s from CSV, %.4f s from the store" % (column, table, csv_elapsed, store_elapsed)
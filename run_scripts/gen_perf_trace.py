@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# Generates a synthetic perf stat -x , -I -a -A trace in the format process.py
+# reads (and perf_collector.py --replay replays): one row per sample, cpu and counter of a
+# counter_lists/<microarch>.txt mapping, then the START TIME and END TIME lines.
+# The counts follow a few random program phases (utilization, frequency, IPC
+# and miss rates per cpu) with some noise, so the derived stats stay plausible.
+#
+# run_scripts/gen_perf_trace.py $WATTWATCHER_HOME/counter_lists/haswell.txt --cpus 8 --duration 3600 > counters.csv
+import sys, csv, argparse, random
+
+# Counts of the translated counter names per unit of the phase quantities, see counts()
+def counts(phase, interval, tsc_frequency, rng):
+	u = min(1.0, max(0.0, rng.gauss(phase["utilization"], 0.02)))
+	cycles = u * phase["frequency"] * interval
+	instructions = cycles * max(0.05, rng.gauss(phase["ipc"], 0.05))
+	branches = 0.2 * instructions
+	loads = 0.3 * instructions
+	stores = 0.1 * instructions
+	l2 = loads * phase["l1_miss_rate"]
+	l3 = l2 * phase["l2_miss_rate"]
+	c = {
+		"cycles": cycles,
+		"ref-cycles": u * tsc_frequency * interval,
+		"instructions": instructions,
+		"uops_dispatched": 1.3 * instructions,
+		"uops_retired": 1.2 * instructions,
+		"context_switches": 100 * interval,
+		"migrations": 2 * interval,
+		"branches_executed": branches,
+		"branches_mispredicted": branches * phase["branch_miss_rate"],
+		"icache_misses": instructions * 0.002,
+		"itlb_misses": instructions * 0.0001,
+		"dtlb_misses": loads * 0.001,
+		"dcache_reads": loads,
+		"dcache_writes": stores,
+		"dcache_read_misses": loads * phase["l1_miss_rate"],
+		"dcache_write_misses": stores * phase["l1_miss_rate"],
+		"l2_accesses": l2,
+		"l2_misses": l3,
+		"l3_accesses": l3,
+		"l3_misses": l3 * phase["l3_miss_rate"],
+		"fp_uops_executed": instructions * phase["fp_fraction"],
+	}
+	return u, c
+
+def random_phase(rng, tsc_frequency):
+	return {
+		"utilization": rng.choice([0.02, 0.3, 0.7, 1.0]),
+		"frequency": tsc_frequency * rng.uniform(0.6, 1.3),
+		"ipc": rng.uniform(0.3, 2.5),
+		"branch_miss_rate": rng.uniform(0.001, 0.05),
+		"l1_miss_rate": rng.uniform(0.01, 0.1),
+		"l2_miss_rate": rng.uniform(0.1, 0.6),
+		"l3_miss_rate": rng.uniform(0.05, 0.5),
+		"fp_fraction": rng.uniform(0, 0.3),
+	}
+
+# Writes a trace of duration seconds sampled every interval seconds.  mapping is [(perf event, translated name)].
+def write_trace(output_f, mapping, cpus, duration, interval, tsc_frequency, phases=4, phase_length=30.0, seed=0, start_time=1444444444):
+	rng = random.Random(seed)
+	programs = [random_phase(rng, tsc_frequency) for i in range(0, phases)]
+	writer = csv.writer(output_f, lineterminator="\n")
+	samples = int(duration / interval)
+	cpu_phase = [rng.randrange(phases) for cpu in range(0, cpus)]
+	for sample in range(1, samples + 1):
+		time_stamp = "%.9f" % (sample * interval + rng.uniform(0, interval * 0.001))
+		busy = 0.0
+		rows = []
+		for cpu in range(0, cpus):
+			if rng.random() < interval / phase_length:
+				cpu_phase[cpu] = rng.randrange(phases)
+			u, c = counts(programs[cpu_phase[cpu]], interval, tsc_frequency, rng)
+			busy += u
+			for event, name in mapping:
+				if name.startswith("energy_"):
+					continue
+				rows.append((time_stamp, "CPU" + str(cpu), "%d" % c.get(name, 1000 * interval), "", event))
+		# RAPL counters are per package, perf -A prints them on the first cpu
+		for event, name in mapping:
+			if name == "energy_pkg":
+				rows.append((time_stamp, "CPU0", "%.2f" % ((10 + 40 * busy / cpus) * interval), "Joules", event))
+			elif name == "energy_cores":
+				rows.append((time_stamp, "CPU0", "%.2f" % ((2 + 30 * busy / cpus) * interval), "Joules", event))
+		writer.writerows(rows)
+	writer.writerow(["START TIME", start_time])
+	writer.writerow(["END TIME", start_time + int(duration)])
+	return samples
+
+def read_mapping(counter_list):
+	mapping = []
+	with open(counter_list, 'rb') as input_f:
+		for row in csv.reader(input_f):
+			if row and not row[0].startswith('#'):
+				mapping.append((row[0], row[1]))
+	return mapping
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Generates a synthetic perf stat trace")
+	parser.add_argument("counter_list", help="counter mapping, e.g. $WATTWATCHER_HOME/counter_lists/haswell.txt")
+	parser.add_argument("--cpus", help="logical cpus (cores x threads per core)", type=int, default=8)
+	parser.add_argument("--duration", help="seconds of trace", type=float, default=600)
+	parser.add_argument("--interval", help="perf sample interval in seconds", type=float, default=1.0)
+	parser.add_argument("--tsc-frequency", help="TSC frequency", type=int, default=2200000000)
+	parser.add_argument("--phases", help="distinct program phases", type=int, default=4)
+	parser.add_argument("--seed", help="random seed", type=int, default=0)
+	parser.add_argument("--output", help="output file (default: stdout)")
+	args = parser.parse_args()
+	output_f = open(args.output, 'wb') if args.output else sys.stdout
+	write_trace(output_f, read_mapping(args.counter_list), args.cpus, args.duration, args.interval, args.tsc_frequency, args.phases, seed=args.seed)
+	if args.output:
+		output_f.close()
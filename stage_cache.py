@@ -0,0 +1,147 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Content addressed stage cache
+# @date: 10/18/2026
+#
+# Every stage of the pipeline is stored under a hash of its inputs, so running
+# process.py again only recomputes the stages whose inputs changed:
+#   rebin    the rebinned (and adaptive) chunks, keyed by the counters file,
+#            the counter mapping and the binning parameters
+#   derived  the derived stats and merged cores of each chunk, keyed by the
+#            rebin key and the processor parameters
+#   mcpat    the McPAT results of a bin, keyed by the McPAT binary and the
+#            McPAT input generated for the bin (template and runtime stats)
+# Chunk streams are only reused once they were written completely.  McPAT
+# results are stored as soon as each run finishes, so an interrupted run
+# resumes with the bins it did not get to.
+
+import os, json, shutil, hashlib, tempfile, threading, itertools, collections
+import numpy
+import stats_array
+
+# Part of every key, bump it when the output of a stage changes
+STAGE_VERSION = 1
+
+def file_hash(path):
+	h = hashlib.sha1()
+	with open(path, 'rb') as f:
+		for block in iter(lambda: f.read(1 << 20), ""):
+			h.update(block)
+	return h.hexdigest()
+
+def key(*parts):
+	h = hashlib.sha1(repr(STAGE_VERSION))
+	for part in parts:
+		h.update(part if isinstance(part, str) else repr(part))
+		h.update("\0")
+	return h.hexdigest()
+
+# Writes a tuple of StatsArray (or None) to a .npz file
+def save_chunk(path, chunk):
+	arrays = {"n": numpy.array(len(chunk))}
+	for i, stats in enumerate(chunk):
+		if stats is None:
+			continue
+		arrays["times_%d" % i] = stats.times
+		arrays["cpus_%d" % i] = numpy.array(stats.cpus)
+		arrays["events_%d" % i] = numpy.array(stats.events())
+		arrays["cube_%d" % i] = stats.array()
+	with open(path, 'wb') as f:
+		numpy.savez(f, **arrays)
+
+def load_chunk(path):
+	arrays = numpy.load(path)
+	chunk = []
+	for i in range(0, int(arrays["n"])):
+		if "times_%d" % i not in arrays.files:
+			chunk.append(None)
+			continue
+		chunk.append(stats_array.StatsArray.from_array(arrays["times_%d" % i], arrays["cpus_%d" % i].tolist(),
+			arrays["events_%d" % i].tolist(), arrays["cube_%d" % i]))
+	return tuple(chunk)
+
+class StageCache:
+
+	def __init__(self, directory):
+		self.directory = directory
+		self.lock = threading.Lock()
+		self.hits = collections.Counter()
+		self.misses = collections.Counter()
+
+	def path(self, stage, stage_key):
+		return os.path.join(self.directory, stage, stage_key[:2], stage_key)
+
+	def count(self, stage, hit):
+		with self.lock:
+			(self.hits if hit else self.misses)[stage] += 1
+
+	# Returns the stored value of a stage, or stores and returns compute()
+	def evaluate(self, stage, stage_key, compute):
+		path = self.path(stage, stage_key) + ".json"
+		if os.path.isfile(path):
+			self.count(stage, True)
+			with open(path, 'rb') as f:
+				return json.load(f, object_pairs_hook=collections.OrderedDict)
+		self.count(stage, False)
+		value = compute()
+		if not os.path.isdir(os.path.dirname(path)):
+			try:
+				os.makedirs(os.path.dirname(path))
+			except OSError:
+				# created by another thread
+				pass
+		fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+		with os.fdopen(fd, 'wb') as f:
+			json.dump(value, f)
+		os.rename(tmp, path)
+		return value
+
+	# Yields the stored chunks of a stage, or stores and yields the chunks of compute().
+	# The chunks are tuples of StatsArray (or None).
+	def chunks(self, stage, stage_key, compute):
+		path = self.path(stage, stage_key)
+		if os.path.isdir(path):
+			self.count(stage, True)
+			for n in itertools.count():
+				chunk_file = os.path.join(path, "chunk_%d.npz" % n)
+				if not os.path.isfile(chunk_file):
+					return
+				yield load_chunk(chunk_file)
+		self.count(stage, False)
+		if not os.path.isdir(os.path.dirname(path)):
+			os.makedirs(os.path.dirname(path))
+		tmp = tempfile.mkdtemp(dir=os.path.dirname(path))
+		try:
+			for n, chunk in enumerate(compute()):
+				save_chunk(os.path.join(tmp, "chunk_%d.npz" % n), chunk)
+				yield chunk
+			try:
+				os.rename(tmp, path)
+			except OSError:
+				# stored by another run in the meantime
+				pass
+		finally:
+			shutil.rmtree(tmp, ignore_errors=True)
+
+	def report(self):
+		print "stage cache %s:" % self.directory, ", ".join(["%s %d reused, %d computed" % (stage, self.hits[stage], self.misses[stage])
+			for stage in ["rebin", "derived", "mcpat"] if self.hits[stage] or self.misses[stage]])
@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+# Array backed store for the counter statistics
+#
+# The stats are a time x cpu x event cube of float64.  It is held as one
+# (time x cpu) column per event, so derived events can be added without
+# copying the others.
+#   stats["cycles"]            (time x cpu) array of one event
+#   stats["cycles", "TOTAL"]   (time) array of one event on one cpu
+#   stats.row(t, "CPU0")       {event: value} of one cpu at time index t
+
+import collections
+import numpy
+
+class StatsArray:
+
+	def __init__(self, times, cpus):
+		self.times = numpy.asarray(times, dtype=numpy.float64)
+		self.cpus = list(cpus)
+		self.cpu_index = dict([(cpu, i) for i, cpu in enumerate(self.cpus)])
+		self.columns = collections.OrderedDict()
+
+	def __len__(self):
+		return len(self.times)
+
+	def events(self):
+		return self.columns.keys()
+
+	def __contains__(self, event):
+		return event in self.columns
+
+	def __getitem__(self, key):
+		if isinstance(key, tuple):
+			event, cpu = key
+			return self.columns[event][:, self.cpu_index[cpu]]
+		return self.columns[key]
+
+	# Adds or replaces an event.  Scalars and per cpu or per time vectors are broadcast.
+	def __setitem__(self, event, values):
+		column = numpy.empty((len(self.times), len(self.cpus)))
+		column[:] = values
+		self.columns[event] = column
+
+	# Appends a cpu, values is {event: (time) array}
+	def add_cpu(self, cpu, values):
+		self.cpu_index[cpu] = len(self.cpus)
+		self.cpus.append(cpu)
+		for event, column in self.columns.iteritems():
+			self.columns[event] = numpy.column_stack((column, values[event]))
+
+	# The whole time x cpu x event cube
+	def array(self):
+		return numpy.dstack(self.columns.values())
+
+	# {event: value} of one cpu at time index t, as Python floats
+	def row(self, t, cpu):
+		i = self.cpu_index[cpu]
+		return collections.OrderedDict([(event, float(column[t, i])) for event, column in self.columns.iteritems()])
+
+	# The rows of every cpu as Python floats, {time: {cpu: {event: value}}}
+	def rows(self):
+		events = self.columns.keys()
+		cube = self.array().tolist()
+		result = collections.OrderedDict()
+		for t, time_stamp in enumerate(self.times.tolist()):
+			result[time_stamp] = collections.OrderedDict([(cpu, collections.OrderedDict(zip(events, cube[t][i]))) for i, cpu in enumerate(self.cpus)])
+		return result
+
+	# Builds the store from a time x cpu x event cube, the inverse of array()
+	@classmethod
+	def from_array(cls, times, cpus, events, cube):
+		stats_array = cls(times, cpus)
+		for i, event in enumerate(events):
+			stats_array[event] = cube[:, :, i]
+		return stats_array
+
+	# Builds the store from the {cpu: {time: {event: value}}} dictionaries
+	@classmethod
+	def from_stats(cls, stats):
+		cpus = stats.keys()
+		times = stats.itervalues().next().keys()
+		stats_array = cls(times, cpus)
+		for event in stats.itervalues().next().itervalues().next().keys():
+			stats_array[event] = [[stats[cpu][time_stamp][event] for cpu in cpus] for time_stamp in times]
+		return stats_array
+
+	# Inverse of from_stats
+	def to_stats(self):
+		stats = collections.OrderedDict([(cpu, collections.OrderedDict()) for cpu in self.cpus])
+		for time_stamp, cpus in self.rows().iteritems():
+			for cpu, values in cpus.iteritems():
+				stats[cpu][time_stamp] = values
+		return stats
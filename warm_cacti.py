@@ -0,0 +1,104 @@
+#!/usr/bin/python
+# Copyright (c) 2015, Michael LeBeane
+# The University of Texas at Austin
+# The Laboratory for Computer Architecture (LCA)
+# All rights reserved.
+#
+# Redistribution of this source or derived binaries is not authorized without
+# the express written consent of the original copyright holders.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AN
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+# Pre-warmed CACTI caches
+# @date: 10/18/2026
+#
+# The first McPAT run of a template on a new node pays for the CACTI design
+# space search of every array of the processor, and only later runs hit the
+# CACTI cache.  This runs McPAT once on the template of each microarch at each
+# TSC frequency, all of them in parallel and sharing one CACTI cache, and
+# compacts that cache into mcpat_procs/<microarch>.cache.  The file holds no
+# absolute addresses or paths and can be copied to other nodes along with the
+# template; run_mcpat passes it to McPAT as a read only seed (mcpat -seed), so
+# the arrays of the template are never solved again.  Whole arrays are keyed
+# with their throughput and latency constraints, which follow the clock, so
+# the seed only serves them at the TSC frequencies it was warmed at; the CACTI
+# solutions it holds are keyed by the parameters CACTI reads (cacti_key in
+# fast_mcpat/cacti/io.cc) and are also reused at other frequencies when those
+# do not change.
+#
+# The arrays a template needs cannot be listed without McPAT: with
+# -opt_for_clk 1 the arrays of a component are resized until they meet the
+# clock, each try being a new CACTI input.  So the template is evaluated as a
+# whole, and only the clock (the only parameter WattWatcher sets) is varied.
+
+import os, sys, re, time, argparse, tempfile, shutil, subprocess, multiprocessing
+from multiprocessing.pool import ThreadPool
+import generate_mcpat
+import run_mcpat
+
+WATTWATCHER_HOME = os.environ['WATTWATCHER_HOME']
+
+# The template with the clock of every core set as generate_mcpat.mcpat_updates does
+def clocked(template, TSC_FREQUENCY):
+	updates = [(component, kind, name, str(int(TSC_FREQUENCY / 1000000))) for component, kind, name in sorted(template.slots.keys())
+		if kind == "param" and name == "clock_rate" and re.match("system\.core[0-9]+$", component)]
+	return template.fill(updates)
+
+# Runs McPAT on xml with the CACTI cache in cache_file, returns the CACTI_STATS counts
+def warm(xml, mcpatdir, cache_file, seed, threads):
+	args = [mcpatdir + "/mcpat", "-print_level", "0", "-opt_for_clk", "1", "-stats", "1", "-cache", cache_file] + run_mcpat.thread_opts(threads) + ["-infile", "-"]
+	if seed:
+		args += ["-seed", seed]
+	proc = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=run_mcpat.mcpat_env(mcpatdir))
+	output = proc.communicate(xml)[0]
+	if proc.returncode:
+		raise subprocess.CalledProcessError(proc.returncode, " ".join(args), output)
+	res = re.search("^CACTI_STATS ([0-9]+) ([0-9]+) ([0-9]+)", output, re.M)
+	return [int(count) for count in res.groups()] if res else [0, 0, 0]
+
+# Run in standalone script mode
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Writes a pre-warmed CACTI cache for McPAT templates")
+	parser.add_argument("microarch", help="microarchitecture names of the McPAT templates", nargs="+")
+	parser.add_argument("--tsc-frequency", help="TSC frequency (Hz) the analyses use, repeat for several", type=int, action="append", required=True)
+	parser.add_argument("--jobs", help="Concurrent McPAT processes",type=int,default=multiprocessing.cpu_count())
+	args = parser.parse_args()
+
+	mcpatdir = WATTWATCHER_HOME + "/fast_mcpat"
+	tmp_dir = tempfile.mkdtemp()
+	try:
+		runs = []
+		for microarch in args.microarch:
+			input_proc_model = WATTWATCHER_HOME + "/mcpat_procs/" + microarch + ".xml"
+			template = generate_mcpat.CompiledTemplate(input_proc_model)
+			seed = run_mcpat.seed_file(input_proc_model)
+			# the arrays of an earlier artifact are copied instead of solved again
+			seed = seed if os.path.isfile(seed) else None
+			for TSC_FREQUENCY in args.tsc_frequency:
+				runs.append((microarch, clocked(template, TSC_FREQUENCY), tmp_dir + "/" + microarch + ".cacti", seed))
+
+		# the runs of a template share its cache, an array solved by one is a hit for the others
+		begin = time.time()
+		jobs = min(args.jobs, len(runs))
+		pool = ThreadPool(processes=jobs)
+		counts = pool.map(lambda run: warm(run[1], mcpatdir, run[2], run[3], run_mcpat.mcpat_threads(jobs)), runs)
+		pool.close()
+		print "McPAT runs done in %.1f s" % (time.time() - begin)
+
+		for microarch in args.microarch:
+			runs_counts = [count for run, count in zip(runs, counts) if run[0] == microarch]
+			memory_hits, cache_hits, solved = [sum(column) for column in zip(*runs_counts)]
+			print "%s: %d arrays solved, %d from the cache, %d repeated" % (microarch, solved, cache_hits, memory_hits)
+			subprocess.check_call([mcpatdir + "/cachetool", "compact", tmp_dir + "/" + microarch + ".cacti",
+				run_mcpat.seed_file(WATTWATCHER_HOME + "/mcpat_procs/" + microarch + ".xml"), "-capacity", "0"], env=run_mcpat.mcpat_env(mcpatdir))
+	finally:
+		shutil.rmtree(tmp_dir)